@@ -0,0 +1,78 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import gevent
+
+from mars.actors import create_actor_pool, new_client, Actor
+from mars.actors.pool.gevent_pool import Connections
+from mars.utils import get_next_port
+
+
+class EchoActor(Actor):
+    def on_receive(self, message):
+        if isinstance(message, tuple) and message[0] == 'sleep':
+            gevent.sleep(message[1])
+        return message
+
+
+class RemoteRPCSuite:
+    """
+    Benchmark throughput and latency of remote actor calls,
+    multiplexed connections are compared with the legacy connections
+    which carry a single outstanding request.
+    """
+    params = [True, False]
+    param_names = ['multiplex']
+
+    def setup(self, multiplex):
+        self.address = '127.0.0.1:{}'.format(get_next_port())
+        self.pool = create_actor_pool(self.address, n_process=2, backend='gevent')
+        self.client = new_client(backend='gevent', multiplex=multiplex)
+        self.refs = [self.client.create_actor(EchoActor, address=self.address,
+                                              uid='echo-{}'.format(i)) for i in range(8)]
+        # emulate the per-address connection cap of a cluster with 200 workers
+        self._addrs = Connections.addrs
+        Connections.addrs = 200
+
+    def teardown(self, multiplex):
+        Connections.addrs = self._addrs
+        self.pool.stop()
+
+    def time_sequential_send(self, multiplex):
+        ref = self.refs[0]
+        for i in range(1000):
+            ref.send(i)
+
+    def time_concurrent_send(self, multiplex):
+        ps = [gevent.spawn(self.refs[i % len(self.refs)].send, i) for i in range(2000)]
+        gevent.joinall(ps, raise_error=True)
+
+    def time_async_send(self, multiplex):
+        futures = [self.refs[i % len(self.refs)].send(i, wait=False) for i in range(2000)]
+        [f.result() for f in futures]
+
+    def track_latency_behind_slow_calls(self, multiplex):
+        # latency of fast calls when slow calls are in flight
+        slow = [gevent.spawn(self.refs[0].send, ('sleep', 1)) for _ in range(4)]
+        gevent.sleep(0.05)
+        start = time.time()
+        ps = [gevent.spawn(self.refs[1 + i % (len(self.refs) - 1)].send, i) for i in range(100)]
+        gevent.joinall(ps, raise_error=True)
+        elapsed = time.time() - start
+        gevent.joinall(slow, raise_error=True)
+        return elapsed
+
+    track_latency_behind_slow_calls.unit = 'seconds'
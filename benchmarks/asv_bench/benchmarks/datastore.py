@@ -0,0 +1,89 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+import mars.tensor as mt
+from mars.session import new_session
+
+
+class HDF5WriteSuite:
+    """
+    Benchmark writing tensors into HDF5, writes serialized by a lock
+    are compared with parallel writes stitched by a virtual dataset.
+    """
+    params = [[(4000, 4000), (16000, 4000)], [False, True]]
+    param_names = ['shape', 'parallel']
+    timeout = 600
+
+    def setup(self, shape, parallel):
+        self.x = mt.tensor(np.random.RandomState(0).rand(*shape), chunk_size=1000)
+        self.session = new_session()
+        self.session.run(self.x)
+        self.dir = tempfile.mkdtemp()
+
+    def teardown(self, shape, parallel):
+        shutil.rmtree(self.dir)
+
+    def _run(self, parallel):
+        filename = os.path.join(self.dir, 'bench_{}.hdf5'.format(time.time()))
+        self.session.run(mt.tohdf5(filename, self.x, dataset='x', parallel=parallel))
+
+    def time_write(self, shape, parallel):
+        self._run(parallel)
+
+    def track_throughput(self, shape, parallel):
+        start = time.time()
+        self._run(parallel)
+        return self.x.nbytes / (time.time() - start) / 1024 ** 2
+
+    track_throughput.unit = 'MB/s'
+
+
+class ZarrWriteSuite:
+    """
+    Benchmark writing tensors into Zarr, chunks of tensors are aligned
+    or not aligned to zarr chunks before they are rechunked.
+    """
+    params = [[(4000, 4000), (16000, 4000)], [1000, 700]]
+    param_names = ['shape', 'chunk_size']
+    timeout = 600
+
+    def setup(self, shape, chunk_size):
+        self.x = mt.tensor(np.random.RandomState(0).rand(*shape), chunk_size=chunk_size)
+        self.session = new_session()
+        self.session.run(self.x)
+        self.dir = tempfile.mkdtemp()
+
+    def teardown(self, shape, chunk_size):
+        shutil.rmtree(self.dir)
+
+    def _run(self):
+        path = os.path.join(self.dir, 'bench_{}.zarr'.format(time.time()))
+        self.session.run(mt.tozarr(path, self.x, dataset='x', chunks=1000))
+
+    def time_write(self, shape, chunk_size):
+        self._run()
+
+    def track_throughput(self, shape, chunk_size):
+        start = time.time()
+        self._run()
+        return self.x.nbytes / (time.time() - start) / 1024 ** 2
+
+    track_throughput.unit = 'MB/s'
@@ -0,0 +1,101 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from mars.graph import DAG
+
+
+def _build_layered_edges(n_nodes, width=1000, fan_in=4, seed=0):
+    """
+    Generate edges of a layered DAG, every node takes at most `fan_in`
+    nodes in the previous layer as predecessors.
+    """
+    rs = np.random.RandomState(seed)
+    dst = np.repeat(np.arange(width, n_nodes), fan_in)
+    layer_starts = (dst // width - 1) * width
+    src = layer_starts + rs.randint(0, width, size=len(dst))
+    edges = np.unique(np.stack([src, dst], axis=1), axis=0)
+    return edges[:, 0].tolist(), edges[:, 1].tolist()
+
+
+def _build_dag(n_nodes, src, dst, edge_attrs=True):
+    dag = DAG(edge_attrs=edge_attrs)
+    for i in range(n_nodes):
+        dag.add_node(i)
+    for u, v in zip(src, dst):
+        dag.add_edge(u, v)
+    return dag
+
+
+class GraphBuildSuite:
+    """
+    Benchmark building and freezing graphs.
+    """
+    params = [[100000, 1000000], [True, False]]
+    param_names = ['n_nodes', 'edge_attrs']
+    timeout = 600
+
+    def setup(self, n_nodes, edge_attrs):
+        self.src, self.dst = _build_layered_edges(n_nodes)
+        self.dag = _build_dag(n_nodes, self.src, self.dst, edge_attrs=edge_attrs)
+
+    def time_build(self, n_nodes, edge_attrs):
+        _build_dag(n_nodes, self.src, self.dst, edge_attrs=edge_attrs)
+
+    def time_freeze(self, n_nodes, edge_attrs):
+        self.dag.unfreeze()
+        self.dag.freeze()
+
+    def peakmem_build(self, n_nodes, edge_attrs):
+        _build_dag(n_nodes, self.src, self.dst, edge_attrs=edge_attrs)
+
+
+class GraphTraverseSuite:
+    """
+    Benchmark traversing graphs with adjacency dicts and
+    with frozen CSR arrays.
+    """
+    params = [[100000, 1000000], [False, True]]
+    param_names = ['n_nodes', 'frozen']
+    timeout = 600
+
+    def setup(self, n_nodes, frozen):
+        src, dst = _build_layered_edges(n_nodes)
+        self.dag = _build_dag(n_nodes, src, dst, edge_attrs=False)
+        if frozen:
+            self.dag.freeze()
+
+    def time_topological_iter(self, n_nodes, frozen):
+        for _ in self.dag.topological_iter():
+            pass
+
+    def time_dfs(self, n_nodes, frozen):
+        for _ in self.dag.dfs():
+            pass
+
+    def time_bfs(self, n_nodes, frozen):
+        for _ in self.dag.bfs():
+            pass
+
+    def time_bfs_all(self, n_nodes, frozen):
+        for _ in self.dag.bfs(start=0, visit_predicate='all'):
+            pass
+
+    def time_iter_indep(self, n_nodes, frozen):
+        for _ in self.dag.iter_indep(reverse=True):
+            pass
+
+    def time_count_indep(self, n_nodes, frozen):
+        self.dag.count_indep()
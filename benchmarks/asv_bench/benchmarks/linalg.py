@@ -0,0 +1,62 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import numpy as np
+
+import mars.tensor as mt
+from mars.config import option_context
+from mars.session import new_session
+
+
+class TensordotSuite:
+    """
+    Benchmark blocked matrix multiply, products of contraction blocks
+    accumulated in place are compared with products summed by tree add.
+    """
+    params = [[2000, 4000], [True, False]]
+    param_names = ['size', 'accumulate']
+    timeout = 600
+
+    def setup(self, size, accumulate):
+        rs = np.random.RandomState(0)
+        self.a = mt.tensor(rs.rand(size, size), chunk_size=size // 8)
+        self.b = mt.tensor(rs.rand(size, size), chunk_size=size // 8)
+        self.session = new_session()
+
+    def _run(self, accumulate):
+        with option_context({'tensordot.accumulate': accumulate}):
+            self.session.run(self.a.dot(self.b))
+
+    def time_dot(self, size, accumulate):
+        self._run(accumulate)
+
+    def peakmem_dot(self, size, accumulate):
+        self._run(accumulate)
+
+    def track_gflops(self, size, accumulate):
+        start = time.time()
+        self._run(accumulate)
+        return 2 * size ** 3 / (time.time() - start) / 1e9
+
+    track_gflops.unit = 'GFLOP/s'
+
+    def track_bytes_transferred(self, size, accumulate):
+        with option_context({'tensordot.accumulate': accumulate}):
+            graph = self.a.dot(self.b).build_graph(tiled=True, compose=False)
+        # every edge moves data of the predecessor when chunks are on different workers
+        return sum(pred.nbytes for succ in graph for pred in graph.iter_predecessors(succ))
+
+    track_bytes_transferred.unit = 'bytes'
@@ -0,0 +1,167 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from mars.actors import create_actor_pool, FunctionActor
+from mars.scheduler.operands import OperandState, OperandStateMachine
+
+
+def _build_layered_graph(n_ops, width=1000, fan_in=4, seed=0):
+    """
+    Build a layered DAG, every operand takes at most `fan_in` operands
+    in the previous layer as predecessors.
+    """
+    rs = np.random.RandomState(seed)
+    keys = ['op-%d' % i for i in range(n_ops)]
+    predecessors = []
+    for i in range(n_ops):
+        layer_start = (i // width) * width
+        if layer_start == 0:
+            predecessors.append([])
+            continue
+        prev_start = layer_start - width
+        preds = rs.randint(prev_start, layer_start, size=fan_in)
+        predecessors.append([keys[p] for p in set(preds.tolist())])
+    depths = [i // width for i in range(n_ops)]
+    return keys, predecessors, depths
+
+
+class OperandStateMachineSuite:
+    """
+    Benchmark bookkeeping of operand states when executing graphs
+    of different sizes in waves.
+    """
+    params = [1000, 10000, 100000]
+    param_names = ['n_operands']
+
+    def setup(self, n_operands):
+        self.keys, self.predecessors, self.depths = _build_layered_graph(n_operands)
+
+    def _build(self):
+        sm = OperandStateMachine()
+        sm.add_operands(self.keys, self.predecessors, depths=self.depths)
+        return sm
+
+    def time_build(self, n_operands):
+        self._build()
+
+    def time_execute(self, n_operands):
+        sm = self._build()
+        ready = sm.ids_in_states(OperandState.READY)
+        while len(ready):
+            ready, freeable = sm.mark_finished(ready)
+
+    def time_demand_depths(self, n_operands):
+        sm = self._build()
+        # the last layer starts running, propagate demands to all ancestors
+        sm.update_demand_depths(np.arange(len(self.keys) - 1000, len(self.keys)))
+
+    def time_cancel(self, n_operands):
+        sm = self._build()
+        sm.cancel()
+
+
+class _CounterActor(FunctionActor):
+    def __init__(self):
+        super().__init__()
+        self._count = 0
+
+    def incr(self):
+        self._count += 1
+
+    def get(self):
+        return self._count
+
+
+class _OperandActor(FunctionActor):
+    def __init__(self, n_preds, succ_uids, counter_uid):
+        super().__init__()
+        self._n_preds = n_preds
+        self._finished_preds = set()
+        self._succ_uids = succ_uids
+        self._counter_uid = counter_uid
+        self._succ_refs = None
+
+    def post_create(self):
+        self._succ_refs = [self.ctx.actor_ref(uid) for uid in self._succ_uids]
+
+    def add_finished_predecessor(self, key):
+        self._finished_preds.add(key)
+        if len(self._finished_preds) == self._n_preds:
+            self.finish()
+
+    def finish(self):
+        if not self._succ_refs:
+            self.ctx.actor_ref(self._counter_uid).incr(_tell=True)
+        for ref in self._succ_refs:
+            ref.add_finished_predecessor(self.uid, _tell=True)
+
+
+class _GraphActor(FunctionActor):
+    def __init__(self, keys, predecessors):
+        super().__init__()
+        self._keys = keys
+        self._predecessors = predecessors
+
+    def execute(self):
+        sm = OperandStateMachine()
+        sm.add_operands(self._keys, self._predecessors)
+        ready = sm.ids_in_states(OperandState.READY)
+        while len(ready):
+            ready, _ = sm.mark_finished(ready)
+
+
+class SchedulingMessagesSuite:
+    """
+    Compare propagating finished states of operands by messages between
+    per-operand actors with a single actor holding an OperandStateMachine.
+    """
+    params = ([1000, 10000], ['actors', 'vectorized'])
+    param_names = ['n_operands', 'mode']
+    # states of actors cannot be reset, run once after every setup
+    number = 1
+    repeat = 3
+    timeout = 300
+
+    def setup(self, n_operands, mode):
+        keys, predecessors, _ = _build_layered_graph(n_operands, width=n_operands // 10)
+        self.pool = create_actor_pool(n_process=1, backend='gevent')
+        if mode == 'actors':
+            successors = dict((k, []) for k in keys)
+            for k, preds in zip(keys, predecessors):
+                for p in preds:
+                    successors[p].append(k)
+            self.counter_ref = self.pool.create_actor(_CounterActor, uid='counter')
+            for k, preds in zip(keys, predecessors):
+                self.pool.create_actor(_OperandActor, len(preds), successors[k],
+                                       self.counter_ref.uid, uid=k)
+            self.initial_refs = [self.pool.actor_ref(k) for k, preds in zip(keys, predecessors)
+                                 if not preds]
+            self.n_terminals = sum(1 for k in keys if not successors[k])
+        else:
+            self.graph_ref = self.pool.create_actor(_GraphActor, keys, predecessors)
+
+    def teardown(self, n_operands, mode):
+        self.pool.stop()
+
+    def time_propagate_states(self, n_operands, mode):
+        if mode == 'actors':
+            for ref in self.initial_refs:
+                ref.finish(_tell=True)
+            # wait till all terminals are reached
+            while self.counter_ref.get() < self.n_terminals:
+                self.pool.sleep(0.001)
+        else:
+            self.graph_ref.execute()
@@ -148,13 +148,13 @@ cpdef object create_actor_pool(str address=None, int n_process=0, object distrib
     return pool
 
 
-cpdef object new_client(object parallel=None, str backend='gevent'):
+cpdef object new_client(object parallel=None, str backend='gevent', object multiplex=None):
     if backend != 'gevent':
         raise ValueError('Only gevent-based actor pool is supported for now')
 
     from .pool.gevent_pool import ActorClient
 
-    return ActorClient(parallel=parallel)
+    return ActorClient(parallel=parallel, multiplex=multiplex)
 
 
 def register_actor_implementation(actor_cls, impl_cls):
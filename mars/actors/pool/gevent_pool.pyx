@@ -20,7 +20,7 @@ import pickle
 import random
 import struct
 import itertools
-from collections import OrderedDict
+from collections import OrderedDict, deque
 
 import gevent
 import gevent.queue
@@ -55,6 +55,8 @@ cdef int REMOTE_FROM_INDEX = -2
 cdef int UNKNOWN_TO_INDEX = -1
 cpdef int REMOTE_DEFAULT_PARALLEL = 50  # parallel connection at most
 cpdef int REMOTE_MAX_CONNECTION = 200  # most connections
+cpdef int REMOTE_MULTIPLEX_CONNECTION = 4  # multiplexed connections per address
+cpdef int REMOTE_PIPELINE_COALESCE_BYTES = 64 * 1024  # small requests are written in one call
 
 _inaction_encoder = _inaction_decoder = None
 
@@ -438,6 +440,144 @@ class Connections(object):
                 pass
 
 
+class MultiplexConnection(object):
+    """
+    A connection which carries many in-flight requests.
+
+    Requests are pipelined, i.e. written without waiting for the responses
+    of previous ones, requests queued when the connection is being written
+    are coalesced into one write. Responses may arrive out of order and are
+    dispatched to the waiters by message ids.
+    """
+    def __init__(self, address):
+        self.sock = gevent.socket.create_connection(address)
+        self._waiters = dict()
+        self._write_queue = deque()
+        self._write_lock = gevent.lock.Semaphore()
+        self._error = None
+        self._reader = gevent.spawn(self._read_responses)
+
+    @property
+    def closed(self):
+        return self._error is not None
+
+    @property
+    def n_inflight(self):
+        return len(self._waiters)
+
+    def request(self, bytes message_id, object binaries):
+        cdef object future
+        cdef list frames
+
+        if self._error is not None:
+            raise BrokenPipeError(self._error)
+
+        future = gevent.event.AsyncResult()
+        self._waiters[message_id] = future
+        frames = []
+        write_remote_message(frames.append, *binaries)
+        self._write_queue.append(frames)
+        self._flush()
+        return future
+
+    def _flush(self):
+        cdef list frames
+        cdef size_t size
+
+        with self._write_lock:
+            frames = []
+            while self._write_queue:
+                frames.extend(self._write_queue.popleft())
+            if not frames or self._error is not None:
+                # written by other requests or broken
+                return
+
+            size = sum(len(f) for f in frames)
+            try:
+                if size <= REMOTE_PIPELINE_COALESCE_BYTES:
+                    self.sock.sendall(b''.join(frames))
+                else:
+                    for f in frames:
+                        self.sock.sendall(f)
+            except (gevent.socket.error, BrokenPipeError):
+                self._set_error('The remote server is closed')
+
+    def _read_responses(self):
+        cdef bytes res_binary
+        cdef object future
+
+        try:
+            while True:
+                res_binary = read_remote_message(self.sock.recv)
+                future = self._waiters.pop(unpack_message_id(res_binary), None)
+                if future is not None:
+                    future.set_result(res_binary)
+        except (gevent.socket.error, BrokenPipeError, struct.error):
+            self._set_error('The remote server is closed')
+
+    def _set_error(self, str message):
+        if self._error is not None:
+            return
+        self._error = message
+        try:
+            self.sock.close()
+        except:  # pragma: no cover
+            pass
+        waiters, self._waiters = self._waiters, dict()
+        for future in waiters.values():
+            # every waiter raises its own exception to keep tracebacks apart
+            future.set_exception(BrokenPipeError(message))
+
+    def close(self):
+        self._set_error('The connection is closed')
+        self._reader.kill(block=False)
+
+
+class MultiplexConnections(object):
+    """
+    Multiplexed connections to an address, the number of connections
+    does not shrink as the number of addresses grows, a new connection is
+    established only when all the existing ones carry requests.
+    """
+    def __init__(self, address, size=None):
+        if isinstance(address, str):
+            self.address = address.split(':', 1)
+        else:
+            self.address = address
+        self.size = size if size is not None else REMOTE_MULTIPLEX_CONNECTION
+
+        self.lock = gevent.lock.Semaphore()
+        self.conns = []
+
+    def connect(self):
+        cdef object conn
+
+        with self.lock:
+            # drop broken connections, new ones will be established instead
+            self.conns = [conn for conn in self.conns if not conn.closed]
+
+            if self.conns:
+                conn = min(self.conns, key=lambda c: c.n_inflight)
+                if conn.n_inflight == 0 or len(self.conns) >= self.size:
+                    return conn
+
+            conn = MultiplexConnection(self.address)
+            self.conns.append(conn)
+            return conn
+
+    def close(self):
+        for conn in self.conns:
+            conn.close()
+        self.conns = []
+
+    def __del__(self):
+        for conn in self.conns:
+            try:
+                conn.close()
+            except:  # pragma: no cover
+                pass
+
+
 cdef class ActorRemoteHelper:
     """
     Used to handle remote operations, like deliver create_actor, destroy_actor, send etc to remote,
@@ -451,85 +591,95 @@ cdef class ActorRemoteHelper:
     cdef object _pool
     cdef dict _connections
     cdef object _lock
+    cdef bint _multiplex
+    cdef object _semaphore
 
-    def __init__(self, parallel=None):
+    def __init__(self, parallel=None, multiplex=None):
         self._parallel = parallel if parallel is not None else REMOTE_DEFAULT_PARALLEL
         self._pool = gevent.pool.Pool(self._parallel)
         self._connections = dict()
         self._lock = gevent.lock.RLock()
+        # multiplexed connections carry many in-flight requests,
+        # whose number is bounded by parallel as well
+        self._multiplex = multiplex if multiplex is not None else False
+        self._semaphore = gevent.lock.BoundedSemaphore(self._parallel)
 
     cdef object _new_connection(self, str address):
         with self._lock:
             if address not in self._connections:
-                connections = Connections(address)
+                if self._multiplex:
+                    connections = MultiplexConnections(address)
+                else:
+                    connections = Connections(address)
                 self._connections[address] = connections
 
             return self._connections[address].connect()
 
-    cpdef object _send_remote(self, str address, object binary):
-        cdef bytes res_binary
+    cpdef object _unpack_response(self, bytes res_binary):
         cdef object message_type
 
+        message_type = unpack_message_type(res_binary)
+        if message_type == MessageType.error:
+            error_message = unpack_error_message(res_binary)
+            raise error_message.error.with_traceback(error_message.traceback) from None
+        else:
+            assert message_type == MessageType.result
+            return unpack_result_message(res_binary).result
+
+    cpdef object _send_remote(self, str address, object packed):
+        cdef bytes res_binary
+
+        # the first item of packed message is the message id
+        if self._multiplex:
+            with self._semaphore:
+                res_binary = self._new_connection(address).request(packed[0], packed[1:]).get()
+            return self._unpack_response(res_binary)
+
         with self._new_connection(address) as sock:
             try:
-                write_remote_message(sock.sendall, *binary)
+                write_remote_message(sock.sendall, *packed[1:])
                 res_binary = read_remote_message(sock.recv)
-                message_type = unpack_message_type(res_binary)
-                if message_type == MessageType.error:
-                    error_message = unpack_error_message(res_binary)
-                    raise error_message.error.with_traceback(error_message.traceback) from None
-                else:
-                    assert message_type == MessageType.result
-                    return unpack_result_message(res_binary).result
+                return self._unpack_response(res_binary)
             except BrokenPipeError:
                 self._connections[address].got_broken_pipe(sock.fileno())
                 raise
 
+    cdef object _call_remote(self, str address, object packed):
+        if self._multiplex:
+            # no greenlet is occupied when waiting for the response
+            return self._send_remote(address, packed)
+        return self._pool.apply(self._send_remote, (address, packed))
+
     def create_actor(self, str address, object uid, object actor_cls, *args, **kwargs):
         cdef bint wait
         cdef object callback
-        cdef tuple binaries
+        cdef tuple packed
         cdef ActorRef actor_ref
-        cdef object future
 
         wait = kwargs.pop('wait', True)
         callback = kwargs.pop('callback', None)
 
         try:
-            binaries = pack_create_actor_message(
+            packed = pack_create_actor_message(
                 ActorRemoteHelper.index, UNKNOWN_TO_INDEX,
-                ActorRef(address, uid), actor_cls, args, kwargs)[1:]
+                ActorRef(address, uid), actor_cls, args, kwargs)
         except (AttributeError, pickle.PickleError):
             raise pickle.PicklingError('Unable to pickle {0}(*{1}, **{2})'.format(actor_cls, args, kwargs))
 
         if wait:
-            actor_ref = self._pool.apply(self._send_remote, (address, binaries))
+            actor_ref = self._call_remote(address, packed)
             actor_ref.ctx = ActorContext(self)
             return actor_ref
 
-        # return future
-        future = gevent.event.AsyncResult()
-
-        def on_success(g):
-            actor_ref = g.value
+        def on_created(actor_ref):
             actor_ref.ctx = ActorContext(self)
             if callback is not None:
                 callback(actor_ref)
-            future.set_result(actor_ref)
-
-        def on_failure(g):
-            try:
-                g.get()
-            except:
-                t, ex, tb = sys.exc_info()
-                future.set_exception(ex, exc_info=(t, ex, tb))
 
-        p = self._pool.apply_async(self._send_remote, (address, binaries))
-        p.link_value(on_success)
-        p.link_exception(on_failure)
-        return future
+        # return future
+        return self._async_run(address, packed, callback=on_created)
 
-    def _async_run(self, str address, object binaries, object callback=None):
+    def _async_run(self, str address, object packed, object callback=None):
         cdef object future
 
         # return future
@@ -548,32 +698,54 @@ cdef class ActorRemoteHelper:
                 t, ex, tb = sys.exc_info()
                 future.set_exception(ex, exc_info=(t, ex, tb))
 
-        p = self._pool.apply_async(self._send_remote, (address, binaries))
+        def on_response(ar):
+            self._semaphore.release()
+            try:
+                ret = self._unpack_response(ar.get())
+            except:
+                t, ex, tb = sys.exc_info()
+                future.set_exception(ex, exc_info=(t, ex, tb))
+                return
+            if callback is not None:
+                callback(ret)
+            future.set_result(ret)
+
+        if self._multiplex:
+            self._semaphore.acquire()
+            try:
+                self._new_connection(address).request(packed[0], packed[1:]).rawlink(on_response)
+            except:
+                self._semaphore.release()
+                t, ex, tb = sys.exc_info()
+                future.set_exception(ex, exc_info=(t, ex, tb))
+            return future
+
+        p = self._pool.apply_async(self._send_remote, (address, packed))
         p.link_value(on_success)
         p.link_exception(on_failure)
         return future
 
     cpdef object destroy_actor(self, ActorRef actor_ref, bint wait=True, object callback=None):
-        cdef tuple binaries
+        cdef tuple packed
 
-        binaries = pack_destroy_actor_message(ActorRemoteHelper.index, UNKNOWN_TO_INDEX, actor_ref)[1:]
+        packed = pack_destroy_actor_message(ActorRemoteHelper.index, UNKNOWN_TO_INDEX, actor_ref)
 
         if wait:
-            return self._pool.apply(self._send_remote, (actor_ref.address, binaries))
+            return self._call_remote(actor_ref.address, packed)
 
         # return future
-        return self._async_run(actor_ref.address, binaries, callback=callback)
+        return self._async_run(actor_ref.address, packed, callback=callback)
 
     cpdef object has_actor(self, ActorRef actor_ref, bint wait=True, object callback=None):
-        cdef tuple binaries
+        cdef tuple packed
 
-        binaries = pack_has_actor_message(ActorRemoteHelper.index, UNKNOWN_TO_INDEX, actor_ref)[1:]
+        packed = pack_has_actor_message(ActorRemoteHelper.index, UNKNOWN_TO_INDEX, actor_ref)
 
         if wait:
-            return self._pool.apply(self._send_remote, (actor_ref.address, binaries))
+            return self._call_remote(actor_ref.address, packed)
 
         # return future
-        return self._async_run(actor_ref.address, binaries, callback=callback)
+        return self._async_run(actor_ref.address, packed, callback=callback)
 
     def actor_ref(self, *args, **kwargs):
         cdef ActorRef ref
@@ -584,22 +756,21 @@ cdef class ActorRemoteHelper:
 
     cpdef _send(self, ActorRef actor_ref, object message, bint wait_response=True,
                       bint wait=True, object callback=None):
-        cdef object func
-        cdef list binaries
+        cdef list packed
 
         try:
             if wait_response:
-                binaries = pack_send_message(ActorRemoteHelper.index, UNKNOWN_TO_INDEX, actor_ref, message)[1:]
+                packed = pack_send_message(ActorRemoteHelper.index, UNKNOWN_TO_INDEX, actor_ref, message)
             else:
-                binaries = pack_tell_message(ActorRemoteHelper.index, UNKNOWN_TO_INDEX, actor_ref, message)[1:]
+                packed = pack_tell_message(ActorRemoteHelper.index, UNKNOWN_TO_INDEX, actor_ref, message)
         except (AttributeError, pickle.PickleError):
             raise pickle.PicklingError('Unable to pickle message {0}'.format(message))
 
         if wait:
-            return self._pool.apply(self._send_remote, (actor_ref.address, binaries))
+            return self._call_remote(actor_ref.address, packed)
 
         # return future
-        return self._async_run(actor_ref.address, binaries, callback=callback)
+        return self._async_run(actor_ref.address, packed, callback=callback)
 
     cpdef send(self, ActorRef actor_ref, object message, bint wait=True, object callback=None):
         return self._send(actor_ref, message, wait_response=True, wait=wait, callback=callback)
@@ -1387,17 +1558,30 @@ cdef class ActorServerHandler:
 
     def __call__(self, sock, address):
         cdef bytes binary
-        cdef object p
+        cdef object write_lock
 
         server = self.server()
         if server:
             server.add_sock(sock)
 
+        # requests are handled concurrently, and responses are written
+        # once ready, clients match them with requests by message ids
+        write_lock = gevent.lock.Semaphore()
+
+        def handle(binary):
+            try:
+                result = self.on_receive(binary)
+                with write_lock:
+                    write_remote_message(sock.sendall, result)
+            except:
+                # close the connection to notify all the waiters
+                sock.close()
+                raise
+
         while True:
             try:
                 binary = read_remote_message(sock.recv)
-                p = gevent.spawn(self.on_receive, binary)
-                write_remote_message(sock.sendall, p.get())
+                gevent.spawn(handle, binary)
             except (gevent.socket.error, struct.error):
                 break
 
@@ -1639,8 +1823,8 @@ cdef class ActorPool:
 cdef class ActorClient:
     cdef object remote_handler
 
-    def __init__(self, parallel=None):
-        self.remote_handler = ActorRemoteHelper(parallel)
+    def __init__(self, parallel=None, multiplex=None):
+        self.remote_handler = ActorRemoteHelper(parallel, multiplex=multiplex)
 
     def create_actor(self, object actor_cls, *args, **kwargs):
         cdef object address
@@ -26,7 +26,8 @@ import gevent
 from mars.actors import create_actor_pool as new_actor_pool, Actor, FunctionActor, \
     ActorPoolNotStarted, ActorAlreadyExist, ActorNotExist, Distributor, new_client, \
     register_actor_implementation, unregister_actor_implementation
-from mars.actors.pool.gevent_pool import Dispatcher, Connections
+from mars.actors.pool.gevent_pool import Dispatcher, Connections, MultiplexConnections
+from mars.actors.pool.messages import pack_send_message, unpack_result_message
 from mars.lib.mmh3 import hash as mmh_hash
 from mars.utils import to_binary
 
@@ -179,6 +180,12 @@ class EventActor(Actor):
         return message
 
 
+class SleepActor(Actor):
+    def on_receive(self, message):
+        gevent.sleep(message)
+        return message
+
+
 class AdminDistributor(Distributor):
     def distribute(self, uid):
         if self.n_process == 1:
@@ -658,6 +665,74 @@ class Test(unittest.TestCase):
 
                     del conns3
 
+    def testRemoteMultiplexConnections(self):
+        with create_actor_pool(address=True, n_process=2, backend='gevent') as pool:
+            addr = pool.cluster_info.address
+
+            client = new_client(backend='gevent')
+            slow_ref = client.create_actor(SleepActor, address=addr, uid='slow')
+            fast_ref = client.create_actor(SleepActor, address=addr, uid='fast')
+
+            connections = MultiplexConnections(addr, size=1)
+            conn = connections.connect()
+
+            # requests share one connection, responses arrive out of order
+            slow_packed = pack_send_message(-2, -1, slow_ref, 0.5)
+            fast_packed = pack_send_message(-2, -1, fast_ref, 0)
+            slow_future = conn.request(slow_packed[0], slow_packed[1:])
+            fast_future = conn.request(fast_packed[0], fast_packed[1:])
+            self.assertIs(connections.connect(), conn)
+
+            self.assertEqual(unpack_result_message(fast_future.get()).result, 0)
+            self.assertFalse(slow_future.ready())
+            self.assertEqual(unpack_result_message(slow_future.get()).result, 0.5)
+            self.assertEqual(conn.n_inflight, 0)
+
+            # new connections are established only when existing ones are busy
+            connections = MultiplexConnections(addr, size=2)
+            conn1 = connections.connect()
+            self.assertIs(connections.connect(), conn1)
+            slow_packed = pack_send_message(-2, -1, slow_ref, 0.1)
+            slow_future = conn1.request(slow_packed[0], slow_packed[1:])
+            conn2 = connections.connect()
+            self.assertIsNot(conn1, conn2)
+            slow_future.get()
+            connections.close()
+            self.assertTrue(conn1.closed)
+            with self.assertRaises(BrokenPipeError):
+                conn1.request(fast_packed[0], fast_packed[1:])
+
+            # broken connections are replaced when connecting
+            connections = MultiplexConnections(addr, size=1)
+            conn1 = connections.connect()
+            conn1.close()
+            conn2 = connections.connect()
+            self.assertIsNot(conn1, conn2)
+            self.assertFalse(conn2.closed)
+            fast_packed = pack_send_message(-2, -1, fast_ref, 0)
+            fast_future = conn2.request(fast_packed[0], fast_packed[1:])
+            self.assertEqual(unpack_result_message(fast_future.get()).result, 0)
+            connections.close()
+
+            # many concurrent requests via multiplexed and legacy clients
+            for multiplex in (True, False):
+                client = new_client(backend='gevent', multiplex=multiplex)
+                ref = client.actor_ref(fast_ref)
+                ps = [gevent.spawn(ref.send, i * 0.001) for i in range(100)]
+                self.assertEqual([p.get() for p in ps], [i * 0.001 for i in range(100)])
+                futures = [ref.send(0, wait=False) for _ in range(10)]
+                self.assertEqual([f.result() for f in futures], [0] * 10)
+
+            # in-flight requests of multiplexed clients are bounded by parallel
+            client = new_client(parallel=1, backend='gevent', multiplex=True)
+            slow_client_ref = client.actor_ref(slow_ref)
+            fast_client_ref = client.actor_ref(fast_ref)
+            slow_future = slow_client_ref.send(0.5, wait=False)
+            t = time.time()
+            self.assertEqual(fast_client_ref.send(0), 0)
+            self.assertGreater(time.time() - t, 0.3)
+            self.assertEqual(slow_future.result(), 0.5)
+
     def testRemotePostCreatePreDestroy(self):
         with create_actor_pool(address=True, n_process=1, backend='gevent') as pool:
             addr = pool.cluster_info.address
@@ -309,11 +309,53 @@ default_options.register_option('combine_size', 4, validator=is_integer, seriali
 
 # the default chunk store size
 default_options.register_option('chunk_store_limit', 128 * 1024 ** 2, validator=is_numeric)
-default_options.register_option('chunk_size', None, validator=any_validator(is_null, is_integer), serialize=True)
+default_options.register_option('chunk_size', None, validator=any_validator(is_null, is_integer, is_in(['auto'])),
+                                serialize=True)
+# chunks decided by `chunk_size='auto'` occupy at most the fraction of memory of a core
+default_options.register_option('auto_chunk.memory_fraction', 0.25, validator=is_numeric, serialize=True)
+# chunks decided by `chunk_size='auto'` are not split smaller than this for parallelism
+default_options.register_option('auto_chunk.min_chunk_bytes', 4 * 1024 ** 2, validator=is_numeric, serialize=True)
 
 # rechunk
 default_options.register_option('rechunk.threshold', 4, validator=is_integer, serialize=True)
 default_options.register_option('rechunk.chunk_size_limit', int(1e8), validator=is_integer, serialize=True)
+# rechunk with shuffle when chunks are sliced into or assembled from more pieces on average
+default_options.register_option('rechunk.shuffle_threshold', 16, validator=is_numeric, serialize=True)
+
+# datasource
+# snap chunks of tensors read from HDF5, Zarr or TileDB to multiples of chunks on disk
+default_options.register_option('datasource.align_storage_chunks', True, validator=is_bool, serialize=True)
+# bytes of decompressed storage blocks cached in a worker process for chunks not aligned
+default_options.register_option('datasource.block_cache_size', 256 * 1024 ** 2, validator=is_numeric)
+
+# reduction
+# combine chunks on the same worker first when workers of input chunks are known
+default_options.register_option('reduction.locality_aware', False, validator=is_bool, serialize=True)
+
+# tensordot
+# accumulate products of contraction blocks into output chunks in place
+default_options.register_option('tensordot.accumulate', False, validator=is_bool, serialize=True)
+# the max bytes of input panels accumulated by one chunk, chunk_store_limit if not specified
+default_options.register_option('tensordot.panel_size_limit', None,
+                                validator=(is_null, is_numeric), serialize=True)
+# assign chunks onto a grid of workers, thus panels are only sent to workers in a row or column
+default_options.register_option('tensordot.pin_workers', False, validator=is_bool, serialize=True)
+
+# fancy index
+# gather chunks of input directly for each chunk of a 1-d fancy index tensor if its values
+# fall in at most limited input chunks, 0 to always shuffle fancy indexes
+default_options.register_option('fancy_index.gather_chunk_limit', 4, validator=is_integer, serialize=True)
+# calculate bounds of fancy index chunks which are not known when tiling by an extra execution,
+# so that they could be gathered as well
+default_options.register_option('fancy_index.calc_gather_bounds', False, validator=is_bool, serialize=True)
+
+# sort
+# samples taken per partition from every chunk in parallel sort, None to grow with log2 of size on axis
+default_options.register_option('sort.oversampling', None, validator=any_validator(is_null, is_integer),
+                                serialize=True)
+# `head` of sorted data selects top rows of every chunk instead of sorting all of them
+# if count of rows is no more than the limit
+default_options.register_option('sort.head_select_limit', 10000, validator=is_integer, serialize=True)
 
 # deploy
 default_options.register_option('deploy.open_browser', True, validator=is_bool)
@@ -340,6 +382,15 @@ default_options.register_option('scheduler.worker_blacklist_time', 3600, validat
 default_options.register_option('scheduler.batch_enqueue_initials', True, validator=is_bool, serialize=True)
 # invoke assigning when where there is no ready descendants
 default_options.register_option('scheduler.aggressive_assign', False, validator=is_bool, serialize=True)
+# handle operands of a graph in a single actor with states stored in arrays
+default_options.register_option('scheduler.vectorized_graph', False, validator=is_bool, serialize=True)
+# serialize executable graphs sent to workers in compact format
+default_options.register_option('scheduler.compact_graph_serialization', False, validator=is_bool, serialize=True)
+# max number of small operands submitted to a worker in a single batch, 1 to disable batching
+default_options.register_option('scheduler.submit_batch_size', 1, validator=is_integer, serialize=True)
+# operands whose total input size is below the limit are considered small
+default_options.register_option('scheduler.submit_batch_input_limit', 4 * 1024 ** 2,
+                                validator=is_integer, serialize=True)
 
 # Worker
 default_options.register_option('worker.spill_directory', None, validator=(is_null, is_string, is_list))
@@ -362,6 +413,12 @@ default_options.register_option('worker.plasma_socket', '/tmp/plasma', validator
 default_options.register_option('optimize.min_stats_count', 10, validator=is_integer)
 default_options.register_option('optimize.stats_sufficient_ratio', 0.9, validator=is_float, serialize=True)
 default_options.register_option('optimize.default_disk_io_speed', 10 * 1024 ** 2, validator=is_integer)
+# fuse subgraphs with multiple inputs when saved intermediate bytes outweigh lost parallelism
+default_options.register_option('optimize.fuse_subgraphs', False, validator=is_bool, serialize=True)
+default_options.register_option('optimize.fuse_parallelism_weight', 1.0, validator=is_numeric, serialize=True)
+# max size of chunks without inputs which can be duplicated into multiple fused chunks
+default_options.register_option('optimize.fuse_duplicate_limit', 1024 ** 2, validator=is_integer,
+                                serialize=True)
 
 default_options.register_option('optimize_tileable_graph', True, validator=is_bool)
 
@@ -14,20 +14,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
+import zlib
+from collections import OrderedDict
 from io import BytesIO
 
 import pandas as pd
 import numpy as np
-from pyarrow import HdfsFile
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pyarrow import HdfsFile, NativeFile
 
 from ... import opcodes as OperandDef
 from ...config import options
 from ...utils import parse_readable_size, lazy_import
 from ...serialize import StringField, DictField, ListField, Int32Field, Int64Field, BoolField, AnyField
-from ...filesystem import open_file, file_size, glob
+from ...filesystem import open_file, file_size, glob, get_fs, LocalFileSystem
 from ..core import IndexValue
-from ..utils import parse_index, build_empty_df, standardize_range_index
+from ..utils import parse_index, build_empty_df, standardize_range_index, \
+    filter_dataframe
 from ..operands import DataFrameOperand, DataFrameOperandMixin, ObjectType
+from ..datastore.to_csv import MANIFEST_FILE_NAME
 
 
 cudf = lazy_import('cudf', globals=globals())
@@ -60,7 +68,7 @@ def _find_hdfs_start_end(f, offset, size):
 
 
 def _find_chunk_start_end(f, offset, size):
-    if isinstance(f, HdfsFile):
+    if isinstance(f, (HdfsFile, NativeFile)):
         return _find_hdfs_start_end(f, offset, size)
     f.seek(offset)
     if f.tell() == 0:
@@ -74,6 +82,125 @@ def _find_chunk_start_end(f, offset, size):
     return start, end
 
 
+def _bgzf_block_size(header):
+    # BGZF blocks store their compressed size in the `BC` extra subfield,
+    # thus blocks can be indexed without decompressing them.
+    if len(header) < 18 or header[:3] != b'\x1f\x8b\x08' or not header[3] & 4:
+        return None
+    if header[12:14] != b'BC' or header[14:16] != b'\x02\x00':
+        return None
+    return int.from_bytes(header[16:18], 'little') + 1
+
+
+def _gzip_member_offsets(f, total_size):
+    """
+    Scan a BGZF file and return offsets where its blocks start. Blocks are
+    located by reading block headers only, and the scan stops at the first
+    member which is not a BGZF block, thus ordinary gzip files are never
+    decompressed here.
+    """
+    offsets = []
+    loc = 0
+    while loc < total_size:
+        f.seek(loc)
+        bsize = _bgzf_block_size(f.read(18))
+        if bsize is None:
+            break
+        offsets.append(loc)
+        loc += bsize
+    return offsets
+
+
+def _decompress_gzip(data):
+    out = []
+    while data:
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        out.append(decompressor.decompress(data))
+        data = decompressor.unused_data
+    return b''.join(out)
+
+
+def _read_gzip_until_delimiter(f, block_size=2 ** 16):
+    # read and decompress the following members until a line delimiter is met,
+    # the line straddling the chunk boundary belongs to the previous chunk
+    delimiter = b'\n'
+    out = []
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    while True:
+        data = f.read(block_size)
+        if not data:
+            return b''.join(out)
+        while data:
+            b = decompressor.decompress(data)
+            if delimiter in b:
+                out.append(b[:b.index(delimiter) + 1])
+                return b''.join(out)
+            out.append(b)
+            if decompressor.eof:
+                data = decompressor.unused_data
+                decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            else:
+                data = b''
+
+
+def _open_arrow_file(path, storage_options=None):
+    # local files are memory-mapped, thus byte ranges are read without copies
+    if isinstance(get_fs(path, storage_options), LocalFileSystem):
+        return pa.memory_map(path, 'r')
+    return open_file(path, storage_options=storage_options)
+
+
+def _to_arrow_type(dtype):
+    if dtype == np.dtype('object'):
+        return pa.string()
+    try:
+        return pa.from_numpy_dtype(dtype)
+    except (NotImplementedError, TypeError, pa.ArrowNotImplementedError):
+        # leave it to arrow's inference
+        return None
+
+
+def _get_manifest_path(path, storage_options=None):
+    if not isinstance(path, str) or '*' in path:
+        return
+    if os.path.basename(path) == MANIFEST_FILE_NAME:
+        return path
+    fs = get_fs(path, storage_options)
+    manifest_path = path.rstrip('/') + '/' + MANIFEST_FILE_NAME
+    if fs.isdir(path) and fs.exists(manifest_path):
+        return manifest_path
+
+
+def _build_partition_df(partitions, partition_dtypes, index=None):
+    """
+    Build a DataFrame with partition values of files, values in manifest
+    are restored into dtypes of partition columns.
+    """
+    cols = list(partition_dtypes)
+    # missing values are recorded as null in manifest
+    data = dict((col, pd.Series([np.nan if p.get(col) is None else p[col] for p in partitions],
+                                index=index, dtype=object))
+                for col in cols)
+    return pd.DataFrame(data, index=index, columns=cols).astype(partition_dtypes)
+
+
+def _build_empty_manifest_df(manifest):
+    """
+    Build an empty DataFrame by dtypes recorded in a manifest without files.
+    """
+    from .dataframe import from_pandas
+
+    data = OrderedDict((col, pd.Series([], dtype=dtype))
+                       for col, dtype in manifest.get('dtypes', []))
+    df = pd.DataFrame(data, columns=list(data))
+    if manifest['partition_cols']:
+        partition_dtypes = OrderedDict((col, manifest['partition_dtypes'].get(col, 'object'))
+                                       for col in manifest['partition_cols'])
+        df = pd.concat([df, _build_partition_df([], partition_dtypes, index=df.index)], axis=1)
+    # empty DataFrames are kept in one chunk
+    return from_pandas(df, chunk_size=((0,), (df.shape[1],)))
+
+
 class DataFrameReadCSV(DataFrameOperand, DataFrameOperandMixin):
     _op_type_ = OperandDef.READ_CSV
 
@@ -87,16 +214,30 @@ class DataFrameReadCSV(DataFrameOperand, DataFrameOperandMixin):
     _offset = Int64Field('offset')
     _size = Int64Field('size')
     _sort_range_index = BoolField('sort_range_index')
+    _engine = StringField('engine')
+    _split_compressed = BoolField('split_compressed')
+    _filters = ListField('filters')
+    # sizes and partition values of files, read from manifest
+    _file_sizes = ListField('file_sizes')
+    _partitions = ListField('partitions')
+    _partition_dtypes = DictField('partition_dtypes')
+    # for chunk
+    _partition = DictField('partition')
 
     _storage_options = DictField('storage_options')
 
     def __init__(self, path=None, names=None, sep=None, header=None, index_col=None,
                  compression=None, usecols=None, offset=None, size=None, gpu=None,
-                 sort_range_index=None, storage_options=None, **kw):
+                 sort_range_index=None, engine=None, split_compressed=None,
+                 filters=None, file_sizes=None, partitions=None, partition_dtypes=None,
+                 partition=None, storage_options=None, **kw):
         super().__init__(_path=path, _names=names, _sep=sep, _header=header,
                          _index_col=index_col, _compression=compression,
                          _usecols=usecols, _offset=offset, _size=size,
                          _gpu=gpu, _sort_range_index=sort_range_index,
+                         _engine=engine, _split_compressed=split_compressed, _filters=filters,
+                         _file_sizes=file_sizes, _partitions=partitions,
+                         _partition_dtypes=partition_dtypes, _partition=partition,
                          _storage_options=storage_options, _object_type=ObjectType.dataframe, **kw)
 
     @property
@@ -139,26 +280,130 @@ class DataFrameReadCSV(DataFrameOperand, DataFrameOperandMixin):
     def sort_range_index(self):
         return self._sort_range_index
 
+    @property
+    def engine(self):
+        return self._engine
+
+    @property
+    def split_compressed(self):
+        return self._split_compressed
+
+    @property
+    def filters(self):
+        return self._filters
+
+    @property
+    def file_sizes(self):
+        return self._file_sizes
+
+    @property
+    def partitions(self):
+        return self._partitions
+
+    @property
+    def partition_dtypes(self):
+        return self._partition_dtypes
+
+    @property
+    def partition(self):
+        return self._partition
+
     @property
     def storage_options(self):
         return self._storage_options
 
+    def get_columns(self):
+        return self._usecols
+
+    def set_pruned_columns(self, columns):
+        self._usecols = columns
+
+    def get_filters(self):
+        return self._filters
+
+    def set_pushed_filters(self, filters):
+        self._filters = filters
+
+    @classmethod
+    def _get_files(cls, op):
+        """
+        Get files to read with their sizes and partition values,
+        files whose partition values cannot satisfy filters are skipped.
+        """
+        if isinstance(op.path, (tuple, list)):
+            paths = list(op.path)
+        else:
+            paths = glob(op.path, storage_options=op.storage_options)
+        sizes = op.file_sizes or [file_size(path, storage_options=op.storage_options)
+                                  for path in paths]
+        if not op.partitions:
+            return [(path, size, None) for path, size in zip(paths, sizes)]
+
+        partitions = op.partitions
+        partition_filters = [f for f in op.filters or [] if f[0] in op.partition_dtypes]
+        if partition_filters:
+            partition_df = _build_partition_df(partitions, op.partition_dtypes)
+            # keep at least one file to generate an empty DataFrame
+            selected = set(filter_dataframe(partition_df, partition_filters).index) or {0}
+        else:
+            selected = set(range(len(paths)))
+        return [(path, size, partition) for i, (path, size, partition)
+                in enumerate(zip(paths, sizes, partitions)) if i in selected]
+
     @classmethod
     def _tile_compressed(cls, op):
-        # Compression does not support break into small parts
         df = op.outputs[0]
-        chunk_op = op.copy().reset_key()
-        chunk_op._offset = 0
-        chunk_op._size = file_size(op.path)
-        shape = df.shape
-        new_chunk = chunk_op.new_chunk(None, shape=shape, index=(0, 0), index_value=df.index_value,
-                                       columns_value=df.columns_value, dtypes=df.dtypes)
+        chunk_bytes = int(parse_readable_size(df.extra_params.chunk_bytes)[0])
+
+        out_chunks = []
+        split_any = False
+        for path, total_bytes, partition in cls._get_files(op):
+            if op.compression == 'gzip' and total_bytes > chunk_bytes:
+                # BGZF files can be broken at block boundaries
+                with open_file(path, storage_options=op.storage_options) as f:
+                    member_offsets = _gzip_member_offsets(f, total_bytes)
+                splits = [0]
+                for member_offset in member_offsets[1:]:
+                    if member_offset - splits[-1] >= chunk_bytes:
+                        splits.append(member_offset)
+            else:
+                # Other compressions do not support break into small parts
+                splits = [0]
+            splits.append(total_bytes)
+            split_any = split_any or len(splits) > 2
+
+            for start, end in zip(splits[:-1], splits[1:]):
+                chunk_op = op.copy().reset_key()
+                chunk_op._path = path
+                chunk_op._offset = start
+                chunk_op._size = end - start
+                chunk_op._split_compressed = len(splits) > 2
+                chunk_op._file_sizes = chunk_op._partitions = None
+                chunk_op._partition = partition
+                out_chunks.append((chunk_op, path))
+
+        single_chunk = len(out_chunks) == 1 and not split_any
+        for i, (chunk_op, path) in enumerate(out_chunks):
+            if single_chunk:
+                shape = df.shape
+                index_value = df.index_value
+            else:
+                shape = (np.nan, len(df.dtypes))
+                index_value = parse_index(df.index_value.to_pandas(), path, i)
+            out_chunks[i] = chunk_op.new_chunk(None, shape=shape, index=(i, 0),
+                                               index_value=index_value,
+                                               columns_value=df.columns_value,
+                                               dtypes=df.dtypes)
+
+        if op.sort_range_index and len(out_chunks) > 1 and \
+                isinstance(df.index_value._index_value, IndexValue.RangeIndex):
+            out_chunks = standardize_range_index(out_chunks)
         new_op = op.copy()
-        nsplits = ((np.nan,), (df.shape[1],))
+        nsplits = ((np.nan,) * len(out_chunks), (df.shape[1],))
         return new_op.new_dataframes(None, df.shape, dtypes=df.dtypes,
                                      index_value=df.index_value,
                                      columns_value=df.columns_value,
-                                     chunks=[new_chunk], nsplits=nsplits)
+                                     chunks=out_chunks, nsplits=nsplits)
 
     @classmethod
     def _validate_dtypes(cls, dtypes, is_gpu):
@@ -177,18 +422,17 @@ class DataFrameReadCSV(DataFrameOperand, DataFrameOperandMixin):
         chunk_bytes = df.extra_params.chunk_bytes
         chunk_bytes = int(parse_readable_size(chunk_bytes)[0])
 
-        paths = op.path if isinstance(op.path, (tuple, list)) else glob(op.path, storage_options=op.storage_options)
-
         out_chunks = []
         index_num = 0
-        for path in paths:
-            total_bytes = file_size(path)
+        for path, total_bytes, partition in cls._get_files(op):
             offset = 0
             for _ in range(int(np.ceil(total_bytes * 1.0 / chunk_bytes))):
                 chunk_op = op.copy().reset_key()
                 chunk_op._path = path
                 chunk_op._offset = offset
                 chunk_op._size = min(chunk_bytes, total_bytes - offset)
+                chunk_op._file_sizes = chunk_op._partitions = None
+                chunk_op._partition = partition
                 shape = (np.nan, len(df.dtypes))
                 index_value = parse_index(df.index_value.to_pandas(), path, index_num)
                 new_chunk = chunk_op.new_chunk(None, shape=shape, index=(index_num, 0), index_value=index_value,
@@ -207,24 +451,137 @@ class DataFrameReadCSV(DataFrameOperand, DataFrameOperandMixin):
                                      columns_value=df.columns_value,
                                      chunks=out_chunks, nsplits=nsplits)
 
+    @classmethod
+    def _is_partition_column(cls, op, col):
+        return op.partition is not None and col in op.partition
+
+    @classmethod
+    def _get_filter_only_columns(cls, op, columns):
+        # columns which are required by filters but not read yet
+        filter_columns = []
+        for col, _, _ in op.filters or []:
+            if col not in columns and col not in filter_columns and \
+                    not cls._is_partition_column(op, col):
+                filter_columns.append(col)
+        return filter_columns
+
+    @classmethod
+    def _get_read_usecols(cls, op):
+        if op.usecols is None:
+            return None
+        usecols = [c for c in op.usecols if not cls._is_partition_column(op, c)]
+        return usecols + cls._get_filter_only_columns(op, usecols)
+
+    @classmethod
+    def _get_read_dtypes(cls, op):
+        # partition columns are not stored in files
+        dtypes = op.outputs[0].dtypes
+        if op.partition is not None:
+            dtypes = dtypes[[c for c in dtypes.index if c not in op.partition]]
+        return dtypes
+
     @classmethod
     def _pandas_read_csv(cls, f, op):
-        csv_kwargs = op.extra_params.copy()
-        out_df = op.outputs[0]
         start, end = _find_chunk_start_end(f, op.offset, op.size)
         f.seek(start)
-        b = BytesIO(f.read(end - start))
-        if end == start:
+        return cls._pandas_read_bytes(f.read(end - start), op, start == 0)
+
+    @classmethod
+    def _pandas_read_bytes(cls, b, op, with_header):
+        csv_kwargs = op.extra_params.copy()
+        if len(b) == 0:
             # the last chunk may be empty
-            df = build_empty_df(out_df.dtypes)
+            return build_empty_df(cls._get_read_dtypes(op))
+        if with_header:
+            # The first chunk contains header
+            # As we specify names and dtype, we need to skip header rows
+            csv_kwargs['skiprows'] = 1 if op.header == 'infer' else op.header
+        if op.engine is not None:
+            csv_kwargs['engine'] = op.engine
+        return pd.read_csv(BytesIO(b), sep=op.sep, names=op.names, index_col=op.index_col,
+                           usecols=cls._get_read_usecols(op),
+                           dtype=cls._get_read_dtypes(op).to_dict(), **csv_kwargs)
+
+    @classmethod
+    def _arrow_read_csv(cls, f, op):
+        start, end = _find_chunk_start_end(f, op.offset, op.size)
+        f.seek(start)
+        if isinstance(f, NativeFile):
+            # zero-copy for memory-mapped files
+            buf = f.read_buffer(end - start)
         else:
-            if start == 0:
-                # The first chunk contains header
-                # As we specify names and dtype, we need to skip header rows
-                csv_kwargs['skiprows'] = 1 if op.header == 'infer' else op.header
-            df = pd.read_csv(b, sep=op.sep, names=op.names, index_col=op.index_col, usecols=op.usecols,
-                             dtype=out_df.dtypes.to_dict(), **csv_kwargs)
-        return df
+            buf = pa.py_buffer(f.read(end - start))
+        return cls._arrow_read_buffer(buf, op, start == 0)
+
+    @classmethod
+    def _arrow_read_buffer(cls, buf, op, with_header):
+        out_df = op.outputs[0]
+        read_dtypes = cls._get_read_dtypes(op)
+        if buf.size == 0:
+            return build_empty_df(read_dtypes)
+
+        column_names = list(op.names)
+        column_types = dict()
+        for name, dtype in read_dtypes.items():
+            arrow_type = _to_arrow_type(dtype)
+            if arrow_type is not None:
+                column_types[name] = arrow_type
+        index_name = None
+        if op.index_col is not None:
+            # names do not include the index column, give it a placeholder
+            index_name = '__index_level_0__'
+            column_names.insert(op.index_col, index_name)
+            index_arrow_type = _to_arrow_type(out_df.index_value.to_pandas().dtype)
+            if index_arrow_type is not None:
+                column_types[index_name] = index_arrow_type
+        read_columns = list(read_dtypes.index)
+        read_columns += cls._get_filter_only_columns(op, read_columns)
+        include_columns = list(read_columns)
+        if index_name is not None:
+            include_columns.insert(0, index_name)
+
+        if not with_header:
+            skip_rows = 0
+        elif op.header == 'infer':
+            skip_rows = 1
+        else:
+            skip_rows = 0 if op.header is None else op.header + 1
+        read_options = pa_csv.ReadOptions(use_threads=True, skip_rows=skip_rows,
+                                          column_names=column_names)
+        parse_options = pa_csv.ParseOptions(delimiter=op.sep)
+        convert_options = pa_csv.ConvertOptions(column_types=column_types,
+                                                include_columns=include_columns,
+                                                strings_can_be_null=True)
+        table = pa_csv.read_csv(pa.BufferReader(buf), read_options=read_options,
+                                parse_options=parse_options,
+                                convert_options=convert_options)
+        df = table.to_pandas(use_threads=True)
+        for name, dtype in read_dtypes.items():
+            if dtype == np.dtype('object') and table.column(name).null_count > 0:
+                # keep consistent with pandas which fills missing strings with NaN
+                df[name] = df[name].where(df[name].notna(), np.nan)
+        if index_name is not None:
+            df.set_index(index_name, inplace=True)
+            df.index.name = out_df.index_value.to_pandas().name
+        return df[read_columns]
+
+    @classmethod
+    def _read_bytes(cls, b, op, with_header):
+        if op.engine == 'arrow':
+            return cls._arrow_read_buffer(pa.py_buffer(b), op, with_header)
+        return cls._pandas_read_bytes(b, op, with_header)
+
+    @classmethod
+    def _read_split_compressed(cls, op):
+        with open_file(op.path, storage_options=op.storage_options) as f:
+            f.seek(op.offset)
+            b = _decompress_gzip(f.read(op.size))
+            if op.offset > 0:
+                # skip the line which belongs to the previous chunk
+                delimiter_pos = b.find(b'\n')
+                b = b[delimiter_pos + 1:] if delimiter_pos >= 0 else b''
+            b += _read_gzip_until_delimiter(f)
+        return cls._read_bytes(b, op, op.offset == 0)
 
     @classmethod
     def _cudf_read_csv(cls, op):
@@ -238,21 +595,53 @@ class DataFrameReadCSV(DataFrameOperand, DataFrameOperandMixin):
         return df
 
     @classmethod
-    def execute(cls, ctx, op):
+    def _read_csv(cls, op):
         xdf = cudf if op.gpu else pd
-        out_df = op.outputs[0]
         csv_kwargs = op.extra_params.copy()
 
+        if op.split_compressed:
+            return cls._read_split_compressed(op)
+        if op.engine == 'arrow' and not op.gpu:
+            if op.compression is not None:
+                with open_file(op.path, compression=op.compression,
+                               storage_options=op.storage_options) as f:
+                    return cls._read_bytes(f.read(), op, True)
+            else:
+                with _open_arrow_file(op.path, storage_options=op.storage_options) as f:
+                    return cls._arrow_read_csv(f, op)
+
         with open_file(op.path, compression=op.compression, storage_options=op.storage_options) as f:
             if op.compression is not None:
                 # As we specify names and dtype, we need to skip header rows
                 csv_kwargs['skiprows'] = 1 if op.header == 'infer' else op.header
+                if op.engine is not None and not op.gpu:
+                    csv_kwargs['engine'] = op.engine
                 df = xdf.read_csv(BytesIO(f.read()), sep=op.sep, names=op.names, index_col=op.index_col,
-                                  usecols=op.usecols, dtype=cls._validate_dtypes(op.outputs[0].dtypes, op.gpu),
+                                  usecols=cls._get_read_usecols(op),
+                                  dtype=cls._validate_dtypes(cls._get_read_dtypes(op), op.gpu),
                                   **csv_kwargs)
             else:
                 df = cls._cudf_read_csv(op) if op.gpu else cls._pandas_read_csv(f, op)
+        return df
 
+    @classmethod
+    def _add_partition_columns(cls, op, df):
+        partition_df = _build_partition_df([op.partition] * len(df),
+                                           op.partition_dtypes, index=df.index)
+        for col in partition_df.columns:
+            df[col] = partition_df[col]
+        return df
+
+    @classmethod
+    def execute(cls, ctx, op):
+        out_df = op.outputs[0]
+        df = cls._read_csv(op)
+        if op.partition is not None:
+            df = cls._add_partition_columns(op, df)
+        if op.filters and len(df) > 0:
+            df = filter_dataframe(df, op.filters)
+        if op.filters or op.partition is not None:
+            df = df[[c for c in out_df.dtypes.index if c in df.columns]]
         ctx[out_df.key] = df
 
     def __call__(self, index_value=None, columns_value=None, dtypes=None, chunk_bytes=None):
@@ -263,7 +652,7 @@ class DataFrameReadCSV(DataFrameOperand, DataFrameOperandMixin):
 
 def read_csv(path, names=None, sep=',', index_col=None, compression=None, header='infer',
              dtype=None, usecols=None, chunk_bytes='64M', gpu=None, head_bytes='100k',
-             head_lines=None, sort_range_index=False, storage_options=None, **kwargs):
+             head_lines=None, sort_range_index=False, engine=None, storage_options=None, **kwargs):
     r"""
     Read a comma-separated values (csv) file into DataFrame.
     Also supports optionally iterating or breaking of the file
@@ -278,6 +667,9 @@ def read_csv(path, names=None, sep=',', index_col=None, compression=None, header
         If you want to pass in a path object, pandas accepts any ``os.PathLike``.
         By file-like object, we refer to objects with a ``read()`` method, such as
         a file handler (e.g. via builtin ``open`` function) or ``StringIO``.
+        If `path` is a directory written by `to_csv` with a manifest, or
+        the manifest file itself, files are located by the manifest instead of
+        listing or checking file status, and partition columns are restored.
     sep : str, default ','
         Delimiter to use. If sep is None, the C engine cannot automatically detect
         the separator, but the Python parsing engine can, meaning the latter will
@@ -345,9 +737,11 @@ def read_csv(path, names=None, sep=',', index_col=None, compression=None, header
         to preserve and not interpret dtype.
         If converters are specified, they will be applied INSTEAD
         of dtype conversion.
-    engine : {'c', 'python'}, optional
+    engine : {'c', 'python', 'arrow'}, optional
         Parser engine to use. The C engine is faster while the python engine is
-        currently more feature-complete.
+        currently more feature-complete. The arrow engine parses every chunk
+        with the multithreaded CSV reader of pyarrow, only `sep`, `names`,
+        `header`, `index_col`, `usecols` and `dtype` are supported.
     converters : dict, optional
         Dict of functions for converting values in certain columns. Keys can either
         be integers or column labels.
@@ -451,6 +845,8 @@ def read_csv(path, names=None, sep=',', index_col=None, compression=None, header
         following extensions: '.gz', '.bz2', '.zip', or '.xz' (otherwise no
         decompression). If using 'zip', the ZIP file must contain only one data
         file to be read in. Set to None for no decompression.
+        BGZF files are split into multiple chunks at block boundaries,
+        other compressed files are read as a single chunk.
     thousands : str, optional
         Thousands separator.
     decimal : str, default '.'
@@ -540,6 +936,25 @@ def read_csv(path, names=None, sep=',', index_col=None, compression=None, header
     >>> import mars.dataframe as md
     >>> md.read_csv('data.csv')  # doctest: +SKIP
     """
+    file_sizes = partitions = partition_dtypes = None
+    manifest_path = _get_manifest_path(path, storage_options)
+    if manifest_path is not None:
+        # files, sizes and partitions are recorded in the manifest written by `to_csv`
+        with open_file(manifest_path, storage_options=storage_options) as f:
+            manifest = json.loads(f.read().decode('utf-8'))
+        if not manifest['files']:
+            # no data written, return an empty DataFrame with recorded dtypes
+            return _build_empty_manifest_df(manifest)
+        root = os.path.dirname(manifest_path)
+        path = [os.path.join(root, entry['path']) for entry in manifest['files']]
+        file_sizes = [entry['bytes'] for entry in manifest['files']]
+        if manifest['partition_cols']:
+            partitions = [entry['partition'] for entry in manifest['files']]
+            partition_dtypes = dict((col, manifest['partition_dtypes'][col])
+                                    for col in manifest['partition_cols'])
+        if compression is None:
+            compression = manifest['compression']
+
     # infer dtypes and columns
     if isinstance(path, (list, tuple)):
         file_path = path[0]
@@ -559,13 +974,20 @@ def read_csv(path, names=None, sep=',', index_col=None, compression=None, header
         index_value = parse_index(pd.RangeIndex(-1))
     else:
         index_value = parse_index(mini_df.index)
-    columns_value = parse_index(mini_df.columns, store_data=True)
     if index_col and not isinstance(index_col, int):
         index_col = list(mini_df.columns).index(index_col)
     names = list(mini_df.columns)
+    dtypes = mini_df.dtypes
+    if partition_dtypes:
+        # partition columns are appended after columns in files
+        dtypes = pd.concat([dtypes, _build_partition_df([], partition_dtypes).dtypes])
+    columns_value = parse_index(dtypes.index, store_data=True)
     op = DataFrameReadCSV(path=path, names=names, sep=sep, header=header, index_col=index_col,
                           usecols=usecols, compression=compression, gpu=gpu,
-                          sort_range_index=sort_range_index, storage_options=storage_options, **kwargs)
+                          sort_range_index=sort_range_index, engine=engine,
+                          file_sizes=file_sizes, partitions=partitions,
+                          partition_dtypes=partition_dtypes,
+                          storage_options=storage_options, **kwargs)
     chunk_bytes = chunk_bytes or options.chunk_store_limit
     return op(index_value=index_value, columns_value=columns_value,
-              dtypes=mini_df.dtypes, chunk_bytes=chunk_bytes)
+              dtypes=dtypes, chunk_bytes=chunk_bytes)
@@ -0,0 +1,371 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+
+import numpy as np
+import pandas as pd
+from pyarrow import parquet as pq
+
+from ... import opcodes as OperandDef
+from ...serialize import ValueType, AnyField, StringField, ListField, DictField, \
+    BoolField, Int32Field, Int64Field
+from ...filesystem import open_file, glob, get_fs
+from ...utils import tokenize
+from ..core import IndexValue
+from ..operands import DataFrameOperand, DataFrameOperandMixin, ObjectType
+from ..utils import parse_index, build_empty_df, normalize_filters, filter_dataframe
+
+
+def _natural_key(path):
+    # make sure part-2 comes before part-10
+    return [int(s) if s.isdigit() else s for s in re.split(r'(\d+)', path)]
+
+
+def _list_files(path, storage_options=None):
+    if isinstance(path, (list, tuple)):
+        return list(path)
+    if '*' in path:
+        return sorted(glob(path, storage_options=storage_options), key=_natural_key)
+    fs = get_fs(path, storage_options)
+    if fs.isdir(path):
+        files = [p for p in fs.ls(path)
+                 if not p.rstrip('/').rsplit('/', 1)[-1].startswith(('_', '.'))]
+        return sorted(files, key=_natural_key)
+    return [path]
+
+
+def _row_group_may_match(statistics, filters):
+    """
+    Check if any row in the row group may satisfy all the filters,
+    according to the min / max statistics stored in the footer.
+    """
+    for col, op, val in filters:
+        stat = statistics.get(col)
+        if stat is None:
+            continue
+        min_val, max_val = stat
+        try:
+            if op in ('==', '='):
+                matched = min_val <= val <= max_val
+            elif op == '<':
+                matched = min_val < val
+            elif op == '<=':
+                matched = min_val <= val
+            elif op == '>':
+                matched = max_val > val
+            elif op == '>=':
+                matched = max_val >= val
+            elif op == 'in':
+                matched = any(min_val <= v <= max_val for v in val)
+            else:
+                # `!=` and `not in` cannot prune by min / max
+                matched = True
+        except TypeError:
+            # incomparable statistics
+            matched = True
+        if not matched:
+            return False
+    return True
+
+
+def _get_row_group_statistics(row_group_meta, column_names):
+    statistics = dict()
+    for i, name in enumerate(column_names):
+        stat = row_group_meta.column(i).statistics
+        if stat is None or not stat.has_min_max:
+            continue
+        min_val, max_val = stat.min, stat.max
+        if isinstance(min_val, bytes):
+            try:
+                min_val, max_val = min_val.decode(), max_val.decode()
+            except UnicodeDecodeError:
+                continue
+        statistics[name] = (min_val, max_val)
+    return statistics
+
+
+def _get_index_columns(schema):
+    pandas_metadata = schema.pandas_metadata or dict()
+    return [c for c in pandas_metadata.get('index_columns', [])
+            if isinstance(c, str)]
+
+
+def _build_index_value(empty_index, min_val, max_val, *token_objects):
+    # build index value with min / max of index from footer statistics
+    index_type = getattr(IndexValue, type(empty_index).__name__)
+    kw = dict(_key=tokenize(empty_index, *token_objects), _name=empty_index.name,
+              _min_val=min_val, _max_val=max_val, _min_val_close=True, _max_val_close=True)
+    if '_dtype' in index_type._FIELDS:
+        kw['_dtype'] = empty_index.dtype
+    return IndexValue(_index_value=index_type(**kw))
+
+
+class DataFrameReadParquet(DataFrameOperand, DataFrameOperandMixin):
+    _op_type_ = OperandDef.READ_PARQUET
+
+    _path = AnyField('path')
+    _engine = StringField('engine')
+    _columns = ListField('columns')
+    _filters = ListField('filters')
+    _groups_as_chunks = BoolField('groups_as_chunks')
+    _read_kwargs = DictField('read_kwargs')
+    _storage_options = DictField('storage_options')
+    _index_columns = ListField('index_columns', ValueType.string)
+    # for chunk
+    _row_group = Int32Field('row_group')
+    _row_offset = Int64Field('row_offset')
+
+    def __init__(self, path=None, engine=None, columns=None, filters=None,
+                 groups_as_chunks=None, read_kwargs=None, storage_options=None,
+                 index_columns=None, row_group=None, row_offset=None, **kw):
+        super().__init__(_path=path, _engine=engine, _columns=columns, _filters=filters,
+                         _groups_as_chunks=groups_as_chunks, _read_kwargs=read_kwargs,
+                         _storage_options=storage_options, _index_columns=index_columns,
+                         _row_group=row_group, _row_offset=row_offset,
+                         _object_type=ObjectType.dataframe, **kw)
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def engine(self):
+        return self._engine
+
+    @property
+    def columns(self):
+        return self._columns
+
+    @property
+    def filters(self):
+        return self._filters
+
+    @property
+    def groups_as_chunks(self):
+        return self._groups_as_chunks
+
+    @property
+    def read_kwargs(self):
+        return self._read_kwargs
+
+    @property
+    def storage_options(self):
+        return self._storage_options
+
+    @property
+    def index_columns(self):
+        return self._index_columns
+
+    @property
+    def row_group(self):
+        return self._row_group
+
+    @property
+    def row_offset(self):
+        return self._row_offset
+
+    def get_columns(self):
+        return self._columns
+
+    def set_pruned_columns(self, columns):
+        self._columns = columns
+
+    def get_filters(self):
+        return self._filters
+
+    def set_pushed_filters(self, filters):
+        self._filters = filters
+
+    @classmethod
+    def _tile_file(cls, op, path, out_df, chunk_index, row_offset):
+        with open_file(path, storage_options=op.storage_options) as f:
+            meta = pq.ParquetFile(f).metadata
+        column_names = [meta.schema.column(i).name for i in range(meta.num_columns)]
+        empty_index = out_df.index_value.to_pandas()[:0]
+
+        if op.groups_as_chunks:
+            pieces = [(i, meta.row_group(i)) for i in range(meta.num_row_groups)]
+        else:
+            pieces = [(None, None)]
+
+        file_chunk_ops = []
+        for row_group, row_group_meta in pieces:
+            num_rows = row_group_meta.num_rows if row_group_meta is not None else meta.num_rows
+            statistics = _get_row_group_statistics(row_group_meta, column_names) \
+                if row_group_meta is not None else dict()
+            if op.filters and not _row_group_may_match(statistics, op.filters):
+                # skip the row group according to the footer statistics
+                row_offset += num_rows
+                continue
+
+            chunk_op = op.copy().reset_key()
+            chunk_op._path = path
+            chunk_op._row_group = row_group
+            chunk_op._row_offset = row_offset
+            if op.filters:
+                shape = (np.nan, out_df.shape[1])
+            else:
+                shape = (num_rows, out_df.shape[1])
+
+            index_columns = op.index_columns
+            if index_columns and len(index_columns) == 1 and index_columns[0] in statistics:
+                min_val, max_val = statistics[index_columns[0]]
+                index_value = _build_index_value(empty_index, min_val, max_val, path, row_group)
+            elif index_columns:
+                index_value = parse_index(empty_index, path, row_group)
+            elif op.filters:
+                index_value = parse_index(pd.Int64Index([]), path, row_group)
+            else:
+                index_value = parse_index(pd.RangeIndex(row_offset, row_offset + num_rows))
+            file_chunk_ops.append((chunk_op, shape, index_value))
+            row_offset += num_rows
+
+        out_chunks = []
+        for chunk_op, shape, index_value in file_chunk_ops:
+            out_chunks.append(chunk_op.new_chunk(
+                None, shape=shape, index=(chunk_index + len(out_chunks), 0),
+                index_value=index_value, columns_value=out_df.columns_value,
+                dtypes=out_df.dtypes))
+        return out_chunks, row_offset
+
+    @classmethod
+    def tile(cls, op):
+        out_df = op.outputs[0]
+        paths = _list_files(op.path, storage_options=op.storage_options)
+
+        out_chunks = []
+        row_offset = 0
+        for path in paths:
+            chunks, row_offset = cls._tile_file(op, path, out_df, len(out_chunks), row_offset)
+            out_chunks.extend(chunks)
+
+        if len(out_chunks) == 0:
+            # all row groups are pruned
+            chunk_op = op.copy().reset_key()
+            chunk_op._path = None
+            out_chunks.append(chunk_op.new_chunk(
+                None, shape=(0, out_df.shape[1]), index=(0, 0),
+                index_value=out_df.index_value, columns_value=out_df.columns_value,
+                dtypes=out_df.dtypes))
+
+        new_op = op.copy()
+        nsplits = (tuple(c.shape[0] for c in out_chunks), (out_df.shape[1],))
+        shape = (sum(nsplits[0]), out_df.shape[1])
+        return new_op.new_dataframes(None, shape, dtypes=out_df.dtypes,
+                                     index_value=out_df.index_value,
+                                     columns_value=out_df.columns_value,
+                                     chunks=out_chunks, nsplits=nsplits)
+
+    @classmethod
+    def execute(cls, ctx, op):
+        out_df = op.outputs[0]
+        if op.path is None:
+            ctx[out_df.key] = build_empty_df(out_df.dtypes)
+            return
+
+        index_columns = op.index_columns or []
+        columns = list(out_df.dtypes.index)
+        read_columns = None
+        if op.columns is not None:
+            read_columns = list(op.columns)
+            for col, _, _ in op.filters or []:
+                if col not in read_columns and col not in index_columns:
+                    read_columns.append(col)
+
+        read_kwargs = op.read_kwargs or dict()
+        with open_file(op.path, storage_options=op.storage_options) as f:
+            pf = pq.ParquetFile(f)
+            if op.row_group is not None:
+                table = pf.read_row_group(op.row_group, columns=read_columns,
+                                          use_pandas_metadata=True, **read_kwargs)
+            else:
+                table = pf.read(columns=read_columns, use_pandas_metadata=True, **read_kwargs)
+        df = table.to_pandas()
+        if not index_columns:
+            df.index = pd.RangeIndex(op.row_offset, op.row_offset + len(df))
+        if op.filters:
+            df = filter_dataframe(df, op.filters)
+        ctx[out_df.key] = df[columns]
+
+    def __call__(self, index_value=None, columns_value=None, dtypes=None):
+        shape = (np.nan, len(dtypes))
+        return self.new_dataframe(None, shape, dtypes=dtypes, index_value=index_value,
+                                  columns_value=columns_value)
+
+
+def read_parquet(path, engine='pyarrow', columns=None, filters=None, groups_as_chunks=True,
+                 storage_options=None, **kwargs):
+    """
+    Load a parquet object from the file path, returning a DataFrame.
+
+    Parameters
+    ----------
+    path : str or list of str
+        File path, directory path, path with wildcards or list of file paths.
+        When a directory is given, all files under it except those starting
+        with '_' or '.' are read.
+    engine : {'pyarrow'}, default 'pyarrow'
+        Parquet library to use.
+    columns : list, default None
+        If not None, only these columns will be read from the file.
+    filters : list of tuples, default None
+        Row filters in the form of ``[(column, op, value), ...]`` which are
+        combined with AND, op could be one of '==', '!=', '<', '<=', '>',
+        '>=', 'in' and 'not in'. Row groups which cannot satisfy the filters
+        according to the statistics in file footers are skipped.
+    groups_as_chunks : bool, default True
+        Generate a chunk for every row group if True, or for every file
+        otherwise.
+    storage_options : dict, optional
+        Options for storage connection.
+    **kwargs
+        Any additional kwargs are passed to the engine.
+
+    Returns
+    -------
+    DataFrame
+
+    See Also
+    --------
+    DataFrame.to_parquet : Write DataFrame to parquet files.
+
+    Examples
+    --------
+    >>> import mars.dataframe as md
+    >>> md.read_parquet('data.parquet')  # doctest: +SKIP
+    """
+    if engine != 'pyarrow':  # pragma: no cover
+        raise NotImplementedError('only support pyarrow engine for now')
+    filters = normalize_filters(filters)
+
+    # infer dtypes and index from the footer of the first file
+    file_path = _list_files(path, storage_options=storage_options)[0]
+    with open_file(file_path, storage_options=storage_options) as f:
+        schema = pq.ParquetFile(f).schema.to_arrow_schema()
+    index_columns = _get_index_columns(schema)
+    empty_df = schema.empty_table().to_pandas()
+    if columns is not None:
+        columns = list(columns)
+        empty_df = empty_df[columns]
+
+    if index_columns:
+        index_value = parse_index(empty_df.index, path)
+    else:
+        index_value = parse_index(pd.RangeIndex(-1), path)
+    columns_value = parse_index(empty_df.columns, store_data=True)
+    op = DataFrameReadParquet(path=path, engine=engine, columns=columns, filters=filters,
+                              groups_as_chunks=groups_as_chunks, read_kwargs=kwargs,
+                              storage_options=storage_options, index_columns=index_columns)
+    return op(index_value=index_value, columns_value=columns_value, dtypes=empty_df.dtypes)
@@ -24,7 +24,7 @@ from ...serialize import StringField, AnyField, BoolField, \
     ListField, Int64Field, Float64Field, BytesField
 from ...tensor.utils import normalize_chunk_sizes
 from ..operands import DataFrameOperand, DataFrameOperandMixin, ObjectType
-from ..utils import parse_index
+from ..utils import parse_index, standardize_range_index
 
 
 class DataFrameReadSQLTable(DataFrameOperand, DataFrameOperandMixin):
@@ -41,18 +41,32 @@ class DataFrameReadSQLTable(DataFrameOperand, DataFrameOperandMixin):
     _engine_kwargs = BytesField('engine_kwargs', on_serialize=cloudpickle.dumps,
                                 on_deserialize=cloudpickle.loads)
     _row_memory_usage = Float64Field('row_memory_usage')
+    _partition_col = StringField('partition_col')
+    _num_partitions = Int64Field('num_partitions')
+    _partition_method = StringField('partition_method')
+    _low_limit = AnyField('low_limit')
+    _high_limit = AnyField('high_limit')
+    _filters = ListField('filters')
     # for chunks
     _offset = Int64Field('offset')
+    _left_end = AnyField('left_end')
+    _right_end = AnyField('right_end')
 
     def __init__(self, table_name=None, con=None, schema=None, index_col=None,
                  coerce_float=None, parse_dates=None, columns=None, chunksize=None,
-                 engine_kwargs=None, row_memory_usage=None, offset=None,
-                 object_type=None, gpu=None, **kw):
+                 engine_kwargs=None, row_memory_usage=None, partition_col=None,
+                 num_partitions=None, partition_method=None, low_limit=None,
+                 high_limit=None, filters=None, offset=None, left_end=None,
+                 right_end=None, object_type=None, gpu=None, **kw):
         super().__init__(_table_name=table_name, _con=con, _schema=schema,
                          _index_col=index_col, _coerce_float=coerce_float,
                          _parse_dates=parse_dates, _columns=columns, _chunksize=chunksize,
                          _engine_kwargs=engine_kwargs, _row_memory_usage=row_memory_usage,
-                         _offset=offset, _object_type=object_type, _gpu=gpu, **kw)
+                         _partition_col=partition_col, _num_partitions=num_partitions,
+                         _partition_method=partition_method, _low_limit=low_limit,
+                         _high_limit=high_limit, _filters=filters, _offset=offset,
+                         _left_end=left_end, _right_end=right_end,
+                         _object_type=object_type, _gpu=gpu, **kw)
         if self._object_type is None:
             self._object_type = ObjectType.dataframe
 
@@ -96,10 +110,54 @@ class DataFrameReadSQLTable(DataFrameOperand, DataFrameOperandMixin):
     def row_memory_usage(self):
         return self._row_memory_usage
 
+    @property
+    def partition_col(self):
+        return self._partition_col
+
+    @property
+    def num_partitions(self):
+        return self._num_partitions
+
+    @property
+    def partition_method(self):
+        return self._partition_method
+
+    @property
+    def low_limit(self):
+        return self._low_limit
+
+    @property
+    def high_limit(self):
+        return self._high_limit
+
+    @property
+    def filters(self):
+        return self._filters
+
     @property
     def offset(self):
         return self._offset
 
+    @property
+    def left_end(self):
+        return self._left_end
+
+    @property
+    def right_end(self):
+        return self._right_end
+
+    def get_columns(self):
+        return self._columns
+
+    def set_pruned_columns(self, columns):
+        self._columns = columns
+
+    def get_filters(self):
+        return self._filters
+
+    def set_pushed_filters(self, filters):
+        self._filters = filters
+
     def _collect_info(self, engine_or_conn, table, columns, test_rows):
         from sqlalchemy import sql
 
@@ -200,6 +258,21 @@ class DataFrameReadSQLTable(DataFrameOperand, DataFrameOperandMixin):
 
             test_df, shape = self._collect_info(con, table, sa_columns, test_rows)
 
+            if self._partition_col is not None:
+                if not isinstance(self._partition_col, str):
+                    self._partition_col = self._partition_col.name
+                # make sure partition column exists
+                partition_col = table.columns[self._partition_col]
+                if self._partition_method == 'range' and not isinstance(
+                        partition_col.type, (sa.types.Integer, sa.types.Numeric,
+                                             sa.types.Date, sa.types.DateTime)):
+                    raise TypeError('partition_col should be of numeric or datetime type '
+                                    'when partition_method is "range", got column {} '
+                                    'of type {}'.format(self._partition_col, partition_col.type))
+                if self._num_partitions is None:
+                    self._num_partitions = len(self._get_row_chunk_sizes(
+                        shape, chunk_size, self._row_memory_usage))
+
             if isinstance(test_df.index, pd.RangeIndex):
                 index_value = parse_index(pd.RangeIndex(shape[0]))
             else:
@@ -211,13 +284,126 @@ class DataFrameReadSQLTable(DataFrameOperand, DataFrameOperandMixin):
                                       raw_chunk_size=chunk_size)
 
     @classmethod
-    def tile(cls, op):
+    def _get_row_chunk_sizes(cls, shape, chunk_size, row_memory_usage):
+        chunk_size = chunk_size or options.chunk_size
+        if chunk_size is None or (isinstance(chunk_size, str) and chunk_size == 'auto'):
+            chunk_size = (max(int(options.chunk_store_limit / row_memory_usage), 1), shape[1])
+        return normalize_chunk_sizes(shape, chunk_size)[0]
+
+    @classmethod
+    def _get_filter_conditions(cls, op, table):
+        import sqlalchemy as sa
+
+        conditions = []
+        for col, filter_op, val in op.filters or []:
+            column = table.columns[col]
+            if filter_op in ('==', '='):
+                cond = column == val
+            elif filter_op == '!=':
+                # keep consistent with pandas that NaN != val is True
+                cond = sa.or_(column != val, column.is_(None))
+            elif filter_op == '<':
+                cond = column < val
+            elif filter_op == '<=':
+                cond = column <= val
+            elif filter_op == '>':
+                cond = column > val
+            elif filter_op == '>=':
+                cond = column >= val
+            elif filter_op == 'in':
+                cond = column.in_(list(val))
+            else:
+                cond = sa.or_(~column.in_(list(val)), column.is_(None))
+            conditions.append(cond)
+        return conditions
+
+    @classmethod
+    def _get_partition_bounds(cls, op, engine, table):
+        """
+        Get the inner bounds of partitions, partition `i` holds the rows
+        whose partition column lies in ``[bounds[i - 1], bounds[i])``.
+        """
+        import sqlalchemy as sa
+
+        col = table.columns[op.partition_col]
+        conditions = cls._get_filter_conditions(op, table)
+        num_partitions = op.num_partitions
+
+        if op.partition_method == 'quantile':
+            # the min value of each bucket which holds nearly same number of rows
+            bucket = sa.func.ntile(num_partitions).over(order_by=col).label('bucket')
+            sub = sa.select([col.label('value'), bucket]) \
+                .where(sa.and_(col.isnot(None), *conditions)).alias()
+            min_value = sa.func.min(sub.c.value)
+            query = sa.select([min_value]).group_by(sub.c.bucket).order_by(min_value)
+            mins = [r[0] for r in engine.execute(query)]
+            return sorted(set(m for m in mins[1:] if m > mins[0]))
+
+        low, high = op.low_limit, op.high_limit
+        if low is None or high is None:
+            query = sa.select([sa.func.min(col), sa.func.max(col)])
+            if conditions:
+                query = query.where(sa.and_(*conditions))
+            min_value, max_value = list(engine.execute(query))[0]
+            low = min_value if low is None else low
+            high = max_value if high is None else high
+        if low is None or high is None or not low < high:
+            # empty table
+            return []
+        bounds = []
+        for i in range(1, num_partitions):
+            if isinstance(low, int) and isinstance(high, int):
+                bound = low + (high - low) * i // num_partitions
+            else:
+                bound = low + (high - low) * i / num_partitions
+            if len(bounds) == 0 or bound > bounds[-1]:
+                bounds.append(bound)
+        return bounds
+
+    @classmethod
+    def _query_size(cls, op, engine, table):
+        import sqlalchemy as sa
+
+        query = sa.select([sa.func.count()]).select_from(table)
+        conditions = cls._get_filter_conditions(op, table)
+        if conditions:
+            query = query.where(sa.and_(*conditions))
+        return list(engine.execute(query))[0][0]
+
+    @classmethod
+    def _tile_partitioned(cls, op, engine, table):
         df = op.outputs[0]
+        bounds = cls._get_partition_bounds(op, engine, table)
+        ends = [None] + bounds + [None]
+
+        out_chunks = []
+        for i in range(len(ends) - 1):
+            chunk_op = op.copy().reset_key()
+            chunk_op._row_memory_usage = None  # no need for chunk
+            chunk_op._left_end = ends[i]
+            chunk_op._right_end = ends[i + 1]
+            index_value = parse_index(df.index_value.to_pandas()[:0], op.table_name,
+                                      op.con, op.filters, ends[i], ends[i + 1])
+            out_chunk = chunk_op.new_chunk(None, shape=(np.nan, df.shape[1]),
+                                           columns_value=df.columns_value,
+                                           index_value=index_value, dtypes=df.dtypes,
+                                           index=(i, 0))
+            out_chunks.append(out_chunk)
+
+        if op.index_col is None:
+            # generate RangeIndex according to the real size of partitions
+            out_chunks = standardize_range_index(out_chunks)
 
-        chunk_size = df.extra_params.raw_chunk_size or options.chunk_size
-        if chunk_size is None:
-            chunk_size = (int(options.chunk_store_limit / op.row_memory_usage), df.shape[1])
-        row_chunk_sizes = normalize_chunk_sizes(df.shape, chunk_size)[0]
+        nsplits = ((np.nan,) * len(out_chunks), (df.shape[1],))
+        new_op = op.copy()
+        return new_op.new_dataframes(None, chunks=out_chunks, nsplits=nsplits,
+                                     **df.params)
+
+    @classmethod
+    def _tile_offset(cls, op, shape):
+        df = op.outputs[0]
+        row_chunk_sizes = cls._get_row_chunk_sizes(
+            shape, df.extra_params.raw_chunk_size, op.row_memory_usage)
         offsets = np.cumsum((0,) + row_chunk_sizes)
 
         out_chunks = []
@@ -231,7 +417,7 @@ class DataFrameReadSQLTable(DataFrameOperand, DataFrameOperandMixin):
                     df.index_value.to_pandas()[offset: offsets[i + 1]])
             else:
                 index_value = parse_index(df.index_value.to_pandas(),
-                                          op.table_name, op.con, i, row_size)
+                                          op.table_name, op.con, op.filters, i, row_size)
             out_chunk = chunk_op.new_chunk(None, shape=(row_size, df.shape[1]),
                                            columns_value=df.columns_value,
                                            index_value=index_value, dtypes=df.dtypes,
@@ -240,20 +426,45 @@ class DataFrameReadSQLTable(DataFrameOperand, DataFrameOperandMixin):
 
         nsplits = (row_chunk_sizes, (df.shape[1],))
         new_op = op.copy()
+        params = df.params
+        params['shape'] = shape
         return new_op.new_dataframes(None, chunks=out_chunks, nsplits=nsplits,
-                                     **df.params)
+                                     **params)
 
     @classmethod
-    def execute(cls, ctx, op):
+    @contextmanager
+    def _connect_table(cls, op):
         import sqlalchemy as sa
 
-        out = op.outputs[0]
-
         engine = sa.create_engine(op.con, **(op.engine_kwargs or dict()))
         try:
             table = sa.Table(op.table_name, sa.MetaData(), autoload=True,
                              autoload_with=engine, schema=op.schema)
+            yield engine, table
+        finally:
+            engine.dispose()
+
+    @classmethod
+    def tile(cls, op):
+        df = op.outputs[0]
+        if op.partition_col is None and not np.isnan(df.shape[0]):
+            return cls._tile_offset(op, df.shape)
+
+        with cls._connect_table(op) as (engine, table):
+            if op.partition_col is not None:
+                return cls._tile_partitioned(op, engine, table)
+            else:
+                # filters pushed down, the size need to be queried
+                shape = (cls._query_size(op, engine, table), df.shape[1])
+                return cls._tile_offset(op, shape)
 
+    @classmethod
+    def execute(cls, ctx, op):
+        import sqlalchemy as sa
+
+        out = op.outputs[0]
+
+        with cls._connect_table(op) as (engine, table):
             columns = [table.columns[col] for col in op.columns]
             column_names = set(op.columns)
             if op.index_col:
@@ -262,34 +473,52 @@ class DataFrameReadSQLTable(DataFrameOperand, DataFrameOperandMixin):
                         columns.append(table.columns[icol])
 
             query = sa.sql.select(columns)
+            conditions = cls._get_filter_conditions(op, table)
+            order_by = []
+            if op.partition_col is not None:
+                partition_col = table.columns[op.partition_col]
+                range_conditions = []
+                if op.left_end is not None:
+                    range_conditions.append(partition_col >= op.left_end)
+                if op.right_end is not None:
+                    range_conditions.append(partition_col < op.right_end)
+                if op.left_end is None and op.right_end is not None:
+                    # the first partition takes the rows of NULL as well
+                    range_conditions = [sa.or_(partition_col.is_(None), *range_conditions)]
+                conditions.extend(range_conditions)
+                order_by.append(partition_col)
+            if conditions:
+                query = query.where(sa.and_(*conditions))
+
             if len(table.primary_key) > 0:
                 # if table has primary key, sort as the order
-                query = query.order_by(*list(table.primary_key))
+                order_by.extend(table.primary_key)
             elif op.index_col:
                 # if no primary key, sort as the index_col
-                query = query.order_by(
-                    *[table.columns[col] for col in op.index_col])
+                order_by.extend(table.columns[col] for col in op.index_col)
             else:
                 # at last, we sort by all the columns
-                query = query.order_by(*columns)
-            query = query.limit(out.shape[0])
-            if op.offset > 0:
-                query = query.offset(op.offset)
+                order_by.extend(columns)
+            query = query.order_by(*order_by)
+            if op.partition_col is None:
+                query = query.limit(out.shape[0])
+                if op.offset > 0:
+                    query = query.offset(op.offset)
 
             df = pd.read_sql(query, engine, index_col=op.index_col,
                              coerce_float=op.coerce_float,
                              parse_dates=op.parse_dates,
                              chunksize=op.chunksize)
-            if op.index_col is None and op.offset > 0:
+            if op.index_col is None and op.offset:
                 df.index = pd.RangeIndex(op.offset, op.offset + out.shape[0])
             ctx[out.key] = df
-        finally:
-            engine.dispose()
 
 
 def read_sql_table(table_name, con, schema=None, index_col=None, coerce_float=True,
                    parse_dates=None, columns=None, chunksize=None,
-                   test_rows=5, chunk_size=None, engine_kwargs=None):
+                   partition_col=None, num_partitions=None, partition_method='range',
+                   low_limit=None, high_limit=None, test_rows=5, chunk_size=None,
+                   engine_kwargs=None):
     """
     Read SQL database table into a DataFrame.
 
@@ -325,6 +554,26 @@ def read_sql_table(table_name, con, schema=None, index_col=None, coerce_float=Tr
     chunksize : int, default None
         If specified, returns an iterator where `chunksize` is the number of
         rows to include in each chunk.
+    partition_col : str, default None
+        Column used to split the table into partitions, each chunk reads
+        the rows whose value of the column lies in a range via ``WHERE``
+        clause instead of ``LIMIT`` and ``OFFSET``, which avoids scanning
+        the skipped rows repeatedly. An indexed column is recommended.
+    num_partitions : int, default None
+        Number of partitions, if not specified, will be decided by
+        `chunk_size` and the size of table.
+    partition_method : {'range', 'quantile'}, default 'range'
+        - 'range': split ``[low_limit, high_limit]`` evenly, the limits
+          are queried via ``MIN`` and ``MAX`` if not specified.
+        - 'quantile': split by the quantiles of `partition_col` queried
+          via window function ``NTILE``, which is more balanced for
+          skewed data but requires a full scan of the column.
+    low_limit : default None
+        Lower limit of `partition_col` when `partition_method` is 'range',
+        rows less than it will be read by the first partition.
+    high_limit : default None
+        Upper limit of `partition_col` when `partition_method` is 'range',
+        rows greater than it will be read by the last partition.
     test_rows: int, default 5
         The number of rows to fetch for inferring dtypes.
     chunk_size: : int or tuple of ints, optional
@@ -353,8 +602,14 @@ def read_sql_table(table_name, con, schema=None, index_col=None, coerce_float=Tr
     >>> md.read_sql_table('table_name', 'postgres:///db_name')  # doctest:+SKIP
     """
 
+    if partition_method not in ('range', 'quantile'):
+        raise ValueError('partition_method should be one of "range" and "quantile", '
+                         'got {}'.format(partition_method))
     op = DataFrameReadSQLTable(table_name=table_name, con=con, schema=schema,
                                index_col=index_col, coerce_float=coerce_float,
                                parse_dates=parse_dates, columns=columns,
-                               chunksize=chunksize, engine_kwargs=engine_kwargs)
+                               chunksize=chunksize, partition_col=partition_col,
+                               num_partitions=num_partitions, partition_method=partition_method,
+                               low_limit=low_limit, high_limit=high_limit,
+                               engine_kwargs=engine_kwargs)
     return op(test_rows, chunk_size)
@@ -33,6 +33,7 @@ from mars.dataframe.datasource.from_tensor import dataframe_from_tensor, \
     series_from_tensor, dataframe_from_1d_tileables
 from mars.dataframe.datasource.from_records import from_records
 from mars.dataframe.datasource.read_csv import read_csv, DataFrameReadCSV
+from mars.dataframe.datasource.read_parquet import read_parquet, DataFrameReadParquet
 from mars.dataframe.datasource.read_sql_table import read_sql_table, DataFrameReadSQLTable
 from mars.dataframe.datasource.date_range import date_range
 
@@ -525,6 +526,42 @@ class Test(TestBase):
         finally:
             shutil.rmtree(tempdir)
 
+    def testReadParquet(self):
+        test_df = pd.DataFrame({'a': np.arange(10).astype(np.int64, copy=False),
+                                'b': ['s%d' % i for i in range(10)],
+                                'c': np.random.rand(10)},
+                               index=pd.Index(np.arange(10, 20), name='idx'))
+
+        with tempfile.TemporaryDirectory() as d:
+            file_path = os.path.join(d, 'test.parquet')
+            test_df.to_parquet(file_path, row_group_size=4)
+
+            df = read_parquet(file_path)
+            self.assertIsInstance(df.op, DataFrameReadParquet)
+            pd.testing.assert_series_equal(df.dtypes, test_df.dtypes)
+
+            df = df.tiles()
+            # one chunk per row group
+            self.assertEqual(df.nsplits, ((4, 4, 2), (3,)))
+            self.assertEqual(df.chunks[0].index_value.min_val, 10)
+            self.assertEqual(df.chunks[0].index_value.max_val, 13)
+            self.assertEqual(df.chunks[2].index_value.min_val, 18)
+            self.assertEqual(df.chunks[2].index_value.max_val, 19)
+
+            df = read_parquet(file_path, groups_as_chunks=False).tiles()
+            self.assertEqual(df.nsplits, ((10,), (3,)))
+
+            # row groups are skipped according to statistics
+            df = read_parquet(file_path, filters=[('a', '>=', 5)]).tiles()
+            self.assertEqual(len(df.chunks), 2)
+            self.assertEqual([c.op.row_group for c in df.chunks], [1, 2])
+
+            df = read_parquet(file_path, columns=['b'])
+            self.assertEqual(list(df.dtypes.index), ['b'])
+
+            with self.assertRaises(ValueError):
+                read_parquet(file_path, filters=[('a', '~', 5)])
+
     def testReadSQLTable(self):
         test_df = pd.DataFrame({'a': np.arange(10).astype(np.int64, copy=False),
                                 'b': ['s%d' % i for i in range(10)]})
@@ -551,6 +588,33 @@ class Test(TestBase):
                 read_sql_table(table_name, uri, chunk_size=4,
                                index_col=b'a')
 
+            # test partition
+            df = read_sql_table(table_name, uri, partition_col='a', num_partitions=3)
+            self.assertEqual(df.shape, test_df.shape)
+
+            df = df.tiles()
+            self.assertEqual(len(df.chunks), 3)
+            self.assertTrue(all(np.isnan(s) for s in df.nsplits[0]))
+            self.assertEqual([(c.inputs[-1].op.left_end, c.inputs[-1].op.right_end)
+                              for c in df.chunks], [(None, 3), (3, 6), (6, None)])
+
+            df = read_sql_table(table_name, uri, partition_col='a', chunk_size=4,
+                                low_limit=2, high_limit=6).tiles()
+            self.assertEqual([(c.inputs[-1].op.left_end, c.inputs[-1].op.right_end)
+                              for c in df.chunks], [(None, 3), (3, 4), (4, None)])
+
+            df = read_sql_table(table_name, uri, partition_col='b', num_partitions=3,
+                                partition_method='quantile').tiles()
+            self.assertEqual(len(df.chunks), 3)
+
+            with self.assertRaises(KeyError):
+                read_sql_table(table_name, uri, partition_col='x')
+            with self.assertRaises(TypeError):
+                read_sql_table(table_name, uri, partition_col='b')
+            with self.assertRaises(ValueError):
+                read_sql_table(table_name, uri, partition_col='a',
+                               partition_method='unknown')
+
     def testDateRange(self):
         with self.assertRaises(TypeError):
             _ = date_range('2020-1-1', periods='2')
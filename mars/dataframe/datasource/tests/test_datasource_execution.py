@@ -23,6 +23,7 @@ import pandas as pd
 
 import mars.tensor as mt
 import mars.dataframe as md
+from mars.config import option_context
 from mars.session import new_session
 from mars.tests.core import TestBase, require_cudf, ExecutorForTest
 from mars.dataframe.datasource.dataframe import from_pandas as from_pandas_df
@@ -51,6 +52,27 @@ class Test(TestBase):
         result = self.executor.execute_dataframe(series, concat=True)[0]
         pd.testing.assert_series_equal(ps, result)
 
+    def testAutoChunkSizeExecution(self):
+        pdf = pd.DataFrame(np.random.rand(20, 3), columns=list('abc'))
+
+        with option_context({'chunk_size': 'auto', 'chunk_store_limit': 8 * 8}):
+            df = from_pandas_df(pdf)
+            result = self.executor.execute_dataframe(df, concat=True)[0]
+            pd.testing.assert_frame_equal(pdf, result)
+            self.assertGreater(len(df.tiles().chunks), 1)
+
+            result = self.executor.execute_tensor(from_pandas_df(pdf).to_tensor(), concat=True)[0]
+            np.testing.assert_array_equal(pdf.values, result)
+
+            series = from_pandas_series(pdf['a'])
+            result = self.executor.execute_dataframe(series, concat=True)[0]
+            pd.testing.assert_series_equal(pdf['a'], result)
+            self.assertGreater(len(series.tiles().chunks), 1)
+
+            index = from_pandas_index(pdf.index)
+            result = self.executor.execute_dataframe(index, concat=True)[0]
+            pd.testing.assert_index_equal(pdf.index, result)
+
     def testFromPandasIndexExecution(self):
         pd_index = pd.timedelta_range('1 days', periods=10)
         index = from_pandas_index(pd_index, chunk_size=7)
@@ -411,6 +433,94 @@ class Test(TestBase):
         finally:
             shutil.rmtree(tempdir)
 
+    def testReadCSVArrowEngineExecution(self):
+        tempdir = tempfile.mkdtemp()
+        file_path = os.path.join(tempdir, 'test.csv')
+        try:
+            df = pd.DataFrame({
+                'col1': np.random.rand(100),
+                'col2': np.random.choice(['a', 'b', 'c'], (100,)),
+                'col3': np.arange(100)
+            })
+            df.to_csv(file_path)
+
+            pdf = pd.read_csv(file_path, index_col=0)
+            mdf = self.executor.execute_dataframe(
+                md.read_csv(file_path, index_col=0, engine='arrow'), concat=True)[0]
+            pd.testing.assert_frame_equal(pdf, mdf)
+
+            mdf2 = self.executor.execute_dataframe(
+                md.read_csv(file_path, index_col=0, engine='arrow', chunk_bytes=100), concat=True)[0]
+            pd.testing.assert_frame_equal(pdf, mdf2)
+
+            # test missing value
+            df.loc[[1, 50], 'col2'] = np.nan
+            df.to_csv(file_path, index=False)
+
+            pdf = pd.read_csv(file_path)
+            mdf = new_session().run(
+                md.read_csv(file_path, engine='arrow', sort_range_index=True, chunk_bytes=100))
+            pd.testing.assert_frame_equal(pdf, mdf)
+        finally:
+            shutil.rmtree(tempdir)
+
+    def testReadBGZFCSVExecution(self):
+        import gzip
+        import struct
+        import zlib
+
+        def _bgzf_compress(data):
+            compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+            deflated = compressor.compress(data) + compressor.flush()
+            # header with the `BC` extra subfield storing block size - 1
+            block_size = 18 + len(deflated) + 8
+            header = b'\x1f\x8b\x08\x04' + b'\x00' * 4 + b'\x00\xff' + struct.pack('<H', 6) \
+                + b'BC' + struct.pack('<HH', 2, block_size - 1)
+            return header + deflated + struct.pack('<II', zlib.crc32(data) & 0xffffffff, len(data))
+
+        tempdir = tempfile.mkdtemp()
+        file_path = os.path.join(tempdir, 'test.csv.gz')
+        gzip_file_path = os.path.join(tempdir, 'test_members.csv.gz')
+        try:
+            df = pd.DataFrame({
+                'col1': np.random.rand(300),
+                'col2': np.random.choice(['a', 'b', 'c'], (300,)),
+                'col3': np.arange(300)
+            })
+            content = df.to_csv().encode()
+            # split into blocks at arbitrary positions, lines straddle block boundaries
+            with open(file_path, 'wb') as f:
+                for i in range(0, len(content), 500):
+                    f.write(_bgzf_compress(content[i: i + 500]))
+                # BGZF end-of-file marker
+                f.write(_bgzf_compress(b''))
+
+            pdf = pd.read_csv(file_path, compression='gzip', index_col=0)
+            r = md.read_csv(file_path, compression='gzip', index_col=0, chunk_bytes=1000)
+            self.assertGreater(len(r.tiles().chunks), 1)
+            mdf = self.executor.execute_dataframe(
+                md.read_csv(file_path, compression='gzip', index_col=0, chunk_bytes=1000),
+                concat=True)[0]
+            pd.testing.assert_frame_equal(pdf, mdf)
+
+            mdf2 = self.executor.execute_dataframe(
+                md.read_csv(file_path, compression='gzip', index_col=0, chunk_bytes=1000,
+                            engine='arrow'), concat=True)[0]
+            pd.testing.assert_frame_equal(pdf, mdf2)
+
+            # ordinary multi-member gzip files are not scanned and read as a single chunk
+            with open(gzip_file_path, 'wb') as f:
+                for i in range(0, len(content), 500):
+                    f.write(gzip.compress(content[i: i + 500]))
+            r = md.read_csv(gzip_file_path, compression='gzip', index_col=0, chunk_bytes=1000)
+            self.assertEqual(len(r.tiles().chunks), 1)
+            mdf = self.executor.execute_dataframe(
+                md.read_csv(gzip_file_path, compression='gzip', index_col=0, chunk_bytes=1000),
+                concat=True)[0]
+            pd.testing.assert_frame_equal(pdf, mdf)
+        finally:
+            shutil.rmtree(tempdir)
+
     @require_cudf
     def testReadCSVGPUExecution(self):
         tempdir = tempfile.mkdtemp()
@@ -453,6 +563,53 @@ class Test(TestBase):
         finally:
             shutil.rmtree(tempdir)
 
+    def testReadParquetExecution(self):
+        test_df = pd.DataFrame({'a': np.arange(10).astype(np.int64, copy=False),
+                                'b': ['s%d' % i for i in range(10)],
+                                'c': np.random.rand(10)})
+        test_df2 = pd.DataFrame({'a': np.arange(10).astype(np.int64, copy=False),
+                                 'b': ['s%d' % i for i in range(10)],
+                                 'c': np.random.rand(10)},
+                                index=pd.Index(np.arange(10, 20), name='idx'))
+
+        with tempfile.TemporaryDirectory() as d:
+            file_path = os.path.join(d, 'test.parquet')
+            test_df.to_parquet(file_path, row_group_size=3)
+
+            r = md.read_parquet(file_path)
+            result = self.executor.execute_dataframe(r, concat=True)[0]
+            pd.testing.assert_frame_equal(result, test_df)
+
+            r = md.read_parquet(file_path, columns=['a', 'c'])
+            result = self.executor.execute_dataframe(r, concat=True)[0]
+            pd.testing.assert_frame_equal(result, test_df[['a', 'c']])
+
+            r = md.read_parquet(file_path, columns=['c'], filters=[('a', '>', 4), ('b', '!=', 's7')])
+            result = self.executor.execute_dataframe(r, concat=True)[0]
+            expected = test_df[(test_df['a'] > 4) & (test_df['b'] != 's7')][['c']]
+            pd.testing.assert_frame_equal(result, expected)
+
+            file_path2 = os.path.join(d, 'test2.parquet')
+            test_df2.to_parquet(file_path2, row_group_size=3)
+
+            r = md.read_parquet(file_path2, filters=[('idx', 'in', [11, 17])])
+            result = self.executor.execute_dataframe(r, concat=True)[0]
+            pd.testing.assert_frame_equal(result, test_df2.loc[[11, 17]])
+
+        # test multiple files
+        with tempfile.TemporaryDirectory() as d:
+            for i in range(3):
+                test_df.iloc[i * 4: (i + 1) * 4].to_parquet(
+                    os.path.join(d, 'part-{}.parquet'.format(i)), index=False)
+
+            r = md.read_parquet(d)
+            result = self.executor.execute_dataframe(r, concat=True)[0]
+            pd.testing.assert_frame_equal(result, test_df)
+
+            r = md.read_parquet(os.path.join(d, '*.parquet'), groups_as_chunks=False)
+            result = self.executor.execute_dataframe(r, concat=True)[0]
+            pd.testing.assert_frame_equal(result, test_df)
+
     def testReadSQLTableExecution(self):
         import sqlalchemy as sa
 
@@ -514,6 +671,22 @@ class Test(TestBase):
                 r = md.read_sql_table(table_name2, engine, chunk_size=4, index_col='id')
                 result = self.executor.execute_dataframe(r, concat=True)[0]
                 pd.testing.assert_frame_equal(result, test_df)
+
+                # test partition
+                r = md.read_sql_table(table_name2, engine, index_col='id',
+                                      partition_col='a', num_partitions=3)
+                result = self.executor.execute_dataframe(r, concat=True)[0]
+                pd.testing.assert_frame_equal(result, test_df)
+
+                r = md.read_sql_table(table_name2, engine, index_col='id',
+                                      partition_col='c', num_partitions=3,
+                                      partition_method='quantile')
+                result = self.executor.execute_dataframe(r, concat=True)[0]
+                pd.testing.assert_frame_equal(result, test_df.sort_values('c'))
+
+                r = md.read_sql_table(table_name, uri, partition_col='a', chunk_size=3)
+                result = self.executor.execute_dataframe(r, concat=True)[0]
+                pd.testing.assert_frame_equal(result, test_df.reset_index(drop=True))
             finally:
                 engine.dispose()
 
@@ -15,11 +15,13 @@
 
 def _install():
     from .to_csv import to_csv
+    from .to_parquet import to_parquet
     from .to_vineyard import to_vineyard
     from ..operands import DATAFRAME_TYPE
 
     for cls in DATAFRAME_TYPE:
         setattr(cls, 'to_csv', to_csv)
+        setattr(cls, 'to_parquet', to_parquet)
         setattr(cls, 'to_vineyard', to_vineyard)
 
 
@@ -18,6 +18,7 @@ import numpy as np
 import pandas as pd
 
 from mars.dataframe import DataFrame
+from mars.operands import OperandStage
 
 
 class Test(unittest.TestCase):
@@ -42,3 +43,33 @@ class Test(unittest.TestCase):
             self.assertEqual(len(c.inputs), 2)
             self.assertIs(c.inputs[0].inputs[0], r.inputs[0].chunks[i].data)
             self.assertEqual(type(c.inputs[1].op).__name__, 'DataFrameToCSVStat')
+
+    def testToCSVWithManifest(self):
+        raw = pd.DataFrame({'a': np.random.rand(10), 'b': np.random.randint(3, size=10)})
+        df = DataFrame(raw, chunk_size=4)
+
+        r = df.to_csv('out_dir', partition_cols=['b'])
+        self.assertTrue(r.op.manifest)
+        self.assertIsNone(r.op.compression)
+        r = r.tiles()
+
+        self.assertEqual(r.nsplits, ((0,), (0,)))
+        self.assertEqual(len(r.chunks), 1)
+        manifest_chunk = r.chunks[0]
+        self.assertEqual(manifest_chunk.op.stage, OperandStage.reduce)
+        self.assertEqual(len(manifest_chunk.inputs), 3)
+        for i, c in enumerate(manifest_chunk.inputs):
+            self.assertEqual(c.op.stage, OperandStage.map)
+            self.assertIs(c.inputs[0], r.inputs[0].chunks[i].data)
+
+        r = df.to_csv('out-*.csv.gz', manifest=True)
+        self.assertEqual(r.op.compression, 'gzip')
+
+        with self.assertRaises(ValueError):
+            df.to_csv('out-*.csv', partition_cols=['b'])
+        with self.assertRaises(ValueError):
+            df.to_csv('out.csv', manifest=True)
+        with self.assertRaises(ValueError):
+            df.to_csv('out-*.csv.bz2', manifest=True)
+        with self.assertRaises(KeyError):
+            df.to_csv('out_dir', partition_cols=['c'])
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import os
 import tempfile
 import unittest
@@ -22,9 +23,12 @@ import pandas as pd
 import mars.dataframe as md
 from mars.config import option_context
 from mars.dataframe import DataFrame
+from mars.dataframe.datasource.read_csv import DataFrameReadCSV
 from mars.deploy.local.core import new_cluster
 from mars.session import new_session
+from mars.optimizes.tileable_graph.core import tileable_optimized
 from mars.tests.core import mock, TestBase, ExecutorForTest
+from mars.tiles import get_tiled
 
 try:
     import vineyard
@@ -70,6 +74,123 @@ class Test(TestBase):
             pd.testing.assert_frame_equal(result, raw)
             pd.testing.assert_frame_equal(dfs[1].set_index('index'), raw.iloc[33: 66])
 
+    def testToCSVWithManifestExecution(self):
+        raw = pd.DataFrame({
+            'col1': np.random.rand(100),
+            'col2': np.random.choice(['a', 'b/c', 'c'], (100,)),
+            'col3': np.arange(100),
+            'col4': np.random.randint(0, 2, (100,)),
+        })
+        # missing values are written into the default partition
+        raw.loc[raw.col2 == 'c', 'col2'] = np.nan
+        df = DataFrame(raw, chunk_size=33)
+
+        with tempfile.TemporaryDirectory() as base_path:
+            # test partitioned
+            path = os.path.join(base_path, 'out_dir')
+            r = df.to_csv(path, index=False, partition_cols=['col4', 'col2'],
+                          compression='gzip', chunksize=10)
+            self.executor.execute_dataframe(r)
+
+            with open(os.path.join(path, '_manifest.json')) as f:
+                manifest = json.load(f)
+            self.assertEqual(manifest['compression'], 'gzip')
+            self.assertEqual(manifest['partition_cols'], ['col4', 'col2'])
+            self.assertEqual(manifest['partition_dtypes'], {'col4': 'int64', 'col2': 'object'})
+            self.assertEqual(sum(e['rows'] for e in manifest['files']), 100)
+            for entry in manifest['files']:
+                file_path = os.path.join(path, entry['path'])
+                self.assertEqual(os.path.getsize(file_path), entry['bytes'])
+                col2 = entry['partition']['col2']
+                escaped = {None: '__HIVE_DEFAULT_PARTITION__', 'b/c': 'b%2Fc'}.get(col2, col2)
+                expected_dir = 'col4={}/col2={}'.format(entry['partition']['col4'], escaped)
+                self.assertTrue(entry['path'].startswith(expected_dir + '/'))
+
+                part = pd.read_csv(file_path, compression='gzip')
+                self.assertEqual(list(part.columns), ['col1', 'col3'])
+                self.assertEqual(len(part), entry['rows'])
+
+            mdf = md.read_csv(path, chunk_bytes=1024)
+            result = self.executor.execute_dataframe(mdf, concat=True)[0]
+            self.assertEqual(list(result.columns), list(raw.columns[[0, 2, 3, 1]]))
+            result = result.sort_values('col3').reset_index(drop=True)
+            pd.testing.assert_frame_equal(result[raw.columns], raw)
+
+            # partitions can be skipped according to filters
+            mdf = md.read_csv(path)
+            mdf = mdf[(mdf.col4 == 1) & (mdf.col1 > 0.5)]
+            result = mdf.execute()
+            expected = raw[(raw.col4 == 1) & (raw.col1 > 0.5)]
+            pd.testing.assert_frame_equal(
+                result.sort_values('col3').reset_index(drop=True)[raw.columns],
+                expected.reset_index(drop=True))
+
+            source = get_tiled(tileable_optimized[mdf.data])
+            self.assertIsInstance(source.op, DataFrameReadCSV)
+            read_paths = set(c.op.path for c in source.chunks)
+            expected_paths = set(os.path.join(path, e['path']) for e in manifest['files']
+                                 if e['partition']['col4'] == 1)
+            self.assertEqual(read_paths, expected_paths)
+
+            # empty frames write a manifest without files
+            path = os.path.join(base_path, 'empty_dir')
+            r = df[df.col3 < 0].to_csv(path, index=False, partition_cols=['col4'])
+            self.executor.execute_dataframe(r)
+
+            with open(os.path.join(path, '_manifest.json')) as f:
+                manifest = json.load(f)
+            self.assertEqual(manifest['files'], [])
+
+            mdf = md.read_csv(path)
+            result = self.executor.execute_dataframe(mdf, concat=True)[0]
+            self.assertEqual(len(result), 0)
+            pd.testing.assert_series_equal(result.dtypes, raw.dtypes[['col1', 'col2', 'col3', 'col4']])
+
+            # test wildcard path with manifest
+            path = os.path.join(base_path, 'out-*.csv')
+            r = df.to_csv(path, index=False, manifest=True)
+            self.executor.execute_dataframe(r)
+
+            with open(os.path.join(base_path, '_manifest.json')) as f:
+                manifest = json.load(f)
+            self.assertEqual([e['path'] for e in manifest['files']],
+                             ['out-{}.csv'.format(i) for i in range(4)])
+            self.assertEqual([e['rows'] for e in manifest['files']], [33, 33, 33, 1])
+
+            mdf = md.read_csv(os.path.join(base_path, '_manifest.json'))
+            self.assertEqual(mdf.op.file_sizes, [e['bytes'] for e in manifest['files']])
+            result = self.executor.execute_dataframe(mdf, concat=True)[0]
+            pd.testing.assert_frame_equal(result.reset_index(drop=True), raw)
+
+    def testToParquetExecution(self):
+        raw = pd.DataFrame({
+            'col1': np.random.rand(100),
+            'col2': np.random.choice(['a', 'b', 'c'], (100,)),
+            'col3': np.arange(100)
+        })
+        df = DataFrame(raw, chunk_size=33)
+
+        with tempfile.TemporaryDirectory() as base_path:
+            # test wildcard
+            path = os.path.join(base_path, 'out-*.parquet')
+            r = df.to_parquet(path)
+            self.executor.execute_dataframe(r)
+
+            dfs = [pd.read_parquet(os.path.join(base_path, 'out-{}.parquet'.format(i)))
+                   for i in range(4)]
+            result = pd.concat(dfs, axis=0)
+            pd.testing.assert_frame_equal(result, raw)
+            pd.testing.assert_frame_equal(dfs[1], raw.iloc[33: 66])
+
+            # test directory
+            path = os.path.join(base_path, 'out_dir')
+            r = df.to_parquet(path, compression=None)
+            self.executor.execute_dataframe(r)
+
+            self.assertEqual(len(os.listdir(path)), 4)
+            result = self.executor.execute_dataframe(md.read_parquet(path), concat=True)[0]
+            pd.testing.assert_frame_equal(result, raw)
+
     @unittest.skipIf(vineyard is None, 'vineyard not installed')
     @mock.patch('webbrowser.open_new_tab', new=lambda *_, **__: True)
     def testToVineyard(self):
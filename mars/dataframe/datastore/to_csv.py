@@ -12,15 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+import json
+import os
 from io import StringIO
+from urllib.parse import quote
 
 import numpy as np
 import pandas as pd
+try:
+    import lz4
+    import lz4.frame
+except ImportError:  # pragma: no cover
+    lz4 = None
 
 from ... import opcodes as OperandDef
 from ...serialize import KeyField, AnyField, StringField, ListField, \
     BoolField, Int32Field, Int64Field, DictField
-from ...filesystem import open_file
+from ...filesystem import open_file, get_fs
 from ...operands import OperandStage
 from ...tensor.core import TensorOrder
 from ...tensor.operands import TensorOperand, TensorOperandMixin
@@ -28,9 +37,66 @@ from ..operands import DataFrameOperand, DataFrameOperandMixin, ObjectType
 from ..utils import parse_index
 
 
+MANIFEST_FILE_NAME = '_manifest.json'
+# value of partition directory for missing values, same as Hive
+HIVE_DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+# every batch of rows is compressed into a separate member or frame,
+# thus files can be written in a streaming way. Members and frames are
+# not indexed, so compressed files are still read back as a whole
+_compressors = {
+    'gzip': gzip.compress,
+}
+if lz4:
+    _compressors['lz4'] = lz4.frame.compress
+
+_compress_extensions = {
+    'gzip': '.gz',
+    'bz2': '.bz2',
+    'zip': '.zip',
+    'xz': '.xz',
+    'lz4': '.lz4',
+}
+
+
+def _escape_partition_value(value):
+    if pd.isna(value):
+        return HIVE_DEFAULT_PARTITION
+    return quote(str(value), safe='')
+
+
+def _to_json_value(value):
+    if pd.isna(value):
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _infer_compression(path, compression, partition_cols):
+    if isinstance(compression, dict):
+        compression = compression.get('method')
+    if compression == 'infer':
+        compression = None
+        if not partition_cols:
+            for method, ext in _compress_extensions.items():
+                if path.endswith(ext):
+                    compression = method
+                    break
+    if compression is not None and compression not in _compressors:
+        raise ValueError('compression should be one of {} when writing '
+                         'with manifest, got {}'.format(list(_compressors), compression))
+    return compression
+
+
 class DataFrameToCSV(DataFrameOperand, DataFrameOperandMixin):
     _op_type_ = OperandDef.TO_CSV
 
+    # rows written and compressed at a time when writing files with manifest
+    _write_batch_rows = 2 ** 16
+
     _input = KeyField('input')
     _path = AnyField('path')
     _sep = StringField('sep')
@@ -51,6 +117,8 @@ class DataFrameToCSV(DataFrameOperand, DataFrameOperandMixin):
     _doublequote = BoolField('doublequote')
     _escapechar = StringField('escapechar')
     _decimal = StringField('decimal')
+    _partition_cols = ListField('partition_cols')
+    _manifest = BoolField('manifest')
     _storage_options = DictField('storage_options')
     # for chunk
     _output_stat = BoolField('output_stat')
@@ -60,13 +128,14 @@ class DataFrameToCSV(DataFrameOperand, DataFrameOperandMixin):
                  mode=None, encoding=None, compression=None, quoting=None,
                  quotechar=None, line_terminator=None, chunksize=None, date_format=None,
                  doublequote=None, escapechar=None, decimal=None, output_stat=None,
-                 storage_options=None, stage=None, **kw):
+                 partition_cols=None, manifest=None, storage_options=None, stage=None, **kw):
         super().__init__(_path=path, _sep=sep, _na_rep=na_rep, _float_format=float_format,
                          _columns=columns, _header=header, _index=index, _index_label=index_label,
                          _mode=mode, _encoding=encoding, _compression=compression, _quoting=quoting,
                          _quotechar=quotechar, _line_terminator=line_terminator, _chunksize=chunksize,
                          _date_format=date_format, _doublequote=doublequote,
                          _escapechar=escapechar, _decimal=decimal, _output_stat=output_stat,
+                         _partition_cols=partition_cols, _manifest=manifest,
                          _object_type=ObjectType.dataframe, _storage_options=storage_options,
                          _stage=stage, **kw)
 
@@ -150,14 +219,22 @@ class DataFrameToCSV(DataFrameOperand, DataFrameOperandMixin):
     def decimal(self):
         return self._decimal
 
+    @property
+    def partition_cols(self):
+        return self._partition_cols
+
+    @property
+    def manifest(self):
+        return self._manifest
+
     @property
     def storage_options(self):
         return self._storage_options
 
     @property
     def one_file(self):
-        # if wildcard in path, write csv into multiple files
-        return '*' not in self._path
+        # if wildcard in path or partitioned, write csv into multiple files
+        return '*' not in self._path and not self._partition_cols
 
     @property
     def output_stat(self):
@@ -177,7 +254,10 @@ class DataFrameToCSV(DataFrameOperand, DataFrameOperandMixin):
         out_df = op.outputs[0]
 
         # make sure only 1 chunk on the column axis
-        in_df = in_df.rechunk({1: in_df.shape[1]})._inplace_tile()
+        if len(in_df.nsplits[1]) > 1:
+            in_df = in_df.rechunk({1: in_df.shape[1]})._inplace_tile()
+        if op.manifest:
+            return cls._tile_with_manifest(op, in_df)
         one_file = op.one_file
 
         out_chunks = [], []
@@ -237,6 +317,34 @@ class DataFrameToCSV(DataFrameOperand, DataFrameOperandMixin):
                                      chunks=out_chunks,
                                      nsplits=((0,) * in_df.chunk_shape[0], (0,)))
 
+    @classmethod
+    def _tile_with_manifest(cls, op, in_df):
+        out_df = op.outputs[0]
+
+        # every chunk writes its own files and outputs the written files
+        write_chunks = []
+        for chunk in in_df.chunks:
+            chunk_op = op.copy().reset_key()
+            chunk_op._stage = OperandStage.map
+            write_chunks.append(chunk_op.new_chunk(
+                [chunk], shape=(), dtype=np.dtype(object), index=chunk.index,
+                order=TensorOrder.C_ORDER, object_type=ObjectType.scalar))
+
+        manifest_op = DataFrameToCSV(stage=OperandStage.reduce, path=op.path,
+                                     compression=op.compression,
+                                     partition_cols=op.partition_cols, manifest=True,
+                                     storage_options=op.storage_options)
+        manifest_chunk = manifest_op.new_chunk(
+            write_chunks, shape=(0, 0), dtypes=out_df.dtypes,
+            index_value=out_df.index_value, columns_value=out_df.columns_value,
+            index=(0, 0))
+
+        new_op = op.copy()
+        return new_op.new_dataframes([in_df], shape=(0, 0), dtypes=in_df.dtypes,
+                                     index_value=in_df.index_value,
+                                     columns_value=in_df.columns_value,
+                                     chunks=[manifest_chunk], nsplits=((0,), (0,)))
+
     def __call__(self, df):
         index_value = parse_index(df.index_value.to_pandas()[:0], df)
         columns_value = parse_index(df.columns_value.to_pandas()[:0], store_data=True)
@@ -244,15 +352,138 @@ class DataFrameToCSV(DataFrameOperand, DataFrameOperandMixin):
                                   index_value=index_value, columns_value=columns_value)
 
     @classmethod
-    def _to_csv(cls, op, df, path, header=None):
+    def _to_csv(cls, op, df, path, header=None, **kw):
         if header is None:
             header = op.header
-        df.to_csv(path, sep=op.sep, na_rep=op.na_rep, float_format=op.float_format,
-                  columns=op.columns, header=header, index=op.index, index_label=op.index_label,
-                  mode=op.mode, encoding=op.encoding, compression=op.compression, quoting=op.quoting,
-                  quotechar=op.quotechar, line_terminator=op.line_terminator, chunksize=op.chunksize,
-                  date_format=op.date_format, doublequote=op.doublequote, escapechar=op.escapechar,
-                  decimal=op.decimal)
+        csv_kwargs = dict(
+            sep=op.sep, na_rep=op.na_rep, float_format=op.float_format,
+            columns=op.columns, header=header, index=op.index, index_label=op.index_label,
+            mode=op.mode, encoding=op.encoding, compression=op.compression, quoting=op.quoting,
+            quotechar=op.quotechar, line_terminator=op.line_terminator, chunksize=op.chunksize,
+            date_format=op.date_format, doublequote=op.doublequote, escapechar=op.escapechar,
+            decimal=op.decimal)
+        csv_kwargs.update(kw)
+        df.to_csv(path, **csv_kwargs)
+
+    @classmethod
+    def _write_file(cls, op, df, path, columns=None):
+        """
+        Write `df` into `path` batch by batch, every batch is compressed
+        separately, return number of bytes written.
+        """
+        compress = _compressors[op.compression] if op.compression else None
+        encoding = op.encoding or 'utf-8'
+        batch_rows = op.chunksize or cls._write_batch_rows
+
+        nbytes = 0
+        with open_file(path, mode='wb', storage_options=op.storage_options) as f:
+            for start in range(0, max(len(df), 1), batch_rows):
+                sio = StringIO()
+                # only the first batch outputs header
+                header = op.header if start == 0 else False
+                cls._to_csv(op, df.iloc[start: start + batch_rows], sio, header=header,
+                            columns=columns, mode='w', compression=None, chunksize=None)
+                b = sio.getvalue().encode(encoding)
+                if compress is not None:
+                    b = compress(b)
+                f.write(b)
+                nbytes += len(b)
+        return nbytes
+
+    @classmethod
+    def _mkdir(cls, path, storage_options):
+        fs = get_fs(path, storage_options)
+        try:
+            fs.mkdir(path)
+        except (IOError, OSError):
+            # may be created by other chunks concurrently
+            if not fs.exists(path):
+                raise
+
+    @classmethod
+    def _write_partitions(cls, op, df, i):
+        root = op.path.rstrip('/')
+        partition_cols = op.partition_cols
+        file_name = 'part-{}.csv{}'.format(i, _compress_extensions.get(op.compression, ''))
+        columns = [c for c in (op.columns or df.columns) if c not in partition_cols]
+
+        files = []
+        # factorize to keep missing values as a partition
+        codes = [pd.factorize(df[col])[0] for col in partition_cols]
+        indices = df.groupby(codes, sort=True).indices if len(df) > 0 else dict()
+        for key in sorted(indices):
+            part_df = df.iloc[indices[key]]
+            values = [part_df[col].iloc[0] for col in partition_cols]
+            part_dir = '/'.join('{}={}'.format(col, _escape_partition_value(v))
+                                for col, v in zip(partition_cols, values))
+            cls._mkdir(root + '/' + part_dir, op.storage_options)
+            file_path = part_dir + '/' + file_name
+            nbytes = cls._write_file(op, part_df, root + '/' + file_path, columns=columns)
+            files.append({
+                'path': file_path,
+                'rows': len(part_df),
+                'bytes': nbytes,
+                'partition': dict((col, _to_json_value(v))
+                                  for col, v in zip(partition_cols, values)),
+            })
+        return files
+
+    @classmethod
+    def _execute_write(cls, ctx, op):
+        out = op.outputs[0]
+        df = ctx[op.input.key]
+        i = out.index[0]
+
+        partition_cols = op.partition_cols or []
+        if partition_cols:
+            files = cls._write_partitions(op, df, i)
+            partition_dtypes = dict((col, str(df.dtypes[col])) for col in partition_cols)
+        else:
+            path = cls._get_path(op.path, i)
+            nbytes = cls._write_file(op, df, path, columns=op.columns)
+            file_path = os.path.relpath(path, os.path.dirname(op.path) or '.')
+            files = [{'path': file_path, 'rows': len(df), 'bytes': nbytes}]
+            partition_dtypes = dict()
+        # dtypes of columns in files, used when no file is written
+        dtypes = [[str(col), str(df.dtypes[col])] for col in (op.columns or df.columns)
+                  if col not in partition_cols]
+        ctx[out.key] = {'partition_dtypes': partition_dtypes, 'dtypes': dtypes, 'files': files}
+
+    @classmethod
+    def _get_manifest_path(cls, path):
+        if '*' in path:
+            return os.path.join(os.path.dirname(path), MANIFEST_FILE_NAME)
+        return path.rstrip('/') + '/' + MANIFEST_FILE_NAME
+
+    @classmethod
+    def _execute_manifest(cls, ctx, op):
+        partition_dtypes = dict()
+        dtypes = []
+        files = []
+        # inputs are ordered by chunk index
+        for inp in op.inputs:
+            written = ctx[inp.key]
+            partition_dtypes.update(written['partition_dtypes'])
+            dtypes = dtypes or written['dtypes']
+            files.extend(written['files'])
+
+        manifest = {
+            'format': 'csv',
+            'compression': op.compression,
+            'partition_cols': list(op.partition_cols or []),
+            'partition_dtypes': partition_dtypes,
+            'dtypes': dtypes,
+            'files': files,
+        }
+        manifest_path = cls._get_manifest_path(op.path)
+        manifest_dir = os.path.dirname(manifest_path)
+        if manifest_dir:
+            # no directory is created by writers if there are no partitions
+            cls._mkdir(manifest_dir, op.storage_options)
+        with open_file(manifest_path, mode='wb', storage_options=op.storage_options) as f:
+            f.write(json.dumps(manifest, indent=2).encode('utf-8'))
+
+        ctx[op.outputs[0].key] = pd.DataFrame()
 
     @classmethod
     def _execute_map(cls, ctx, op):
@@ -292,10 +523,14 @@ class DataFrameToCSV(DataFrameOperand, DataFrameOperandMixin):
 
     @classmethod
     def execute(cls, ctx, op):
-        if op.stage == OperandStage.map:
+        if op.stage == OperandStage.map and op.manifest:
+            cls._execute_write(ctx, op)
+        elif op.stage == OperandStage.map:
             cls._execute_map(ctx, op)
         elif op.stage == OperandStage.agg:
             cls._execute_agg(ctx, op)
+        elif op.stage == OperandStage.reduce:
+            cls._execute_manifest(ctx, op)
         else:
             assert op.stage is None
             df = ctx[op.input.key]
@@ -344,7 +579,8 @@ class DataFrameToCSVStat(TensorOperand, TensorOperandMixin):
 def to_csv(df, path, sep=',', na_rep='', float_format=None, columns=None, header=True,
            index=True, index_label=None, mode='w', encoding=None, compression='infer',
            quoting=None, quotechar='"', line_terminator=None, chunksize=None, date_format=None,
-           doublequote=True, escapechar=None, decimal='.', storage_options=None):
+           doublequote=True, escapechar=None, decimal='.', partition_cols=None,
+           manifest=None, storage_options=None):
     r"""
     Write object to a comma-separated values (csv) file.
 
@@ -412,6 +648,24 @@ def to_csv(df, path, sep=',', na_rep='', float_format=None, columns=None, header
     decimal : str, default '.'
         Character recognized as decimal separator. E.g. use ',' for
         European data.
+    partition_cols : list of str, optional
+        Column names by which to partition the dataset. If specified, `path`
+        is treated as the root directory, every chunk writes its rows into
+        Hive-style sub-directories concurrently, e.g.
+        '/to/path/year=2020/part-0.csv', and partition columns are
+        not written into files.
+    manifest : bool, optional
+        Whether to write a manifest named '_manifest.json' which records
+        the path, number of rows and bytes of every written file after all
+        chunks are written, it is located in `path` if `partition_cols`
+        specified, otherwise in the directory of the wildcard path.
+        `read_csv` reads the manifest instead of listing files and
+        partition columns are restored. Files are written and compressed
+        in batches of `chunksize` rows, only 'gzip' and 'lz4' compressions
+        are supported. Default to True if `partition_cols` is specified.
+    storage_options : dict, optional
+        Options for storage connection.
+
     Returns
     -------
     None or str
@@ -433,10 +687,28 @@ def to_csv(df, path, sep=',', na_rep='', float_format=None, columns=None, header
 
     if mode != 'w':  # pragma: no cover
         raise NotImplementedError("only support to_csv with mode 'w' for now")
+    if partition_cols is not None:
+        partition_cols = [partition_cols] if isinstance(partition_cols, str) \
+            else list(partition_cols)
+        if '*' in path:
+            raise ValueError('path should be a directory when partition_cols specified')
+        for col in partition_cols:
+            if col not in df.dtypes:
+                raise KeyError('partition column {} does not exist'.format(col))
+        if len(partition_cols) == len(df.dtypes):
+            raise ValueError('cannot partition by all the columns')
+    if manifest is None:
+        manifest = bool(partition_cols)
+    if manifest:
+        if '*' not in path and not partition_cols:
+            raise ValueError('manifest can only be written when path contains '
+                             'a wildcard or partition_cols specified')
+        compression = _infer_compression(path, compression, partition_cols)
     op = DataFrameToCSV(path=path, sep=sep, na_rep=na_rep, float_format=float_format,
                         columns=columns, header=header, index=index, index_label=index_label,
                         mode=mode, encoding=encoding, compression=compression, quoting=quoting,
                         quotechar=quotechar, line_terminator=line_terminator, chunksize=chunksize,
                         date_format=date_format, doublequote=doublequote, escapechar=escapechar,
-                        decimal=decimal, storage_options=storage_options)
+                        decimal=decimal, partition_cols=partition_cols, manifest=manifest,
+                        storage_options=storage_options)
     return op(df)
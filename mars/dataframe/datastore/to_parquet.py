@@ -0,0 +1,185 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import parquet as pq
+
+from ... import opcodes as OperandDef
+from ...serialize import KeyField, AnyField, StringField, BoolField, DictField
+from ...filesystem import open_file, get_fs
+from ..operands import DataFrameOperand, DataFrameOperandMixin, ObjectType
+from ..utils import parse_index
+
+
+class DataFrameToParquet(DataFrameOperand, DataFrameOperandMixin):
+    _op_type_ = OperandDef.TO_PARQUET
+
+    _input = KeyField('input')
+    _path = AnyField('path')
+    _engine = StringField('engine')
+    _compression = StringField('compression')
+    _index = BoolField('index')
+    _write_kwargs = DictField('write_kwargs')
+    _storage_options = DictField('storage_options')
+
+    def __init__(self, path=None, engine=None, compression=None, index=None,
+                 write_kwargs=None, storage_options=None, **kw):
+        super().__init__(_path=path, _engine=engine, _compression=compression,
+                         _index=index, _write_kwargs=write_kwargs,
+                         _storage_options=storage_options,
+                         _object_type=ObjectType.dataframe, **kw)
+
+    @property
+    def input(self):
+        return self._input
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def engine(self):
+        return self._engine
+
+    @property
+    def compression(self):
+        return self._compression
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def write_kwargs(self):
+        return self._write_kwargs
+
+    @property
+    def storage_options(self):
+        return self._storage_options
+
+    def _set_inputs(self, inputs):
+        super()._set_inputs(inputs)
+        self._input = self._inputs[0]
+
+    @classmethod
+    def tile(cls, op):
+        in_df = op.input
+        out_df = op.outputs[0]
+
+        # make sure only 1 chunk on the column axis
+        in_df = in_df.rechunk({1: in_df.shape[1]})._inplace_tile()
+
+        out_chunks = []
+        for chunk in in_df.chunks:
+            chunk_op = op.copy().reset_key()
+            index_value = parse_index(chunk.index_value.to_pandas()[:0], chunk)
+            out_chunk = chunk_op.new_chunk([chunk], shape=(0, 0),
+                                           index_value=index_value,
+                                           columns_value=out_df.columns_value,
+                                           dtypes=out_df.dtypes,
+                                           index=chunk.index)
+            out_chunks.append(out_chunk)
+
+        new_op = op.copy()
+        return new_op.new_dataframes([in_df], shape=(0, 0), dtypes=out_df.dtypes,
+                                     index_value=out_df.index_value,
+                                     columns_value=out_df.columns_value,
+                                     chunks=out_chunks,
+                                     nsplits=((0,) * in_df.chunk_shape[0], (0,)))
+
+    @classmethod
+    def _get_path(cls, path, i):
+        if '*' in path:
+            return path.replace('*', str(i))
+        # take path as a directory
+        return '{}/part-{}.parquet'.format(path.rstrip('/'), i)
+
+    @classmethod
+    def execute(cls, ctx, op):
+        df = ctx[op.input.key]
+        out = op.outputs[0]
+        path = cls._get_path(op.path, out.index[0])
+        if '*' not in op.path:
+            fs = get_fs(op.path, op.storage_options)
+            try:
+                fs.mkdir(op.path)
+            except (IOError, OSError):
+                # may be created by other chunks concurrently
+                if not fs.exists(op.path):
+                    raise
+
+        table = pa.Table.from_pandas(df, preserve_index=op.index)
+        with open_file(path, mode='wb', storage_options=op.storage_options) as f:
+            pq.write_table(table, f, compression=op.compression,
+                           **(op.write_kwargs or dict()))
+
+        ctx[out.key] = pd.DataFrame()
+
+    def __call__(self, df):
+        index_value = parse_index(df.index_value.to_pandas()[:0], df)
+        columns_value = parse_index(df.columns_value.to_pandas()[:0], store_data=True)
+        return self.new_dataframe([df], shape=(0, 0), dtypes=df.dtypes[:0],
+                                  index_value=index_value, columns_value=columns_value)
+
+
+def to_parquet(df, path, engine='pyarrow', compression='snappy', index=None,
+               storage_options=None, **kwargs):
+    """
+    Write a DataFrame to the binary parquet format, each chunk will be
+    written to a separate file in parallel.
+
+    Parameters
+    ----------
+    path : str
+        If path is a string with wildcard e.g. '/to/path/out-*.parquet',
+        to_parquet will write a file for every chunk, for instance,
+        chunk (0, 0) will write data into '/to/path/out-0.parquet'.
+        If path is a string without wildcard, it is taken as a directory
+        and chunk (0, 0) will write data into '/path/part-0.parquet'.
+    engine : {'pyarrow'}, default 'pyarrow'
+        Parquet library to use.
+    compression : {'snappy', 'gzip', 'brotli', None}, default 'snappy'
+        Name of the compression to use. Use ``None`` for no compression.
+    index : bool, default None
+        If ``True``, include the dataframe's index(es) in the file output.
+        If ``False``, they will not be written to the file.
+        If ``None``, similar to ``True`` the dataframe's index(es)
+        will be saved, however, RangeIndex will be stored as metadata.
+    storage_options : dict, optional
+        Options for storage connection.
+    **kwargs
+        Additional arguments passed to the parquet library.
+
+    Returns
+    -------
+    DataFrame
+        An empty DataFrame which can be executed to trigger writing.
+
+    See Also
+    --------
+    read_parquet : Read a parquet file.
+
+    Examples
+    --------
+    >>> import mars.dataframe as md
+    >>> df = md.DataFrame(data={'col1': [1, 2], 'col2': [3, 4]})
+    >>> df.to_parquet('out-*.parquet').execute()  # doctest: +SKIP
+    """
+    if engine != 'pyarrow':  # pragma: no cover
+        raise NotImplementedError('only support pyarrow engine for now')
+    op = DataFrameToParquet(path=path, engine=engine, compression=compression,
+                            index=index, write_kwargs=kwargs,
+                            storage_options=storage_options)
+    return op(df)
@@ -0,0 +1,236 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from ...tensor.fuse.core import estimate_fuse_size
+from ...tensor.fuse.ne import evaluate_template
+from .. import arithmetic
+from ..core import DATAFRAME_CHUNK_TYPE, SERIES_CHUNK_TYPE
+from ..operands import DataFrameFuseChunk
+
+# dtypes whose results of numexpr are identical with pandas
+NE_DTYPES = {np.dtype(np.bool_), np.dtype(np.int64), np.dtype(np.float64)}
+
+NE_UNARYOP_TO_STRING = {
+    arithmetic.DataFrameAbs: 'abs',
+    arithmetic.DataFrameNot: '~',
+    arithmetic.DataFrameExp: 'exp',
+    arithmetic.DataFrameExpm1: 'expm1',
+    arithmetic.DataFrameLog: 'log',
+    arithmetic.DataFrameLog10: 'log10',
+    arithmetic.DataFrameSqrt: 'sqrt',
+
+    arithmetic.DataFrameSin: 'sin',
+    arithmetic.DataFrameCos: 'cos',
+    arithmetic.DataFrameTan: 'tan',
+    arithmetic.DataFrameArcsin: 'arcsin',
+    arithmetic.DataFrameArccos: 'arccos',
+    arithmetic.DataFrameArctan: 'arctan',
+    arithmetic.DataFrameSinh: 'sinh',
+    arithmetic.DataFrameCosh: 'cosh',
+    arithmetic.DataFrameTanh: 'tanh',
+    arithmetic.DataFrameArcsinh: 'arcsinh',
+    arithmetic.DataFrameArccosh: 'arccosh',
+    arithmetic.DataFrameArctanh: 'arctanh',
+}
+
+NE_BINOP_TO_STRING = {
+    arithmetic.DataFrameAdd: '+',
+    arithmetic.DataFrameSubtract: '-',
+    arithmetic.DataFrameMul: '*',
+    arithmetic.DataFrameTrueDiv: '/',
+    arithmetic.DataFramePower: '**',
+
+    arithmetic.DataFrameEqual: '==',
+    arithmetic.DataFrameNotEqual: '!=',
+    arithmetic.DataFrameLess: '<',
+    arithmetic.DataFrameLessEqual: '<=',
+    arithmetic.DataFrameGreater: '>',
+    arithmetic.DataFrameGreaterEqual: '>=',
+
+    arithmetic.DataFrameAnd: '&',
+    arithmetic.DataFrameOr: '|',
+}
+
+SUPPORT_OP = set(NE_UNARYOP_TO_STRING) | set(NE_BINOP_TO_STRING)
+# numexpr only evaluates logical operators on booleans,
+# and casts integers into floats when calling functions
+BOOL_OP = {arithmetic.DataFrameNot, arithmetic.DataFrameAnd, arithmetic.DataFrameOr}
+FLOAT_OP = set(NE_UNARYOP_TO_STRING) - BOOL_OP
+ARITHMETIC_OP = {arithmetic.DataFrameAdd, arithmetic.DataFrameSubtract, arithmetic.DataFrameMul,
+                 arithmetic.DataFrameTrueDiv, arithmetic.DataFramePower}
+
+_VAR_FLAG = 'V_'
+
+
+class DataFrameNeFuseChunk(DataFrameFuseChunk):
+    _op_type_ = None  # no opcode, cannot be serialized
+
+    if sys.platform == 'win32':
+        # since we found thread-safe problem for ne.evaluate
+        # thus add a lock for windows
+        _lock = threading.Lock()
+    else:
+        _lock = None
+
+    @classmethod
+    def _evaluate(cls, expr, input_chunks, inputs):
+        if cls._lock is not None:
+            cls._lock.acquire()
+        try:
+            return evaluate_template(expr, [c.key for c in input_chunks], inputs)
+        finally:
+            if cls._lock is not None:
+                cls._lock.release()
+
+    @classmethod
+    def _execute_composed(cls, ctx, op):
+        # fallback when inputs are not aligned, execute composed chunks one by one
+        local_ctx = dict((c.key, ctx[c.key]) for c in op.inputs)
+        for c in op.outputs[0].composed:
+            type(c.op).execute(local_ctx, c.op)
+        ctx[op.outputs[0].key] = local_ctx[op.outputs[0].key]
+
+    @classmethod
+    def execute(cls, ctx, op):
+        chunk = op.outputs[0]
+        out_chunk = chunk.composed[-1]
+        inputs = [ctx[c.key] for c in op.inputs]
+
+        first = inputs[0]
+        if any(not inp.index.equals(first.index) for inp in inputs[1:]) or \
+                (isinstance(first, pd.DataFrame) and
+                 any(not inp.columns.equals(first.columns) for inp in inputs[1:])):
+            return cls._execute_composed(ctx, op)
+
+        expr = _evaluate(chunk)
+        if isinstance(first, pd.Series):
+            res = cls._evaluate(expr, op.inputs, [inp.values for inp in inputs])
+            ctx[chunk.key] = pd.Series(res, index=first.index, name=out_chunk.name)
+        else:
+            data = OrderedDict()
+            for i in range(first.shape[1]):
+                data[i] = cls._evaluate(expr, op.inputs, [inp.iloc[:, i].values for inp in inputs])
+            result = pd.DataFrame(data, index=first.index)
+            result.columns = first.columns
+            ctx[chunk.key] = result
+
+    @classmethod
+    def estimate_size(cls, ctx, op):
+        estimate_fuse_size(ctx, op)
+
+
+def _is_scalar_operand(x):
+    return isinstance(x, (bool, int, float, np.bool_, np.integer, np.floating)) \
+        and bool(np.isfinite(x))
+
+
+def _is_ne_chunk(c, valid_dtypes=None):
+    if isinstance(c, SERIES_CHUNK_TYPE):
+        dtypes = [c.dtype]
+    elif isinstance(c, DATAFRAME_CHUNK_TYPE):
+        dtypes = list(c.dtypes) if c.dtypes is not None else [None]
+    else:
+        return False
+    valid_dtypes = valid_dtypes or NE_DTYPES
+    return all(dt in valid_dtypes for dt in dtypes)
+
+
+def _has_same_index(c1, c2):
+    if isinstance(c1, SERIES_CHUNK_TYPE) and isinstance(c2, SERIES_CHUNK_TYPE):
+        attrs = ('index_value',)
+    elif isinstance(c1, DATAFRAME_CHUNK_TYPE) and isinstance(c2, DATAFRAME_CHUNK_TYPE):
+        attrs = ('index_value', 'columns_value')
+    else:
+        return False
+    for attr in attrs:
+        v1, v2 = getattr(c1, attr, None), getattr(c2, attr, None)
+        if v1 is None or v2 is None or v1.key != v2.key:
+            return False
+    return True
+
+
+def support(node):
+    """
+    Check if a chunk can be evaluated by numexpr over its underlying arrays.
+    Binary operands are supported only when both sides are chunks of the
+    same type with identical index and columns, or when one side is a scalar.
+    """
+    op = node.op
+    op_type = type(op)
+    if op_type not in SUPPORT_OP or op.gpu or not _is_ne_chunk(node):
+        return False
+    if op_type in BOOL_OP:
+        valid_dtypes = {np.dtype(np.bool_)}
+    elif op_type in FLOAT_OP:
+        valid_dtypes = {np.dtype(np.float64)}
+    elif op_type in ARITHMETIC_OP:
+        valid_dtypes = {np.dtype(np.int64), np.dtype(np.float64)}
+    else:
+        valid_dtypes = NE_DTYPES
+
+    if op_type in NE_UNARYOP_TO_STRING:
+        return len(op.inputs) == 1 and _is_ne_chunk(op.inputs[0], valid_dtypes)
+    if op.fill_value is not None or op.level is not None:
+        return False
+    if len(op.inputs) == 2:
+        return all(_is_ne_chunk(c, valid_dtypes) for c in op.inputs) and \
+            _has_same_index(op.inputs[0], op.inputs[1])
+    if len(op.inputs) == 1:
+        other = op.lhs if op.rhs is op.inputs[0] else op.rhs
+        if op_type in BOOL_OP and not isinstance(other, (bool, np.bool_)):
+            return False
+        return _is_ne_chunk(op.inputs[0], valid_dtypes) and _is_scalar_operand(other)
+    return False
+
+
+def _handle_unary(chunk):
+    data = chunk.inputs[0]
+    unary_op = NE_UNARYOP_TO_STRING[type(chunk.op)]
+    return '{}({})'.format(unary_op, _VAR_FLAG + data.key)
+
+
+def _handle_bin(chunk):
+    def _operand(x):
+        if _is_scalar_operand(x):
+            return '({})'.format(x)
+        return _VAR_FLAG + x.key
+
+    op = NE_BINOP_TO_STRING[type(chunk.op)]
+    return op.join([_operand(chunk.op.lhs), _operand(chunk.op.rhs)])
+
+
+def _decompose(chunk):
+    expr = _VAR_FLAG + chunk.key
+    for node in reversed(chunk.composed):
+        _expr = _evaluate(node)
+        expr = expr.replace(_VAR_FLAG + node.key, '({})'.format(_expr))
+    return expr
+
+
+def _evaluate(chunk):
+    if type(chunk.op) in NE_UNARYOP_TO_STRING:
+        return _handle_unary(chunk)
+    elif type(chunk.op) in NE_BINOP_TO_STRING:
+        return _handle_bin(chunk)
+    elif isinstance(chunk.op, DataFrameNeFuseChunk):
+        return _decompose(chunk)
+    else:
+        raise TypeError("unsupported operator in numexpr: {}".format(chunk.op.__class__.__name__))
@@ -0,0 +1,90 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from mars import tensor as mt
+from mars.executor import Executor
+from mars.dataframe.datasource.dataframe import from_pandas
+from mars.dataframe.arithmetic import DataFrameMul, DataFrameAdd, DataFrameGreater
+from mars.dataframe.fuse.ne import DataFrameNeFuseChunk
+from mars.optimizes.runtime.optimizers.dataframe_ne import DataFrameNeOptimizer
+from mars.tensor.fuse.ne import NUMEXPR_INSTALLED
+
+
+@unittest.skipIf(not NUMEXPR_INSTALLED, 'numexpr not installed')
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.executor = Executor('numexpr')
+        self.executor_numpy = Executor('numpy')
+
+    def testCompose(self):
+        raw = pd.DataFrame(np.random.rand(10, 3), columns=list('abc'))
+        df = from_pandas(raw, chunk_size=5)
+        r = (df.a * 2 + df.b) > df.c
+
+        graph = r.build_graph(tiled=True, compose=False)
+        result_keys = [n.key for n in graph if graph.count_successors(n) == 0]
+        composed_nodes = DataFrameNeOptimizer(graph).compose(keys=result_keys)
+        self.assertEqual(len(composed_nodes), 2)
+        for n in composed_nodes:
+            self.assertIsInstance(n.op, DataFrameNeFuseChunk)
+            self.assertEqual([type(c.op) for c in n.composed],
+                             [DataFrameMul, DataFrameAdd, DataFrameGreater])
+            self.assertEqual(len(n.inputs), 3)
+            self.assertEqual(graph.count_predecessors(n), 3)
+
+        # fill_value cannot be evaluated by numexpr
+        r = df.add(df, fill_value=1) * 2
+        graph = r.build_graph(tiled=True, compose=False)
+        composed_nodes = DataFrameNeOptimizer(graph).compose()
+        self.assertEqual(len(composed_nodes), 0)
+
+    def testSeriesExecution(self):
+        raw = pd.DataFrame(np.random.rand(10, 3), columns=list('abc'))
+        df = from_pandas(raw, chunk_size=4)
+
+        r = (df.a * 2 + df.b) > df.c
+        res = self.executor.execute_dataframe(r, concat=True)[0]
+        expected = self.executor_numpy.execute_dataframe(r, concat=True)[0]
+        pd.testing.assert_series_equal(res, expected)
+        pd.testing.assert_series_equal(res, (raw.a * 2 + raw.b) > raw.c)
+
+        r = mt.exp(-1 - abs(df.a)) / df.b
+        res = self.executor.execute_dataframe(r, concat=True)[0]
+        pd.testing.assert_series_equal(res, np.exp(-1 - raw.a.abs()) / raw.b)
+
+    def testDataFrameExecution(self):
+        raw1 = pd.DataFrame(np.random.rand(10, 4) * 10, columns=list('abcd'))
+        raw2 = pd.DataFrame(np.random.rand(10, 4), columns=list('abcd'))
+        df1 = from_pandas(raw1, chunk_size=4)
+        df2 = from_pandas(raw2, chunk_size=4)
+
+        r = abs(df1 * 3 - 10) + 1
+        res = self.executor.execute_dataframe(r, concat=True)[0]
+        pd.testing.assert_frame_equal(res, (raw1 * 3 - 10).abs() + 1)
+
+        r = ((df1 + df2) <= df1 * df2) | (df1 > df2)
+        res = self.executor.execute_dataframe(r, concat=True)[0]
+        pd.testing.assert_frame_equal(res, ((raw1 + raw2) <= raw1 * raw2) | (raw1 > raw2))
+
+        # integers are not passed to functions of numexpr
+        raw3 = pd.DataFrame(np.random.randint(-10, 10, size=(10, 4)), columns=list('abcd'))
+        df3 = from_pandas(raw3, chunk_size=4)
+        r = abs(df3 - 1) * 2
+        res = self.executor.execute_dataframe(r, concat=True)[0]
+        pd.testing.assert_frame_equal(res, (raw3 - 1).abs() * 2)
@@ -441,6 +441,12 @@ def iloc(a):
 
 
 def head(a, n=5):
+    from ..sort.nlargest import sort_values_head
+
+    # avoid sorting all data if only first rows are required
+    ret = sort_values_head(a, n)
+    if ret is not None:
+        return ret
     return DataFrameIloc(a)[0:n]
 
 
@@ -21,6 +21,7 @@ from ...config import options
 from ...operands import OperandStage
 from ...utils import lazy_import
 from ...serialize import BoolField, AnyField, DataTypeField, Int32Field
+from ...tensor.reduction.core import TensorReductionMixin
 from ..utils import parse_index, build_df, build_empty_df, build_series, validate_axis
 from ..operands import DataFrameOperandMixin, DataFrameOperand, ObjectType, DATAFRAME_TYPE
 from ..merge import DataFrameConcat
@@ -136,43 +137,72 @@ class DataFrameReductionMixin(DataFrameOperandMixin):
         return new_op.new_tileables(op.inputs, kws=[params])
 
     @classmethod
-    def _tree_reduction(cls, chunks, op, combine_size, idx):
+    def _get_chunk_workers(cls, chunks):
+        return TensorReductionMixin._get_chunk_workers(chunks)
+
+    @classmethod
+    def _group_by_workers(cls, chunks, workers, combine_func):
+        """
+        Combine chunks on the same worker into one chunk before
+        combining across workers.
+        """
+        if workers is None or len(set(workers)) <= 1:
+            return chunks
+        worker_chunks = OrderedDict()
+        for c, w in zip(chunks, workers):
+            worker_chunks.setdefault(w, []).append(c)
+        combined = []
+        for w in sorted(worker_chunks):
+            chks = worker_chunks[w]
+            while len(chks) > 1:
+                chks = combine_func(chks)
+            combined.extend(chks)
+        return combined
+
+    @classmethod
+    def _combine_dataframe_chunks(cls, chunks, op, combine_size):
+        new_chunks = []
+        for i in range(0, len(chunks), combine_size):
+            chks = chunks[i: i + combine_size]
+            for j, c in enumerate(chunks):
+                c._index = (j,)
+
+            # concatenate chunks into one chunk
+            concat_op = DataFrameConcat(axis=op.axis, object_type=ObjectType.dataframe)
+            if op.axis == 0:
+                concat_index = parse_index(pd.RangeIndex(len(chks)))
+                concat_dtypes = chks[0].dtypes
+                concat_shape = (sum([c.shape[0] for c in chks]), chks[0].shape[1])
+            else:
+                concat_index = chks[0].index_value
+                concat_dtypes = pd.Series([c.dtypes[0] for c in chks])
+                concat_shape = (chks[0].shape[0], (sum([c.shape[1] for c in chks])))
+            chk = concat_op.new_chunk(chks, shape=concat_shape, index=(i,),
+                                      dtypes=concat_dtypes, index_value=concat_index)
+
+            # do reduction
+            if op.axis == 0:
+                reduced_shape = (1, chk.shape[1])
+                index_value = parse_index(pd.RangeIndex(1))
+                dtypes = chk.dtypes
+            else:
+                reduced_shape = (chk.shape[0], 1)
+                index_value = chk.index_value
+                dtypes = pd.Series(op.outputs[0].dtype)
+            new_op = op.copy().reset_key()
+            new_op._stage = OperandStage.combine
+            # all intermediate results' type is dataframe
+            new_op._object_type = ObjectType.dataframe
+            new_chunks.append(new_op.new_chunk([chk], shape=reduced_shape, index=(i,), dtypes=dtypes,
+                                               index_value=index_value))
+        return new_chunks
+
+    @classmethod
+    def _tree_reduction(cls, chunks, op, combine_size, idx, workers=None):
+        chunks = cls._group_by_workers(
+            chunks, workers, lambda chks: cls._combine_dataframe_chunks(chks, op, combine_size))
         while len(chunks) > combine_size:
-            new_chunks = []
-            for i in range(0, len(chunks), combine_size):
-                chks = chunks[i: i + combine_size]
-                for j, c in enumerate(chunks):
-                    c._index = (j,)
-
-                # concatenate chunks into one chunk
-                concat_op = DataFrameConcat(axis=op.axis, object_type=ObjectType.dataframe)
-                if op.axis == 0:
-                    concat_index = parse_index(pd.RangeIndex(len(chks)))
-                    concat_dtypes = chks[0].dtypes
-                    concat_shape = (sum([c.shape[0] for c in chks]), chks[0].shape[1])
-                else:
-                    concat_index = chks[0].index_value
-                    concat_dtypes = pd.Series([c.dtypes[0] for c in chks])
-                    concat_shape = (chks[0].shape[0], (sum([c.shape[1] for c in chks])))
-                chk = concat_op.new_chunk(chks, shape=concat_shape, index=(i,),
-                                          dtypes=concat_dtypes, index_value=concat_index)
-
-                # do reduction
-                if op.axis == 0:
-                    reduced_shape = (1, chk.shape[1])
-                    index_value = parse_index(pd.RangeIndex(1))
-                    dtypes = chk.dtypes
-                else:
-                    reduced_shape = (chk.shape[0], 1)
-                    index_value = chk.index_value
-                    dtypes = pd.Series(op.outputs[0].dtype)
-                new_op = op.copy().reset_key()
-                new_op._stage = OperandStage.combine
-                # all intermediate results' type is dataframe
-                new_op._object_type = ObjectType.dataframe
-                new_chunks.append(new_op.new_chunk([chk], shape=reduced_shape, index=(i,), dtypes=dtypes,
-                                                   index_value=index_value))
-            chunks = new_chunks
+            chunks = cls._combine_dataframe_chunks(chunks, op, combine_size)
 
         if op.axis == 0:
             concat_shape = (sum([c.shape[0] for c in chunks]), chunks[0].shape[1])
@@ -222,21 +252,49 @@ class DataFrameReductionMixin(DataFrameOperandMixin):
                 dtypes = pd.Series(op.outputs[0].dtype)
             reduction_chunks[c.index] = new_chunk_op.new_chunk([c], shape=reduced_shape,
                                                                dtypes=dtypes, index_value=index_value)
+        workers = cls._get_chunk_workers(in_df.chunks)
+        chunk_workers = None
+        if workers is not None:
+            chunk_workers = dict((c.index, w) for c, w in zip(in_df.chunks, workers))
+
         # Tree reduction
         out_chunks = []
         if op.axis is None or op.axis == 0:
             for col in range(n_cols):
                 chunks = [reduction_chunks[i, col] for i in range(n_rows)]
-                out_chunks.append(cls._tree_reduction(chunks, op, combine_size, col))
+                chunks_workers = [chunk_workers[i, col] for i in range(n_rows)] \
+                    if chunk_workers is not None else None
+                out_chunks.append(cls._tree_reduction(chunks, op, combine_size, col,
+                                                      workers=chunks_workers))
         elif op.axis == 1:
             for row in range(n_rows):
                 chunks = [reduction_chunks[row, i] for i in range(n_cols)]
-                out_chunks.append(cls._tree_reduction(chunks, op, combine_size, row))
+                chunks_workers = [chunk_workers[row, i] for i in range(n_cols)] \
+                    if chunk_workers is not None else None
+                out_chunks.append(cls._tree_reduction(chunks, op, combine_size, row,
+                                                      workers=chunks_workers))
         new_op = op.copy()
         nsplits = (tuple(c.shape[0] for c in out_chunks),)
         return new_op.new_seriess(op.inputs, df.shape, nsplits=nsplits, chunks=out_chunks,
                                   dtype=df.dtype, index_value=df.index_value)
 
+    @classmethod
+    def _combine_series_chunks(cls, chunks, op, combine_size):
+        new_chunks = []
+        for i in range(0, len(chunks), combine_size):
+            chks = chunks[i: i + combine_size]
+            concat_op = DataFrameConcat(object_type=ObjectType.series)
+            length = sum([c.shape[0] for c in chks if len(c.shape) > 0])
+            range_num = -1 if np.isnan(length) else length
+            chk = concat_op.new_chunk(chks, shape=(length,), index=(i,), dtype=chks[0].dtype,
+                                      index_value=parse_index(pd.RangeIndex(range_num), [c.key for c in chks]))
+            new_op = op.copy().reset_key()
+            new_op._object_type = ObjectType.series
+            new_op._stage = OperandStage.combine
+            new_chunks.append(new_op.new_chunk([chk], shape=(), index=(i,), dtype=chk.dtype,
+                                               index_value=parse_index(pd.RangeIndex(-1))))
+        return new_chunks
+
     @classmethod
     def _tile_series(cls, op):
         series = op.outputs[0]
@@ -248,21 +306,15 @@ class DataFrameReductionMixin(DataFrameOperandMixin):
             new_chunk_op._stage = OperandStage.map
             chunks[c.index] = new_chunk_op.new_chunk([c], shape=(), dtype=series.dtype)
 
+        workers = cls._get_chunk_workers(op.inputs[0].chunks)
+        if workers is not None:
+            chunk_workers = dict((c.index, w) for c, w in zip(op.inputs[0].chunks, workers))
+            workers = [chunk_workers[(i,)] for i in range(len(chunks))]
+        chunks = cls._group_by_workers(
+            list(chunks), workers, lambda chks: cls._combine_series_chunks(chks, op, combine_size))
+
         while len(chunks) > combine_size:
-            new_chunks = []
-            for i in range(0, len(chunks), combine_size):
-                chks = chunks[i: i + combine_size]
-                concat_op = DataFrameConcat(object_type=ObjectType.series)
-                length = sum([c.shape[0] for c in chks if len(c.shape) > 0])
-                range_num = -1 if np.isnan(length) else length
-                chk = concat_op.new_chunk(chks, shape=(length,), index=(i,), dtype=chks[0].dtype,
-                                          index_value=parse_index(pd.RangeIndex(range_num), [c.key for c in chks]))
-                new_op = op.copy().reset_key()
-                new_op._object_type = ObjectType.series
-                new_op._stage = OperandStage.combine
-                new_chunks.append(new_op.new_chunk([chk], shape=(), index=(i,), dtype=chk.dtype,
-                                                   index_value=parse_index(pd.RangeIndex(-1))))
-            chunks = new_chunks
+            chunks = cls._combine_series_chunks(chunks, op, combine_size)
 
         concat_op = DataFrameConcat(object_type=ObjectType.series)
         length = sum([c.shape[0] for c in chunks if len(c.shape) > 0])
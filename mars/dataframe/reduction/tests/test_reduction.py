@@ -15,6 +15,7 @@
 import operator
 import unittest
 from functools import reduce
+from unittest import mock
 
 import pandas as pd
 import numpy as np
@@ -204,6 +205,52 @@ class TestReduction(TestBase):
         self.assertIsInstance(reduction_df.chunks[0].inputs[0].op, DataFrameConcat)
         self.assertEqual(len(reduction_df.chunks[0].inputs[0].inputs), 2)
 
+    def testLocalityReduction(self):
+        def _get_sources(chunk):
+            sources = []
+            stack = [chunk]
+            while stack:
+                c = stack.pop()
+                if not c.inputs:
+                    sources.append(c)
+                else:
+                    stack.extend(c.inputs)
+            return sources
+
+        kwargs = dict(skipna=True) if self.has_skipna else dict()
+        # chunks are interleaved on 2 workers
+        workers = ['worker{}'.format(i % 2) for i in range(20)]
+        data = pd.Series(np.random.rand(20))
+        with mock.patch.object(self.op, '_get_chunk_workers', return_value=workers):
+            reduction_df = getattr(from_pandas_series(data, chunk_size=1), self.func_name)(**kwargs).tiles()
+
+        agg_chunk = reduction_df.chunks[0]
+        self.assertEqual(agg_chunk.op.stage, OperandStage.agg)
+        worker_chunks = agg_chunk.inputs[0].inputs
+        self.assertEqual(len(worker_chunks), 2)
+        for c in worker_chunks:
+            self.assertEqual(c.op.stage, OperandStage.combine)
+            sources = _get_sources(c)
+            self.assertEqual(len(sources), 10)
+            self.assertEqual(len(set(sc.index[0] % 2 for sc in sources)), 1)
+
+        # rows of chunks are interleaved on 2 workers
+        workers = ['worker{}'.format((i // 2) % 2) for i in range(20)]
+        data = pd.DataFrame(np.random.rand(20, 4))
+        with mock.patch.object(self.op, '_get_chunk_workers', return_value=workers):
+            reduction_df = getattr(from_pandas_df(data, chunk_size=(2, 2)), self.func_name)(**kwargs).tiles()
+
+        self.assertEqual(len(reduction_df.chunks), 2)
+        for agg_chunk in reduction_df.chunks:
+            self.assertEqual(agg_chunk.op.stage, OperandStage.agg)
+            worker_chunks = agg_chunk.inputs[0].inputs
+            self.assertEqual(len(worker_chunks), 2)
+            for c in worker_chunks:
+                self.assertEqual(c.op.stage, OperandStage.combine)
+                sources = _get_sources(c)
+                self.assertEqual(len(sources), 5)
+                self.assertEqual(len(set(sc.index[0] % 2 for sc in sources)), 1)
+
 
 cum_reduction_functions = dict(
     cummin=dict(func_name='cummin', op=DataFrameCummin, has_skipna=True),
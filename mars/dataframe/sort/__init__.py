@@ -14,20 +14,27 @@
 
 from .sort_values import DataFrameSortValues
 from .sort_index import DataFrameSortIndex
+from .nlargest import DataFrameNLargest
 
 
 def _install():
     from ..core import DATAFRAME_TYPE, SERIES_TYPE
     from .sort_values import dataframe_sort_values, series_sort_values
     from .sort_index import sort_index
+    from .nlargest import dataframe_nlargest, dataframe_nsmallest, \
+        series_nlargest, series_nsmallest
 
     for cls in DATAFRAME_TYPE:
         setattr(cls, 'sort_values', dataframe_sort_values)
         setattr(cls, 'sort_index', sort_index)
+        setattr(cls, 'nlargest', dataframe_nlargest)
+        setattr(cls, 'nsmallest', dataframe_nsmallest)
 
     for cls in SERIES_TYPE:
         setattr(cls, 'sort_values', series_sort_values)
         setattr(cls, 'sort_index', sort_index)
+        setattr(cls, 'nlargest', series_nlargest)
+        setattr(cls, 'nsmallest', series_nsmallest)
 
 
 _install()
@@ -0,0 +1,382 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+
+from ... import opcodes as OperandDef
+from ...config import options
+from ...operands import OperandStage
+from ...serialize import Int64Field, ListField, StringField, BoolField, ValueType
+from ...utils import lazy_import
+from ..core import IndexValue
+from ..operands import DataFrameOperand, DataFrameOperandMixin, ObjectType
+from ..utils import parse_index, build_concatenated_rows_frame
+
+cudf = lazy_import('cudf', globals=globals())
+
+_SELECT_DTYPE_KINDS = 'biufmM'
+
+
+class DataFrameNLargest(DataFrameOperand, DataFrameOperandMixin):
+    """
+    Select n rows with the largest or smallest keys. Every chunk selects
+    its own candidates first, then candidates are merged in a tree, thus
+    at most n rows for each chunk are held besides ties.
+
+    If `keep` is None, first n rows of data sorted by `sort_values` are
+    selected, NaNs and ties are kept in the same way as `sort_values`.
+    """
+
+    _op_type_ = OperandDef.NLARGEST
+
+    _n = Int64Field('n')
+    _by = ListField('by', ValueType.string)
+    _keep = StringField('keep')
+    _largest = BoolField('largest')
+
+    # for first rows of sorted data
+    _kind = StringField('kind')
+    _na_position = StringField('na_position')
+
+    def __init__(self, n=None, by=None, keep=None, largest=None, kind=None,
+                 na_position=None, stage=None, object_type=None, **kw):
+        super().__init__(_n=n, _by=by, _keep=keep, _largest=largest, _kind=kind,
+                         _na_position=na_position, _stage=stage,
+                         _object_type=object_type, **kw)
+
+    @property
+    def n(self):
+        return self._n
+
+    @property
+    def by(self):
+        return self._by
+
+    @property
+    def keep(self):
+        return self._keep
+
+    @property
+    def largest(self):
+        return self._largest
+
+    @property
+    def kind(self):
+        return self._kind
+
+    @property
+    def na_position(self):
+        return self._na_position
+
+    def __call__(self, a, shape=None, index_value=None):
+        if shape is None:
+            shape = (np.nan,) + a.shape[1:]
+        if index_value is None:
+            if isinstance(a.index_value.value, IndexValue.RangeIndex):
+                index_value = parse_index(pd.Int64Index([]))
+            else:
+                index_value = a.index_value
+        if self.object_type == ObjectType.dataframe:
+            return self.new_dataframe([a], shape=shape, dtypes=a.dtypes,
+                                      index_value=index_value,
+                                      columns_value=a.columns_value)
+        else:
+            return self.new_series([a], shape=shape, dtype=a.dtype,
+                                   index_value=index_value, name=a.name)
+
+    @classmethod
+    def _gen_chunk(cls, op, inputs, stage, index):
+        out = op.outputs[0]
+        chunk_op = op.copy().reset_key()
+        chunk_op._stage = stage
+        if stage == OperandStage.agg:
+            shape = out.shape
+        else:
+            shape = (np.nan,) + out.shape[1:]
+        if op.object_type == ObjectType.dataframe:
+            return chunk_op.new_chunk(inputs, shape=shape, index=(index, 0),
+                                      index_value=out.index_value,
+                                      columns_value=out.columns_value, dtypes=out.dtypes)
+        else:
+            return chunk_op.new_chunk(inputs, shape=shape, index=(index,),
+                                      index_value=out.index_value,
+                                      dtype=out.dtype, name=out.name)
+
+    @classmethod
+    def tile(cls, op):
+        in_data = op.inputs[0]
+        out = op.outputs[0]
+        if op.object_type == ObjectType.dataframe:
+            in_data = build_concatenated_rows_frame(in_data)
+        combine_size = options.combine_size
+
+        chunks = in_data.chunks
+        if len(chunks) > 1:
+            chunks = [cls._gen_chunk(op, [c], OperandStage.map, i)
+                      for i, c in enumerate(chunks)]
+        while len(chunks) > combine_size:
+            chunks = [cls._gen_chunk(op, chunks[i: i + combine_size], OperandStage.combine, j)
+                      for j, i in enumerate(range(0, len(chunks), combine_size))]
+        out_chunk = cls._gen_chunk(op, chunks, OperandStage.agg, 0)
+
+        new_op = op.copy()
+        kws = out.params.copy()
+        kws['chunks'] = [out_chunk]
+        kws['nsplits'] = tuple((s,) for s in out.shape)
+        if op.object_type == ObjectType.dataframe:
+            return new_op.new_dataframes(op.inputs, **kws)
+        else:
+            return new_op.new_seriess(op.inputs, **kws)
+
+    @classmethod
+    def _select(cls, a, op, keep):
+        method = 'nlargest' if op.largest else 'nsmallest'
+        if op.object_type == ObjectType.dataframe:
+            return getattr(a, method)(op.n, op.by, keep=keep)
+        else:
+            return getattr(a, method)(op.n, keep=keep)
+
+    @classmethod
+    def _select_sorted_head(cls, a, op):
+        # keys equal to the n-th one as well as NaNs are candidates too,
+        # thus first rows of sorted candidates are identical with sorted data
+        positioned = a.reset_index(drop=True)
+        positions = cls._select(positioned, op, 'all').index
+        if op.object_type == ObjectType.dataframe:
+            na = positioned[op.by].isna().any(axis=1)
+        else:
+            na = positioned.isna()
+        positions = np.union1d(positions, positioned.index[na.values])
+        kw = dict(ascending=not op.largest, kind=op.kind, na_position=op.na_position)
+        if op.object_type == ObjectType.dataframe:
+            kw['by'] = op.by
+        return a.iloc[positions].sort_values(**kw).head(op.n)
+
+    @classmethod
+    def execute(cls, ctx, op):
+        inputs = [ctx[c.key] for c in op.inputs]
+        xdf = pd if isinstance(inputs[0], (pd.DataFrame, pd.Series)) else cudf
+        a = xdf.concat(inputs) if len(inputs) > 1 else inputs[0]
+
+        if op.keep is None:
+            ctx[op.outputs[0].key] = cls._select_sorted_head(a, op)
+        elif op.stage == OperandStage.agg:
+            ctx[op.outputs[0].key] = cls._select(a, op, op.keep)
+        else:
+            # candidates are kept in the original order,
+            # thus ties are resolved by `keep` when merged
+            positions = cls._select(a.reset_index(drop=True), op, op.keep).index
+            ctx[op.outputs[0].key] = a.iloc[np.sort(positions)]
+
+
+def _validate_keys(a, by, method):
+    if a.op.object_type == ObjectType.dataframe:
+        dtypes = a.dtypes[by]
+        for col, dtype in zip(by, dtypes):
+            if dtype.kind not in _SELECT_DTYPE_KINDS:
+                raise TypeError('Column {!r} has dtype {}, cannot use method {!r} '
+                                'with this dtype'.format(col, dtype, method))
+    elif a.dtype.kind not in _SELECT_DTYPE_KINDS:
+        raise TypeError('Cannot use method {!r} with dtype {}'.format(method, a.dtype))
+
+
+def _nselect(a, n, columns, keep, largest):
+    method = 'nlargest' if largest else 'nsmallest'
+    if keep not in ('first', 'last', 'all'):
+        raise ValueError('keep must be either "first", "last" or "all"')
+    object_type = a.op.object_type
+    if object_type == ObjectType.dataframe:
+        by = list(columns) if isinstance(columns, (list, tuple)) else [columns]
+    else:
+        by = None
+    _validate_keys(a, by, method)
+    op = DataFrameNLargest(n=n, by=by, keep=keep, largest=largest,
+                           object_type=object_type)
+    return op(a)
+
+
+def dataframe_nlargest(df, n, columns, keep='first'):
+    """
+    Return the first `n` rows ordered by `columns` in descending order.
+
+    Rows with the largest values in `columns` are returned, in descending
+    order. Columns that are not specified are returned as well, but not
+    used for ordering.
+
+    This method is equivalent to
+    ``df.sort_values(columns, ascending=False).head(n)``, but more
+    performant, since every chunk only keeps `n` candidates.
+
+    Parameters
+    ----------
+    df : input DataFrame.
+    n : int
+        Number of rows to return.
+    columns : label or list of labels
+        Column label(s) to order by.
+    keep : {'first', 'last', 'all'}, default 'first'
+        Where there are duplicate values:
+
+        - `first` : prioritize the first occurrence(s)
+        - `last` : prioritize the last occurrence(s)
+        - ``all`` : do not drop any duplicates, even it means
+                    selecting more than `n` items.
+
+    Returns
+    -------
+    DataFrame
+        The first `n` rows ordered by the given columns in descending
+        order.
+
+    Examples
+    --------
+    >>> import mars.dataframe as md
+    >>> df = md.DataFrame({'population': [59000000, 65000000, 434000,
+    ...                                   434000, 434000, 337000, 11300,
+    ...                                   11300, 11300],
+    ...                    'GDP': [1937894, 2583560 , 12011, 4520, 12128,
+    ...                            17036, 182, 38, 311],
+    ...                    'alpha-2': ["IT", "FR", "MT", "MV", "BN",
+    ...                                "IS", "NR", "TV", "AI"]},
+    ...                   index=["Italy", "France", "Malta",
+    ...                          "Maldives", "Brunei", "Iceland",
+    ...                          "Nauru", "Tuvalu", "Anguilla"])
+    >>> df.nlargest(3, 'population').execute()
+            population      GDP alpha-2
+    France    65000000  2583560      FR
+    Italy     59000000  1937894      IT
+    Malta       434000    12011      MT
+    """
+    return _nselect(df, n, columns, keep, True)
+
+
+def dataframe_nsmallest(df, n, columns, keep='first'):
+    """
+    Return the first `n` rows ordered by `columns` in ascending order.
+
+    This method is equivalent to
+    ``df.sort_values(columns, ascending=True).head(n)``, but more
+    performant, since every chunk only keeps `n` candidates.
+
+    Parameters
+    ----------
+    df : input DataFrame.
+    n : int
+        Number of items to retrieve.
+    columns : list or str
+        Column name or names to order by.
+    keep : {'first', 'last', 'all'}, default 'first'
+        Where there are duplicate values:
+
+        - ``first`` : take the first occurrence.
+        - ``last`` : take the last occurrence.
+        - ``all`` : do not drop any duplicates, even it means
+          selecting more than `n` items.
+
+    Returns
+    -------
+    DataFrame
+    """
+    return _nselect(df, n, columns, keep, False)
+
+
+def series_nlargest(series, n=5, keep='first'):
+    """
+    Return the largest `n` elements.
+
+    Parameters
+    ----------
+    series : input Series.
+    n : int, default 5
+        Return this many descending sorted values.
+    keep : {'first', 'last', 'all'}, default 'first'
+        When there are duplicate values that cannot all fit in a
+        Series of `n` elements:
+
+        - ``first`` : return the first `n` occurrences in order
+            of appearance.
+        - ``last`` : return the last `n` occurrences in reverse
+            order of appearance.
+        - ``all`` : keep all occurrences. This can result in a Series of
+            size larger than `n`.
+
+    Returns
+    -------
+    Series
+        The `n` largest values in the Series, sorted in decreasing order.
+    """
+    return _nselect(series, n, None, keep, True)
+
+
+def series_nsmallest(series, n=5, keep='first'):
+    """
+    Return the smallest `n` elements.
+
+    Parameters
+    ----------
+    series : input Series.
+    n : int, default 5
+        Return this many ascending sorted values.
+    keep : {'first', 'last', 'all'}, default 'first'
+        When there are duplicate values that cannot all fit in a
+        Series of `n` elements:
+
+        - ``first`` : return the first `n` occurrences in order
+            of appearance.
+        - ``last`` : return the last `n` occurrences in reverse
+            order of appearance.
+        - ``all`` : keep all occurrences. This can result in a Series of
+            size larger than `n`.
+
+    Returns
+    -------
+    Series
+        The `n` smallest values in the Series, sorted in increasing order.
+    """
+    return _nselect(series, n, None, keep, False)
+
+
+def sort_values_head(a, n):
+    """
+    Select first `n` rows of data sorted by `sort_values` without sorting
+    all of them, None is returned if the rows cannot be selected this way.
+    """
+    from .sort_values import DataFrameSortValues
+
+    sort_op = a.op
+    if not isinstance(sort_op, DataFrameSortValues) or sort_op.ignore_index:
+        return
+    # keys with mixed sort orders cannot be selected by `nlargest`
+    if not isinstance(sort_op.ascending, (bool, np.bool_)):
+        return
+    if n < 0 or n > options.sort.head_select_limit or sort_op.axis != 0:
+        return
+    if not np.isnan(a.shape[0]) and n >= a.shape[0]:
+        return
+    if sort_op.object_type == ObjectType.dataframe:
+        dtypes = a.dtypes[sort_op.by]
+    else:
+        dtypes = [a.dtype]
+    # bools are not supported by `nlargest` of some pandas versions
+    if any(dt.kind not in 'iufmM' for dt in dtypes):
+        return
+
+    in_data = sort_op.inputs[0]
+    op = DataFrameNLargest(n=n, by=sort_op.by, largest=not sort_op.ascending,
+                           kind=sort_op.kind, na_position=sort_op.na_position,
+                           object_type=sort_op.object_type)
+    size = n if np.isnan(a.shape[0]) else min(n, a.shape[0])
+    shape = (size,) + a.shape[1:]
+    return op(in_data, shape=shape, index_value=a.index_value)
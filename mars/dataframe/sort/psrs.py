@@ -18,9 +18,9 @@ import pandas as pd
 from ... import opcodes as OperandDef
 from ...utils import lazy_import, get_shuffle_input_keys_idxes
 from ...operands import OperandStage
-from ...serialize import ValueType, Int32Field, ListField, StringField, BoolField
-from ...tensor.base.psrs import PSRSOperandMixin
-from ..utils import standardize_range_index
+from ...serialize import ValueType, Int32Field, Int64Field, ListField, StringField, BoolField
+from ...tensor.base.psrs import PSRSOperandMixin, _duplicated_pivots
+from ..utils import parse_index, standardize_range_index
 from ..operands import DataFrameOperandMixin, DataFrameOperand, DataFrameShuffleProxy, \
     ObjectType, DataFrameMapReduceOperand
 
@@ -41,13 +41,25 @@ class DataFramePSRSOperandMixin(DataFrameOperandMixin, PSRSOperandMixin):
         return properties
 
     @classmethod
-    def local_sort_and_regular_sample(cls, op, in_data, axis_chunk_shape, axis_offsets, out_idx):
+    def _estimate_nbytes(cls, in_data):
+        if in_data.ndim == 2:
+            itemsize = sum(dt.itemsize for dt in in_data.dtypes)
+        else:
+            itemsize = in_data.dtype.itemsize
+        return in_data.shape[0] * itemsize
+
+    @classmethod
+    def local_sort_and_regular_sample(cls, op, in_data, axis_chunk_shape, axis_offsets, out_idx,
+                                      n_partition=None):
         # stage 1: local sort and regular samples collected
+        n_partition = n_partition or axis_chunk_shape
+        n_sample = cls.calc_n_sample(op, in_data, n_partition)
         sorted_chunks, indices_chunks, sampled_chunks = [], [], []
         for i in range(axis_chunk_shape):
             in_chunk = in_data.chunks[i]
             kind = None if op.psrs_kinds is None else op.psrs_kinds[0]
-            chunk_op = DataFramePSRSSortRegularSample(kind=kind, n_partition=axis_chunk_shape,
+            chunk_op = DataFramePSRSSortRegularSample(kind=kind, n_sample=n_sample,
+                                                      axis_offset=axis_offsets[i],
                                                       object_type=op.object_type,
                                                       **cls._collect_op_properties(op))
             kws = []
@@ -56,11 +68,11 @@ class DataFramePSRSOperandMixin(DataFrameOperandMixin, PSRSOperandMixin):
                         'index_value': in_chunk.index_value,
                         'index': in_chunk.index})
             if chunk_op.sort_type == 'sort_values':
-                sampled_shape = (axis_chunk_shape, len(op.by)) if \
-                    op.by else (axis_chunk_shape,)
+                sampled_shape = (n_sample, len(op.by)) if \
+                    op.by else (n_sample,)
             else:
-                sampled_shape = (axis_chunk_shape, sort_shape[1]) if\
-                    len(sort_shape) == 2 else (axis_chunk_shape,)
+                sampled_shape = (n_sample, sort_shape[1]) if\
+                    len(sort_shape) == 2 else (n_sample,)
             kws.append({'shape': sampled_shape,
                         'index_value': in_chunk.index_value,
                         'index': (i,),
@@ -79,31 +91,35 @@ class DataFramePSRSOperandMixin(DataFrameOperandMixin, PSRSOperandMixin):
         return sorted_chunks, indices_chunks, sampled_chunks
 
     @classmethod
-    def concat_and_pivot(cls, op, axis_chunk_shape, out_idx, sorted_chunks, sampled_chunks):
+    def concat_and_pivot(cls, op, axis_chunk_shape, out_idx, sorted_chunks, sampled_chunks,
+                         n_partition=None):
         # stage 2: gather and merge samples, choose and broadcast p-1 pivots
+        n_partition = n_partition or axis_chunk_shape
         kind = None if op.psrs_kinds is None else op.psrs_kinds[1]
-        concat_pivot_op = DataFramePSRSConcatPivot(kind=kind, n_partition=axis_chunk_shape,
+        concat_pivot_op = DataFramePSRSConcatPivot(kind=kind, n_partition=n_partition,
                                                    object_type=op.object_type,
                                                    **cls._collect_op_properties(op))
         concat_pivot_shape = \
-            sorted_chunks[0].shape[:op.axis] + (axis_chunk_shape - 1,) + \
+            sorted_chunks[0].shape[:op.axis] + (n_partition - 1,) + \
             sorted_chunks[0].shape[op.axis + 1:]
         concat_pivot_index = out_idx[:op.axis] + (0,) + out_idx[op.axis:]
         concat_pivot_chunk = concat_pivot_op.new_chunk(sampled_chunks,
                                                        shape=concat_pivot_shape,
                                                        index=concat_pivot_index,
                                                        object_type=op.object_type)
-        return concat_pivot_chunk
+        return [concat_pivot_chunk]
 
     @classmethod
     def partition_local_data(cls, op, axis_chunk_shape, sorted_chunks,
-                             indices_chunks, concat_pivot_chunk):
+                             indices_chunks, concat_pivot_chunks, n_partition=None):
         # stage 3: Local data is partitioned
+        n_partition = n_partition or axis_chunk_shape
         partition_chunks = []
         length = len(sorted_chunks)
         for i in range(length):
-            chunk_inputs = [sorted_chunks[i], concat_pivot_chunk]
-            partition_shuffle_map = DataFramePSRSShuffle(n_partition=axis_chunk_shape,
+            chunk_inputs = [sorted_chunks[i]] + list(concat_pivot_chunks)
+            partition_shuffle_map = DataFramePSRSShuffle(n_partition=n_partition,
+                                                         axis_offset=sorted_chunks[i].op.axis_offset,
                                                          stage=OperandStage.map,
                                                          object_type=op.object_type,
                                                          **cls._collect_op_properties(op))
@@ -120,19 +136,30 @@ class DataFramePSRSOperandMixin(DataFrameOperandMixin, PSRSOperandMixin):
         return partition_chunks
 
     @classmethod
-    def partition_merge_data(cls, op, need_align, return_value, partition_chunks, proxy_chunk):
+    def partition_merge_data(cls, op, need_align, return_value, partition_chunks, proxy_chunk,
+                             n_partition=None):
         # stage 4: all *ith* classes are gathered and merged
+        n_partition = n_partition or len(partition_chunks)
         partition_sort_chunks, partition_indices_chunks, sort_info_chunks = [], [], []
-        for i, partition_chunk in enumerate(partition_chunks):
+        for i in range(n_partition):
             kind = None if op.psrs_kinds is None else op.psrs_kinds[2]
             partition_shuffle_reduce = DataFramePSRSShuffle(
                 stage=OperandStage.reduce, kind=kind, shuffle_key=str(i),
                 object_type=op.object_type, **cls._collect_op_properties(op))
+            if n_partition == len(partition_chunks):
+                partition_chunk = partition_chunks[i]
+                index_value = partition_chunk.index_value
+            else:
+                # more partitions than input chunks, index of output is unknown
+                partition_chunk = partition_chunks[0]
+                index_value = parse_index(pd.Int64Index([]), proxy_chunk.key, i)
             chunk_shape = list(partition_chunk.shape)
             chunk_shape[op.axis] = np.nan
+            chunk_index = list(partition_chunk.index)
+            chunk_index[op.axis] = i
 
-            kw = dict(shape=tuple(chunk_shape), index=partition_chunk.index,
-                      index_value=partition_chunk.index_value)
+            kw = dict(shape=tuple(chunk_shape), index=tuple(chunk_index),
+                      index_value=index_value)
             if op.object_type == ObjectType.dataframe:
                 kw.update(dict(columns_value=partition_chunk.columns_value,
                                dtypes=partition_chunk.dtypes))
@@ -147,25 +174,28 @@ class DataFramePSRSOperandMixin(DataFrameOperandMixin, PSRSOperandMixin):
     def _tile_psrs(cls, op, in_data):
         out = op.outputs[0]
         in_df, axis_chunk_shape, _, _ = cls.preprocess(op, in_data=in_data)
+        axis_offsets = [0] + np.cumsum(in_df.nsplits[op.axis]).tolist()[:-1]
+        n_partition = cls.calc_n_partition(op, in_df, axis_chunk_shape, False)
 
         # stage 1: local sort and regular samples collected
         sorted_chunks, _, sampled_chunks = cls.local_sort_and_regular_sample(
-            op, in_df, axis_chunk_shape, None, None)
+            op, in_df, axis_chunk_shape, axis_offsets, None, n_partition=n_partition)
 
         # stage 2: gather and merge samples, choose and broadcast p-1 pivots
-        concat_pivot_chunk = cls.concat_and_pivot(
-            op, axis_chunk_shape, (), sorted_chunks, sampled_chunks)
+        concat_pivot_chunks = cls.concat_and_pivot(
+            op, axis_chunk_shape, (), sorted_chunks, sampled_chunks, n_partition=n_partition)
 
         # stage 3: Local data is partitioned
         partition_chunks = cls.partition_local_data(
-            op, axis_chunk_shape, sorted_chunks, None, concat_pivot_chunk)
+            op, axis_chunk_shape, sorted_chunks, None, concat_pivot_chunks,
+            n_partition=n_partition)
 
         proxy_chunk = DataFrameShuffleProxy(object_type=op.object_type).new_chunk(
             partition_chunks, shape=())
 
         # stage 4: all *ith* classes are gathered and merged
         partition_sort_chunks = cls.partition_merge_data(
-            op, False, None, partition_chunks, proxy_chunk)[0]
+            op, False, None, partition_chunks, proxy_chunk, n_partition=n_partition)[0]
 
         if op.ignore_index:
             chunks = standardize_range_index(partition_sort_chunks, axis=op.axis)
@@ -186,14 +216,15 @@ class DataFramePSRSOperandMixin(DataFrameOperandMixin, PSRSOperandMixin):
                                       dtype=out.dtype, name=out.name)
 
 
-def execute_sort_values(data, op, inplace=None):
+def execute_sort_values(data, op, inplace=None, kind=None):
     if inplace is None:
         inplace = op.inplace
+    kind = kind if kind is not None else op.kind
     # ignore_index is new in Pandas version 1.0.0.
     ignore_index = getattr(op, 'ignore_index', False)
     if isinstance(data, (pd.DataFrame, pd.Series)):
         kwargs = dict(axis=op.axis, ascending=op.ascending, ignore_index=ignore_index,
-                      na_position=op.na_position, kind=op.kind)
+                      na_position=op.na_position, kind=kind)
         if isinstance(data, pd.DataFrame):
             kwargs['by'] = op.by
         if inplace:
@@ -249,6 +280,28 @@ def execute_sort_index(data, op, inplace=None):
         return data.sort_index(ascending=op.ascending)
 
 
+def _search_pivots(keys, pivots, ascending, pivot_ranks, axis_offset):
+    """
+    Find positions to split sorted keys by pivots. Keys equal to a pivot
+    go to one partition, except that if the pivot is duplicate, they are
+    spread across partitions by comparing their ranks with the pivot.
+    """
+    if ascending:
+        poses = keys.searchsorted(pivots, side='right')
+    else:
+        poses = len(keys) - keys[::-1].searchsorted(pivots, side='right')
+    dup = _duplicated_pivots(np.asarray(pivots), np)
+    if dup.any():
+        if ascending:
+            left_poses, right_poses = keys.searchsorted(pivots, side='left'), poses
+        else:
+            left_poses = poses
+            right_poses = len(keys) - keys[::-1].searchsorted(pivots, side='left')
+        rank_poses = np.clip(pivot_ranks - axis_offset + 1, left_poses, right_poses)
+        poses = np.where(dup, rank_poses, poses)
+    return poses
+
+
 class DataFramePSRSChunkOperand(DataFrameOperand):
     # sort type could be 'sort_values' or 'sort_index'
     _sort_type = StringField('sort_type')
@@ -265,12 +318,16 @@ class DataFramePSRSChunkOperand(DataFrameOperand):
     _sort_remaining = BoolField('sort_remaining')
 
     _n_partition = Int32Field('n_partition')
+    _n_sample = Int32Field('n_sample')
+    _axis_offset = Int64Field('axis_offset')
 
     def __init__(self, sort_type=None, by=None, axis=None, ascending=None, inplace=None, kind=None,
-                 na_position=None, level=None, sort_remaining=None, n_partition=None, object_type=None, **kw):
+                 na_position=None, level=None, sort_remaining=None, n_partition=None, n_sample=None,
+                 axis_offset=None, object_type=None, **kw):
         super().__init__(_sort_type=sort_type, _by=by, _axis=axis, _ascending=ascending,
                          _inplace=inplace, _kind=kind, _na_position=na_position,
                          _level=level, _sort_remaining=sort_remaining, _n_partition=n_partition,
+                         _n_sample=n_sample, _axis_offset=axis_offset,
                          _object_type=object_type, **kw)
 
     @property
@@ -313,6 +370,14 @@ class DataFramePSRSChunkOperand(DataFrameOperand):
     def n_partition(self):
         return self._n_partition
 
+    @property
+    def n_sample(self):
+        return self._n_sample
+
+    @property
+    def axis_offset(self):
+        return self._axis_offset
+
 
 class DataFramePSRSSortRegularSample(DataFramePSRSChunkOperand, DataFrameOperandMixin):
     _op_type_ = OperandDef.PSRS_SORT_REGULAR_SMAPLE
@@ -325,17 +390,22 @@ class DataFramePSRSSortRegularSample(DataFramePSRSChunkOperand, DataFrameOperand
     def execute(cls, ctx, op):
         a = ctx[op.inputs[0].key]
 
-        n = op.n_partition
-        w = int(a.shape[op.axis] // n)
+        # regular samples are spread evenly over the chunk
+        n = op.n_sample
+        positions = np.arange(n) * a.shape[op.axis] // n
 
-        slc = (slice(None),) * op.axis + (slice(0, n * w, w),)
+        slc = (slice(None),) * op.axis + (positions,)
         if op.sort_type == 'sort_values':
             ctx[op.outputs[0].key] = res = execute_sort_values(a, op)
             # do regular sample
             if op.by is not None:
-                ctx[op.outputs[-1].key] = res[op.by].iloc[slc]
+                sampled = res[op.by].iloc[slc]
             else:
-                ctx[op.outputs[-1].key] = res.iloc[slc]
+                sampled = res.iloc[slc]
+            # index of samples are replaced by their ranks in sorted data
+            # which are used to spread duplicate keys across partitions
+            sampled.index = op.axis_offset + positions
+            ctx[op.outputs[-1].key] = sampled
         else:
             ctx[op.outputs[0].key] = res = execute_sort_index(a, op)
             # do regular sample
@@ -355,13 +425,15 @@ class DataFramePSRSConcatPivot(DataFramePSRSChunkOperand, DataFrameOperandMixin)
         xdf = pd if isinstance(inputs[0], (pd.DataFrame, pd.Series)) else cudf
 
         a = xdf.concat(inputs, axis=op.axis)
-        p = len(inputs)
-        assert a.shape[op.axis] == p ** 2
 
-        select = slice(p - 1, (p - 1) ** 2 + 1, p - 1)
+        # choose p-1 pivots evenly from samples
+        n = a.shape[op.axis]
+        select = np.arange(1, op.n_partition) * n // op.n_partition
         slc = (slice(None),) * op.axis + (select,)
         if op.sort_type == 'sort_values':
-            a = execute_sort_values(a, op, inplace=False)
+            # samples are sorted stably, thus samples with identical keys
+            # are ordered by their ranks kept in index
+            a = execute_sort_values(a, op, inplace=False, kind='mergesort')
             ctx[op.outputs[-1].key] = a.iloc[slc]
         else:
             a = execute_sort_index(a, op, inplace=False)
@@ -380,6 +452,7 @@ class DataFramePSRSShuffle(DataFrameMapReduceOperand, DataFrameOperandMixin):
     _inplace = BoolField('inplace')
     _na_position = StringField('na_position')
     _n_partition = Int32Field('n_partition')
+    _axis_offset = Int64Field('axis_offset')
 
     # for sort_index
     _level = ListField('level')
@@ -389,11 +462,12 @@ class DataFramePSRSShuffle(DataFrameMapReduceOperand, DataFrameOperandMixin):
     _kind = StringField('kind')
 
     def __init__(self, sort_type=None, by=None, axis=None, ascending=None, n_partition=None,
-                 na_position=None, inplace=None, kind=None, level=None, sort_remaining=None,
-                 stage=None, shuffle_key=None, object_type=None, **kw):
+                 axis_offset=None, na_position=None, inplace=None, kind=None, level=None,
+                 sort_remaining=None, stage=None, shuffle_key=None, object_type=None, **kw):
         super().__init__(_sort_type=sort_type, _by=by, _axis=axis, _ascending=ascending,
-                         _n_partition=n_partition, _na_position=na_position, _inplace=inplace,
-                         _kind=kind, _level=level, _sort_remaining=sort_remaining, _stage=stage,
+                         _n_partition=n_partition, _axis_offset=axis_offset,
+                         _na_position=na_position, _inplace=inplace, _kind=kind, _level=level,
+                         _sort_remaining=sort_remaining, _stage=stage,
                          _shuffle_key=shuffle_key, _object_type=object_type, **kw)
 
     @property
@@ -432,6 +506,10 @@ class DataFramePSRSShuffle(DataFrameMapReduceOperand, DataFrameOperandMixin):
     def n_partition(self):
         return self._n_partition
 
+    @property
+    def axis_offset(self):
+        return self._axis_offset
+
     @property
     def kind(self):
         return self._kind
@@ -449,10 +527,8 @@ class DataFramePSRSShuffle(DataFrameMapReduceOperand, DataFrameOperandMixin):
             # use numpy.searchsorted to find split positions.
             records = a[op.by].to_records(index=False)
             p_records = pivots.to_records(index=False)
-            if op.ascending:
-                poses = records.searchsorted(p_records, side='right')
-            else:
-                poses = len(records) - records[::-1].searchsorted(p_records, side='right')
+            poses = _search_pivots(records, p_records, op.ascending,
+                                   pivots.index.values, op.axis_offset)
 
             poses = (None,) + tuple(poses) + (None,)
             for i in range(op.n_partition):
@@ -481,10 +557,8 @@ class DataFramePSRSShuffle(DataFrameMapReduceOperand, DataFrameOperandMixin):
         out = op.outputs[0]
 
         if isinstance(a, pd.Series):
-            if op.ascending:
-                poses = a.searchsorted(pivots, side='right')
-            else:
-                poses = len(a) - a.iloc[::-1].searchsorted(pivots, side='right')
+            poses = _search_pivots(a, pivots, op.ascending,
+                                   pivots.index.values, op.axis_offset)
             poses = (None,) + tuple(poses) + (None,)
             for i in range(op.n_partition):
                 values = a.iloc[poses[i]: poses[i + 1]]
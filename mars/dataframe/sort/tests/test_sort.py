@@ -18,10 +18,11 @@ import numpy as np
 import pandas as pd
 
 from mars.operands import OperandStage
-from mars.dataframe.initializer import DataFrame
+from mars.dataframe.initializer import DataFrame, Series
 from mars.dataframe.indexing.getitem import DataFrameIndex
 from mars.dataframe.sort.sort_values import dataframe_sort_values, DataFrameSortValues
 from mars.dataframe.sort.sort_index import sort_index, DataFrameSortIndex
+from mars.dataframe.sort.nlargest import DataFrameNLargest
 
 
 class Test(unittest.TestCase):
@@ -118,3 +119,54 @@ class Test(unittest.TestCase):
         tiled = sorted_df.tiles()
 
         self.assertTrue(all(isinstance(c.op, DataFrameIndex) for c in tiled.chunks))
+
+    def testNLargest(self):
+        raw = pd.DataFrame({'a': np.random.rand(10),
+                            'b': np.random.randint(1000, size=10),
+                            'c': [np.random.bytes(10) for _ in range(10)]})
+        df = DataFrame(raw, chunk_size=1)
+        r = df.nlargest(3, ['a', 'b'])
+
+        self.assertIsInstance(r.op, DataFrameNLargest)
+        self.assertTrue(np.isnan(r.shape[0]))
+
+        tiled = r.tiles()
+
+        self.assertEqual(len(tiled.chunks), 1)
+        self.assertEqual(tiled.chunks[0].op.stage, OperandStage.agg)
+        combine_chunks = tiled.chunks[0].inputs
+        self.assertEqual(len(combine_chunks), 3)
+        self.assertTrue(all(c.op.stage == OperandStage.combine for c in combine_chunks))
+        self.assertEqual(sum(len(c.inputs) for c in combine_chunks), 10)
+
+        with self.assertRaises(TypeError):
+            df.nsmallest(3, 'c')
+        with self.assertRaises(ValueError):
+            df.nsmallest(3, 'a', keep='none')
+
+        # head of sorted data is selected without sorting
+        r = df.sort_values('a', ascending=False).head(3)
+
+        self.assertIsInstance(r.op, DataFrameNLargest)
+        self.assertTrue(r.op.largest)
+        self.assertEqual(r.shape, (3, 3))
+
+        r = df.sort_values('c').head(3)
+        self.assertNotIsInstance(r.op, DataFrameNLargest)
+
+        r = df.sort_values('a').head(20)
+        self.assertNotIsInstance(r.op, DataFrameNLargest)
+
+        r = df.sort_values(['a', 'b'], ascending=[True, False]).head(3)
+        self.assertNotIsInstance(r.op, DataFrameNLargest)
+
+        series = Series(raw['a'], chunk_size=4)
+        r = series.sort_values().head(3)
+
+        self.assertIsInstance(r.op, DataFrameNLargest)
+        self.assertFalse(r.op.largest)
+
+        tiled = r.tiles()
+
+        self.assertEqual(len(tiled.chunks), 1)
+        self.assertEqual(tiled.nsplits, ((3,),))
@@ -18,6 +18,7 @@ import unittest
 import numpy as np
 import pandas as pd
 
+from mars.config import option_context
 from mars.tests.core import ExecutorForTest
 from mars.dataframe import DataFrame, Series
 from mars.session import new_session
@@ -160,6 +161,30 @@ class Test(unittest.TestCase):
 
         pd.testing.assert_series_equal(result, expected)
 
+        # test duplicate keys spread across partitions, which are more
+        # than input chunks when the data is larger than chunk_store_limit
+        raw = pd.Series(np.random.RandomState(0).randint(10, size=400))
+        raw[raw < 7] = 5
+        series = Series(raw, chunk_size=100)
+        with option_context({'chunk_store_limit': 400}):
+            for ascending in [True, False]:
+                results = self.executor.execute_dataframe(series.sort_values(ascending=ascending))
+                self.assertGreater(len(results), 4)
+                self.assertLess(max(len(r) for r in results), len(raw) // 4)
+                result = pd.concat(results)
+                expected = raw.sort_values(ascending=ascending)
+                np.testing.assert_array_equal(result.values, expected.values)
+                self.assertEqual(sorted(result.index), sorted(expected.index))
+
+            raw = pd.DataFrame({'a': raw, 'b': np.random.RandomState(1).randint(2, size=400)})
+            mdf = DataFrame(raw, chunk_size=100)
+            results = self.executor.execute_dataframe(mdf.sort_values(['a', 'b'], ascending=False))
+            self.assertGreater(len(results), 4)
+            self.assertLess(max(len(r) for r in results), len(raw) // 4)
+            result = pd.concat(results)
+            expected = raw.sort_values(['a', 'b'], ascending=False)
+            np.testing.assert_array_equal(result.values, expected.values)
+
     def testSortIndexExecution(self):
         raw = pd.DataFrame(np.random.rand(100, 20), index=np.random.rand(100))
 
@@ -241,3 +266,48 @@ class Test(unittest.TestCase):
         result = self.executor.execute_dataframe(series.sort_index(ascending=False), concat=True)[0]
         expected = raw.sort_index(ascending=False)
         pd.testing.assert_series_equal(result, expected)
+
+    def testNLargestExecution(self):
+        raw = pd.Series(np.random.RandomState(0).randint(10, size=100))
+        series = Series(raw, chunk_size=7)
+
+        for keep in ['first', 'last', 'all']:
+            result = self.executor.execute_dataframe(series.nlargest(10, keep=keep), concat=True)[0]
+            pd.testing.assert_series_equal(result, raw.nlargest(10, keep=keep))
+
+            result = self.executor.execute_dataframe(series.nsmallest(10, keep=keep), concat=True)[0]
+            pd.testing.assert_series_equal(result, raw.nsmallest(10, keep=keep))
+
+        raw = pd.DataFrame({'a': np.random.RandomState(0).randint(10, size=100),
+                            'b': np.random.RandomState(1).randint(10, size=100),
+                            'c': np.random.rand(100)})
+        mdf = DataFrame(raw, chunk_size=7)
+
+        for keep in ['first', 'last', 'all']:
+            result = self.executor.execute_dataframe(mdf.nlargest(10, ['a', 'b'], keep=keep), concat=True)[0]
+            pd.testing.assert_frame_equal(result, raw.nlargest(10, ['a', 'b'], keep=keep))
+
+            result = self.executor.execute_dataframe(mdf.nsmallest(10, 'a', keep=keep), concat=True)[0]
+            pd.testing.assert_frame_equal(result, raw.nsmallest(10, 'a', keep=keep))
+
+        # test head of sorted data
+        raw = pd.DataFrame({'a': np.random.RandomState(0).randint(10, size=100),
+                            'b': np.random.rand(100)})
+        raw.loc[np.random.RandomState(2).rand(100) < 0.3, 'b'] = np.nan
+        mdf = DataFrame(raw, chunk_size=7)
+
+        result = self.executor.execute_dataframe(mdf.sort_values(['a', 'b']).head(10), concat=True)[0]
+        pd.testing.assert_frame_equal(result, raw.sort_values(['a', 'b']).head(10))
+
+        result = self.executor.execute_dataframe(
+            mdf.sort_values('b', ascending=False).head(90), concat=True)[0]
+        pd.testing.assert_frame_equal(result, raw.sort_values('b', ascending=False).head(90))
+
+        # keys with mixed sort orders are sorted before selecting head
+        sess = new_session()
+        result = sess.run(mdf.sort_values(['a', 'b'], ascending=[True, False]).head(5))
+        pd.testing.assert_frame_equal(result, raw.sort_values(['a', 'b'], ascending=[True, False]).head(5))
+
+        series = Series(raw['b'], chunk_size=7)
+        result = self.executor.execute_dataframe(series.sort_values().head(80), concat=True)[0]
+        pd.testing.assert_series_equal(result, raw['b'].sort_values().head(80))
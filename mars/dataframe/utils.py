@@ -105,6 +105,9 @@ def decide_dataframe_chunk_sizes(shape, chunk_size, memory_usage):
     """
     from ..config import options
 
+    if isinstance(chunk_size, str) and chunk_size == 'auto':
+        # split by the store limit as consumers are not considered
+        chunk_size = None
     chunk_size = dictify_chunk_size(shape, chunk_size)
     average_memory_usage = memory_usage / shape[0]
 
@@ -160,6 +163,9 @@ def decide_dataframe_chunk_sizes(shape, chunk_size, memory_usage):
 def decide_series_chunk_size(shape, chunk_size, memory_usage):
     from ..config import options
 
+    if isinstance(chunk_size, str) and chunk_size == 'auto':
+        # split by the store limit as consumers are not considered
+        chunk_size = None
     chunk_size = dictify_chunk_size(shape, chunk_size)
     average_memory_usage = memory_usage / shape[0]
 
@@ -656,6 +662,46 @@ def in_range_index(i, pd_range_index):
     return False
 
 
+_filter_ops = {
+    '==': operator.eq,
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda s, v: s.isin(v),
+    'not in': lambda s, v: ~s.isin(v),
+}
+
+
+def normalize_filters(filters):
+    if filters is None:
+        return None
+    normalized = []
+    for f in filters:
+        if len(f) != 3 or f[1] not in _filter_ops:
+            raise ValueError('filter should be a tuple of (column, op, value) '
+                             'with op in {}, got {}'.format(list(_filter_ops), f))
+        normalized.append(tuple(f))
+    return normalized
+
+
+def filter_dataframe(df, filters):
+    """
+    Select the rows of `df` which satisfy all the filters,
+    each filter is a tuple of (column, op, value).
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for col, op, val in filters:
+        if col in df.columns:
+            s = df[col]
+        else:
+            s = df.index.get_level_values(col).to_series(index=df.index)
+        mask &= np.asarray(_filter_ops[op](s, val))
+    return df[mask]
+
+
 def wrap_notimplemented_exception(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -19,21 +19,250 @@ from collections import deque
 from enum import Enum
 from io import StringIO
 
+import numpy as np
+cimport numpy as np
+cimport cython
+
 from .serialize import Serializable
 from .serialize.core cimport ValueType, ProviderType, ListField, Int8Field
 
 logger = logging.getLogger(__name__)
 
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef tuple _build_csr(list node_list, dict node_index, dict adjacency):
+    cdef:
+        Py_ssize_t n_nodes = len(node_list)
+        Py_ssize_t n_edges = 0
+        Py_ssize_t i, pos = 0
+        np.int64_t[:] indptr
+        np.int64_t[:] indices
+        dict neighbors
+
+    for i in range(n_nodes):
+        n_edges += len(<dict>adjacency[node_list[i]])
+
+    indptr_arr = np.empty(n_nodes + 1, dtype=np.int64)
+    indices_arr = np.empty(n_edges, dtype=np.int64)
+    indptr = indptr_arr
+    indices = indices_arr
+    for i in range(n_nodes):
+        indptr[i] = pos
+        neighbors = adjacency[node_list[i]]
+        for nb in neighbors:
+            indices[pos] = node_index[nb]
+            pos += 1
+    indptr[n_nodes] = pos
+    return indptr_arr, indices_arr
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _kahn_order(object indptr_arr, object indices_arr, object pred_indptr_arr, bint lifo):
+    """
+    Order nodes in CSR arrays with Kahn's algorithm. Nodes whose
+    predecessors are all visited are popped from a stack if lifo
+    is True, otherwise from a queue.
+    """
+    cdef:
+        np.int64_t[:] indptr = indptr_arr
+        np.int64_t[:] indices = indices_arr
+        np.int64_t[:] pred_indptr = pred_indptr_arr
+        np.int64_t[:] degrees
+        np.int64_t[:] pending
+        np.int64_t[:] order
+        Py_ssize_t n_nodes = indptr.shape[0] - 1
+        Py_ssize_t i, j, k
+        Py_ssize_t head = 0, tail = 0, count = 0
+
+    degrees = np.empty(n_nodes, dtype=np.int64)
+    pending = np.empty(n_nodes, dtype=np.int64)
+    order_arr = np.empty(n_nodes, dtype=np.int64)
+    order = order_arr
+
+    for i in range(n_nodes):
+        degrees[i] = pred_indptr[i + 1] - pred_indptr[i]
+        if degrees[i] == 0:
+            pending[tail] = i
+            tail += 1
+
+    while head < tail:
+        if lifo:
+            tail -= 1
+            i = pending[tail]
+        else:
+            i = pending[head]
+            head += 1
+        order[count] = i
+        count += 1
+        for k in range(indptr[i], indptr[i + 1]):
+            j = indices[k]
+            degrees[j] -= 1
+            if degrees[j] == 0:
+                pending[tail] = j
+                tail += 1
+
+    if count != n_nodes:
+        raise GraphContainsCycleError
+    return order_arr
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _bfs_order(object indptr_arr, object indices_arr, object starts_arr):
+    """
+    Order nodes in CSR arrays reachable from start nodes by
+    Breadth-first Search.
+    """
+    cdef:
+        np.int64_t[:] indptr = indptr_arr
+        np.int64_t[:] indices = indices_arr
+        np.int64_t[:] starts = starts_arr
+        np.uint8_t[:] seen
+        np.int64_t[:] queue
+        Py_ssize_t n_nodes = indptr.shape[0] - 1
+        Py_ssize_t i, j, k
+        Py_ssize_t head = 0, tail = 0
+
+    seen = np.zeros(n_nodes, dtype=np.uint8)
+    queue_arr = np.empty(n_nodes, dtype=np.int64)
+    queue = queue_arr
+
+    for k in range(starts.shape[0]):
+        i = starts[k]
+        if not seen[i]:
+            seen[i] = 1
+            queue[tail] = i
+            tail += 1
+
+    while head < tail:
+        i = queue[head]
+        head += 1
+        for k in range(indptr[i], indptr[i + 1]):
+            j = indices[k]
+            if not seen[j]:
+                seen[j] = 1
+                queue[tail] = j
+                tail += 1
+    return queue_arr[:tail]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _traverse_order(object succ_indptr_arr, object succ_indices_arr,
+                            object pred_indptr_arr, object pred_indices_arr,
+                            object starts_arr, bint lifo, bint defer_first):
+    """
+    Order nodes in CSR arrays in the same way as dict-based traversals.
+    Nodes are popped from a stack if lifo is True, otherwise from a queue.
+    A node is visited when all its predecessors are visited, otherwise
+    it is pushed back together with its unvisited predecessors, before
+    them unless defer_first is True.
+    """
+    cdef:
+        np.int64_t[:] succ_indptr = succ_indptr_arr
+        np.int64_t[:] succ_indices = succ_indices_arr
+        np.int64_t[:] pred_indptr = pred_indptr_arr
+        np.int64_t[:] pred_indices = pred_indices_arr
+        np.int64_t[:] starts = starts_arr
+        np.uint8_t[:] visited
+        np.int64_t[:] pending
+        np.int64_t[:] order
+        Py_ssize_t n_nodes = succ_indptr.shape[0] - 1
+        Py_ssize_t i, j, k, n_push
+        Py_ssize_t head = 0, tail = 0, count = 0
+        bint ready
+
+    visited = np.zeros(n_nodes, dtype=np.uint8)
+    order_arr = np.empty(n_nodes, dtype=np.int64)
+    order = order_arr
+    pending_arr = np.empty(max(2 * (n_nodes + starts.shape[0]), 16), dtype=np.int64)
+    pending = pending_arr
+
+    for k in range(starts.shape[0]):
+        pending[tail] = starts[k]
+        tail += 1
+
+    while head < tail:
+        if lifo:
+            tail -= 1
+            i = pending[tail]
+        else:
+            i = pending[head]
+            head += 1
+        if visited[i]:
+            continue
+
+        ready = True
+        for k in range(pred_indptr[i], pred_indptr[i + 1]):
+            if not visited[pred_indices[k]]:
+                ready = False
+                break
+
+        if ready:
+            n_push = succ_indptr[i + 1] - succ_indptr[i]
+        else:
+            n_push = 1 + pred_indptr[i + 1] - pred_indptr[i]
+        if tail + n_push > pending.shape[0]:
+            # move pending nodes to the front and enlarge the buffer if needed
+            new_pending_arr = np.empty(max(2 * (tail - head + n_push), pending.shape[0]),
+                                       dtype=np.int64)
+            new_pending_arr[:tail - head] = pending_arr[head:tail]
+            pending_arr = new_pending_arr
+            pending = pending_arr
+            tail -= head
+            head = 0
+
+        if ready:
+            order[count] = i
+            count += 1
+            visited[i] = 1
+            for k in range(succ_indptr[i], succ_indptr[i + 1]):
+                j = succ_indices[k]
+                if not visited[j]:
+                    pending[tail] = j
+                    tail += 1
+        else:
+            if not defer_first:
+                pending[tail] = i
+                tail += 1
+            for k in range(pred_indptr[i], pred_indptr[i + 1]):
+                j = pred_indices[k]
+                if not visited[j]:
+                    pending[tail] = j
+                    tail += 1
+            if defer_first:
+                pending[tail] = i
+                tail += 1
+    return order_arr[:count]
+
+
 cdef class DirectedGraph:
     cdef:
         dict _nodes
         dict _predecessors
         dict _successors
-
-    def __init__(self):
+        bint _edge_attrs
+        # integer-indexed nodes and CSR arrays, only for frozen graphs
+        list _node_list
+        dict _node_index
+        object _succ_indptr
+        object _succ_indices
+        object _pred_indptr
+        object _pred_indices
+
+    def __init__(self, bint edge_attrs=True):
+        """
+        :param edge_attrs: if False, attributes of edges are not allowed
+                           and no dict is allocated for every edge
+        """
         self._nodes = dict()
         self._predecessors = dict()
         self._successors = dict()
+        self._edge_attrs = edge_attrs
+        self._node_list = None
+        self._node_index = None
 
     def __iter__(self):
         return iter(self._nodes)
@@ -50,6 +279,54 @@ cdef class DirectedGraph:
     def contains(self, node):
         return node in self._nodes
 
+    @property
+    def edge_attrs(self):
+        return self._edge_attrs
+
+    @property
+    def frozen(self):
+        return self._node_list is not None
+
+    cdef inline _check_mutable(self):
+        if self._node_list is not None:
+            raise GraphFrozenError('Cannot modify a frozen graph, call `unfreeze` first')
+
+    def freeze(self):
+        """
+        Freeze the graph. Nodes are indexed by integers and edges are
+        stored in CSR arrays, thus default traversals in `topological_iter`,
+        `bfs`, `dfs` and `traverse` run on arrays instead of allocating
+        containers for every node. Frozen graphs cannot be modified till
+        `unfreeze` is called.
+
+        :return: the graph itself
+        """
+        cdef:
+            list node_list
+            dict node_index
+
+        if self._node_list is not None:
+            return self
+        node_list = list(self._nodes)
+        node_index = dict(zip(node_list, range(len(node_list))))
+        self._succ_indptr, self._succ_indices = _build_csr(node_list, node_index, self._successors)
+        self._pred_indptr, self._pred_indices = _build_csr(node_list, node_index, self._predecessors)
+        self._node_index = node_index
+        self._node_list = node_list
+        return self
+
+    def unfreeze(self):
+        """
+        Drop arrays of the frozen graph to make it mutable again.
+
+        :return: the graph itself
+        """
+        self._node_list = None
+        self._node_index = None
+        self._succ_indptr = self._succ_indices = None
+        self._pred_indptr = self._pred_indices = None
+        return self
+
     def add_node(self, node, node_attr=None, **node_attrs):
         if node_attr is None:
             node_attr = node_attrs
@@ -61,6 +338,7 @@ cdef class DirectedGraph:
         self._add_node(node, node_attr)
 
     cdef inline _add_node(self, node, node_attr=None):
+        self._check_mutable()
         if node_attr is None:
             node_attr = dict()
         if node not in self._nodes:
@@ -71,6 +349,7 @@ cdef class DirectedGraph:
             self._nodes[node].update(node_attr)
 
     def remove_node(self, node):
+        self._check_mutable()
         if node not in self._nodes:
             raise KeyError('Node %s does not exist in the directed graph' % node)
 
@@ -98,11 +377,22 @@ cdef class DirectedGraph:
         cdef:
             dict u_succ, v_pred
 
+        self._check_mutable()
         if u not in self._nodes:
             raise KeyError('Node %s does not exist in the directed graph' % u)
         if v not in self._nodes:
             raise KeyError('Node %s does not exist in the directed graph' % v)
 
+        if not self._edge_attrs:
+            if edge_attr:
+                raise ValueError('Edge attributes are not allowed in the graph')
+            u_succ = self._successors[u]
+            if v not in u_succ:
+                u_succ[v] = None
+                v_pred = self._predecessors[v]
+                v_pred[u] = None
+            return
+
         if edge_attr is None:
             edge_attr = dict()
 
@@ -118,6 +408,7 @@ cdef class DirectedGraph:
             v_pred[u] = edge_attr
 
     def remove_edge(self, u, v):
+        self._check_mutable()
         try:
             del self._successors[u][v]
             del self._predecessors[v][u]
@@ -161,15 +452,46 @@ cdef class DirectedGraph:
 
     def iter_indep(self, reverse=False):
         cdef dict preds
+        if self._node_list is not None:
+            return map(self._node_list.__getitem__, self._indep_indexes(reverse).tolist())
         preds = self._predecessors if not reverse else self._successors
-        for n, p in preds.items():
-            if len(p) == 0:
-                yield n
+        return (n for n, p in preds.items() if len(p) == 0)
+
+    def _indep_indexes(self, reverse=False):
+        indptr = self._pred_indptr if not reverse else self._succ_indptr
+        return np.flatnonzero(np.diff(indptr) == 0)
+
+    def _start_indexes(self, start, reverse, from_indep):
+        if from_indep:
+            return self._indep_indexes(reverse).astype(np.int64)
+        if not isinstance(start, (list, tuple)):
+            start = [start]
+        return np.array([self._node_index[n] for n in start], dtype=np.int64)
+
+    def _iter_traverse_order(self, start_indexes, reverse=False, lifo=True, defer_first=False):
+        if not reverse:
+            order = _traverse_order(self._succ_indptr, self._succ_indices,
+                                    self._pred_indptr, self._pred_indices,
+                                    start_indexes, lifo, defer_first)
+        else:
+            order = _traverse_order(self._pred_indptr, self._pred_indices,
+                                    self._succ_indptr, self._succ_indices,
+                                    start_indexes, lifo, defer_first)
+        return map(self._node_list.__getitem__, order.tolist())
+
+    def _iter_kahn_order(self, reverse=False, lifo=True):
+        if not reverse:
+            order = _kahn_order(self._succ_indptr, self._succ_indices, self._pred_indptr, lifo)
+        else:
+            order = _kahn_order(self._pred_indptr, self._pred_indices, self._succ_indptr, lifo)
+        return map(self._node_list.__getitem__, order.tolist())
 
     cpdef int count_indep(self, reverse=False):
         cdef:
             dict preds
             int result = 0
+        if self._node_list is not None:
+            return len(self._indep_indexes(reverse))
         preds = self._predecessors if not reverse else self._successors
         for n, p in preds.items():
             if len(p) == 0:
@@ -177,6 +499,12 @@ cdef class DirectedGraph:
         return result
 
     def traverse(self, visit_predicate=None):
+        if self._node_list is not None and visit_predicate is None:
+            return self._iter_traverse_order(self._start_indexes(None, False, True),
+                                             lifo=False, defer_first=True)
+        return self._traverse(visit_predicate=visit_predicate)
+
+    def _traverse(self, visit_predicate=None):
         cdef:
             set visited = set()
 
@@ -201,6 +529,13 @@ cdef class DirectedGraph:
                 q.append(node)
 
     def dfs(self, start=None, visit_predicate=None, successors=None, reverse=False):
+        if self._node_list is not None and not reverse and visit_predicate is None \
+                and successors is None:
+            return self._iter_traverse_order(self._start_indexes(start, False, not start), lifo=True)
+        return self._dfs(start=start, visit_predicate=visit_predicate,
+                         successors=successors, reverse=reverse)
+
+    def _dfs(self, start=None, visit_predicate=None, successors=None, reverse=False):
         cdef:
             set visited = set()
             list stack
@@ -239,6 +574,21 @@ cdef class DirectedGraph:
                 stack.extend(n for n in preds if n not in visited)
 
     def bfs(self, start=None, visit_predicate=None, successors=None, reverse=False):
+        if self._node_list is not None and successors is None:
+            if visit_predicate == 'all':
+                start_indexes = self._start_indexes(start, reverse, start is None)
+                if not reverse:
+                    order = _bfs_order(self._succ_indptr, self._succ_indices, start_indexes)
+                else:
+                    order = _bfs_order(self._pred_indptr, self._pred_indices, start_indexes)
+                return map(self._node_list.__getitem__, order.tolist())
+            elif visit_predicate is None:
+                return self._iter_traverse_order(self._start_indexes(start, reverse, start is None),
+                                                 reverse=reverse, lifo=False)
+        return self._bfs(start=start, visit_predicate=visit_predicate,
+                         successors=successors, reverse=reverse)
+
+    def _bfs(self, start=None, visit_predicate=None, successors=None, reverse=False):
         cdef:
             object queue
             object node
@@ -279,7 +629,7 @@ cdef class DirectedGraph:
                 queue.extend(n for n in preds if n not in visited)
 
     def copy(self):
-        cdef DirectedGraph graph = type(self)()
+        cdef DirectedGraph graph = type(self)(edge_attrs=self._edge_attrs)
         for n in self:
             if n not in graph._nodes:
                 graph._add_node(n)
@@ -290,7 +640,7 @@ cdef class DirectedGraph:
         return graph
 
     def build_undirected(self):
-        cdef DirectedGraph graph = DirectedGraph()
+        cdef DirectedGraph graph = DirectedGraph(edge_attrs=self._edge_attrs)
         for n in self:
             if n not in graph._nodes:
                 graph._add_node(n)
@@ -302,7 +652,7 @@ cdef class DirectedGraph:
         return graph
 
     def build_reversed(self):
-        cdef DirectedGraph graph = type(self)()
+        cdef DirectedGraph graph = type(self)(edge_attrs=self._edge_attrs)
         for n in self:
             if n not in graph._nodes:
                 graph._add_node(n)
@@ -467,8 +817,19 @@ class GraphContainsCycleError(Exception):
     pass
 
 
+class GraphFrozenError(Exception):
+    pass
+
+
 cdef class DAG(DirectedGraph):
     def topological_iter(self, succ_checker=None, reverse=False):
+        if self._node_list is not None and succ_checker is None:
+            if len(self) == 0:
+                return iter(())
+            return self._iter_kahn_order(reverse=reverse, lifo=True)
+        return self._topological_iter(succ_checker=succ_checker, reverse=reverse)
+
+    def _topological_iter(self, succ_checker=None, reverse=False):
         cdef:
             dict preds, succs
             set visited = set()
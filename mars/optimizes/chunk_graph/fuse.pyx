@@ -14,9 +14,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 from collections import deque
 
-from ...operands import Fuse, VirtualOperand
+import numpy as np
+
+from ...config import options
+from ...operands import Fetch, Fuse, VirtualOperand
+
+
+def estimate_chunk_nbytes(chunk):
+    """
+    Estimate size of a chunk with its metadata.
+
+    :param chunk: chunk to estimate
+    :return: estimated size in bytes, None if the size is unknown
+    """
+    try:
+        shape = chunk.shape
+        if shape is None or any(np.isnan(s) for s in shape):
+            return None
+        dtype = getattr(chunk, 'dtype', None)
+        if dtype is not None:
+            return int(np.prod(shape)) * dtype.itemsize
+        dtypes = getattr(chunk, 'dtypes', None)
+        if dtypes is None or len(shape) != 2:
+            return None
+        return int(shape[0]) * int(sum(dt.itemsize for dt in dtypes))
+    except (AttributeError, TypeError, ValueError):
+        return None
 
 
 class Fusion(object):
@@ -51,6 +77,12 @@ class Fusion(object):
         return composed_nodes
 
     def compose(self, list keys=None):
+        composed_nodes = self._compose_chains(keys)
+        if options.optimize.fuse_subgraphs:
+            composed_nodes = self._compose_subgraphs(composed_nodes, keys)
+        return composed_nodes
+
+    def _compose_chains(self, list keys=None):
         def _visit_predicate(n, visited):
             cond = any if getattr(n.op, '_loose_require', False) else all
             preds = self._graph.predecessors(n)
@@ -89,6 +121,210 @@ class Fusion(object):
                 composes.append(list(selected))
         return self._compose_graph(composes)
 
+    def _topological_order(self):
+        cdef:
+            dict pred_counts = dict()
+            list order
+
+        order = list(self._graph.iter_indep())
+        for n in self._graph:
+            pred_counts[n] = self._graph.count_predecessors(n)
+        for n in order:
+            for succ in self._graph.iter_successors(n):
+                pred_counts[succ] -= 1
+                if pred_counts[succ] == 0:
+                    order.append(succ)
+        return order
+
+    def _is_fusible(self, node):
+        if isinstance(node.op, (Fetch, VirtualOperand)) or len(node.op.outputs) != 1:
+            return False
+        for c in node.composed or [node]:
+            if c.op.expect_worker is not None or getattr(c.op, '_loose_require', False):
+                return False
+            # staged operands are parts of tree reductions or shuffles,
+            # whose parallelism is decided when tiling
+            if c.op.stage is not None or not all(c.op.prepare_inputs):
+                return False
+        # shuffle reducers must stay as heads of fused chunks
+        return not any(isinstance(pred.op, VirtualOperand)
+                       for pred in self._graph.iter_predecessors(node))
+
+    @staticmethod
+    def _get_size(chunk, dict sizes):
+        try:
+            return sizes[chunk]
+        except KeyError:
+            size = sizes[chunk] = estimate_chunk_nbytes(chunk)
+            return size
+
+    def _estimate_work(self, node, dict sizes):
+        """
+        Estimate work of a node by bytes it reads and writes,
+        including work of chunks fused into the node.
+        """
+        cdef:
+            object size
+
+        work = 0
+        if node.composed:
+            pairs = [(c, c.inputs or ()) for c in node.composed]
+        else:
+            pairs = [(node, self._graph.iter_predecessors(node))]
+        for c, inputs in pairs:
+            for inp in itertools.chain([c], inputs):
+                size = self._get_size(inp, sizes)
+                if size is None:
+                    return None
+                work += size
+        return work
+
+    def _grow_subgraph(self, tail, dict sizes, dict assigned, set keys_set):
+        """
+        Grow a single-output subgraph from the tail by adding predecessors
+        all of whose successors are already in the subgraph. Predecessors
+        without inputs and with small outputs can be duplicated into the
+        subgraph even if they have other successors. The subgraph is grown
+        only when the intermediate bytes saved outweigh the parallelism
+        lost, which is estimated by the difference between total work and
+        work on the critical path in the subgraph.
+        """
+        cdef:
+            dict paths
+            list members = [tail]
+            set duplicated = set()
+
+        graph = self._graph
+        weight = options.optimize.fuse_parallelism_weight
+        duplicate_limit = options.optimize.fuse_duplicate_limit
+
+        total_work = critical_work = self._estimate_work(tail, sizes)
+        if total_work is None:
+            return members, duplicated
+        paths = {tail: total_work}
+        saved = 0
+
+        q = deque(graph.iter_predecessors(tail))
+        while q:
+            pred = q.popleft()
+            if pred in paths or pred in assigned or pred.key in keys_set:
+                continue
+            if not self._is_fusible(pred) or pred.op.gpu != tail.op.gpu:
+                continue
+            size = self._get_size(pred, sizes)
+            work = self._estimate_work(pred, sizes)
+            if work is None:
+                continue
+
+            succs = [s for s in graph.iter_successors(pred) if s in paths]
+            is_duplicate = len(succs) < graph.count_successors(pred)
+            if is_duplicate and (graph.count_predecessors(pred) > 0 or size > duplicate_limit):
+                continue
+
+            path = work + max(paths[s] for s in succs)
+            new_total = total_work + work
+            new_critical = max(critical_work, path)
+            if saved + size < weight * (new_total - new_critical):
+                continue
+
+            members.append(pred)
+            paths[pred] = path
+            total_work, critical_work = new_total, new_critical
+            saved += size
+            if is_duplicate:
+                duplicated.add(pred)
+            q.extend(graph.iter_predecessors(pred))
+        return members, duplicated
+
+    def _compose_subgraphs(self, list composed_nodes, list keys=None):
+        """
+        Fuse single-output subgraphs with multiple inputs guided by costs.
+        Chunks fused in linear chains are treated as single nodes and
+        flattened into new fused chunks.
+        """
+        cdef:
+            dict sizes = dict()
+            dict assigned = dict()
+            dict topo_index
+            list order
+            list groups = []
+            set keys_set = set(keys or [])
+            set all_duplicated = set()
+
+        graph = self._graph
+        order = self._topological_order()
+        topo_index = dict((n, i) for i, n in enumerate(order))
+
+        for tail in reversed(order):
+            if tail in assigned or tail in all_duplicated or not self._is_fusible(tail):
+                continue
+            members, duplicated = self._grow_subgraph(tail, sizes, assigned, keys_set)
+            if len(members) < 2:
+                continue
+            for n in members:
+                if n not in duplicated:
+                    assigned[n] = tail
+            all_duplicated.update(duplicated)
+            members.sort(key=topo_index.__getitem__)
+            groups.append((members, duplicated))
+
+        if not groups:
+            return composed_nodes
+
+        removed = set()
+        new_nodes = []
+        for members, duplicated in groups:
+            fuse_chunk = self._compose_subgraph(members, duplicated)
+            removed.update(n for n in members if n not in duplicated)
+            new_nodes.append(fuse_chunk)
+        # remove duplicated chunks if all their successors are fused
+        for n in all_duplicated:
+            if n in graph and graph.count_successors(n) == 0:
+                graph.remove_node(n)
+                removed.add(n)
+        return [n for n in composed_nodes if n not in removed] + new_nodes
+
+    def _compose_subgraph(self, list members, set duplicated):
+        from ...utils import build_fuse_chunk
+
+        graph = self._graph
+        member_set = set(members)
+        tail = members[-1]
+
+        fused = []
+        for n in members:
+            fused.extend(n.composed or [n])
+        fused_set = set(fused)
+        inputs = []
+        input_set = set()
+        for c in fused:
+            for inp in c.inputs or ():
+                if inp not in fused_set and inp not in input_set:
+                    input_set.add(inp)
+                    inputs.append(inp)
+
+        fuse_chunk = build_fuse_chunk(fused, inputs=inputs)
+        graph.add_node(fuse_chunk)
+        for n in members:
+            for pred in graph.iter_predecessors(n):
+                if pred not in member_set:
+                    graph.add_edge(pred, fuse_chunk)
+        for succ in graph.iter_successors(tail):
+            graph.add_edge(fuse_chunk, succ)
+        for n in members:
+            if n not in duplicated:
+                graph.remove_node(n)
+        return fuse_chunk
+
+    @staticmethod
+    def _is_chain(list composed_nodes):
+        # chunks fused in linear chains only take inputs from their
+        # predecessors in the chain except the head chunk
+        for pre, cur_node in zip(composed_nodes[:-1], composed_nodes[1:]):
+            if not cur_node.inputs or any(inp.key != pre.key for inp in cur_node.inputs):
+                return False
+        return True
+
     def _decompose_node(self, node):
         def get_node(n):
             if n.composed:
@@ -120,9 +356,64 @@ class Fusion(object):
             self._graph.add_edge(composed_nodes[-1], n)
         self._graph.remove_node(node)
 
+    def _decompose_subgraph_node(self, node, dict sources):
+        """
+        Decompose a fused chunk whose composed chunks form a DAG. Inputs
+        are matched by keys, as inputs of composed chunks may be replaced
+        by chunks with the same keys, for instance, fetch chunks or copies
+        created by deserialization. Source chunks duplicated into several
+        fused chunks are restored only once.
+        """
+        cdef:
+            dict key_to_nodes = dict()
+            set connected = set()
+            list composed_nodes = []
+
+        for cur_node in node.composed:
+            if not cur_node.inputs:
+                # copies of a duplicated source chunk share the operand,
+                # restore the output of the operand which will be executed
+                for output in cur_node.op.outputs:
+                    if output.key == cur_node.key and \
+                            output is not getattr(cur_node, 'data', cur_node):
+                        cur_node = output
+                        break
+                cur_node = sources.setdefault(cur_node.key, cur_node)
+            key_to_nodes[cur_node.key] = cur_node
+            composed_nodes.append(cur_node)
+        pred_mapping = dict((pred.key, pred) for pred in self._graph.iter_predecessors(node))
+
+        for cur_node in composed_nodes:
+            self._graph.add_node(cur_node)
+        for cur_node in composed_nodes:
+            for pre in cur_node.inputs or ():
+                if pre.key in key_to_nodes:
+                    pre = key_to_nodes[pre.key]
+                elif pre.key in pred_mapping:
+                    pre = pred_mapping[pre.key]
+                    connected.add(pre.key)
+                if pre in self._graph:
+                    self._graph.add_edge(pre, cur_node)
+        # predecessors not matched by any input are kept on the head node
+        for key, pre in pred_mapping.items():
+            if key not in connected:
+                self._graph.add_edge(pre, composed_nodes[0])
+        for n in self._graph.iter_successors(node):
+            self._graph.add_edge(composed_nodes[-1], n)
+        self._graph.remove_node(node)
+
     def decompose(self, nodes=None):
+        cdef:
+            dict sources
+
         if nodes is None:
             nodes = list(self._graph.traverse())
+        sources = dict((n.key, n) for n in self._graph.iter_indep()
+                       if not n.inputs and not isinstance(n.op, Fuse))
         for v in nodes:
             if isinstance(v.op, Fuse):
-                self._decompose_node(v)
+                # source chunks may be duplicated into several fused chunks
+                if v.composed[0].inputs and self._is_chain(v.composed):
+                    self._decompose_node(v)
+                else:
+                    self._decompose_subgraph_node(v, sources)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+class ChainFuseOptimizer(object):
+    """
+    Base of optimizers fusing chains of operands into chunks.
+
+    Unlike chains fused by NeOptimizer, a successor with multiple
+    predecessors can be appended to a chain, other predecessors become
+    extra inputs of the fused chunk.
+    """
+    def __init__(self, graph):
+        self._graph = graph
+
+    def optimize(self, keys=None):
+        self.compose(keys=keys)
+
+    @classmethod
+    def _support(cls, node):
+        raise NotImplementedError
+
+    @classmethod
+    def _new_fuse_op(cls, tail_node, **kw):
+        raise NotImplementedError
+
+    def _compose_graph(self, composes):
+        graph = self._graph
+        composed_nodes = []
+
+        for c in composes:
+            tail_node = c[-1]
+            nodes_set = set(c)
+
+            inputs = []
+            for node in c:
+                for inp in node.inputs:
+                    if inp not in nodes_set and inp not in inputs:
+                        inputs.append(inp)
+
+            op = self._new_fuse_op(tail_node, _key=tail_node.op.key,
+                                   _operands=[n.op for n in c])
+            composed_chunk = op.new_chunk(inputs, kws=[tail_node.params], _key=tail_node.key,
+                                          _composed=c).data
+            graph.add_node(composed_chunk)
+            for node in graph.iter_successors(tail_node):
+                graph.add_edge(composed_chunk, node)
+            for node in c:
+                for pred in graph.iter_predecessors(node):
+                    if pred not in nodes_set:
+                        graph.add_edge(pred, composed_chunk)
+            for node in c:
+                graph.remove_node(node)
+            composed_nodes.append(composed_chunk)
+
+        return composed_nodes
+
+    def compose(self, keys=None):
+        composes = []
+        explored = set()
+        keys = set(keys or [])
+
+        graph = self._graph
+        for v in graph.bfs():
+            if v in explored or v.key in keys:
+                continue
+            if graph.count_successors(v) != 1 or not self._support(v):
+                continue
+            selected = [v]
+            # add successors, predecessors of successors out of the chain
+            # cannot depend on the chain as every node in it has one successor
+            cur_node = graph.successors(v)[0]
+            while cur_node not in explored and self._support(cur_node):
+                selected.append(cur_node)
+                if cur_node.key in keys or graph.count_successors(cur_node) != 1:
+                    break
+                cur_node = graph.successors(cur_node)[0]
+            if len(selected) > 1:
+                explored.update(selected)
+                composes.append(selected)
+        return self._compose_graph(composes)
@@ -16,12 +16,14 @@
 
 from .ne import NeOptimizer
 from .cp import CpOptimizer
+from .nb import NumbaOptimizer
 from ....tensor.fuse.ne import NUMEXPR_INSTALLED
 
 
 class Optimizer(object):
     engine_dic = {'numexpr': NeOptimizer,
-                  'cupy': CpOptimizer}
+                  'cupy': CpOptimizer,
+                  'numba': NumbaOptimizer}
 
     def __init__(self, graph, engine=None):
         self._graph = graph
@@ -36,3 +38,6 @@ class Optimizer(object):
             return
         optimizer = self.engine_dic[self._engine](self._graph)
         optimizer.optimize(keys=keys)
+        if self._engine == 'numexpr':
+            from .dataframe_ne import DataFrameNeOptimizer
+            DataFrameNeOptimizer(self._graph).optimize(keys=keys)
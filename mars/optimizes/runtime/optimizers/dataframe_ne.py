@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from ....dataframe.fuse.ne import DataFrameNeFuseChunk, support
+from .chain import ChainFuseOptimizer
+
+
+class DataFrameNeOptimizer(ChainFuseOptimizer):
+    """
+    Fuse chains of elementwise DataFrame and Series operands into
+    chunks evaluated by numexpr over underlying column arrays, thus
+    ``(df.a * 2 + df.b) > df.c`` can be fused entirely.
+    """
+    @classmethod
+    def _support(cls, node):
+        return support(node)
+
+    @classmethod
+    def _new_fuse_op(cls, tail_node, **kw):
+        return DataFrameNeFuseChunk(sparse=tail_node.op.sparse, **kw)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from ....tensor.fuse import TensorNumbaFuseChunk
+from ....tensor.fuse.nb import support
+from .chain import ChainFuseOptimizer
+
+
+class NumbaOptimizer(ChainFuseOptimizer):
+    """
+    Fuse chains of elementwise tensor operands into chunks evaluated
+    by kernels compiled with numba. Besides operands supported by
+    numexpr, ``where``, ``clip``, ``astype`` and integer operands
+    like ``floor_divide`` can be fused.
+    """
+    @classmethod
+    def _support(cls, node):
+        return support(node)
+
+    @classmethod
+    def _new_fuse_op(cls, tail_node, **kw):
+        return TensorNumbaFuseChunk(dtype=tail_node.dtype, **kw)
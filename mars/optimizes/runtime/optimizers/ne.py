@@ -14,12 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from ....operands import OperandStage
 from ....tensor import arithmetic
 from ....tensor import reduction
 from ....tensor.fuse import TensorNeFuseChunk
-
-REDUCTION_OP = {reduction.TensorSum, reduction.TensorProd,
-                reduction.TensorMax, reduction.TensorMin}
+from ....tensor.fuse.ne import REDUCTION_OP
 SUPPORT_OP = {
     arithmetic.TensorAdd,
     arithmetic.TensorSubtract,
@@ -66,28 +65,20 @@ SUPPORT_OP = {
     reduction.TensorSum,
     reduction.TensorProd,
     reduction.TensorMax,
-    reduction.TensorMin
+    reduction.TensorMin,
+    reduction.TensorMean,
 }
 
 
-def _check_reduction_axis(node):
-    return len(node.op.axis) == 1 or len(node.op.axis) == node.ndim
-
-
 def _support(node):
     op_type = type(node.op)
     if op_type in REDUCTION_OP:
-        return _check_reduction_axis(node)
+        # reductions are only fused after elementwise operands,
+        # combine stages take outputs of other reductions as inputs
+        return node.op.stage != OperandStage.combine
     return op_type in SUPPORT_OP
 
 
-def _transfer_op(node):
-    op = node.op
-    if type(op) in REDUCTION_OP and not _check_reduction_axis(node):
-        return op
-    return op
-
-
 class NeOptimizer(object):
     def __init__(self, graph):
         self._graph = graph
@@ -16,6 +16,9 @@
 
 import unittest
 
+import numpy as np
+
+from mars.config import option_context
 from mars.executor import Executor
 from mars.tensor.arithmetic import TensorTreeAdd
 from mars.tensor.indexing import TensorSlice
@@ -160,3 +163,104 @@ class Test(unittest.TestCase):
         composed_nodes = optimizer.compose()
         self.assertTrue(composed_nodes[0].composed == chunks[:2])
         self.assertTrue(composed_nodes[1].composed == chunks[2:4])
+
+    def testComposeSubgraph(self):
+        r"""
+        graph(@: node, #: composed_node):
+
+              @
+            /   \
+        @         @   ========>    #
+            \   /
+              @
+        """
+        chunks = [TensorTreeAdd(_key=str(n), dtype=np.dtype(float)).new_chunk(None, shape=(10,))
+                  for n in range(4)]
+        chunks[1].op._inputs = [chunks[0]]
+        chunks[2].op._inputs = [chunks[0]]
+        chunks[3].op._inputs = [chunks[1], chunks[2]]
+        graph = DirectedGraph()
+        list(map(graph.add_node, chunks))
+        graph.add_edge(chunks[0], chunks[1])
+        graph.add_edge(chunks[0], chunks[2])
+        graph.add_edge(chunks[1], chunks[3])
+        graph.add_edge(chunks[2], chunks[3])
+
+        # subgraph fusion is turned off by default
+        composed_nodes = graph.compose(keys=[chunks[3].key])
+        self.assertEqual(len(composed_nodes), 0)
+
+        with option_context({'optimize.fuse_subgraphs': True}):
+            composed_nodes = graph.compose(keys=[chunks[3].key])
+            self.assertEqual(len(composed_nodes), 1)
+            self.assertEqual(len(graph), 1)
+            self.assertEqual(composed_nodes[0].composed[0], chunks[0])
+            self.assertEqual(composed_nodes[0].composed[-1], chunks[3])
+            self.assertEqual(set(composed_nodes[0].composed), set(chunks))
+
+            graph.decompose()
+            self.assertEqual(len(graph), 4)
+            self.assertEqual(set(graph.successors(chunks[0])), {chunks[1], chunks[2]})
+            self.assertEqual(set(graph.predecessors(chunks[3])), {chunks[1], chunks[2]})
+
+            # the parallelism lost is too large to fuse both branches,
+            # thus the source node is duplicated into each branch
+            with option_context({'optimize.fuse_parallelism_weight': 10.0}):
+                composed_nodes = graph.compose(keys=[chunks[3].key])
+                self.assertEqual(len(composed_nodes), 2)
+                self.assertEqual(len(graph), 2)
+                for n in composed_nodes:
+                    self.assertEqual(n.composed[0], chunks[0])
+
+            # the duplicated source node is restored only once
+            graph.decompose()
+            self.assertEqual(len(graph), 4)
+            self.assertEqual(set(graph.successors(chunks[0])), {chunks[1], chunks[2]})
+
+            r"""
+            graph(@: node, #: composed_node):
+
+            @ --> @ --> @              #
+              \               ========>
+                --> @                  @ --> @
+
+            the source node is duplicated into the fused chunk
+            """
+            chunks = [TensorTreeAdd(_key=str(n), dtype=np.dtype(float)).new_chunk(None, shape=(10,))
+                      for n in range(3)]
+            # size of the last chunk is unknown, thus it cannot be fused
+            chunks.append(TensorTreeAdd(_key='3', dtype=np.dtype(float)).new_chunk(None, shape=(np.nan,)))
+            chunks[1].op._inputs = [chunks[0]]
+            chunks[2].op._inputs = [chunks[1]]
+            chunks[3].op._inputs = [chunks[0]]
+            graph = DirectedGraph()
+            list(map(graph.add_node, chunks))
+            graph.add_edge(chunks[0], chunks[1])
+            graph.add_edge(chunks[1], chunks[2])
+            graph.add_edge(chunks[0], chunks[3])
+
+            composed_nodes = graph.compose(keys=[chunks[2].key, chunks[3].key])
+            self.assertEqual(len(composed_nodes), 1)
+            self.assertEqual(composed_nodes[0].composed, chunks[:3])
+            self.assertIn(chunks[0], graph)
+            self.assertEqual(graph.successors(chunks[0]), [chunks[3]])
+            self.assertEqual(graph.count_predecessors(composed_nodes[0]), 0)
+
+    def testComposeSubgraphExecution(self):
+        import mars.tensor as mt
+        from mars.tests.core import ExecutorForTest
+
+        executor = ExecutorForTest('numpy')
+        raw = np.array([[1, 2, 4], [1, 6, 24]])
+
+        with option_context({'optimize.fuse_subgraphs': True,
+                             'optimize.fuse_parallelism_weight': 10.0}):
+            # source chunks are duplicated into several fused chunks,
+            # and then restored from the serialized graph
+            t = mt.ediff1d(mt.tensor(raw, chunk_size=2))
+            res = executor.execute_tensor(t, concat=True)[0]
+            np.testing.assert_array_equal(res, np.ediff1d(raw))
+
+            t = (mt.tensor(raw, chunk_size=2) + 1).sum(axis=0)
+            res = executor.execute_tensor(t, concat=True)[0]
+            np.testing.assert_array_equal(res, (raw + 1).sum(axis=0))
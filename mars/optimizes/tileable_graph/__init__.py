@@ -14,5 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .column_pruning import GroupbyPruneReadCSV
+# graph rules are applied in the order of registration,
+# push predicates first, thus columns only used by filters can be pruned
+from .predicate_pushdown import PredicatePushdown
+from .column_pruning import ColumnPruning
 from .core import OptimizeIntegratedTileableGraphBuilder, tileable_optimized
@@ -14,54 +14,253 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+
 from ...utils import copy_tileables
+from ...dataframe.arithmetic.core import DataFrameBinOp, DataFrameUnaryOp
 from ...dataframe.groupby.aggregation import DataFrameGroupByAgg
+from ...dataframe.indexing.getitem import DataFrameIndex
+from ...dataframe.merge.merge import _DataFrameMergeBase
+from ...dataframe.sort.sort_values import DataFrameSortValues
 from ...dataframe.datasource.read_csv import DataFrameReadCSV
-from .core import TileableOptimizeRule, register
+from ...dataframe.datasource.read_parquet import DataFrameReadParquet
+from ...dataframe.datasource.read_sql_table import DataFrameReadSQLTable
+from ...dataframe.utils import parse_index, build_empty_df
+from .core import TileableGraphOptimizeRule, register_graph_rule
+
+
+def _to_list(labels):
+    if labels is None:
+        return []
+    return list(labels) if isinstance(labels, (list, tuple)) else [labels]
 
 
-class GroupbyPruneReadCSV(TileableOptimizeRule):
+def _union(required, columns):
+    if required is None:
+        return None
+    return required | set(columns)
+
+
+class ColumnPruning(TileableGraphOptimizeRule):
     """
-    An experimental implementation for tileable optimization rule.
-    This rule works only when groupby aggregation operation follows the read CSV files,
-    we can prune the columns that not used by the following operations when read the files.
+    Collect the columns required by the successors of every DataFrame
+    in the graph, then prune the columns of data sources which support
+    column selection, e.g. read CSV files, parquet files or SQL tables,
+    so that the unused columns will never be read.
+
+    Columns requirements are passed through the operands which
+    work column by column, e.g. arithmetic, filtering, sorting and merging,
+    any other operand is assumed to require all columns of its inputs.
     """
-    def match(self, node):
-        if isinstance(node.inputs[0].op, DataFrameReadCSV) and \
-                node.inputs[0] not in self._optimizer_context.result_tileables:
-            by_data = node.op.groupby_params.get('by')
-            by_columns = by_data if isinstance(by_data, (list, tuple)) else [by_data]
-            if isinstance(node.op.func, (str, list)):
-                # Passing func name(s) means perform on all columns.
-                return False
-            elif len(set(by_columns + list(node.op.func))) == len(node.inputs[0].op.usecols or node.inputs[0].dtypes):
-                # If performs on all columns, no need to prune.
-                return False
+    _datasource_types = (DataFrameReadCSV, DataFrameReadParquet, DataFrameReadSQLTable)
+
+    @classmethod
+    def _is_dataframe(cls, node):
+        return getattr(node, 'ndim', None) == 2 and hasattr(node, 'dtypes')
+
+    @classmethod
+    def _has_columns(cls, node, columns):
+        return all(c in node.dtypes for c in columns)
+
+    @classmethod
+    def _is_mask_filter(cls, node):
+        op = node.op
+        return isinstance(op, DataFrameIndex) and op.col_names is None and \
+            op.mask is not None and cls._is_dataframe(node.inputs[0]) and \
+            (len(node.inputs) == 1 or node.inputs[1].ndim == 1)
+
+    @classmethod
+    def _is_elementwise(cls, node):
+        op = node.op
+        if isinstance(op, DataFrameUnaryOp):
             return True
+        if isinstance(op, DataFrameBinOp):
+            if len(node.inputs) == 1:
+                return np.isscalar(op.lhs) or np.isscalar(op.rhs)
+            left, right = node.inputs
+            # only prune when columns of both sides are identical,
+            # otherwise order of the result columns may change
+            return cls._is_dataframe(left) and cls._is_dataframe(right) and \
+                left.dtypes.index.equals(right.dtypes.index)
         return False
 
-    def apply(self, node):
-        by_data = node.op.groupby_params.get('by')
-        by_columns = by_data if isinstance(by_data, (list, tuple)) else [by_data]
-        agg_columns = list(node.op.func)
-        input_node = node.inputs[0]
-        selected_columns = [c for c in list(input_node.dtypes.index) if c in by_columns + agg_columns]
-        if input_node in self._optimizer_context:
-            new_input = self._optimizer_context[input_node]
-            selected_columns = [
-                c for c in list(input_node.dtypes.index) if c in selected_columns + new_input.op._usecols]
+    @classmethod
+    def _is_sort_values(cls, node):
+        op = node.op
+        return isinstance(op, DataFrameSortValues) and op.axis == 0 and \
+            cls._has_columns(node.inputs[0], op.by)
+
+    @classmethod
+    def _get_merge_keys(cls, node):
+        op = node.op
+        left, right = node.inputs
+        on = op.on
+        if on is None and op.left_on is None and op.right_on is None and \
+                not op.left_index and not op.right_index:
+            on = [c for c in left.dtypes.index if c in right.dtypes]
+        if on is not None:
+            left_keys = right_keys = _to_list(on)
         else:
-            new_input = copy_tileables([input_node])[0].data
+            left_keys, right_keys = _to_list(op.left_on), _to_list(op.right_on)
+        return left_keys, right_keys
 
-        new_input._shape = (input_node.shape[0], len(selected_columns))
-        new_input._dtypes = input_node.dtypes[selected_columns]
-        new_input._columns_value = new_input._dtypes.index
-        new_input.op._usecols = selected_columns
-        new_node = copy_tileables([node], inputs=[new_input])[0].data
+    @classmethod
+    def _is_merge(cls, node):
+        op = node.op
+        if not isinstance(op, _DataFrameMergeBase) or len(node.inputs) != 2 or \
+                not all(cls._is_dataframe(inp) for inp in node.inputs):
+            return False
+        left, right = node.inputs
+        try:
+            left_keys, right_keys = cls._get_merge_keys(node)
+        except TypeError:  # pragma: no cover
+            return False
+        if not cls._has_columns(left, left_keys) or \
+                not cls._has_columns(right, right_keys):
+            # merge on index levels or arrays
+            return False
+        overlapped = set(left.dtypes.index) & set(right.dtypes.index)
+        return all(isinstance(s, str) for s in op.suffixes) and \
+            all(isinstance(c, str) for c in overlapped)
 
-        self._optimizer_context[node] = new_node
-        self._optimizer_context[input_node] = new_input
+    def _get_merge_inputs_required(self, node, required):
+        left, right = node.inputs
+        left_keys, right_keys = self._get_merge_keys(node)
+        left_required, right_required = set(left_keys), set(right_keys)
+        shared_keys = set(lk for lk, rk in zip(left_keys, right_keys) if lk == rk)
+        left_suffix, right_suffix = node.op.suffixes
+        for c in left.dtypes.index:
+            if c in right.dtypes and c not in shared_keys:
+                # overlapped columns will be renamed with suffixes,
+                # keep them on both sides to make sure names unchanged
+                if c in left_keys or c in right_keys or \
+                        c + left_suffix in required or c + right_suffix in required:
+                    left_required.add(c)
+                    right_required.add(c)
+            elif c in required:
+                left_required.add(c)
+        for c in right.dtypes.index:
+            if c not in left.dtypes and c in required:
+                right_required.add(c)
+        return [left_required, right_required]
+
+    def _get_inputs_required(self, node, required):
+        """
+        Get columns required of the inputs of node, None means all columns.
+        """
+        op = node.op
+        inputs_required = [None] * len(node.inputs or [])
+
+        if isinstance(op, DataFrameGroupByAgg):
+            in_df = node.inputs[0]
+            by = op.groupby_params.get('by')
+            if not self._is_dataframe(in_df) or not isinstance(op.func, dict) or \
+                    (by is not None and not isinstance(by, (str, list, tuple))):
+                return inputs_required
+            columns = _to_list(by) + list(op.func)
+            selection = op.groupby_params.get('selection')
+            if selection is not None:
+                columns.extend(_to_list(selection))
+            if self._has_columns(in_df, columns):
+                inputs_required[0] = set(columns)
+        elif isinstance(op, DataFrameIndex) and op.col_names is not None:
+            columns = _to_list(op.col_names)
+            if op.mask is None and self._has_columns(node.inputs[0], columns):
+                inputs_required[0] = set(columns)
+        elif required is None or not self._is_dataframe(node):
+            pass
+        elif self._is_mask_filter(node):
+            inputs_required[0] = required
+        elif self._is_elementwise(node):
+            inputs_required = [required if self._is_dataframe(inp) else None
+                               for inp in node.inputs]
+        elif self._is_sort_values(node):
+            inputs_required[0] = _union(required, op.by)
+        elif self._is_merge(node):
+            inputs_required = self._get_merge_inputs_required(node, required)
+        return inputs_required
+
+    def _collect_required(self, graph):
+        results = self._get_result_nodes()
+        # required columns contributed by the successors
+        contributions = dict()
+        required_columns = dict()
+        for node in graph.topological_iter(reverse=True):
+            if node in results or node not in contributions:
+                required = None
+            else:
+                required = contributions[node]
+            required_columns[node] = required
+
+            for inp, inp_required in zip(node.inputs or [], self._get_inputs_required(node, required)):
+                if inp not in contributions:
+                    contributions[inp] = inp_required
+                elif contributions[inp] is not None:
+                    contributions[inp] = _union(inp_required, contributions[inp])
+        return required_columns
+
+    @classmethod
+    def _prune_columns(cls, node, columns):
+        dtypes = node.dtypes[columns]
+        node._shape = (node.shape[0], len(columns))
+        node._dtypes = dtypes
+        node._columns_value = parse_index(dtypes.index, store_data=True)
+
+    def _can_prune_datasource(self, node):
+        op = node.op
+        if not isinstance(op, self._datasource_types):
+            return False
+        if isinstance(op, DataFrameReadCSV) and op.index_col is not None:
+            # names of csv exclude the index column,
+            # thus `usecols` cannot be specified
+            return False
+        return True
+
+    def _prune_datasource(self, node, required):
+        columns = [c for c in node.dtypes.index if c in required]
+        if len(columns) == len(node.dtypes) or len(columns) == 0:
+            return node
+        new_node = copy_tileables([node])[0].data
+        new_node.op.set_pruned_columns(columns)
+        self._prune_columns(new_node, columns)
         return new_node
 
+    def _copy_node(self, node, new_inputs):
+        new_nodes = [t.data for t in copy_tileables(node.op.outputs, inputs=new_inputs)]
+        new_node = new_nodes[node.op.outputs.index(node)]
+        if self._is_dataframe(node) and \
+                (self._is_mask_filter(node) or self._is_elementwise(node) or
+                 self._is_sort_values(node)):
+            available = new_inputs[0].dtypes
+            columns = [c for c in node.dtypes.index if c in available]
+            self._prune_columns(new_node, columns)
+        elif self._is_dataframe(node) and self._is_merge(node):
+            op = node.op
+            left, right = new_inputs
+            merged = build_empty_df(left.dtypes).merge(
+                build_empty_df(right.dtypes), how=op.how, on=op.on,
+                left_on=op.left_on, right_on=op.right_on, left_index=op.left_index,
+                right_index=op.right_index, suffixes=op.suffixes, indicator=op.indicator)
+            columns = [c for c in node.dtypes.index if c in merged.columns]
+            self._prune_columns(new_node, columns)
+        return dict(zip(node.op.outputs, new_nodes))
+
+    def apply(self, graph):
+        required_columns = self._collect_required(graph)
+
+        replaced = dict()
+        for node in graph.topological_iter():
+            if node in replaced:
+                continue
+            required = required_columns[node]
+            if self._can_prune_datasource(node) and required is not None:
+                new_node = self._prune_datasource(node, required)
+                if new_node is not node:
+                    replaced[node] = new_node
+            elif any(inp in replaced for inp in node.inputs or []):
+                new_inputs = [replaced.get(inp, inp) for inp in node.inputs]
+                replaced.update(self._copy_node(node, new_inputs))
+        return self._build_replaced_graph(graph, replaced)
+
 
-register(DataFrameGroupByAgg, GroupbyPruneReadCSV)
+register_graph_rule(ColumnPruning)
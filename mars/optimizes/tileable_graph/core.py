@@ -22,6 +22,7 @@ from ...graph_builder import TileableGraphBuilder
 from ...utils import copy_tileables, kernel_mode, enter_build_mode
 
 _rules = defaultdict(list)
+_graph_rules = []
 
 tileable_optimized = weakref.WeakKeyDictionary()
 
@@ -37,6 +38,64 @@ class TileableOptimizeRule(object):
         raise NotImplementedError
 
 
+class TileableGraphOptimizeRule(object):
+    """
+    Rule which rewrites the whole tileable graph, it's used for
+    the optimizations which need to look over more than one node,
+    e.g. pushing the columns required by the successors into data sources.
+    """
+    def __init__(self, optimized_context):
+        self._optimizer_context = optimized_context
+
+    def apply(self, graph):
+        raise NotImplementedError
+
+    def _get_result_nodes(self):
+        return set(self._optimizer_context.get(t, t)
+                   for t in self._optimizer_context.result_tileables)
+
+    def _record_replaced(self, old, new):
+        for k, v in list(self._optimizer_context.items()):
+            if v is old:
+                self._optimizer_context[k] = new
+        self._optimizer_context[old] = new
+
+    def _build_replaced_graph(self, graph, replaced):
+        """
+        Copy the successors of replaced nodes, record the replacements
+        into optimizer context, and build new graph from the results.
+        """
+        if len(replaced) == 0:
+            return graph
+
+        results = self._get_result_nodes()
+        for n in graph.topological_iter():
+            if n in replaced or not any(inp in replaced for inp in n.inputs or []):
+                continue
+            new_inputs = [replaced.get(inp, inp) for inp in n.inputs]
+            new_tileables = copy_tileables(n.op.outputs, inputs=new_inputs)
+            for t, new_t in zip(n.op.outputs, new_tileables):
+                replaced[t] = new_t.data
+        for old, new in replaced.items():
+            self._record_replaced(old, new)
+
+        new_graph = DAG()
+        visited = set()
+        nodes = [replaced.get(n, n) for n in graph if n in results]
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            new_graph.add_node(node)
+            for inp in node.inputs or []:
+                new_graph.add_node(inp)
+                if not new_graph.has_successor(inp, node):
+                    new_graph.add_edge(inp, node)
+                nodes.extend(inp.op.outputs)
+        return new_graph
+
+
 class OptimizeContext(weakref.WeakKeyDictionary):
     def __init__(self, dict=None):
         weakref.WeakKeyDictionary.__init__(self, dict=dict)
@@ -104,9 +163,15 @@ class OptimizeIntegratedTileableGraphBuilder(TileableGraphBuilder):
         self._optimizer_context.append_result_tileables(tileables)
         graph = super().build(tileables, tileable_graph=tileable_graph)
         graph = self._replace_copied_tilebale(graph)
+        for rule in _graph_rules:
+            graph = rule(self._optimizer_context).apply(graph)
         self._mapping_tileables(tileables)
         return graph
 
 
 def register(op_type, rule):
     _rules[op_type].append(rule)
+
+
+def register_graph_rule(rule):
+    _graph_rules.append(rule)
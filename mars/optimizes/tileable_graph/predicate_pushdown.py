@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from ...dataframe.arithmetic import DataFrameEqual, DataFrameNotEqual, \
+    DataFrameLess, DataFrameLessEqual, DataFrameGreater, DataFrameGreaterEqual, \
+    DataFrameAnd
+from ...dataframe.base.isin import DataFrameIsin
+from ...dataframe.core import IndexValue
+from ...dataframe.indexing.getitem import DataFrameIndex
+from ...dataframe.datasource.read_csv import DataFrameReadCSV
+from ...dataframe.datasource.read_parquet import DataFrameReadParquet
+from ...dataframe.datasource.read_sql_table import DataFrameReadSQLTable
+from .core import TileableGraphOptimizeRule, register_graph_rule
+
+
+_comparison_ops = {
+    DataFrameEqual: '==',
+    DataFrameNotEqual: '!=',
+    DataFrameLess: '<',
+    DataFrameLessEqual: '<=',
+    DataFrameGreater: '>',
+    DataFrameGreaterEqual: '>=',
+}
+
+# op when operands are swapped, e.g. `1 < df.a` equals to `df.a > 1`
+_swapped_ops = {
+    '==': '==',
+    '!=': '!=',
+    '<': '>',
+    '<=': '>=',
+    '>': '<',
+    '>=': '<=',
+}
+
+
+class PredicatePushdown(TileableGraphOptimizeRule):
+    """
+    Push the row filter like `df[(df.a > 1) & (df.b == 'x')]` down into
+    data sources which support filters, e.g. read CSV or parquet files
+    and SQL tables, for parquet files, row groups can be skipped according
+    to statistics, for CSV files, rows are dropped right after parsed,
+    for SQL tables, filters are translated into the ``WHERE`` clause.
+
+    Only comparisons between columns of the data source and scalars,
+    `isin` with a list of values, and `&` combinations of them are supported.
+    """
+    _datasource_types = (DataFrameReadCSV, DataFrameReadParquet, DataFrameReadSQLTable)
+
+    def _is_column_of(self, node, source):
+        op = node.op
+        return isinstance(op, DataFrameIndex) and op.mask is None and \
+            node.ndim == 1 and node.inputs[0] is source and \
+            op.col_names in source.dtypes
+
+    def _extract_filters(self, node, source, visited):
+        """
+        Extract filters from mask, all the nodes visited
+        will be added into `visited`, return None if not supported.
+        """
+        op = node.op
+        if isinstance(op, DataFrameAnd) and len(node.inputs) == 2:
+            filters = []
+            for inp in node.inputs:
+                inp_filters = self._extract_filters(inp, source, visited)
+                if inp_filters is None:
+                    return
+                filters.extend(inp_filters)
+            visited.append(node)
+            return filters
+        elif type(op) in _comparison_ops and len(node.inputs) == 1:
+            column = node.inputs[0]
+            if np.isscalar(op.rhs) and op.lhs is column:
+                filter_op, value = _comparison_ops[type(op)], op.rhs
+            elif np.isscalar(op.lhs) and op.rhs is column:
+                filter_op, value = _swapped_ops[_comparison_ops[type(op)]], op.lhs
+            else:
+                return
+        elif isinstance(op, DataFrameIsin) and len(node.inputs) == 1 and \
+                isinstance(op.values, (list, tuple, set, np.ndarray)):
+            column = node.inputs[0]
+            filter_op, value = 'in', list(op.values)
+        else:
+            return
+
+        if not self._is_column_of(column, source):
+            return
+        if isinstance(value, np.generic):
+            value = value.item()
+        visited.extend([node, column])
+        return [(column.op.col_names, filter_op, value)]
+
+    def _support_filters(self, source):
+        op = source.op
+        if not isinstance(op, self._datasource_types) or op.gpu:
+            return False
+        if isinstance(op, DataFrameReadCSV) and op.sort_range_index and \
+                isinstance(source.index_value.value, IndexValue.RangeIndex):
+            # RangeIndex will be standardized according to the filtered sizes
+            return False
+        if isinstance(op, DataFrameReadSQLTable) and not op.index_col:
+            # RangeIndex will be generated according to the filtered sizes
+            return False
+        return True
+
+    def _match(self, graph, node, results):
+        op = node.op
+        if not isinstance(op, DataFrameIndex) or op.col_names is not None or \
+                len(node.inputs) != 2 or node.inputs[1].ndim != 1:
+            return
+        source, mask = node.inputs
+        if source in results or not self._support_filters(source):
+            return
+
+        visited = []
+        filters = self._extract_filters(mask, source, visited)
+        if filters is None:
+            return
+        # make sure nodes to be eliminated are not used by others
+        pattern = set(visited) | {node}
+        for n in visited + [source]:
+            if n in results and n is not source:
+                return
+            if any(succ not in pattern for succ in graph.iter_successors(n)):
+                return
+        return filters
+
+    def _push_filters(self, node, filters):
+        source = node.inputs[0]
+        op = source.op.copy()
+        op.set_pushed_filters(list(op.get_filters() or []) + filters)
+        op.reset_key()
+        params = node.params.copy()
+        params['_key'] = node.key
+        params['_id'] = node.id
+        params.update(source.extra_params)
+        return op.new_tileables(None, kws=[params], output_limit=1)[0].data
+
+    def apply(self, graph):
+        results = self._get_result_nodes()
+        replaced = dict()
+        for node in graph.topological_iter():
+            filters = self._match(graph, node, results)
+            if filters is not None:
+                replaced[node] = self._push_filters(node, filters)
+        return self._build_replaced_graph(graph, replaced)
+
+
+register_graph_rule(PredicatePushdown)
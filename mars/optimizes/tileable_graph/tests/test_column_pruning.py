@@ -97,3 +97,71 @@ class Test(TestBase):
 
         finally:
             shutil.rmtree(tempdir)
+
+    def testGroupByPruneReadParquet(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            file_path = os.path.join(tempdir, 'test.parquet')
+
+            df = pd.DataFrame({'a': [3, 4, 5, 3, 5, 4, 1, 2, 3],
+                               'b': [1, 3, 4, 5, 6, 5, 4, 4, 4],
+                               'c': list('aabaaddce'),
+                               'd': list('abaaaddce')})
+            df.to_parquet(file_path)
+
+            mdf = md.read_parquet(file_path).groupby('c').agg({'a': 'sum'})
+            expected = df.groupby('c').agg({'a': 'sum'})
+            pd.testing.assert_frame_equal(mdf.execute(), expected)
+            pd.testing.assert_frame_equal(mdf.fetch(), expected)
+
+            optimized_df = tileable_optimized[mdf.data]
+            self.assertEqual(optimized_df.inputs[0].op.columns, ['a', 'c'])
+
+    def testPruneThroughOperands(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            file_path = os.path.join(tempdir, 'test.csv')
+            df = pd.DataFrame({'a': [3, 4, 5, 3, 5, 4, 1, 2, 3],
+                               'b': [1, 3, 4, 5, 6, 5, 4, 4, 4],
+                               'c': list('aabaaddce'),
+                               'd': list('abaaaddce')})
+            df.to_csv(file_path, index=False)
+
+            # arithmetic and sort
+            mdf = (md.read_csv(file_path) + 1).sort_values('a')['b']
+            expected = (df[['a', 'b']] + 1).sort_values('a')['b']
+            pd.testing.assert_series_equal(mdf.execute(), expected)
+            source = list(mdf.build_graph().topological_iter())[0]
+            self.assertIsNone(source.op.usecols)
+            optimized = tileable_optimized[mdf.data]
+            self.assertEqual(optimized.inputs[0].inputs[0].inputs[0].op.usecols, ['a', 'b'])
+
+            # filter by mask
+            in_df = md.read_csv(file_path)
+            mdf = in_df[in_df['a'] > in_df['b']][['a', 'd']]
+            expected = df[df['a'] > df['b']][['a', 'd']]
+            pd.testing.assert_frame_equal(mdf.execute().reset_index(drop=True),
+                                          expected.reset_index(drop=True))
+            optimized = tileable_optimized[mdf.data]
+            self.assertEqual(optimized.inputs[0].inputs[0].op.usecols, ['a', 'b', 'd'])
+
+            # merge
+            df2 = pd.DataFrame({'a': [1, 2, 3], 'b': [7, 8, 9], 'e': list('xyz')})
+            mdf2 = md.DataFrame(df2, chunk_size=2)
+            mdf = md.read_csv(file_path).merge(mdf2, on='a')[['b_x', 'e']]
+            expected = df.merge(df2, on='a')[['b_x', 'e']]
+            pd.testing.assert_frame_equal(
+                mdf.execute().sort_values(['b_x', 'e']).reset_index(drop=True),
+                expected.sort_values(['b_x', 'e']).reset_index(drop=True))
+            optimized = tileable_optimized[mdf.data]
+            self.assertEqual(list(optimized.inputs[0].dtypes.index), ['a', 'b_x', 'b_y', 'e'])
+            self.assertEqual(optimized.inputs[0].inputs[0].op.usecols, ['a', 'b'])
+
+            # column selection before unknown operands
+            mdf = md.read_csv(file_path)[['a', 'b']].sum()
+            pd.testing.assert_series_equal(mdf.execute(), df[['a', 'b']].sum())
+            optimized = tileable_optimized[mdf.data]
+            self.assertEqual(optimized.inputs[0].inputs[0].op.usecols, ['a', 'b'])
+
+            # unknown operand requires all columns
+            mdf = md.read_csv(file_path).count()
+            pd.testing.assert_series_equal(mdf.execute(), df.count())
+            self.assertNotIn(mdf.data, tileable_optimized)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+
+import pandas as pd
+
+import mars.dataframe as md
+from mars.config import option_context
+from mars.core import ExecutableTuple
+from mars.dataframe.datasource.read_csv import DataFrameReadCSV
+from mars.dataframe.datasource.read_parquet import DataFrameReadParquet
+from mars.dataframe.datasource.read_sql_table import DataFrameReadSQLTable
+from mars.tests.core import TestBase
+from mars.optimizes.tileable_graph.core import tileable_optimized
+
+
+class Test(TestBase):
+    def setUp(self):
+        super().setUp()
+        self.df = pd.DataFrame({'a': [3, 4, 5, 3, 5, 4, 1, 2, 3],
+                                'b': [1, 3, 4, 5, 6, 5, 4, 4, 4],
+                                'c': list('aabaaddce'),
+                                'd': list('abaaaddce')})
+
+    def testPushdownReadCSV(self):
+        df = self.df
+        with tempfile.TemporaryDirectory() as tempdir:
+            file_path = os.path.join(tempdir, 'test.csv')
+            df.to_csv(file_path, index=False)
+
+            in_df = md.read_csv(file_path)
+            mdf = in_df[(in_df.a > 2) & (3 >= in_df['b'])]
+            expected = df[(df.a > 2) & (3 >= df['b'])]
+            pd.testing.assert_frame_equal(mdf.execute(), expected)
+            pd.testing.assert_frame_equal(mdf.fetch(), expected)
+
+            optimized = tileable_optimized[mdf.data]
+            self.assertIsInstance(optimized.op, DataFrameReadCSV)
+            self.assertEqual(optimized.op.filters, [('a', '>', 2), ('b', '<=', 3)])
+            self.assertIsNone(optimized.op.usecols)
+
+            # filter columns are pruned from the output
+            in_df = md.read_csv(file_path)
+            mdf = in_df[in_df.c.isin(['a', 'b'])][['a', 'd']]
+            expected = df[df.c.isin(['a', 'b'])][['a', 'd']]
+            pd.testing.assert_frame_equal(mdf.execute(), expected)
+
+            optimized = tileable_optimized[mdf.data]
+            source = optimized.inputs[0]
+            self.assertEqual(source.op.filters, [('c', 'in', ['a', 'b'])])
+            self.assertEqual(source.op.usecols, ['a', 'd'])
+            self.assertEqual(list(source.dtypes.index), ['a', 'd'])
+
+            # mask is used by other tileables, cannot push down
+            in_df = md.read_csv(file_path)
+            mask = in_df.a > 2
+            mdf = in_df[mask]
+            results = ExecutableTuple((mdf, mask)).execute()
+            pd.testing.assert_frame_equal(results[0], df[df.a > 2])
+            pd.testing.assert_series_equal(results[1], df.a > 2)
+            self.assertNotIn(mdf.data, tileable_optimized)
+
+            # comparison between columns cannot be pushed down
+            in_df = md.read_csv(file_path)
+            mdf = in_df[in_df.a > in_df.b]
+            pd.testing.assert_frame_equal(mdf.execute(), df[df.a > df.b])
+            self.assertNotIn(mdf.data, tileable_optimized)
+
+            with option_context({'optimize_tileable_graph': False}):
+                in_df = md.read_csv(file_path)
+                mdf = in_df[in_df.a > 2]
+                pd.testing.assert_frame_equal(mdf.execute(), df[df.a > 2])
+                self.assertNotIn(mdf.data, tileable_optimized)
+
+    def testPushdownReadParquet(self):
+        df = self.df
+        with tempfile.TemporaryDirectory() as tempdir:
+            file_path = os.path.join(tempdir, 'test.parquet')
+            df.to_parquet(file_path, row_group_size=3)
+
+            in_df = md.read_parquet(file_path)
+            mdf = in_df[in_df.a < 4].groupby('c').agg({'b': 'sum'})
+            expected = df[df.a < 4].groupby('c').agg({'b': 'sum'})
+            pd.testing.assert_frame_equal(mdf.execute(), expected)
+
+            optimized = tileable_optimized[mdf.data]
+            source = optimized.inputs[0]
+            self.assertIsInstance(source.op, DataFrameReadParquet)
+            self.assertEqual(source.op.filters, [('a', '<', 4)])
+            self.assertEqual(source.op.columns, ['b', 'c'])
+
+            in_df = md.read_parquet(file_path, filters=[('b', '>', 1)])
+            mdf = in_df[in_df.d == 'a']
+            expected = df[(df.b > 1) & (df.d == 'a')]
+            pd.testing.assert_frame_equal(mdf.execute(), expected)
+
+            optimized = tileable_optimized[mdf.data]
+            self.assertEqual(optimized.op.filters, [('b', '>', 1), ('d', '==', 'a')])
+
+    def testPushdownReadSQLTable(self):
+        df = self.df
+        with tempfile.TemporaryDirectory() as tempdir:
+            uri = 'sqlite:///' + os.path.join(tempdir, 'test.db')
+            df.to_sql('test', uri, index_label='id')
+
+            in_df = md.read_sql_table('test', uri, index_col='id', chunk_size=4)
+            mdf = in_df[(in_df.a >= 3) & (in_df.c != 'a')][['b']]
+            expected = df[(df.a >= 3) & (df.c != 'a')][['b']].rename_axis('id')
+            pd.testing.assert_frame_equal(mdf.execute(), expected)
+
+            optimized = tileable_optimized[mdf.data]
+            source = optimized.inputs[0]
+            self.assertIsInstance(source.op, DataFrameReadSQLTable)
+            self.assertEqual(source.op.filters, [('a', '>=', 3), ('c', '!=', 'a')])
+            self.assertEqual(source.op.columns, ['b'])
+
+            in_df = md.read_sql_table('test', uri, index_col='id', partition_col='a',
+                                      num_partitions=3)
+            mdf = in_df[in_df.d.isin(['a', 'c'])]
+            expected = df[df.d.isin(['a', 'c'])].rename_axis('id').sort_values(['a'], kind='mergesort')
+            pd.testing.assert_frame_equal(mdf.execute(), expected)
+            self.assertIsInstance(tileable_optimized[mdf.data].op, DataFrameReadSQLTable)
+
+            # filters cannot be pushed when RangeIndex generated
+            in_df = md.read_sql_table('test', uri, columns=['a', 'b'], chunk_size=4)
+            mdf = in_df[in_df.a > 3]
+            self.assertNotIn('filters', mdf.explain())
+
+    def testExplain(self):
+        df = self.df
+        with tempfile.TemporaryDirectory() as tempdir:
+            file_path = os.path.join(tempdir, 'test.csv')
+            df.to_csv(file_path, index=False)
+
+            in_df = md.read_csv(file_path)
+            mdf = in_df[in_df.a > 2][['b', 'c']]
+
+            plan = mdf.explain().splitlines()
+            self.assertEqual(len(plan), 2)
+            self.assertTrue(plan[0].startswith('DataFrameIndex('))
+            self.assertIn("columns=['b', 'c']", plan[0])
+            self.assertTrue(plan[1].startswith('  DataFrameReadCSV('))
+            self.assertIn("columns=['b', 'c']", plan[1])
+            self.assertIn("filters=[('a', '>', 2)]", plan[1])
+
+            plan = mdf.explain(optimize=False).splitlines()
+            self.assertEqual(len(plan), 6)
+            self.assertTrue(plan[0].startswith('DataFrameIndex('))
+            self.assertNotIn('filters', '\n'.join(plan))
+            # the data source is shared by the mask
+            self.assertTrue(plan[-1].endswith('...'))
@@ -21,27 +21,39 @@ from functools import reduce
 import numpy as np
 
 from ..operands import VirtualOperand
+from .csrgraph import gather_neighbors
 from .operands import OperandState
 
 logger = logging.getLogger(__name__)
 
 
+def _unique_ordered(arr):
+    """Remove duplicated elements in an array, keeping orders of first occurrences"""
+    _, first_idxes = np.unique(arr, return_index=True)
+    return arr[np.sort(first_idxes)]
+
+
 class GraphAnalyzer(object):
     """
     Analyzer for chunk graph, supporting optimization analysis
     as well as fail-over analysis.
     """
     def __init__(self, graph, worker_slots, fixed_assigns=None, op_states=None,
-                 lost_chunks=None):
+                 lost_chunks=None, csr_graph=None):
         """
         :param graph: chunk graph
         :param worker_slots: dict mapping worker endpoint to slots available
         :param fixed_assigns: dict mapping operands to workers fixed
         :param op_states:  dict recording operand states
         :param lost_chunks: keys of lost chunks, for fail-over analysis
+        :param csr_graph: array representation of the chunk graph, Fetch chunks
+                          excluded. If specified, analyses are done on arrays.
+        :type csr_graph: mars.scheduler.csrgraph.CSRChunkGraph
         """
         self._graph = graph
+        self._csr_graph = csr_graph
         self._undigraph = None
+        self._bfs_arrays = None
         self._worker_slots = OrderedDict(worker_slots)
         self._op_states = op_states or dict()
         self._lost_chunks = lost_chunks or []
@@ -58,6 +70,10 @@ class GraphAnalyzer(object):
         Calculate depths of every operand
         :return: dict mapping operand keys into depth
         """
+        if self._csr_graph is not None:
+            csr_graph = self._csr_graph
+            return dict(zip(csr_graph.op_keys, csr_graph.calc_op_depths().tolist()))
+
         graph = self._graph
         depth_cache = dict()
 
@@ -76,14 +92,30 @@ class GraphAnalyzer(object):
         sizes are not accurate.
         :return: dict mapping operand keys into estimated descendant size
         """
-        graph = self._graph
         sizes = self._descendant_sizes
-        for n in graph.topological_iter(reverse=True):
-            sizes[n.op.key] += 1
-            if not graph.count_predecessors(n):
-                continue
-            for ni in set(graph.predecessors(n)):
-                sizes[ni.op.key] += sizes[n.op.key]
+        if self._csr_graph is not None:
+            csr_graph = self._csr_graph
+            sizes.update(zip(csr_graph.op_keys,
+                             (int(v) for v in csr_graph.calc_op_descendant_sizes())))
+            return sizes
+
+        graph = self._graph
+        levels = dict()
+        level_nodes = defaultdict(list)
+        for n in graph.topological_iter():
+            levels[n] = max((levels[ni] + 1 for ni in graph.iter_predecessors(n)), default=0)
+            level_nodes[levels[n]].append(n)
+
+        # nodes in the same level are accumulated together, thus
+        # sizes do not depend on orders of topological iteration
+        for level in sorted(level_nodes, reverse=True):
+            nodes = level_nodes[level]
+            for n in nodes:
+                sizes[n.op.key] += 1
+            updates = [(ni.op.key, sizes[n.op.key]) for n in nodes
+                       for ni in graph.iter_predecessors(n)]
+            for op_key, size in updates:
+                sizes[op_key] += size
         return sizes
 
     def collect_external_input_chunks(self, initial=True):
@@ -93,16 +125,25 @@ class GraphAnalyzer(object):
         :param initial: collect initial chunks only
         :return: dict mapping operand key to its input keys
         """
-        graph = self._graph
-        chunk_keys = set(n.key for n in graph)
+        csr_graph = self._csr_graph
+        if csr_graph is not None:
+            chunk_keys = set(csr_graph.chunk_keys)
+            if initial:
+                nodes = [csr_graph.chunks[idx]
+                         for idx in np.flatnonzero(csr_graph.pred_counts == 0)]
+            else:
+                nodes = csr_graph.chunks
+        else:
+            graph = self._graph
+            chunk_keys = set(n.key for n in graph)
+            nodes = [n for n in graph if not initial or not graph.count_predecessors(n)]
+
         visited = set()
         results = dict()
-        for n in graph:
+        for n in nodes:
             op_key = n.op.key
             if op_key in visited or not n.inputs:
                 continue
-            if initial and graph.count_predecessors(n):
-                continue
             ext_keys = [c.key for c in n.inputs if c.key not in chunk_keys]
             if not ext_keys:
                 continue
@@ -152,6 +193,60 @@ class GraphAnalyzer(object):
                 worker_assigns[n.op.key] = max_worker
                 yield n.op.key, max_worker
 
+    def _iter_successor_assigns_csr(self, existing_assigns):
+        """
+        Iterate over all successors to get allocations of successor nodes,
+        with chunks of the same depth handled together.
+        """
+        csr_graph = self._csr_graph
+        op_keys = csr_graph.op_keys
+        chunk_ops = csr_graph.chunk_ops
+        pred_indptr, pred_indices = csr_graph.pred_indptr, csr_graph.pred_indices
+
+        workers = list(self._worker_slots)
+        workers.extend(set(existing_assigns.values()).difference(workers))
+        worker_idxes = dict((w, idx) for idx, w in enumerate(workers))
+        n_workers = len(workers)
+
+        op_workers = np.full(len(op_keys), -1, dtype=np.int64)
+        for op_key, worker in existing_assigns.items():
+            try:
+                op_workers[csr_graph.op_index[op_key]] = worker_idxes[worker]
+            except KeyError:
+                continue
+
+        for chunks in csr_graph.iter_levels():
+            preds, owners = gather_neighbors(pred_indptr, pred_indices, chunks)
+            if not len(preds):
+                continue
+            pred_workers = op_workers[chunk_ops[preds]]
+            assigned = pred_workers >= 0
+            # count predecessors held by every worker
+            pair_codes, pair_sizes = np.unique(
+                owners[assigned] * n_workers + pred_workers[assigned], return_counts=True)
+            if not len(pair_codes):
+                continue
+            pair_owners, pair_workers = np.divmod(pair_codes, n_workers)
+
+            total_counts = np.bincount(owners, minlength=len(chunks))
+            involved_counts = np.bincount(pair_owners, minlength=len(chunks)) \
+                + (np.bincount(owners[~assigned], minlength=len(chunks)) > 0)
+
+            # get the worker occupying most of the data, randomly
+            # chosen when there are multiple ones
+            jittered = pair_sizes + np.random.random(len(pair_sizes)) * 0.5
+            order = np.lexsort((jittered, pair_owners))
+            max_pairs = order[np.diff(pair_owners[order], append=-1) != 0]
+            max_owners = pair_owners[max_pairs]
+            max_sizes = pair_sizes[max_pairs]
+            dominant = max_sizes > total_counts[max_owners] / np.maximum(2, involved_counts[max_owners])
+
+            succ_ops = chunk_ops[chunks[max_owners[dominant]]]
+            succ_workers = pair_workers[max_pairs[dominant]]
+            op_workers[succ_ops] = succ_workers
+            for op_idx, worker_idx in zip(succ_ops.tolist(), succ_workers.tolist()):
+                yield op_keys[op_idx], workers[worker_idx]
+
     def _calc_worker_assign_limits(self, initial_count, occupied=None):
         """
         Calculate limitation of number of initial operands for workers
@@ -193,17 +288,26 @@ class GraphAnalyzer(object):
             self.calc_descendant_sizes()
 
         graph = self._graph
+        csr_graph = self._csr_graph
         descendant_sizes = self._descendant_sizes
         fixed_assigns = self._fixed_assigns
 
         zero_degrees = list()
-        visited_keys = set()
-        for n in graph:
-            if n.op.key in visited_keys:
-                continue
-            visited_keys.add(n.op.key)
-            if not graph.predecessors(n) and n.op.key not in fixed_assigns:
-                zero_degrees.append(n)
+        if csr_graph is not None:
+            initials = np.flatnonzero(csr_graph.pred_counts == 0)
+            _, first_idxes = np.unique(csr_graph.chunk_ops[initials], return_index=True)
+            for idx in initials[np.sort(first_idxes)].tolist():
+                n = csr_graph.chunks[idx]
+                if n.op.key not in fixed_assigns:
+                    zero_degrees.append(n)
+        else:
+            visited_keys = set()
+            for n in graph:
+                if n.op.key in visited_keys:
+                    continue
+                visited_keys.add(n.op.key)
+                if not graph.predecessors(n) and n.op.key not in fixed_assigns:
+                    zero_degrees.append(n)
         random.shuffle(zero_degrees)
 
         # note that different orders can contribute to different efficiency
@@ -268,6 +372,74 @@ class GraphAnalyzer(object):
                 break
         initial_sizes[worker] -= assigned
 
+    def _assign_by_bfs_csr(self, start, worker, initial_sizes, spread_limits,
+                           assigned_record):
+        """
+        Assign initial nodes using Breadth-first Search on arrays, visiting
+        nodes with the same distance to start nodes together.
+        """
+        if initial_sizes[worker] <= 0:
+            return
+
+        csr_graph = self._csr_graph
+        op_keys = csr_graph.op_keys
+        chunk_ops = csr_graph.chunk_ops
+        indptr, indices, to_assign, assigned_ops = self._bfs_arrays
+
+        if not isinstance(start, (list, tuple)):
+            start = [start]
+        layer = _unique_ordered(np.array([csr_graph.chunk_index(c) for c in start],
+                                         dtype=np.int64))
+        visited = np.zeros(len(csr_graph), dtype=bool)
+
+        assigned = 0
+        spread_range = 0
+        while len(layer):
+            visited[layer] = True
+
+            ops = chunk_ops[layer]
+            ops = ops[~assigned_ops[ops]]
+            # operands with multiple chunks are assigned only once
+            first_mask = np.zeros(len(ops), dtype=bool)
+            first_mask[np.unique(ops, return_index=True)[1]] = True
+            ops = ops[first_mask | ~to_assign[ops]]
+
+            wanted = to_assign[ops]
+            spreads = spread_range + np.arange(1, len(ops) + 1)
+            assigns = assigned + np.cumsum(wanted)
+            stops = np.flatnonzero(wanted & ((spreads >= spread_limits[worker])
+                                             | (assigns >= initial_sizes[worker])))
+            if len(stops):
+                ops, wanted = ops[:stops[0] + 1], wanted[:stops[0] + 1]
+
+            new_ops = ops[wanted]
+            assigned_ops[new_ops] = True
+            for op_idx in new_ops.tolist():
+                assigned_record[op_keys[op_idx]] = worker
+            assigned += len(new_ops)
+            spread_range += len(ops)
+            if len(stops):
+                break
+
+            neighbors, _ = gather_neighbors(indptr, indices, layer)
+            layer = _unique_ordered(neighbors[~visited[neighbors]])
+        initial_sizes[worker] -= assigned
+
+    def _prepare_bfs_arrays(self, op_keys, cur_assigns, remove_pred_edges):
+        csr_graph = self._csr_graph
+        op_index = csr_graph.op_index
+
+        to_assign = np.zeros(len(csr_graph.op_keys), dtype=bool)
+        to_assign[[op_index[k] for k in op_keys if k in op_index]] = True
+        assigned_ops = np.zeros(len(csr_graph.op_keys), dtype=bool)
+        assigned_ops[[op_index[k] for k in cur_assigns if k in op_index]] = True
+
+        edge_mask = None
+        if remove_pred_edges:
+            edge_mask = ~to_assign[csr_graph.chunk_ops[csr_graph.dst]]
+        indptr, indices = csr_graph.undirected_csr(edge_mask)
+        self._bfs_arrays = indptr, indices, to_assign, assigned_ops
+
     def calc_operand_assignments(self, op_keys, input_chunk_metas=None):
         """
         Decide target worker for given chunks.
@@ -278,24 +450,35 @@ class GraphAnalyzer(object):
         :return: dict mapping operand keys into worker endpoints
         """
         graph = self._graph
+        csr_graph = self._csr_graph
         op_states = self._op_states
         cur_assigns = OrderedDict(self._fixed_assigns)
 
-        key_to_chunks = defaultdict(list)
-        for n in graph:
-            key_to_chunks[n.op.key].append(n)
+        if csr_graph is not None:
+            key_to_chunks = csr_graph.op_key_to_chunks
+        else:
+            key_to_chunks = defaultdict(list)
+            for n in graph:
+                key_to_chunks[n.op.key].append(n)
 
         descendant_readies = set()
         op_keys = set(op_keys)
         chunks_to_assign = [key_to_chunks[k][0] for k in op_keys]
 
-        if any(graph.count_predecessors(c) for c in chunks_to_assign):
-            graph = graph.copy()
-            for c in graph:
-                if c.op.key not in op_keys:
-                    continue
-                for pred in graph.predecessors(c):
-                    graph.remove_edge(pred, c)
+        if csr_graph is not None:
+            pred_counts = csr_graph.pred_counts
+            has_preds = any(pred_counts[csr_graph.chunk_index(c)] for c in chunks_to_assign)
+            graph_size = len(csr_graph)
+        else:
+            has_preds = any(graph.count_predecessors(c) for c in chunks_to_assign)
+            if has_preds:
+                graph = graph.copy()
+                for c in graph:
+                    if c.op.key not in op_keys:
+                        continue
+                    for pred in graph.predecessors(c):
+                        graph.remove_edge(pred, c)
+            graph_size = len(graph)
 
         assigned_counts = defaultdict(lambda: 0)
         worker_op_keys = defaultdict(set)
@@ -328,7 +511,11 @@ class GraphAnalyzer(object):
 
         if cur_assigns:
             # calculate ranges of nodes already assigned
-            for op_key, worker in self._iter_successor_assigns(cur_assigns):
+            if csr_graph is not None:
+                successor_assigns = self._iter_successor_assigns_csr(cur_assigns)
+            else:
+                successor_assigns = self._iter_successor_assigns(cur_assigns)
+            for op_key, worker in successor_assigns:
                 cur_assigns[op_key] = worker
                 worker_op_keys[worker].add(op_key)
 
@@ -336,19 +523,29 @@ class GraphAnalyzer(object):
 
         # calculate expected descendant count (spread range) of
         # every worker and subtract assigned number from it
-        average_spread_range = len(graph) * 1.0 / len(self._worker_slots)
+        average_spread_range = graph_size * 1.0 / len(self._worker_slots)
         spread_ranges = defaultdict(lambda: average_spread_range)
         for worker in cur_assigns.values():
             spread_ranges[worker] -= 1
 
         logger.debug('Scan spread ranges: %r', dict(spread_ranges))
 
+        if csr_graph is not None:
+            self._prepare_bfs_arrays(op_keys, cur_assigns, has_preds)
+
+            def assign_by_bfs(start, worker):
+                self._assign_by_bfs_csr(start, worker, worker_quotas, spread_ranges,
+                                        cur_assigns)
+        else:
+            def assign_by_bfs(start, worker):
+                self._assign_by_bfs(start, worker, worker_quotas, spread_ranges,
+                                    op_keys, cur_assigns, graph=graph)
+
         # assign pass 1: assign from fixed groups
         sorted_workers = sorted(worker_op_keys, reverse=True, key=lambda k: len(worker_op_keys[k]))
         for worker in sorted_workers:
             start_chunks = reduce(operator.add, (key_to_chunks[op_key] for op_key in worker_op_keys[worker]))
-            self._assign_by_bfs(start_chunks, worker, worker_quotas, spread_ranges,
-                                op_keys, cur_assigns, graph=graph)
+            assign_by_bfs(start_chunks, worker)
 
         # assign pass 2: assign from other nodes to be assigned
         sorted_candidates = [v for v in chunks_to_assign]
@@ -357,8 +554,7 @@ class GraphAnalyzer(object):
             cur = sorted_candidates.pop()
             while cur.op.key in cur_assigns:
                 cur = sorted_candidates.pop()
-            self._assign_by_bfs(cur, worker, worker_quotas, spread_ranges, op_keys,
-                                cur_assigns, graph=graph)
+            assign_by_bfs(cur, worker)
 
         # FIXME: force to assign vineyard source/sink ops to their `expect_worker` even when
         # the worker has an input.
@@ -382,6 +578,9 @@ class GraphAnalyzer(object):
         Update operand states when some chunks are lost.
         :return: dict mapping operand keys into changed states
         """
+        if self._csr_graph is not None:
+            return self._analyze_state_changes_csr()
+
         graph = self._graph
         lost_chunks = set(self._lost_chunks)
         op_states = self._op_states
@@ -438,3 +637,82 @@ class GraphAnalyzer(object):
 
         op_states.update(new_states)
         return new_states
+
+    def _analyze_state_changes_csr(self):
+        """
+        Update operand states when some chunks are lost, with the graph
+        scanned by levels on arrays. Inputs from Fetch chunks are regarded
+        as preserved unless they are lost.
+        """
+        csr_graph = self._csr_graph
+        op_keys = csr_graph.op_keys
+        chunk_ops = csr_graph.chunk_ops
+        src, dst = csr_graph.src, csr_graph.dst
+        lost_chunks = set(self._lost_chunks)
+        op_states = self._op_states
+
+        states = [op_states.get(k) for k in op_keys]
+        stop_spread_states = (OperandState.RUNNING, OperandState.FINISHED)
+        holds_data = np.array([s in stop_spread_states for s in states], dtype=bool)
+        unscheduled = np.array([s == OperandState.UNSCHEDULED for s in states], dtype=bool)
+
+        lost = np.array([k in lost_chunks for k in csr_graph.chunk_keys], dtype=bool)
+        ext_lost = np.zeros(len(csr_graph), dtype=bool)
+        ext_keys = csr_graph.ext_keys
+        if len(ext_keys):
+            ext_lost_mask = np.array([k in lost_chunks for k in ext_keys], dtype=bool)
+            ext_lost[csr_graph.ext_dst[ext_lost_mask]] = True
+
+        # mark lost virtual nodes as lost when some preds are lost
+        pred_indptr, pred_indices = csr_graph.pred_indptr, csr_graph.pred_indices
+        virtual = csr_graph.virtual & ~unscheduled[chunk_ops]
+        if virtual.any():
+            for chunks in csr_graph.iter_levels():
+                chunks = chunks[virtual[chunks]]
+                if not len(chunks):
+                    continue
+                preds, owners = gather_neighbors(pred_indptr, pred_indices, chunks)
+                lost[chunks[owners[lost[preds]]]] = True
+                lost[chunks[ext_lost[chunks]]] = True
+
+        # check data on finished operands. when data lost, mark the operand
+        # and its successors as affected.
+        affected = np.zeros(len(op_keys), dtype=bool)
+        affected[chunk_ops[lost]] = True
+        affected[chunk_ops[dst[affected[chunk_ops[src]]]]] = True
+        affected[chunk_ops[ext_lost]] = True
+
+        not_ready = np.zeros(len(op_keys), dtype=bool)
+        not_ready[chunk_ops[ext_lost]] = True
+
+        # scan the graph from bottom and mark operands whose
+        # predecessors do not hold data
+        for chunks in csr_graph.iter_levels(reverse=True):
+            chunks = chunks[affected[chunk_ops[chunks]]]
+            if not len(chunks):
+                continue
+            preds, owners = gather_neighbors(pred_indptr, pred_indices, chunks)
+            pred_ops = chunk_ops[preds]
+            # mark affected, if
+            # 1. data of the operand is lost
+            # 2. state does not hold data, or data is lost,
+            #    for instance, operand is freed.
+            invalid = lost[preds] | ~holds_data[pred_ops]
+            affected[pred_ops[invalid]] = True
+            not_ready[chunk_ops[chunks[owners[invalid]]]] = True
+
+        # update state given data preservation of prior nodes,
+        # in reversed topological order
+        affected_ops = np.flatnonzero(affected)
+        affected_ops = affected_ops[np.argsort(-csr_graph.calc_op_depths()[affected_ops],
+                                               kind='stable')]
+        new_states = dict()
+        for op_idx in affected_ops.tolist():
+            op_key, op_state = op_keys[op_idx], states[op_idx]
+            if not not_ready[op_idx] and op_state != OperandState.READY:
+                new_states[op_key] = OperandState.READY
+            elif not_ready[op_idx] and op_state != OperandState.UNSCHEDULED:
+                new_states[op_key] = OperandState.UNSCHEDULED
+
+        op_states.update(new_states)
+        return new_states
@@ -19,13 +19,15 @@ import os
 import random
 import sys
 import time
+import uuid
 from collections import defaultdict
 
 from .. import promise
 from ..config import options
-from ..errors import DependencyMissing
+from ..errors import DependencyMissing, WorkerDead
 from ..utils import log_unhandled
 from .operands import BaseOperandActor
+from .operands.core import rewrite_worker_errors
 from .resource import ResourceActor
 from .utils import SchedulerActor
 
@@ -297,6 +299,8 @@ class AssignEvaluationActor(SchedulerActor):
         unassigned = []
         reject_workers = set()
         assigned = 0
+        # small operands allocated to the same worker, submitted in batches
+        batches = defaultdict(list)
         # the assigning procedure will continue till all workers rejected
         # or max_allocates reached
         while len(reject_workers) < len(self._worker_metrics) and assigned < max_allocates:
@@ -307,11 +311,14 @@ class AssignEvaluationActor(SchedulerActor):
             try:
                 alloc_ep, rejects = self._allocate_resource(
                     item.session_id, item.op_key, item.op_info, item.target_worker,
-                    reject_workers=reject_workers)
+                    reject_workers=reject_workers, batches=batches)
             except:  # noqa: E722
                 logger.exception('Unexpected error occurred in %s', self.uid)
-                if item.callback:  # pragma: no branch
+                if item.callback:
                     self.tell_promise(item.callback, *sys.exc_info(), _accept=False)
+                elif item.op_info.get('handler_uid'):
+                    self.get_actor_ref(item.op_info['handler_uid']).reject_allocation(
+                        item.op_key, *sys.exc_info(), _tell=True, _wait=False)
                 continue
 
             # collect workers failed to assign operand to
@@ -323,6 +330,8 @@ class AssignEvaluationActor(SchedulerActor):
             else:
                 # put the unassigned item into unassigned list to add back to the queue later
                 unassigned.append(item)
+        if batches:
+            self._submit_batches(batches)
         if unassigned:
             # put unassigned back to the queue, if any
             self._assigner_ref.extend(unassigned, _tell=True)
@@ -331,7 +340,8 @@ class AssignEvaluationActor(SchedulerActor):
             self._assigner_ref.get_allocate_requests(_tell=True, _wait=False)
 
     @log_unhandled
-    def _allocate_resource(self, session_id, op_key, op_info, target_worker=None, reject_workers=None):
+    def _allocate_resource(self, session_id, op_key, op_info, target_worker=None, reject_workers=None,
+                           batches=None):
         """
         Allocate resource for single operand
         :param session_id: session id
@@ -339,6 +349,8 @@ class AssignEvaluationActor(SchedulerActor):
         :param op_info: operand info dict
         :param target_worker: worker to allocate, can be None
         :param reject_workers: workers denied to assign to
+        :param batches: if specified, small operands are put into this dict
+                        instead of being submitted to workers immediately
         """
         if target_worker not in self._worker_metrics:
             target_worker = None
@@ -371,6 +383,9 @@ class AssignEvaluationActor(SchedulerActor):
 
         # todo make more detailed allocation plans
         calc_device = op_info.get('calc_device', 'cpu')
+        batch_size = options.scheduler.submit_batch_size
+        batched = batches is not None and batch_size > 1 and calc_device == 'cpu' \
+            and sum(input_sizes.values()) <= options.scheduler.submit_batch_input_limit
         if calc_device == 'cpu':
             alloc_dict = dict(cpu=options.scheduler.default_cpu_usage, memory=sum(input_sizes.values()))
         elif calc_device == 'cuda':
@@ -380,15 +395,138 @@ class AssignEvaluationActor(SchedulerActor):
 
         rejects = []
         for worker_ep in candidate_workers:
-            if self._resource_ref.allocate_resource(session_id, op_key, worker_ep, alloc_dict):
+            if batched:
+                groups = batches[(session_id, worker_ep)]
+                if groups and len(groups[-1][1]) < batch_size:
+                    batch_key, new_batch = groups[-1][0], False
+                else:
+                    batch_key, new_batch = str(uuid.uuid4()), True
+                if self._allocate_batched_resource(session_id, op_key, worker_ep, alloc_dict,
+                                                   batch_key, new_batch):
+                    logger.debug('Operand %s(%s) allocated to run in %s with batch %s',
+                                 op_key, op_info['op_name'], worker_ep, batch_key)
+                    if new_batch:
+                        groups.append((batch_key, []))
+                    groups[-1][1].append((op_key, op_info, input_metas))
+                    return worker_ep, rejects
+            elif self._resource_ref.allocate_resource(session_id, op_key, worker_ep, alloc_dict):
                 logger.debug('Operand %s(%s) allocated to run in %s', op_key, op_info['op_name'], worker_ep)
-
-                self.get_actor_ref(BaseOperandActor.gen_uid(session_id, op_key)) \
-                    .submit_to_worker(worker_ep, input_metas, _tell=True, _wait=False)
+                self._submit_operand(session_id, op_key, op_info, worker_ep, input_metas)
                 return worker_ep, rejects
             rejects.append(worker_ep)
         return None, rejects
 
+    def _allocate_batched_resource(self, session_id, op_key, worker_ep, alloc_dict,
+                                   batch_key, new_batch):
+        """
+        Allocate resource for an operand submitted in a batch. Operands in a
+        batch are executed as a single graph, thus the cpu slot is allocated
+        under the batch key and released when the whole batch is done.
+        :return: True if allocated successfully
+        """
+        if new_batch and not self._resource_ref.allocate_resource(
+                session_id, batch_key, worker_ep, dict(cpu=alloc_dict['cpu'])):
+            return False
+        if self._resource_ref.allocate_resource(session_id, op_key, worker_ep, dict(alloc_dict, cpu=0)):
+            return True
+        if new_batch:
+            self._resource_ref.deallocate_resource(session_id, batch_key, worker_ep)
+        return False
+
+    def _get_operand_ref(self, session_id, op_key, op_info):
+        """
+        Get ref of the actor handling the operand and the leading
+        arguments passed to it
+        """
+        handler_uid = op_info.get('handler_uid')
+        if handler_uid is not None:
+            # operand handled by a graph-level actor
+            return self.get_actor_ref(handler_uid), (op_key,)
+        else:
+            return self.get_actor_ref(BaseOperandActor.gen_uid(session_id, op_key)), ()
+
+    def _submit_operand(self, session_id, op_key, op_info, worker_ep, input_metas):
+        ref, args = self._get_operand_ref(session_id, op_key, op_info)
+        ref.submit_to_worker(*(args + (worker_ep, input_metas)), _tell=True, _wait=False)
+
+    def _submit_batches(self, batches):
+        """
+        Submit small operands allocated to the same worker in batches,
+        operands in a batch are executed by the worker in a single graph
+        :param batches: dict mapping (session_id, worker) to list of
+                        (batch_key, operands)
+        """
+        for (session_id, worker_ep), groups in batches.items():
+            for batch_key, group in groups:
+                self._submit_batch(session_id, worker_ep, batch_key, group)
+
+    def _submit_batch(self, session_id, worker_ep, batch_key, group):
+        """
+        Collect executable graphs of operands in a batch and submit
+        them to the worker in a single call
+        :param session_id: session id
+        :param worker_ep: worker endpoint
+        :param batch_key: key of the batch, holding the cpu slot
+        :param group: list of (op_key, op_info, input_metas)
+        """
+        from ..worker import ExecutionActor
+
+        futures = []
+        for op_key, op_info, input_metas in group:
+            ref, args = self._get_operand_ref(session_id, op_key, op_info)
+            futures.append((op_key, op_info, ref, args, input_metas, ref.prepare_submission(
+                *(args + (worker_ep, input_metas)), _wait=False)))
+
+        submissions = []
+        submitted = []
+        failed = []
+        for op_key, op_info, ref, args, input_metas, future in futures:
+            try:
+                submission = future.result()
+            except:  # noqa: E722
+                logger.exception('Failed to prepare submission of operand %s', op_key)
+                failed.append((op_key, op_info))
+                continue
+            # operand cancelled or already running
+            if submission is None:
+                self._resource_ref.deallocate_resource(
+                    session_id, op_key, worker_ep, _tell=True, _wait=False)
+                continue
+            submissions.append((op_key,) + tuple(submission))
+            submitted.append((op_key, op_info, ref, args, input_metas))
+
+        if submissions:
+            logger.debug('Submitting %d operands to %s in batch %s', len(submissions), worker_ep, batch_key)
+            execution_ref = self.ctx.actor_ref(ExecutionActor.default_uid(), address=worker_ep)
+            try:
+                with rewrite_worker_errors():
+                    execution_ref.execute_graphs(session_id, batch_key, submissions, _tell=True)
+            except WorkerDead:
+                logger.debug('Worker %s dead when submitting batch %s', worker_ep, batch_key)
+                self._resource_ref.detach_dead_workers([worker_ep], _tell=True)
+                failed.extend((op_key, op_info) for op_key, op_info, _, _, _ in submitted)
+                submitted = []
+            except:  # noqa: E722
+                logger.exception('Failed to submit batch %s to %s', batch_key, worker_ep)
+                failed.extend((op_key, op_info) for op_key, op_info, _, _, _ in submitted)
+                submitted = []
+
+        if not submitted:
+            # the batch does not run, release its cpu slot
+            self._resource_ref.deallocate_resource(
+                session_id, batch_key, worker_ep, _tell=True, _wait=False)
+        if failed:
+            # release resources of failed operands and put them back
+            # into the queue to be assigned again
+            for op_key, _ in failed:
+                self._resource_ref.deallocate_resource(
+                    session_id, op_key, worker_ep, _tell=True, _wait=False)
+            self._assigner_ref.apply_for_multiple_resources(session_id, failed, _tell=True)
+
+        for _, _, ref, args, input_metas in submitted:
+            ref.submit_to_worker(*(args + (worker_ep, input_metas)), submitted=True,
+                                 _tell=True, _wait=False)
+
     def _get_chunks_meta(self, session_id, keys):
         if not keys:
             return dict()
@@ -0,0 +1,308 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from ..operands import Fetch, VirtualOperand
+
+_EMPTY_INDEXES = np.empty(0, dtype=np.int64)
+
+
+def gather_neighbors(indptr, indices, nodes):
+    """
+    Gather neighbors of given nodes in a CSR matrix.
+
+    :param indptr: index pointers of the CSR matrix
+    :param indices: column indices of the CSR matrix
+    :param nodes: array of nodes
+    :return: tuple of neighbors and positions in `nodes` of the node
+             every neighbor belongs to
+    """
+    starts = indptr[nodes]
+    lens = indptr[nodes + 1] - starts
+    total = int(lens.sum())
+    if total == 0:
+        return _EMPTY_INDEXES, _EMPTY_INDEXES
+    offsets = np.repeat(starts - np.cumsum(lens) + lens, lens)
+    return indices[offsets + np.arange(total)], np.repeat(np.arange(len(nodes)), lens)
+
+
+def build_csr(n_nodes, src, dst):
+    """
+    Build a CSR matrix of edges from src to dst. Orders of edges
+    sharing the same source are kept.
+
+    :return: tuple of index pointers and column indices
+    """
+    order = np.argsort(src, kind='stable')
+    indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n_nodes), out=indptr[1:])
+    return indptr, dst[order]
+
+
+def _array_property(name):
+    return property(lambda self: self._get_arrays()[name])
+
+
+class CSRChunkGraph(object):
+    """
+    Array representation of a chunk graph for graph analysis. Fetch chunks
+    are excluded, and edges between chunks are stored as CSR matrices.
+    Derived arrays like depths are calculated once and reused by every
+    analysis, including analyses on fail-over.
+
+    Chunks are appended when they are merged into the chunk graph. When
+    tiling iteratively, analyses only cover chunks appended in current
+    iteration, thus `start_iteration` should be called before appending
+    chunks of a new iteration.
+    """
+    def __init__(self):
+        self._clear()
+
+    def _clear(self):
+        self._chunks = []
+        self._chunk_keys = []
+        self._chunk_index = dict()
+        self._op_keys = []
+        self._op_index = dict()
+        self._chunk_ops = []
+        self._virtual = []
+        self._edge_src = []
+        self._edge_dst = []
+        # inputs of chunks from fetch chunks, held by other graphs
+        self._ext_keys = []
+        self._ext_dst = []
+
+        self._arrays = None
+        self._levels = None
+        self._level_bounds = None
+        self._descendant_sizes = None
+        self._op_key_to_chunks = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        csr_graph = cls()
+        csr_graph.add_chunks(graph, graph)
+        return csr_graph
+
+    def start_iteration(self):
+        """
+        Start a new iteration of tiling. Chunks appended before are
+        dropped from analyses, and edges from them are treated as
+        inputs from fetch chunks.
+        """
+        if self._chunks:
+            self._clear()
+
+    def __len__(self):
+        return len(self._chunks)
+
+    @property
+    def chunks(self):
+        return self._chunks
+
+    @property
+    def chunk_keys(self):
+        return self._chunk_keys
+
+    @property
+    def op_keys(self):
+        return self._op_keys
+
+    @property
+    def op_index(self):
+        return self._op_index
+
+    src = _array_property('src')
+    dst = _array_property('dst')
+    chunk_ops = _array_property('chunk_ops')
+    virtual = _array_property('virtual')
+    succ_indptr = _array_property('succ_indptr')
+    succ_indices = _array_property('succ_indices')
+    pred_indptr = _array_property('pred_indptr')
+    pred_indices = _array_property('pred_indices')
+    ext_keys = _array_property('ext_keys')
+    ext_dst = _array_property('ext_dst')
+
+    @property
+    def op_key_to_chunks(self):
+        if self._op_key_to_chunks is None:
+            key_to_chunks = self._op_key_to_chunks = dict()
+            for c in self._chunks:
+                try:
+                    key_to_chunks[c.op.key].append(c)
+                except KeyError:
+                    key_to_chunks[c.op.key] = [c]
+        return self._op_key_to_chunks
+
+    def chunk_index(self, chunk):
+        return self._chunk_index[chunk.key, chunk.id]
+
+    def add_chunks(self, graph, chunks):
+        """
+        Append chunks and their edges in the graph. Chunks already
+        added are skipped, and edges are only added between appended
+        chunks and their predecessors, thus predecessors should be
+        appended before or together with their successors.
+
+        :param graph: chunk graph holding the chunks
+        :param chunks: chunks to append
+        """
+        chunk_index = self._chunk_index
+        op_index = self._op_index
+
+        new_chunks = []
+        for c in chunks:
+            if isinstance(c.op, Fetch) or (c.key, c.id) in chunk_index:
+                continue
+            op_key = c.op.key
+            try:
+                op_idx = op_index[op_key]
+            except KeyError:
+                op_idx = op_index[op_key] = len(self._op_keys)
+                self._op_keys.append(op_key)
+            chunk_index[c.key, c.id] = len(self._chunks)
+            self._chunks.append(c)
+            self._chunk_keys.append(c.key)
+            self._chunk_ops.append(op_idx)
+            self._virtual.append(isinstance(c.op, VirtualOperand))
+            new_chunks.append(c)
+
+        for c in new_chunks:
+            c_idx = chunk_index[c.key, c.id]
+            for pred in graph.iter_predecessors(c):
+                if isinstance(pred.op, Fetch) or (pred.key, pred.id) not in chunk_index:
+                    # fetch chunks or chunks of previous iterations
+                    self._ext_keys.append(pred.key)
+                    self._ext_dst.append(c_idx)
+                else:
+                    self._edge_src.append(chunk_index[pred.key, pred.id])
+                    self._edge_dst.append(c_idx)
+
+        if new_chunks:
+            self._arrays = self._levels = self._level_bounds = None
+            self._descendant_sizes = self._op_key_to_chunks = None
+
+    def _get_arrays(self):
+        if self._arrays is None:
+            n_chunks = len(self._chunks)
+            src = np.array(self._edge_src, dtype=np.int64)
+            dst = np.array(self._edge_dst, dtype=np.int64)
+            # keep edges in orders of their sources, as in DirectedGraph
+            order = np.argsort(src, kind='stable')
+            src, dst = src[order], dst[order]
+            succ_indptr, succ_indices = build_csr(n_chunks, src, dst)
+            pred_indptr, pred_indices = build_csr(n_chunks, dst, src)
+            self._arrays = dict(
+                src=src, dst=dst, chunk_ops=np.array(self._chunk_ops, dtype=np.int64),
+                virtual=np.array(self._virtual, dtype=bool),
+                succ_indptr=succ_indptr, succ_indices=succ_indices,
+                pred_indptr=pred_indptr, pred_indices=pred_indices,
+                ext_keys=np.array(self._ext_keys, dtype=object),
+                ext_dst=np.array(self._ext_dst, dtype=np.int64),
+            )
+        return self._arrays
+
+    @property
+    def pred_counts(self):
+        return np.diff(self.pred_indptr)
+
+    def undirected_csr(self, edge_mask=None):
+        """
+        Build CSR matrix of the undirected graph. Neighbors are ordered
+        in the same way as `DirectedGraph.build_undirected`.
+
+        :param edge_mask: mask of edges to keep
+        """
+        src, dst = self.src, self.dst
+        if edge_mask is not None:
+            src, dst = src[edge_mask], dst[edge_mask]
+        both_src = np.empty(2 * len(src), dtype=np.int64)
+        both_dst = np.empty(2 * len(src), dtype=np.int64)
+        both_src[0::2], both_src[1::2] = src, dst
+        both_dst[0::2], both_dst[1::2] = dst, src
+        return build_csr(len(self._chunks), both_src, both_dst)
+
+    def _calc_levels(self):
+        n_chunks = len(self._chunks)
+        succ_indptr, succ_indices = self.succ_indptr, self.succ_indices
+        in_degrees = self.pred_counts.copy()
+        levels = np.zeros(n_chunks, dtype=np.int64)
+
+        level = 0
+        frontier = np.flatnonzero(in_degrees == 0)
+        while len(frontier):
+            levels[frontier] = level
+            succs, _ = gather_neighbors(succ_indptr, succ_indices, frontier)
+            if not len(succs):
+                break
+            succs, counts = np.unique(succs, return_counts=True)
+            in_degrees[succs] -= counts
+            frontier = succs[in_degrees[succs] == 0]
+            level += 1
+
+        order = np.argsort(levels, kind='stable')
+        bounds = np.searchsorted(levels[order], np.arange(level + 2))
+        self._levels = levels
+        self._level_bounds = order, bounds
+
+    @property
+    def levels(self):
+        """
+        Length of the longest path from initial chunks to every chunk
+        """
+        if self._levels is None:
+            self._calc_levels()
+        return self._levels
+
+    def iter_levels(self, reverse=False):
+        """
+        Iterate over arrays of chunks with the same level
+        """
+        if self._levels is None:
+            self._calc_levels()
+        order, bounds = self._level_bounds
+        level_range = range(len(bounds) - 1)
+        for level in (reversed(level_range) if reverse else level_range):
+            chunks = order[bounds[level]:bounds[level + 1]]
+            if len(chunks):
+                yield chunks
+
+    def calc_op_depths(self):
+        op_depths = np.zeros(len(self._op_keys), dtype=np.int64)
+        np.maximum.at(op_depths, self.chunk_ops, self.levels)
+        return op_depths
+
+    @property
+    def op_descendant_sizes(self):
+        """
+        Estimated descendant sizes of operands. Levels are visited in
+        reverse, every chunk adds 1 to the size of its operand, and the
+        sizes of operands are then added to the operands of predecessors.
+        Chunks in the same level are accumulated together.
+        """
+        if self._descendant_sizes is None:
+            chunk_ops = self.chunk_ops
+            pred_indptr, pred_indices = self.pred_indptr, self.pred_indices
+            sizes = np.zeros(len(self._op_keys), dtype=np.float64)
+            for chunks in self.iter_levels(reverse=True):
+                np.add.at(sizes, chunk_ops[chunks], 1)
+                preds, owners = gather_neighbors(pred_indptr, pred_indices, chunks)
+                if len(preds):
+                    np.add.at(sizes, chunk_ops[preds], sizes[chunk_ops[chunks[owners]]])
+            self._descendant_sizes = sizes
+        return self._descendant_sizes
+
+    def calc_op_descendant_sizes(self):
+        return self.op_descendant_sizes
@@ -26,6 +26,7 @@ import numpy as np
 
 from .analyzer import GraphAnalyzer
 from .assigner import AssignerActor
+from .csrgraph import CSRChunkGraph
 from .kvstore import KVStoreActor
 from .operands import get_operand_actor_class, OperandState
 from .resource import ResourceActor
@@ -142,6 +143,10 @@ class GraphMetaActor(SchedulerActor):
             self._state_to_infos[old_state].pop(op_key, None)
         self._state_to_infos[op_state][op_key] = self._op_infos[op_key]
 
+    def update_op_states(self, op_keys, op_names, op_state):
+        for op_key, op_name in zip(op_keys, op_names):
+            self.update_op_state(op_key, op_name, op_state)
+
     def update_op_worker(self, op_key, op_name, worker):
         new_info = dict(op_name=op_name, worker=worker)
         self._op_infos[op_key].update(new_info)
@@ -241,6 +246,8 @@ class GraphActor(SchedulerActor):
 
         self._tileable_graph_cache = None
         self._chunk_graph_cache = None
+        # array representation of chunk graph, updated when chunks are merged
+        self._chunk_graph_csr = None
 
         # chunk graph builder
         self._chunk_graph_builder = None
@@ -272,6 +279,10 @@ class GraphActor(SchedulerActor):
 
         self._graph_analyze_pool = None
 
+        # actor handling operands when scheduler.vectorized_graph is enabled
+        self._operands_ref = None
+        self._vectorized_op_keys = set()
+
     def post_create(self):
         super().post_create()
         logger.debug('Actor %s running in process %d', self.uid, os.getpid())
@@ -295,6 +306,8 @@ class GraphActor(SchedulerActor):
     def pre_destroy(self):
         super().pre_destroy()
         self._graph_meta_ref.destroy()
+        if self._operands_ref is not None:
+            self._operands_ref.destroy()
 
     @contextlib.contextmanager
     def _open_dump_file(self, prefix):  # pragma: no cover
@@ -420,11 +433,15 @@ class GraphActor(SchedulerActor):
             if self._operand_infos[chunk.op.key].get('state') in \
                     (OperandState.READY, OperandState.RUNNING, OperandState.FINISHED):
                 # we only need to stop on ready, running and finished operands
+                has_stopping = True
+                if chunk.op.key in self._vectorized_op_keys:
+                    continue
                 op_uid = OperandActor.gen_uid(self._session_id, chunk.op.key)
                 scheduler_addr = self.get_scheduler(op_uid)
                 ref = self.ctx.actor_ref(op_uid, address=scheduler_addr)
-                has_stopping = True
                 ref.stop_operand(_tell=True)
+        if has_stopping and self._operands_ref is not None:
+            self._operands_ref.stop_operands(_tell=True)
         if not has_stopping:
             self.state = GraphState.CANCELLED
             self._graph_meta_ref.set_graph_end(_tell=True, _wait=False)
@@ -626,6 +643,13 @@ class GraphActor(SchedulerActor):
         if chunk_graph_builder.done:
             self._prune_chunk_graph(cur_chunk_graph, self._terminal_chunk_keys)
 
+        if self._chunk_graph_csr is None:
+            self._chunk_graph_csr = CSRChunkGraph()
+        csr_graph = self._chunk_graph_csr
+        # analyses only cover chunks in current iteration
+        csr_graph.start_iteration()
+
+        merged_chunks = []
         for c in list(cur_chunk_graph):
             if not isinstance(c.op, Fetch):
                 self._op_key_to_chunk[c.op.key].append(c)
@@ -633,6 +657,7 @@ class GraphActor(SchedulerActor):
             # merge current chunk into self.chunk_graph_cache
             if isinstance(c.op, Fetch):
                 continue
+            merged_chunks.append(c)
             chunk_graph.add_node(c)
             self._chunk_key_id_to_chunk[c.key, c.id] = c
             for inp in cur_chunk_graph.iter_predecessors(c):
@@ -645,6 +670,9 @@ class GraphActor(SchedulerActor):
                         chunk_graph.add_node(inp)
                     chunk_graph.add_edge(inp, c)
 
+        # arrays are shared by all analyses in current iteration
+        csr_graph.add_chunks(cur_chunk_graph, merged_chunks)
+
     def _get_worker_slots(self):
         metrics = self._resource_actor_ref.get_workers_meta()
         return dict((ep, int(metrics[ep]['hardware']['cpu_total'])) for ep in metrics)
@@ -671,7 +699,8 @@ class GraphActor(SchedulerActor):
             assignments = {c.op.key: c.op.expect_worker for c in initial_chunks}
         else:
             if analyzer is None:
-                analyzer = GraphAnalyzer(chunk_graph, self._get_worker_slots())
+                analyzer = GraphAnalyzer(chunk_graph, self._get_worker_slots(),
+                                         csr_graph=self._chunk_graph_csr)
             assignments = analyzer.calc_operand_assignments(op_keys, input_chunk_metas=input_chunk_metas)
         for idx, (k, v) in enumerate(assignments.items()):
             operand_infos[k]['optimize']['placement_order'] = idx
@@ -696,20 +725,15 @@ class GraphActor(SchedulerActor):
     def analyze_graph(self, **kwargs):
         operand_infos = self._operand_infos
         chunk_graph = self.get_chunk_graph()
+        # fetch chunks are excluded in arrays
+        csr_graph = self._chunk_graph_csr
 
-        # remove fetch chunk if exists
-        if any(isinstance(c.op, Fetch) for c in chunk_graph):
-            chunk_graph = chunk_graph.copy()
-            for c in list(chunk_graph):
-                if isinstance(c.op, Fetch):
-                    chunk_graph.remove_node(c)
-
-        if len(chunk_graph) == 0:
+        if len(csr_graph) == 0:
             return
 
-        for n in chunk_graph:
+        succ_sizes = np.diff(csr_graph.succ_indptr).tolist()
+        for n, succ_size in zip(csr_graph.chunks, succ_sizes):
             k = n.op.key
-            succ_size = chunk_graph.count_successors(n)
             if k not in operand_infos:
                 operand_infos[k] = dict(optimize=dict(
                     depth=0, demand_depths=(), successor_size=succ_size, descendant_size=0
@@ -719,7 +743,7 @@ class GraphActor(SchedulerActor):
 
         worker_slots = self._get_worker_slots()
         self._assigned_workers = set(worker_slots)
-        analyzer = GraphAnalyzer(chunk_graph, worker_slots)
+        analyzer = GraphAnalyzer(chunk_graph, worker_slots, csr_graph=csr_graph)
 
         for k, v in analyzer.calc_depths().items():
             operand_infos[k]['optimize']['depth'] = v
@@ -762,7 +786,7 @@ class GraphActor(SchedulerActor):
                     for inp in inputs:
                         graph.add_edge(inp, out)
         if serialize:
-            return serialize_graph(graph)
+            return serialize_graph(graph, compact=options.scheduler.compact_graph_serialization)
         else:
             return graph
 
@@ -822,11 +846,20 @@ class GraphActor(SchedulerActor):
         """
         Create operand actors for all operands
         """
+        from .operands import OperandActor
+
         logger.debug('Creating operand actors for graph %s', self._graph_key)
 
         chunk_graph = self.get_chunk_graph()
         operand_infos = self._operand_infos
 
+        # operands with specific actors, for instance, shuffle proxies,
+        # cannot be handled by the vectorized actor
+        vectorized = options.scheduler.vectorized_graph and all(
+            get_operand_actor_class(type(chunks[0].op)) is OperandActor
+            for chunks in self._op_key_to_chunk.values())
+        vectorized_op_infos = OrderedDict()
+
         session_id = self._session_id
         op_refs = dict()
         meta_op_infos = dict()
@@ -864,6 +897,13 @@ class GraphActor(SchedulerActor):
             if any(c.key in self._terminal_chunk_keys for c in op.outputs):
                 op_info['is_terminal'] = True
 
+            if vectorized:
+                vectorized_op_infos[op_key] = op_info.copy()
+                if _clean_info:
+                    op_info.pop('executable_dag', None)
+                    del op_info['io_meta']
+                continue
+
             op_cls = get_operand_actor_class(type(op))
             op_uid = op_cls.gen_uid(session_id, op_key)
             scheduler_addr = self.get_scheduler(op_uid)
@@ -887,6 +927,10 @@ class GraphActor(SchedulerActor):
         self.state = GraphState.RUNNING
         self._graph_meta_ref.update_op_infos(meta_op_infos, _tell=True, _wait=False)
 
+        if vectorized:
+            self._create_vectorized_operands(vectorized_op_infos, _start=_start)
+            return
+
         if _start:
             existing_keys = []
             for op_key, future in op_refs.items():
@@ -917,6 +961,32 @@ class GraphActor(SchedulerActor):
             self._assigner_actor_ref.apply_for_multiple_resources(
                 session_id, res_applications, _tell=True)
 
+    def _create_vectorized_operands(self, op_infos, _start=True):
+        """
+        Hand operands over to the actor handling all operands of the graph
+        """
+        from .operands import VectorizedOperandsActor
+
+        if self._operands_ref is None:
+            uid = VectorizedOperandsActor.gen_uid(self._session_id, self._graph_key)
+            self._operands_ref = self.ctx.create_actor(
+                VectorizedOperandsActor, self._session_id, self._graph_key,
+                with_kvstore=self._kv_store_ref is not None,
+                schedulers=self.get_schedulers(), uid=uid, address=self.get_scheduler(uid))
+        self._vectorized_op_keys.update(op_infos)
+        if _start:
+            self._operands_ref.add_operands(op_infos, _tell=True)
+
+    @log_unhandled
+    def add_finished_terminals(self, op_keys, final_state=None, exc=None):
+        """
+        Add terminal operands to finished set in batch.
+        :param op_keys: operand keys
+        :param final_state: state of the operands
+        """
+        for op_key in op_keys:
+            self.add_finished_terminal(op_key, final_state=final_state, exc=exc)
+
     @log_unhandled
     def add_finished_terminal(self, op_key, final_state=None, exc=None):
         """
@@ -1036,6 +1106,17 @@ class GraphActor(SchedulerActor):
         except KeyError:
             pass
 
+    def set_operand_states(self, op_keys, state):
+        op_keys = [k for k in op_keys if k in self._operand_infos]
+        op_names = []
+        for op_key in op_keys:
+            op_info = self._operand_infos[op_key]
+            op_info['state'] = state
+            op_info.pop('failover_state', None)
+            op_names.append(op_info['op_name'])
+        self._graph_meta_ref.update_op_states(op_keys, op_names, state,
+                                              _tell=True, _wait=False)
+
     def get_operand_target_worker(self, op_key):
         return self._operand_infos[op_key]['target_worker']
 
@@ -1078,9 +1159,16 @@ class GraphActor(SchedulerActor):
     def free_tileable_data(self, tileable_key, wait=False):
         tileable = self._get_tileable_by_key(tileable_key)
         futures = []
+        vectorized_op_keys = []
         for chunk in tileable.chunks:
+            if chunk.op.key in self._vectorized_op_keys:
+                vectorized_op_keys.append(chunk.op.key)
+                continue
             futures.append(self._get_operand_ref(chunk.op.key).free_data(
                 check=False, _tell=not wait, _wait=False))
+        if vectorized_op_keys:
+            futures.append(self._operands_ref.free_data(
+                vectorized_op_keys, check=False, _tell=not wait, _wait=False))
         [f.result() for f in futures]
 
     def get_tileable_metas(self, tileable_keys, filter_fields=None):
@@ -1223,6 +1311,8 @@ class GraphActor(SchedulerActor):
             # all crucial state changes are received by GraphActor.
             # During the delay, no operands are allowed to be freed.
             self._operand_free_paused = True
+            if self._operands_ref is not None:
+                self._operands_ref.pause_free(_tell=True)
             self._worker_adds.update(adds)
             self._worker_removes.update(removes)
             self._lost_chunks.update(lost_chunks)
@@ -1238,11 +1328,11 @@ class GraphActor(SchedulerActor):
         self._worker_removes = set()
         lost_chunks = self._lost_chunks
         self._lost_chunks = set()
-        if not adds and not removes:
-            return
-
-        if all(ep in self._assigned_workers for ep in adds) \
-                and not any(ep in self._assigned_workers for ep in removes):
+        if (not adds and not removes) or \
+                (all(ep in self._assigned_workers for ep in adds)
+                 and not any(ep in self._assigned_workers for ep in removes)):
+            if self._operands_ref is not None:
+                self._operands_ref.resume_free(_tell=True)
             return
 
         worker_slots = self._get_worker_slots()
@@ -1273,7 +1363,8 @@ class GraphActor(SchedulerActor):
             sorted(((k, v) for k, v in graph_states.items()),
                    key=lambda d: operand_infos[d[0]]['optimize'].get('placement_order', 0))
         )
-        analyzer = GraphAnalyzer(graph, worker_slots, fixed_assigns, ordered_states, lost_chunks)
+        analyzer = GraphAnalyzer(graph, worker_slots, fixed_assigns, ordered_states, lost_chunks,
+                                 csr_graph=self._chunk_graph_csr)
         if removes or lost_chunks:
             new_states = analyzer.analyze_state_changes()
             logger.debug('%d chunks lost. %d operands changed state.', len(lost_chunks),
@@ -1294,6 +1385,7 @@ class GraphActor(SchedulerActor):
             if state in (OperandState.READY, OperandState.RUNNING):
                 new_states[key] = state
 
+        vectorized_states = dict()
         for key, state in new_states.items():
             new_target = new_targets.get(key)
 
@@ -1303,6 +1395,10 @@ class GraphActor(SchedulerActor):
             # in case of concurrency issues
             op_info['failover_state'] = state
 
+            if key in self._vectorized_op_keys:
+                vectorized_states[key] = state
+                continue
+
             op_ref = self._get_operand_ref(key)
             # states may easily slip into the next state when we are
             # calculating fail-over states. Hence we need to include them
@@ -1317,6 +1413,10 @@ class GraphActor(SchedulerActor):
                 from_states = [from_state]
             futures.append(op_ref.move_failover_state(
                 from_states, state, new_target, removes, _tell=True, _wait=False))
+        if self._operands_ref is not None:
+            # free operations are resumed after states moved
+            futures.append(self._operands_ref.move_failover_states(
+                vectorized_states, new_targets, list(removes), _tell=True, _wait=False))
         [f.result() for f in futures]
 
         self._dump_failover_info(adds, removes, lost_chunks, new_states)
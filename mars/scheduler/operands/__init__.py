@@ -18,3 +18,4 @@ from .core import register_operand_class, get_operand_actor_class, \
 from .common import OperandActor
 from .shuffle import ShuffleProxyActor
 from .successors_exclusive import SuccessorsExclusiveOperandActor
+from .vectorized import OperandStateMachine, VectorizedOperandsActor
@@ -22,7 +22,57 @@ from .core import OperandState, rewrite_worker_errors
 logger = logging.getLogger(__name__)
 
 
-class BaseOperandActor(SchedulerActor):
+class WorkerDataMixin(object):
+    """
+    Helpers for scheduler actors managing data stored in workers
+    """
+    def _get_raw_execution_ref(self, uid=None, address=None):
+        """
+        Get raw ref of ExecutionActor on assigned worker. This method can be patched on debug
+        """
+        from ...worker import ExecutionActor
+        uid = uid or ExecutionActor.default_uid()
+
+        return self.ctx.actor_ref(uid, address=address)
+
+    def _wait_worker_futures(self, worker_futures):
+        dead_workers = []
+        for ep, future in worker_futures:
+            try:
+                with rewrite_worker_errors():
+                    future.result()
+            except WorkerDead:
+                dead_workers.append(ep)
+        if dead_workers:
+            self._resource_ref.detach_dead_workers(dead_workers, _tell=True)
+        return dead_workers
+
+    def _free_data_in_worker(self, data_keys, workers_list=None):
+        """
+        Free data on single worker
+        :param data_keys: keys of data in chunk meta
+        """
+        if not workers_list:
+            workers_list = self.chunk_meta.batch_get_workers(self._session_id, data_keys)
+        worker_data = defaultdict(list)
+        for data_key, endpoints in zip(data_keys, workers_list):
+            if endpoints is None:
+                continue
+            for ep in endpoints:
+                worker_data[ep].append(data_key)
+
+        self.chunk_meta.batch_delete_meta(self._session_id, data_keys, _tell=True, _wait=False)
+
+        worker_futures = []
+        for ep, data_keys in worker_data.items():
+            ref = self._get_raw_execution_ref(address=ep)
+            worker_futures.append((ep, ref.delete_data_by_keys(
+                self._session_id, data_keys, _tell=True, _wait=False)))
+
+        return self._wait_worker_futures(worker_futures)
+
+
+class BaseOperandActor(WorkerDataMixin, SchedulerActor):
     @staticmethod
     def gen_uid(session_id, op_key):
         return 's:h1:operand$%s$%s' % (session_id, op_key)
@@ -136,15 +186,6 @@ class BaseOperandActor(SchedulerActor):
     def get_state(self):
         return self._state
 
-    def _get_raw_execution_ref(self, uid=None, address=None):
-        """
-        Get raw ref of ExecutionActor on assigned worker. This method can be patched on debug
-        """
-        from ...worker import ExecutionActor
-        uid = uid or ExecutionActor.default_uid()
-
-        return self.ctx.actor_ref(uid, address=address)
-
     def _get_operand_actor(self, key):
         """
         Get ref of OperandActor by operand key
@@ -152,42 +193,6 @@ class BaseOperandActor(SchedulerActor):
         op_uid = self.gen_uid(self._session_id, key)
         return self.ctx.actor_ref(op_uid, address=self.get_scheduler(op_uid))
 
-    def _wait_worker_futures(self, worker_futures):
-        dead_workers = []
-        for ep, future in worker_futures:
-            try:
-                with rewrite_worker_errors():
-                    future.result()
-            except WorkerDead:
-                dead_workers.append(ep)
-        if dead_workers:
-            self._resource_ref.detach_dead_workers(dead_workers, _tell=True)
-        return dead_workers
-
-    def _free_data_in_worker(self, data_keys, workers_list=None):
-        """
-        Free data on single worker
-        :param data_keys: keys of data in chunk meta
-        """
-        if not workers_list:
-            workers_list = self.chunk_meta.batch_get_workers(self._session_id, data_keys)
-        worker_data = defaultdict(list)
-        for data_key, endpoints in zip(data_keys, workers_list):
-            if endpoints is None:
-                continue
-            for ep in endpoints:
-                worker_data[ep].append(data_key)
-
-        self.chunk_meta.batch_delete_meta(self._session_id, data_keys, _tell=True, _wait=False)
-
-        worker_futures = []
-        for ep, data_keys in worker_data.items():
-            ref = self._get_raw_execution_ref(address=ep)
-            worker_futures.append((ep, ref.delete_data_by_keys(
-                self._session_id, data_keys, _tell=True, _wait=False)))
-
-        return self._wait_worker_futures(worker_futures)
-
     def start_operand(self, state=None, **kwargs):
         """
         Start handling operand given self.state
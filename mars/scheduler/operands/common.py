@@ -325,8 +325,54 @@ class OperandActor(BaseOperandActor):
                          self._op_key, target_predicts)
         return target_predicts
 
+    def _get_exec_graph(self):
+        try:
+            input_metas = self._io_meta['input_data_metas']
+            input_chunks = [k[0] if isinstance(k, tuple) else k for k in input_metas]
+        except KeyError:
+            input_chunks = self._input_chunks
+
+        if set(input_chunks) != set(self._input_chunks) or self._executable_dag is None:
+            return self._graph_refs[-1].get_executable_operand_dag(self._op_key, input_chunks)
+        else:
+            return self._executable_dag
+
     @log_unhandled
-    def submit_to_worker(self, worker, data_metas):
+    def prepare_submission(self, worker, data_metas):
+        """
+        Prepare arguments of ExecutionActor.execute_graph when the operand
+        is submitted to the worker in a batch by the assigner
+        :return: None if the operand cannot be submitted
+        """
+        if self.state in (OperandState.CANCELLED, OperandState.CANCELLING):
+            self.start_operand()
+            return None
+        if self.state == OperandState.RUNNING:
+            return None
+
+        self.worker = worker
+        target_predicts = self._get_target_predicts(worker)
+        return self._get_exec_graph(), self._io_meta, data_metas, self._calc_device, target_predicts
+
+    @log_unhandled
+    def submit_to_worker(self, worker, data_metas, submitted=False):
+        """
+        Submit the operand to the worker assigned
+        :param worker: worker endpoint
+        :param data_metas: data metas of inputs
+        :param submitted: if True, the operand is already submitted
+                          to the worker in a batch
+        """
+        if submitted:
+            self._execution_ref = self._get_execution_ref()
+            if self.state in (OperandState.CANCELLED, OperandState.CANCELLING):
+                with rewrite_worker_errors(ignore_error=True):
+                    self._execution_ref.stop_execution(self._session_id, self._op_key, _tell=True)
+                self.start_operand()
+                return
+            self.start_operand(OperandState.RUNNING)
+            return
+
         # worker assigned, submit job
         if self.state in (OperandState.CANCELLED, OperandState.CANCELLING):
             self.start_operand()
@@ -338,17 +384,9 @@ class OperandActor(BaseOperandActor):
         self.worker = worker
 
         target_predicts = self._get_target_predicts(worker)
-        try:
-            input_metas = self._io_meta['input_data_metas']
-            input_chunks = [k[0] if isinstance(k, tuple) else k for k in input_metas]
-        except KeyError:
-            input_chunks = self._input_chunks
 
         # submit job
-        if set(input_chunks) != set(self._input_chunks) or self._executable_dag is None:
-            exec_graph = self._graph_refs[-1].get_executable_operand_dag(self._op_key, input_chunks)
-        else:
-            exec_graph = self._executable_dag
+        exec_graph = self._get_exec_graph()
         self._execution_ref = self._get_execution_ref()
         try:
             with rewrite_worker_errors():
@@ -0,0 +1,227 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+import uuid
+
+from mars import tensor as mt
+from mars.actors import ActorAlreadyExist
+from mars.config import option_context
+from mars.scheduler import OperandActor, ResourceActor, GraphActor, AssignerActor, \
+    ChunkMetaActor, GraphMetaActor
+from mars.scheduler.operands import OperandState, OperandStateMachine, \
+    VectorizedOperandsActor
+from mars.scheduler.operands.tests.test_common_exec import FakeExecutionActor
+from mars.scheduler.utils import GraphState, SchedulerClusterInfoActor
+from mars.utils import serialize_graph
+from mars.tests.core import patch_method, create_actor_pool
+
+
+class Test(unittest.TestCase):
+    def _build_state_machine(self):
+        # a, b -> c -> d, b -> e
+        sm = OperandStateMachine()
+        sm.add_operands(['a', 'b', 'c', 'd', 'e'], [[], [], ['a', 'b'], ['c'], ['b']],
+                        depths=[0, 0, 1, 2, 1], terminals=[False, False, False, True, True])
+        return sm
+
+    def testStateMachine(self):
+        sm = self._build_state_machine()
+        self.assertEqual(len(sm), 5)
+        self.assertEqual(sm.get_states(sm.get_ids(['a', 'b', 'c'])),
+                         [OperandState.READY, OperandState.READY, OperandState.UNSCHEDULED])
+        self.assertEqual(sm.get_keys(sm.get_successors(sm.get_ids(['b']))), ['c', 'e'])
+        self.assertEqual(sm.get_keys(sm.get_predecessors(sm.get_ids(['c']))), ['a', 'b'])
+
+        ready, freeable = sm.mark_finished(sm.get_ids(['a']))
+        self.assertEqual(len(ready), 0)
+        self.assertEqual(len(freeable), 0)
+
+        ready, freeable = sm.mark_finished(sm.get_ids(['b']))
+        self.assertEqual(sm.get_keys(ready), ['c', 'e'])
+        self.assertEqual(sm.get_states(ready), [OperandState.READY] * 2)
+        self.assertEqual(len(freeable), 0)
+
+        # finishing twice changes nothing
+        ready, freeable = sm.mark_finished(sm.get_ids(['b']))
+        self.assertEqual(len(ready), 0)
+
+        ready, freeable = sm.mark_finished(sm.get_ids(['c', 'e']))
+        self.assertEqual(sm.get_keys(ready), ['d'])
+        self.assertEqual(sm.get_keys(freeable), ['a', 'b'])
+
+        # terminals are never freed
+        ready, freeable = sm.mark_finished(sm.get_ids(['d']))
+        self.assertEqual(sm.get_keys(freeable), ['c'])
+
+        # add operands in the next iteration
+        new_ids = sm.add_operands(['f', 'c'], [[], ['a']])
+        self.assertEqual(sm.get_keys(new_ids), ['f'])
+        self.assertEqual(sm.get_states(new_ids), [OperandState.READY])
+        self.assertEqual(sm.get_keys(sm.get_successors(sm.get_ids(['c']))), ['d'])
+
+    def testStateMachineDemands(self):
+        sm = self._build_state_machine()
+        sm.mark_finished(sm.get_ids(['a', 'b']))
+
+        # d demands data of c which is ready
+        changed = sm.update_demand_depths(sm.get_ids(['d']))
+        self.assertEqual(sm.get_keys(changed), ['c'])
+        self.assertEqual(sm.get_demand_depths(sm.get_ids(['d'])[0]), (2,))
+        self.assertEqual(sm.get_demand_depths(sm.get_ids(['c'])[0]), (2,))
+
+        changed = sm.update_demand_depths(sm.get_ids(['d']))
+        self.assertEqual(len(changed), 0)
+
+        sm.set_workers(sm.get_ids(['a']), 'w1')
+        sm.set_workers(sm.get_ids(['b']), 'w2')
+        succs, workers = sm.predict_successor_workers(sm.get_ids(['b']))
+        self.assertEqual(sm.get_keys(succs), ['c', 'e'])
+        # no dominant workers for c
+        self.assertEqual(workers, [None, 'w2'])
+
+        sm.set_target_workers(sm.get_ids(['c']), 'w1')
+        succs, workers = sm.predict_successor_workers(sm.get_ids(['b']))
+        self.assertEqual(workers, ['w1', 'w2'])
+        self.assertEqual(sm.get_keys(sm.get_ids_on_workers(['w2'])), ['b'])
+
+    def testStateMachineTermination(self):
+        sm = self._build_state_machine()
+        sm.mark_finished(sm.get_ids(['a', 'b']))
+        sm.mark_finished(sm.get_ids(['c']))
+
+        # data of a and c lost
+        executed = sm.reset(sm.get_ids(['a']), OperandState.READY)
+        self.assertEqual(sm.get_keys(executed), ['a'])
+        sm.reset(sm.get_ids(['c']), OperandState.UNSCHEDULED)
+        ready, _ = sm.mark_finished(sm.get_ids(['a']))
+        self.assertEqual(sm.get_keys(ready), ['c'])
+
+        affected = sm.mark_fatal(sm.get_ids(['c']))
+        self.assertEqual(sm.get_keys(affected), ['c', 'd'])
+        self.assertEqual(sm.get_states(affected), [OperandState.FATAL] * 2)
+
+        sm.set_states(sm.get_ids(['e']), OperandState.RUNNING)
+        running, finished, others = sm.cancel()
+        self.assertEqual(sm.get_keys(running), ['e'])
+        self.assertEqual(sm.get_keys(finished), ['a', 'b'])
+        self.assertEqual(len(others), 0)
+        self.assertEqual(sm.get_states(running), [OperandState.CANCELLING])
+
+
+@patch_method(ResourceActor._broadcast_sessions)
+@patch_method(ResourceActor._broadcast_workers)
+class ExecutionTest(unittest.TestCase):
+    def _run_graph(self, tensor, fail_count=0, cancel_after=None):
+        session_id = str(uuid.uuid4())
+        graph_key = str(uuid.uuid4())
+        graph = tensor.build_graph(compose=False)
+
+        with create_actor_pool(n_process=1, backend='gevent') as pool, \
+                option_context({'scheduler.vectorized_graph': True,
+                                'scheduler.retry_delay': 0}):
+            pool.create_actor(SchedulerClusterInfoActor, [pool.cluster_info.address],
+                              uid=SchedulerClusterInfoActor.default_uid())
+            resource_ref = pool.create_actor(ResourceActor, uid=ResourceActor.default_uid())
+            pool.create_actor(ChunkMetaActor, uid=ChunkMetaActor.default_uid())
+            pool.create_actor(AssignerActor, uid=AssignerActor.gen_uid(session_id))
+            graph_ref = pool.create_actor(GraphActor, session_id, graph_key, serialize_graph(graph),
+                                          uid=GraphActor.gen_uid(session_id, graph_key))
+
+            def _build_mock_ref(uid=None, address=None):
+                try:
+                    return pool.create_actor(
+                        FakeExecutionActor, exec_delay=0.1, fail_count=fail_count,
+                        uid=FakeExecutionActor.gen_uid(address))
+                except ActorAlreadyExist:
+                    return pool.actor_ref(FakeExecutionActor.gen_uid(address))
+
+            # handle mock objects
+            VectorizedOperandsActor._get_raw_execution_ref.side_effect = _build_mock_ref
+
+            mock_resource = dict(hardware=dict(cpu=4, cpu_total=4, memory=512))
+            resource_ref.set_worker_meta('localhost:12345', mock_resource)
+            resource_ref.set_worker_meta('localhost:23456', mock_resource)
+
+            graph_ref.prepare_graph(compose=False)
+            fetched_graph = graph_ref.get_chunk_graph()
+            graph_ref.analyze_graph()
+            graph_ref.create_operand_actors()
+
+            # no actors created for single operands
+            for c in fetched_graph:
+                self.assertFalse(pool.has_actor(pool.actor_ref(
+                    OperandActor.gen_uid(session_id, c.op.key))))
+            self.assertTrue(pool.has_actor(pool.actor_ref(
+                VectorizedOperandsActor.gen_uid(session_id, graph_key))))
+
+            graph_meta_ref = pool.actor_ref(GraphMetaActor.gen_uid(session_id, graph_key))
+            start_time = time.time()
+            cancel_called = False
+            while True:
+                pool.sleep(0.05)
+                if cancel_after is not None and not cancel_called \
+                        and time.time() > start_time + cancel_after:
+                    cancel_called = True
+                    graph_ref.stop_graph(_tell=True)
+                if time.time() - start_time > 30:
+                    raise SystemError('Wait for execution finish timeout')
+                if graph_meta_ref.get_state() in (GraphState.SUCCEEDED, GraphState.FAILED,
+                                                  GraphState.CANCELLED):
+                    break
+            # wait for state changes sent after graph terminated
+            pool.sleep(0.2)
+            return graph_meta_ref.get_state(), graph_ref.get_operand_info()
+
+    @patch_method(VectorizedOperandsActor._get_raw_execution_ref)
+    @patch_method(VectorizedOperandsActor._free_data_in_worker)
+    def testVectorizedExecution(self, *_):
+        arr = mt.random.randint(10, size=(10, 8), chunk_size=4)
+        arr_add = mt.random.randint(10, size=(10, 8), chunk_size=4)
+        arr2 = (arr + arr_add).sum(axis=0)
+
+        state, op_infos = self._run_graph(arr2)
+        self.assertEqual(state, GraphState.SUCCEEDED)
+        # data of non-terminal operands are freed
+        for op_info in op_infos.values():
+            if op_info.get('is_terminal'):
+                self.assertEqual(op_info['state'], OperandState.FINISHED)
+            else:
+                self.assertEqual(op_info['state'], OperandState.FREED)
+
+    @patch_method(VectorizedOperandsActor._get_raw_execution_ref)
+    @patch_method(VectorizedOperandsActor._free_data_in_worker)
+    def testVectorizedExecutionWithRetry(self, *_):
+        arr = mt.random.randint(10, size=(10, 8), chunk_size=4)
+        arr_add = mt.random.randint(10, size=(10, 8), chunk_size=4)
+
+        state, _ = self._run_graph(arr + arr_add, fail_count=2)
+        self.assertEqual(state, GraphState.SUCCEEDED)
+
+        arr = mt.random.randint(10, size=(10, 8), chunk_size=4)
+        arr_add = mt.random.randint(10, size=(10, 8), chunk_size=4)
+        state, op_infos = self._run_graph(arr + arr_add, fail_count=5)
+        self.assertEqual(state, GraphState.FAILED)
+        self.assertTrue(all(info['state'] == OperandState.FATAL for info in op_infos.values()))
+
+    @patch_method(VectorizedOperandsActor._get_raw_execution_ref)
+    @patch_method(VectorizedOperandsActor._free_data_in_worker)
+    def testVectorizedExecutionWithCancel(self, *_):
+        arr = mt.random.randint(10, size=(10, 8), chunk_size=4)
+        arr_add = mt.random.randint(10, size=(10, 8), chunk_size=4)
+        arr2 = (arr + arr_add).sum(axis=0)
+
+        state, _ = self._run_graph(arr2, cancel_after=0.15)
+        self.assertEqual(state, GraphState.CANCELLED)
@@ -0,0 +1,871 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import time
+from collections import defaultdict
+from functools import partial
+
+import numpy as np
+
+from ...config import options
+from ...errors import ExecutionInterrupted, DependencyMissing, WorkerDead
+from ...utils import log_unhandled
+from ..utils import GraphState, SchedulerActor
+from .base import WorkerDataMixin
+from .core import OperandState, rewrite_worker_errors
+
+logger = logging.getLogger(__name__)
+
+_states = list(OperandState.__members__.values())
+_state_codes = dict((s, idx) for idx, s in enumerate(_states))
+
+
+def _codes_of(states):
+    return np.array([_state_codes[s] for s in states], dtype=np.int8)
+
+
+_terminated_codes = _codes_of(OperandState.TERMINATED_STATES)
+
+
+def _build_csr(rows, cols, size):
+    """
+    Build CSR indptr and indices from coordinates of non-zero values
+    """
+    order = np.lexsort((cols, rows))
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=size), out=indptr[1:])
+    return indptr, cols[order]
+
+
+def _gather(indptr, indices, ids):
+    """
+    Gather neighbors of nodes in CSR format
+    :return: positions of owners in ``ids`` and neighbors
+    """
+    ids = np.asarray(ids, dtype=np.int64)
+    starts = indptr[ids]
+    lens = indptr[ids + 1] - starts
+    total = int(lens.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    ends = np.cumsum(lens)
+    positions = np.arange(total) + np.repeat(starts - ends + lens, lens)
+    return np.repeat(np.arange(len(ids)), lens), indices[positions]
+
+
+class OperandStateMachine(object):
+    """
+    States of all operands in a graph kept in arrays indexed by integer
+    operand ids, with predecessors and successors stored in CSR format.
+    State transitions of operands are done in batches by array operations
+    instead of messages between operand actors.
+    """
+    def __init__(self):
+        self._keys = []
+        self._key_to_id = dict()
+
+        self._edge_src = np.empty(0, dtype=np.int64)
+        self._edge_dst = np.empty(0, dtype=np.int64)
+        # CSR arrays are built lazily when edges are changed
+        self._pred_csr = self._succ_csr = None
+
+        self._states = np.empty(0, dtype=np.int8)
+        # whether operands are executed successfully
+        self._done = np.empty(0, dtype=np.bool_)
+        # number of predecessors not executed
+        self._pending_preds = np.empty(0, dtype=np.int64)
+        # number of successors not executed
+        self._pending_succs = np.empty(0, dtype=np.int64)
+        self._terminals = np.empty(0, dtype=np.bool_)
+        self._depths = np.empty(0, dtype=np.int64)
+        # sorted ids of operands demanded by operands of every depth
+        self._demand_ids = dict()
+
+        # workers are stored as integer ids, -1 if not assigned
+        self._workers = np.empty(0, dtype=np.int32)
+        self._targets = np.empty(0, dtype=np.int32)
+        self._worker_names = []
+        self._worker_ids = dict()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._key_to_id
+
+    @property
+    def keys(self):
+        return self._keys
+
+    def get_ids(self, keys):
+        return np.array([self._key_to_id[k] for k in keys], dtype=np.int64)
+
+    def get_keys(self, ids):
+        return [self._keys[i] for i in ids]
+
+    def _get_worker_id(self, worker):
+        if worker is None:
+            return -1
+        try:
+            return self._worker_ids[worker]
+        except KeyError:
+            wid = self._worker_ids[worker] = len(self._worker_names)
+            self._worker_names.append(worker)
+            return wid
+
+    def add_operands(self, keys, predecessors, states=None, depths=None,
+                     terminals=None, target_workers=None):
+        """
+        Add operands into the state machine. Operands already added are skipped.
+
+        :param keys: keys of operands
+        :param predecessors: keys of predecessors for every operand
+        :param states: initial states, READY for operands without predecessors
+                       and UNSCHEDULED for others by default
+        :param depths: depths of operands in graph
+        :param terminals: whether operands are terminals of the graph
+        :param target_workers: workers proposed for operands
+        :return: ids of operands added
+        """
+        start = len(self._keys)
+        new_pos = []
+        for pos, key in enumerate(keys):
+            if key in self._key_to_id:
+                continue
+            self._key_to_id[key] = len(self._keys)
+            self._keys.append(key)
+            new_pos.append(pos)
+        size = len(self._keys)
+        new_ids = np.arange(start, size, dtype=np.int64)
+        n_new = len(new_pos)
+
+        src, dst = [], []
+        for op_id, pos in zip(new_ids, new_pos):
+            for pred_key in predecessors[pos]:
+                try:
+                    src.append(self._key_to_id[pred_key])
+                    dst.append(op_id)
+                except KeyError:
+                    continue
+        # new edges always point to new operands, thus never duplicate existing ones
+        edge_codes = np.unique(np.array(src, dtype=np.int64) * size + np.array(dst, dtype=np.int64))
+        new_src, new_dst = edge_codes // size, edge_codes % size
+        self._edge_src = np.concatenate([self._edge_src, new_src])
+        self._edge_dst = np.concatenate([self._edge_dst, new_dst])
+        self._pred_csr = self._succ_csr = None
+
+        def _pick(values, default):
+            if values is None:
+                return [default] * n_new
+            return [values[pos] for pos in new_pos]
+
+        self._depths = np.concatenate(
+            [self._depths, np.array(_pick(depths, 0), dtype=np.int64)])
+        self._terminals = np.concatenate(
+            [self._terminals, np.array(_pick(terminals, False), dtype=np.bool_)])
+        self._targets = np.concatenate(
+            [self._targets, np.array([self._get_worker_id(w) for w in _pick(target_workers, None)],
+                                     dtype=np.int32)])
+        self._workers = np.concatenate([self._workers, np.full(n_new, -1, dtype=np.int32)])
+        self._done = np.concatenate([self._done, np.zeros(n_new, dtype=np.bool_)])
+        self._states = np.concatenate([self._states, np.zeros(n_new, dtype=np.int8)])
+
+        # new operands are not executed, so only counts on new edges are added
+        self._pending_preds = np.concatenate([
+            self._pending_preds,
+            np.bincount(new_dst[~self._done[new_src]] - start, minlength=n_new)])
+        self._pending_succs = np.concatenate([
+            self._pending_succs, np.zeros(n_new, dtype=np.int64)])
+        np.add.at(self._pending_succs, new_src, 1)
+
+        if states is None:
+            has_preds = np.bincount(new_dst - start, minlength=n_new) > 0
+            self._states[new_ids] = np.where(
+                has_preds, _state_codes[OperandState.UNSCHEDULED], _state_codes[OperandState.READY])
+        else:
+            self._states[new_ids] = _codes_of(_pick(states, None))
+        return new_ids
+
+    @property
+    def _pred_arrays(self):
+        if self._pred_csr is None:
+            self._pred_csr = _build_csr(self._edge_dst, self._edge_src, len(self._keys))
+        return self._pred_csr
+
+    @property
+    def _succ_arrays(self):
+        if self._succ_csr is None:
+            self._succ_csr = _build_csr(self._edge_src, self._edge_dst, len(self._keys))
+        return self._succ_csr
+
+    def _recount(self):
+        size = len(self._keys)
+        self._pending_preds = np.bincount(
+            self._edge_dst[~self._done[self._edge_src]], minlength=size).astype(np.int64)
+        self._pending_succs = np.bincount(
+            self._edge_src[~self._done[self._edge_dst]], minlength=size).astype(np.int64)
+
+    def get_predecessors(self, ids):
+        return np.unique(_gather(*self._pred_arrays, ids)[1])
+
+    def get_successors(self, ids):
+        return np.unique(_gather(*self._succ_arrays, ids)[1])
+
+    def get_states(self, ids):
+        return [_states[c] for c in self._states[ids]]
+
+    def set_states(self, ids, state):
+        self._states[ids] = _state_codes[state]
+
+    def filter_states(self, ids, *states):
+        ids = np.asarray(ids, dtype=np.int64)
+        return ids[np.isin(self._states[ids], _codes_of(states))]
+
+    def ids_in_states(self, *states):
+        return np.flatnonzero(np.isin(self._states, _codes_of(states)))
+
+    def is_terminal(self, ids):
+        return self._terminals[ids]
+
+    def get_depths(self, ids):
+        return self._depths[ids]
+
+    def get_demand_depths(self, op_id):
+        depths = []
+        for depth, demand_ids in self._demand_ids.items():
+            pos = np.searchsorted(demand_ids, op_id)
+            if pos < len(demand_ids) and demand_ids[pos] == op_id:
+                depths.append(depth)
+        return tuple(sorted(depths, reverse=True))
+
+    def get_workers(self, ids):
+        return [self._worker_names[w] if w >= 0 else None for w in self._workers[ids]]
+
+    def set_workers(self, ids, worker):
+        self._workers[ids] = self._get_worker_id(worker)
+
+    def get_ids_on_workers(self, workers):
+        worker_ids = [self._worker_ids[w] for w in workers if w in self._worker_ids]
+        return np.flatnonzero(np.isin(self._workers, worker_ids))
+
+    def get_target_workers(self, ids):
+        return [self._worker_names[w] if w >= 0 else None for w in self._targets[ids]]
+
+    def set_target_workers(self, ids, worker):
+        self._targets[ids] = self._get_worker_id(worker)
+
+    def mark_finished(self, ids):
+        """
+        Mark operands as finished, and collect successors whose predecessors
+        are all finished, and predecessors whose successors are all finished.
+
+        :param ids: ids of finished operands
+        :return: ids of operands becoming ready, ids of operands whose data can be freed
+        """
+        ids = np.unique(np.asarray(ids, dtype=np.int64))
+        ids = ids[~self._done[ids]]
+        self._done[ids] = True
+        self.set_states(ids, OperandState.FINISHED)
+
+        succ_indptr, succ_indices = self._succ_arrays
+        succs = _gather(succ_indptr, succ_indices, ids)[1]
+        np.subtract.at(self._pending_preds, succs, 1)
+        succs = np.unique(succs)
+        ready = succs[(self._pending_preds[succs] == 0) &
+                      (self._states[succs] == _state_codes[OperandState.UNSCHEDULED])]
+        self.set_states(ready, OperandState.READY)
+
+        preds = _gather(*self._pred_arrays, ids)[1]
+        np.subtract.at(self._pending_succs, preds, 1)
+        candidates = np.union1d(preds, ids[np.diff(succ_indptr)[ids] > 0])
+        return ready, self.filter_freeable(candidates)
+
+    def filter_freeable(self, ids):
+        """
+        Filter finished operands whose successors are all executed
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        return ids[(self._pending_succs[ids] == 0) & ~self._terminals[ids] &
+                   (self._states[ids] == _state_codes[OperandState.FINISHED])]
+
+    def _iter_descendants(self, ids, stop_codes):
+        visited = np.zeros(len(self._keys), dtype=np.bool_)
+        frontier = np.unique(np.asarray(ids, dtype=np.int64))
+        while len(frontier):
+            visited[frontier] = True
+            yield frontier
+            succs = self.get_successors(frontier)
+            frontier = succs[~visited[succs] & ~np.isin(self._states[succs], stop_codes)]
+
+    def mark_fatal(self, ids):
+        """
+        Mark operands and all their descendants not terminated as FATAL
+
+        :param ids: ids of failed operands
+        :return: ids of all operands moved to FATAL
+        """
+        affected = []
+        for frontier in self._iter_descendants(ids, _terminated_codes):
+            affected.append(frontier)
+        affected = np.concatenate(affected) if affected else np.empty(0, dtype=np.int64)
+        self.set_states(affected, OperandState.FATAL)
+        return affected
+
+    def cancel(self):
+        """
+        Cancel all operands not terminated. Running operands are moved to
+        CANCELLING while other operands are moved to CANCELLED.
+
+        :return: ids of running operands, ids of finished operands whose
+                 data shall be freed, ids of other operands cancelled
+        """
+        running = self.ids_in_states(OperandState.RUNNING)
+        finished = self.ids_in_states(OperandState.FINISHED)
+        others = self.ids_in_states(OperandState.UNSCHEDULED, OperandState.READY)
+        self.set_states(running, OperandState.CANCELLING)
+        self.set_states(finished, OperandState.CANCELLED)
+        self.set_states(others, OperandState.CANCELLED)
+        return running, finished, others
+
+    def reset(self, ids, state):
+        """
+        Move operands back into an unexecuted state, used in fail-over
+
+        :param ids: ids of operands
+        :param state: state to move into
+        :return: ids of operands which are executed before
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        executed = ids[self._done[ids]]
+        self._done[ids] = False
+        self._workers[ids] = -1
+        self.set_states(ids, state)
+        if len(executed):
+            self._recount()
+        return executed
+
+    def update_demand_depths(self, ids):
+        """
+        Insert depths of operands into demand depths of themselves and
+        their ancestors not executed, till ready operands met.
+
+        :param ids: ids of operands whose predecessors start running
+        :return: ids of ready operands whose demand depths changed
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        unscheduled_code = _state_codes[OperandState.UNSCHEDULED]
+        walk_codes = _codes_of([OperandState.UNSCHEDULED, OperandState.READY])
+        changed_ready = [np.empty(0, dtype=np.int64)]
+
+        depths = self._depths[ids]
+        for depth in np.unique(depths):
+            depth = int(depth)
+            demand_ids = self._demand_ids.get(depth, np.empty(0, dtype=np.int64))
+            frontier = np.unique(ids[depths == depth])
+            while len(frontier):
+                inserted = frontier[~np.isin(frontier, demand_ids, assume_unique=True)]
+                demand_ids = np.union1d(demand_ids, inserted)
+                walk_mask = self._states[inserted] == unscheduled_code
+                changed_ready.append(inserted[~walk_mask])
+                preds = self.get_predecessors(inserted[walk_mask])
+                frontier = preds[np.isin(self._states[preds], walk_codes)]
+            self._demand_ids[depth] = demand_ids
+        return self.filter_states(np.unique(np.concatenate(changed_ready)), OperandState.READY)
+
+    def predict_successor_workers(self, ids):
+        """
+        Predict workers of successors of operands given workers of
+        their predecessors. A worker is predicted when it is assigned or
+        proposed to the successor, or it owns more than half of the
+        predecessors.
+
+        :param ids: ids of operands with workers assigned
+        :return: ids of successors, and predicted workers
+        """
+        succs = self.get_successors(ids)
+        n_workers = len(self._worker_names)
+        if len(succs) == 0 or n_workers == 0:
+            return succs, [None] * len(succs)
+
+        fixed = np.where(self._workers[succs] >= 0, self._workers[succs], self._targets[succs])
+        pred_indptr, pred_indices = self._pred_arrays
+        owners, preds = _gather(pred_indptr, pred_indices, succs)
+        pred_workers = self._workers[preds]
+        valid = pred_workers >= 0
+        counts = np.bincount(owners[valid] * n_workers + pred_workers[valid],
+                             minlength=len(succs) * n_workers).reshape(len(succs), n_workers)
+        best = counts.argmax(axis=1)
+        scores = counts[np.arange(len(succs)), best] / np.diff(pred_indptr)[succs]
+        predicted = np.where(fixed >= 0, fixed, np.where(scores > 0.5, best, -1))
+        return succs, [self._worker_names[w] if w >= 0 else None for w in predicted]
+
+
+class VectorizedOperandsActor(WorkerDataMixin, SchedulerActor):
+    """
+    Actor handling lifecycles of all operands in a graph. States of operands
+    are kept in an :class:`OperandStateMachine`, thus actor messages are only
+    needed when communicating with workers.
+    """
+    @staticmethod
+    def gen_uid(session_id, graph_key):
+        return 's:h1:vectorized_operands$%s$%s' % (session_id, graph_key)
+
+    def __init__(self, session_id, graph_key, with_kvstore=True, schedulers=None):
+        super().__init__()
+        self._session_id = session_id
+        self._graph_key = graph_key
+
+        self._state_machine = OperandStateMachine()
+        # operand infos indexed by operand ids
+        self._infos = []
+        self._executable_dags = []
+        self._retries = []
+        self._excs = dict()
+        self._submit_promises = dict()
+
+        self._free_paused = False
+        self._paused_frees = set()
+
+        self._graph_ref = None
+        self._assigner_ref = None
+        self._resource_ref = None
+
+        self._with_kvstore = with_kvstore
+        self._kv_store_ref = None
+
+        if schedulers:  # pragma: no branch
+            self.set_schedulers(schedulers)
+
+    def post_create(self):
+        from ..graph import GraphActor
+        from ..assigner import AssignerActor
+        from ..kvstore import KVStoreActor
+        from ..resource import ResourceActor
+
+        super().post_create()
+        self.set_cluster_info_ref()
+        self._assigner_ref = self.get_actor_ref(AssignerActor.gen_uid(self._session_id))
+        self._graph_ref = self.get_actor_ref(GraphActor.gen_uid(self._session_id, self._graph_key))
+        self._resource_ref = self.get_actor_ref(ResourceActor.default_uid())
+
+        if self._with_kvstore:
+            self._kv_store_ref = self.ctx.actor_ref(KVStoreActor.default_uid())
+
+    def _get_op_path(self, op_key):
+        return '/sessions/%s/operands/%s' % (self._session_id, op_key)
+
+    def _get_execution_ref(self, worker):
+        return self.promise_ref(self._get_raw_execution_ref(address=worker))
+
+    def _is_worker_alive(self, worker):
+        return bool(self._assigner_ref.filter_alive_workers([worker], refresh=True))
+
+    def get_operand_states(self, op_keys):
+        return self._state_machine.get_states(self._state_machine.get_ids(op_keys))
+
+    def _set_states(self, ids, state, notify_only=False):
+        """
+        Set states of operands and broadcast to GraphActor and KVStoreActor
+        """
+        if len(ids) == 0:
+            return
+        if not notify_only:
+            self._state_machine.set_states(ids, state)
+        keys = self._state_machine.get_keys(ids)
+        logger.debug('%d operands in graph %s moved to %s.', len(keys), self._graph_key, state)
+        self._graph_ref.set_operand_states(keys, state, _tell=True, _wait=False)
+        if self._kv_store_ref is not None:
+            self._kv_store_ref.write_batch(
+                [('%s/state' % self._get_op_path(k), state.name) for k in keys],
+                _tell=True, _wait=False)
+
+    def _set_worker(self, op_id, worker):
+        self._state_machine.set_workers([op_id], worker)
+        op_key = self._state_machine.keys[op_id]
+        self._graph_ref.set_operand_worker(op_key, worker, _tell=True, _wait=False)
+        if self._kv_store_ref is not None:
+            if worker:
+                self._kv_store_ref.write('%s/worker' % self._get_op_path(op_key), worker,
+                                         _tell=True, _wait=False)
+            else:
+                self._kv_store_ref.delete('%s/worker' % self._get_op_path(op_key), silent=True,
+                                          _tell=True, _wait=False)
+
+    def _add_finished_terminals(self, ids, final_state=None, exc=None):
+        ids = np.asarray(ids, dtype=np.int64)
+        ids = ids[self._state_machine.is_terminal(ids)]
+        if len(ids) == 0:
+            return
+        if self._graph_ref.reload_state() in (GraphState.RUNNING, GraphState.CANCELLING):
+            self._graph_ref.add_finished_terminals(
+                self._state_machine.get_keys(ids), final_state=final_state, exc=exc,
+                _tell=True, _wait=False)
+
+    @log_unhandled
+    def add_operands(self, op_infos):
+        """
+        Add operands of the graph and start ready ones
+        :param op_infos: operand infos including io_meta, keyed by operand keys
+        """
+        keys = list(op_infos)
+        infos = [op_infos[k] for k in keys]
+        new_ids = self._state_machine.add_operands(
+            keys, [info['io_meta']['predecessors'] for info in infos],
+            states=[info['state'] for info in infos],
+            depths=[info['optimize'].get('depth', 0) for info in infos],
+            terminals=[bool(info.get('is_terminal')) for info in infos],
+            target_workers=[info.get('target_worker') for info in infos],
+        )
+        key_to_info = dict(zip(keys, infos))
+        for op_key in self._state_machine.get_keys(new_ids):
+            info = key_to_info[op_key]
+            self._executable_dags.append(info.pop('executable_dag', None))
+            self._retries.append(info.get('retries', 0))
+            info['handler_uid'] = self.uid
+            self._infos.append(info)
+
+        ready = self._state_machine.filter_states(new_ids, OperandState.READY)
+        self._apply_for_resources(ready)
+
+    def _apply_for_resources(self, ids):
+        if len(ids) == 0:
+            return
+        # if under retry, give application a delay
+        delayed_apps, apps = [], []
+        for op_id, op_key in zip(ids, self._state_machine.get_keys(ids)):
+            info = self._infos[op_id]
+            info['optimize']['demand_depths'] = self._state_machine.get_demand_depths(op_id)
+            (delayed_apps if self._retries[op_id] else apps).append((op_key, info))
+        if apps:
+            self._assigner_ref.apply_for_multiple_resources(
+                self._session_id, apps, _tell=True, _wait=False)
+        if delayed_apps:
+            self._assigner_ref.apply_for_multiple_resources(
+                self._session_id, delayed_apps, _tell=True, _wait=False,
+                _delay=options.scheduler.retry_delay)
+
+    @log_unhandled
+    def reject_allocation(self, op_key, *exc_info):
+        """
+        Handle errors raised when allocating resources for an operand
+        """
+        op_id = self._state_machine.get_ids([op_key])[0]
+        if issubclass(exc_info[0], DependencyMissing):
+            logger.warning('DependencyMissing met, operand %s will be back to UNSCHEDULED.', op_key)
+            self._set_worker(op_id, None)
+            self._set_states([op_id], OperandState.UNSCHEDULED)
+        else:
+            self._fail_operands([op_id], exc_info)
+
+    def _get_target_predicts(self, op_id, worker):
+        if not options.scheduler.enable_active_push:
+            return None
+        state_machine = self._state_machine
+        succ_ids, predicted = state_machine.predict_successor_workers([op_id])
+        candidates = set(w for w in predicted if w is not None and w != worker)
+        if not candidates:
+            return None
+        live_workers = set(self._assigner_ref.filter_alive_workers(list(candidates)))
+
+        chunks = set(self._infos[op_id]['io_meta']['chunks'])
+        target_predicts = defaultdict(set)
+        for succ_id, target in zip(succ_ids, predicted):
+            if target not in live_workers:
+                continue
+            for k in self._infos[succ_id]['io_meta']['input_chunks']:
+                if k in chunks:
+                    target_predicts[k].add(target)
+        if not target_predicts:
+            return None
+        logger.debug('Receive active pushing list for operand %s: %r',
+                     state_machine.keys[op_id], target_predicts)
+        return dict(target_predicts)
+
+    def _check_ready(self, op_id, op_key, worker):
+        if self._state_machine.get_states([op_id])[0] != OperandState.READY:
+            # operand cancelled or failed during allocation
+            self._resource_ref.deallocate_resource(
+                self._session_id, op_key, worker, _tell=True, _wait=False)
+            return False
+        return True
+
+    @log_unhandled
+    def prepare_submission(self, op_key, worker, data_metas):
+        """
+        Prepare arguments of ExecutionActor.execute_graph when the operand
+        is submitted to the worker in a batch by the assigner
+        :return: None if the operand cannot be submitted
+        """
+        op_id = self._state_machine.get_ids([op_key])[0]
+        if not self._check_ready(op_id, op_key, worker):
+            return None
+
+        info = self._infos[op_id]
+        io_meta = info['io_meta']
+        target_predicts = self._get_target_predicts(op_id, worker)
+        return self._get_exec_graph(op_id, op_key), io_meta, data_metas, \
+            info.get('calc_device', 'cpu'), target_predicts
+
+    def _get_exec_graph(self, op_id, op_key):
+        io_meta = self._infos[op_id]['io_meta']
+        try:
+            input_metas = io_meta['input_data_metas']
+            input_chunks = [k[0] if isinstance(k, tuple) else k for k in input_metas]
+        except KeyError:
+            input_chunks = io_meta['input_chunks']
+
+        exec_graph = self._executable_dags[op_id]
+        if set(input_chunks) != set(io_meta['input_chunks']) or exec_graph is None:
+            exec_graph = self._graph_ref.get_executable_operand_dag(op_key, input_chunks)
+        return exec_graph
+
+    @log_unhandled
+    def submit_to_worker(self, op_key, worker, data_metas, submitted=False):
+        """
+        Submit an operand to the worker allocated by AssignerActor
+        :param op_key: operand key
+        :param worker: worker endpoint
+        :param data_metas: data metas of inputs
+        :param submitted: if True, the operand is already submitted
+                          to the worker in a batch
+        """
+        state_machine = self._state_machine
+        op_id = state_machine.get_ids([op_key])[0]
+        if not self._check_ready(op_id, op_key, worker):
+            if submitted:
+                with rewrite_worker_errors(ignore_error=True):
+                    self._get_raw_execution_ref(address=worker).stop_execution(
+                        self._session_id, op_key, _tell=True)
+            return
+
+        self._set_worker(op_id, worker)
+        try:
+            with rewrite_worker_errors():
+                if submitted:
+                    promise = self._get_execution_ref(worker).add_finish_callback(
+                        self._session_id, op_key, _promise=True, _spawn=False)
+                else:
+                    info = self._infos[op_id]
+                    target_predicts = self._get_target_predicts(op_id, worker)
+                    promise = self._get_execution_ref(worker).execute_graph(
+                        self._session_id, op_key, self._get_exec_graph(op_id, op_key),
+                        info['io_meta'], data_metas, calc_device=info.get('calc_device', 'cpu'),
+                        send_addresses=target_predicts, _promise=True, _spawn=False)
+        except WorkerDead:
+            logger.debug('Worker %s dead when submitting operand %s into queue', worker, op_key)
+            self._resource_ref.detach_dead_workers([worker], _tell=True)
+            return
+
+        self._set_states([op_id], OperandState.RUNNING)
+        promise.then(partial(self._accept_execution, op_id, worker),
+                     partial(self._reject_execution, op_id, worker))
+
+        # propagate priority changes to successors and their ancestors
+        changed = state_machine.update_demand_depths(state_machine.get_successors([op_id]))
+        for changed_id, changed_key in zip(changed, state_machine.get_keys(changed)):
+            optimize_data = self._infos[changed_id]['optimize']
+            optimize_data['demand_depths'] = state_machine.get_demand_depths(changed_id)
+            self._assigner_ref.update_priority(changed_key, optimize_data, _tell=True, _wait=False)
+
+    @log_unhandled
+    def _accept_execution(self, op_id, worker, data_sizes):
+        op_key = self._state_machine.keys[op_id]
+        if not self._is_worker_alive(worker):
+            return
+        self._resource_ref.deallocate_resource(
+            self._session_id, op_key, worker, _tell=True, _wait=False)
+        self._infos[op_id]['io_meta']['data_targets'] = list(data_sizes)
+
+        if self._state_machine.get_states([op_id])[0] == OperandState.CANCELLING:
+            self._cancel_operands([op_id], free_data=True)
+        else:
+            self._finish_operands([op_id])
+
+    @log_unhandled
+    def _reject_execution(self, op_id, worker, *exc):
+        op_key = self._state_machine.keys[op_id]
+        exc_type = exc[0]
+        self._resource_ref.deallocate_resource(
+            self._session_id, op_key, worker, _tell=True, _wait=False)
+
+        if self._state_machine.get_states([op_id])[0] == OperandState.CANCELLING:
+            logger.warning('Execution of operand %s cancelled.', op_key)
+            self._cancel_operands([op_id])
+        elif issubclass(exc_type, ExecutionInterrupted):
+            logger.warning('Execution of operand %s interrupted.', op_key)
+            self._cancel_operands([op_id])
+        elif issubclass(exc_type, DependencyMissing):
+            logger.warning('Operand %s moved to UNSCHEDULED because of DependencyMissing.', op_key)
+            self._set_worker(op_id, None)
+            self._set_states([op_id], OperandState.UNSCHEDULED)
+        else:
+            logger.exception('Attempt %d: Unexpected error %s occurred in executing operand %s in %s',
+                             self._retries[op_id] + 1, exc_type.__name__, op_key, worker, exc_info=exc)
+            # increase retry times
+            self._retries[op_id] += 1
+            self._infos[op_id]['retries'] = self._retries[op_id]
+            self._infos[op_id]['retry_timestamp'] = time.time()
+            if self._retries[op_id] >= options.scheduler.retry_num:
+                # no further trial
+                self._fail_operands([op_id], exc)
+            else:
+                self._set_worker(op_id, None)
+                self._set_states([op_id], OperandState.READY)
+                self._apply_for_resources([op_id])
+
+    def _finish_operands(self, ids):
+        state_machine = self._state_machine
+        ready, freeable = state_machine.mark_finished(ids)
+        self._set_states(ids, OperandState.FINISHED, notify_only=True)
+
+        self._set_states(ready, OperandState.READY, notify_only=True)
+        self._apply_for_resources(ready)
+        self._free_operands(freeable)
+        # update records in GraphActor to help decide if the whole graph finished execution
+        self._add_finished_terminals(ids)
+
+        if options.scheduler.aggressive_assign and len(ready) == 0:
+            # require more chunks to execute if the completion caused no successors to run
+            self._assigner_ref.allocate_top_resources(1, _tell=True)
+
+    def _fail_operands(self, ids, exc=None):
+        affected = self._state_machine.mark_fatal(ids)
+        self._set_states(affected, OperandState.FATAL, notify_only=True)
+        if exc is not None:
+            self._excs.update((op_id, exc) for op_id in ids)
+        self._add_finished_terminals(affected, final_state=GraphState.FAILED, exc=exc)
+
+    def _cancel_operands(self, ids, free_data=False):
+        if free_data:
+            self._free_data_of_operands(ids)
+        self._set_states(ids, OperandState.CANCELLED)
+        self._add_finished_terminals(ids, final_state=GraphState.CANCELLED)
+
+    def _free_data_of_operands(self, ids):
+        data_keys = []
+        for op_id in ids:
+            data_keys.extend(self._infos[op_id]['io_meta'].get('data_targets') or ())
+        if data_keys:
+            self._free_data_in_worker(data_keys)
+
+    def _free_operands(self, ids):
+        if len(ids) == 0:
+            return
+        if self._free_paused:
+            # blocked by an ongoing fail-over step, we free them later
+            self._paused_frees.update(int(i) for i in ids)
+            return
+        ids = self._state_machine.filter_states(ids, OperandState.FINISHED)
+        self._set_states(ids, OperandState.FREED)
+        self._free_data_of_operands(ids)
+
+    @log_unhandled
+    def free_data(self, op_keys, check=True):
+        """
+        Free output data of operands
+        :param op_keys: keys of operands
+        :param check: only free operands whose successors are all executed
+        """
+        state_machine = self._state_machine
+        ids = state_machine.get_ids([k for k in op_keys if k in state_machine])
+        if check:
+            self._free_operands(state_machine.filter_freeable(ids))
+        else:
+            ids = state_machine.filter_states(ids, *OperandState.STORED_STATES)
+            self._set_states(ids, OperandState.FREED)
+            self._free_data_of_operands(ids)
+
+    @log_unhandled
+    def stop_operands(self):
+        """
+        Stop all operands by starting CANCELLING procedure
+        """
+        state_machine = self._state_machine
+        running, finished, others = state_machine.cancel()
+        self._set_states(running, OperandState.CANCELLING, notify_only=True)
+
+        # send stop to workers
+        for op_key, worker in zip(state_machine.get_keys(running),
+                                  state_machine.get_workers(running)):
+            logger.debug('Sending stop on operand %s to %s', op_key, worker)
+            with rewrite_worker_errors(ignore_error=True):
+                self._get_raw_execution_ref(address=worker).stop_execution(
+                    self._session_id, op_key, _tell=True)
+
+        # delete data on cancelled
+        self._free_data_of_operands(finished)
+        cancelled = np.concatenate([finished, others])
+        self._set_states(cancelled, OperandState.CANCELLED, notify_only=True)
+        self._add_finished_terminals(cancelled, final_state=GraphState.CANCELLED)
+
+    def pause_free(self):
+        self._free_paused = True
+
+    def resume_free(self):
+        self._free_paused = False
+        paused_frees, self._paused_frees = self._paused_frees, set()
+        self._free_operands(np.array(sorted(paused_frees), dtype=np.int64))
+
+    @log_unhandled
+    def move_failover_states(self, new_states, new_targets, dead_workers):
+        """
+        Move operands into new states when executing fail-over step
+        :param new_states: target states of operands
+        :param new_targets: new target workers proposed for operands
+        :param dead_workers: list of dead workers
+        """
+        state_machine = self._state_machine
+        dead_workers = set(dead_workers)
+        dead_ids = set(state_machine.get_ids_on_workers(dead_workers).tolist())
+
+        state_to_ids = defaultdict(list)
+        for op_key, state in new_states.items():
+            if op_key not in state_machine:
+                continue
+            op_id = int(state_machine.get_ids([op_key])[0])
+            from_state = state_machine.get_states([op_id])[0]
+            if from_state in (OperandState.RUNNING, OperandState.FINISHED):
+                if state != OperandState.UNSCHEDULED and op_id not in dead_ids:
+                    # worker of the operand still alive
+                    continue
+                elif state == OperandState.RUNNING:
+                    # move running operand in dead worker to ready
+                    state = OperandState.READY
+
+            new_target = new_targets.get(op_key)
+            target_updated = bool(new_target) and \
+                state_machine.get_target_workers([op_id])[0] != new_target
+            if target_updated:
+                logger.debug('Target worker of %s reassigned to %s', op_key, new_target)
+                state_machine.set_target_workers([op_id], new_target)
+                self._infos[op_id]['target_worker'] = new_target
+            if from_state == state == OperandState.READY and not target_updated:
+                target = state_machine.get_target_workers([op_id])[0]
+                if target is not None and target not in dead_workers:
+                    continue
+            state_to_ids[state].append(op_id)
+
+        for state, ids in state_to_ids.items():
+            ids = np.array(ids, dtype=np.int64)
+            executed = state_machine.reset(ids, state)
+            self._set_states(ids, state, notify_only=True)
+            for op_key in state_machine.get_keys(executed[state_machine.is_terminal(executed)]):
+                # remove executed traces in GraphActor
+                self._graph_ref.remove_finished_terminal(op_key, _tell=True, _wait=False)
+            if state == OperandState.READY:
+                self._apply_for_resources(ids)
+
+        self.resume_free()
@@ -15,11 +15,17 @@
 import unittest
 
 import mars.tensor as mt
+from mars.scheduler import OperandState
 from mars.scheduler.analyzer import GraphAnalyzer
+from mars.scheduler.csrgraph import CSRChunkGraph
 from mars.graph import DAG
 
 
 class Test(unittest.TestCase):
+    @staticmethod
+    def _create_analyzer(graph, *args, **kwargs):
+        return GraphAnalyzer(graph, *args, **kwargs)
+
     def testDepths(self):
         from mars.tensor.arithmetic import TensorAdd
         from mars.tensor.base import TensorSplit
@@ -30,7 +36,7 @@ class Test(unittest.TestCase):
         arr_sum = arr_split[0] + arr_split[1]
 
         graph = arr_sum.build_graph(compose=False, tiled=True)
-        analyzer = GraphAnalyzer(graph, {})
+        analyzer = self._create_analyzer(graph, {})
 
         depths = analyzer.calc_depths()
         for n in graph:
@@ -47,7 +53,7 @@ class Test(unittest.TestCase):
         arr_dot = arr.dot(arr2)
 
         graph = arr_dot.build_graph(compose=False, tiled=True)
-        analyzer = GraphAnalyzer(graph, {})
+        analyzer = self._create_analyzer(graph, {})
 
         depths = analyzer.calc_depths()
         descendants = analyzer.calc_descendant_sizes()
@@ -76,7 +82,7 @@ class Test(unittest.TestCase):
         graph.add_edge(n1, n3)
         graph.add_edge(n3, n4)
 
-        analyzer = GraphAnalyzer(graph, {})
+        analyzer = self._create_analyzer(graph, {})
         ext_chunks = analyzer.collect_external_input_chunks(initial=False)
         self.assertListEqual(ext_chunks[n3.op.key], [n2.key])
         self.assertEqual(len(analyzer.collect_external_input_chunks(initial=True)), 0)
@@ -109,7 +115,7 @@ class Test(unittest.TestCase):
                 graph.add_node(n)
                 graph.add_edge(n, r)
 
-        analyzer = GraphAnalyzer(graph, dict(w1=24, w2=24, w3=24))
+        analyzer = self._create_analyzer(graph, dict(w1=24, w2=24, w3=24))
         assignments = analyzer.calc_operand_assignments(analyzer.get_initial_operand_keys())
         for inp in inputs:
             self.assertEqual(1, len(set(assignments[n.op.key] for n in inp)))
@@ -142,7 +148,7 @@ class Test(unittest.TestCase):
                 graph.add_node(n)
                 graph.add_edge(n, r)
 
-        analyzer = GraphAnalyzer(graph, dict(w1=24, w2=24, w3=24))
+        analyzer = self._create_analyzer(graph, dict(w1=24, w2=24, w3=24))
         assignments = analyzer.calc_operand_assignments(analyzer.get_initial_operand_keys())
         self.assertEqual(len(assignments), 6)
 
@@ -185,7 +191,7 @@ class Test(unittest.TestCase):
             '3': dict(c30=WorkerMeta(chunk_size=10, workers=('w3',))),
             '4': dict(c40=WorkerMeta(chunk_size=7, workers=('w3',))),
         }
-        analyzer = GraphAnalyzer(graph, dict(w1=24, w2=24, w3=24))
+        analyzer = self._create_analyzer(graph, dict(w1=24, w2=24, w3=24))
         assignments = analyzer.calc_operand_assignments(
             analyzer.get_initial_operand_keys(),
             input_chunk_metas=data_dist
@@ -216,7 +222,7 @@ class Test(unittest.TestCase):
             '4': dict(c40=WorkerMeta(chunk_size=7, workers=('w2',))),
             '5': dict(c50=WorkerMeta(chunk_size=7, workers=('w2',))),
         }
-        analyzer = GraphAnalyzer(graph, dict(w1=24, w2=24, w3=24))
+        analyzer = self._create_analyzer(graph, dict(w1=24, w2=24, w3=24))
         assignments = analyzer.calc_operand_assignments(
             analyzer.get_initial_operand_keys(),
             input_chunk_metas=data_dist
@@ -239,7 +245,7 @@ class Test(unittest.TestCase):
         graph = b.build_graph(compose=False, tiled=True)
 
         worker_res = dict(w1=24, w2=24, w3=24)
-        analyzer = GraphAnalyzer(graph, worker_res)
+        analyzer = self._create_analyzer(graph, worker_res)
         assignments = analyzer.calc_operand_assignments(analyzer.get_initial_operand_keys())
         self.assertSetEqual(set(assignments.values()), set(worker_res))
 
@@ -300,7 +306,7 @@ class Test(unittest.TestCase):
                 op_states[n.op.key] = OperandState.READY
 
         worker_metrics = dict(w1=24, w2=24, w3=24)
-        analyzer = GraphAnalyzer(graph, worker_metrics, fixed_assigns, op_states)
+        analyzer = self._create_analyzer(graph, worker_metrics, fixed_assigns, op_states)
         assignments = analyzer.calc_operand_assignments(analyzer.get_initial_operand_keys())
         for inp in inputs:
             if any(n.op.key in fixed_assigns for n in inp):
@@ -369,7 +375,7 @@ class Test(unittest.TestCase):
         lost_chunks = [c.key for inp in (inputs[0], inputs[2]) for c in inp]
 
         worker_metrics = dict(w2=24, w3=24)
-        analyzer = GraphAnalyzer(graph, worker_metrics, fixed_assigns, op_states, lost_chunks)
+        analyzer = self._create_analyzer(graph, worker_metrics, fixed_assigns, op_states, lost_chunks)
         changed_states = analyzer.analyze_state_changes()
 
         self.assertEqual(len(changed_states), 8)
@@ -388,3 +394,81 @@ class Test(unittest.TestCase):
             worker_assigns[w] += 1
         self.assertEqual(2, worker_assigns['w2'])
         self.assertEqual(6, worker_assigns['w3'])
+
+
+class CSRGraphTest(Test):
+    @staticmethod
+    def _create_analyzer(graph, *args, **kwargs):
+        return GraphAnalyzer(graph, *args, csr_graph=CSRChunkGraph.from_graph(graph), **kwargs)
+
+    def testCSRChunkGraph(self):
+        from mars.utils import build_fetch_chunk
+
+        arr = mt.ones((12, 12), chunk_size=4)
+        arr2 = (arr + 1).sum(axis=0)
+        graph = arr2.build_graph(compose=False, tiled=True)
+
+        analyzer = GraphAnalyzer(graph, {})
+        csr_analyzer = self._create_analyzer(graph, {})
+        self.assertDictEqual(analyzer.calc_depths(), csr_analyzer.calc_depths())
+        self.assertDictEqual(dict(analyzer.calc_descendant_sizes()),
+                             dict(csr_analyzer.calc_descendant_sizes()))
+
+        # descendant sizes do not depend on orders of nodes
+        reversed_graph = DAG()
+        for c in reversed(list(graph)):
+            reversed_graph.add_node(c)
+        for c in graph:
+            for succ in graph.iter_successors(c):
+                reversed_graph.add_edge(c, succ)
+        self.assertDictEqual(dict(GraphAnalyzer(reversed_graph, {}).calc_descendant_sizes()),
+                             dict(csr_analyzer.calc_descendant_sizes()))
+
+        # replace initial chunks with fetch chunks
+        fetch_graph = DAG()
+        fetch_chunks = dict()
+        for c in graph:
+            if graph.count_predecessors(c):
+                fetch_graph.add_node(c)
+        for c in list(fetch_graph):
+            for pred in graph.iter_predecessors(c):
+                if pred not in fetch_graph:
+                    if pred not in fetch_chunks:
+                        fetch_chunks[pred] = build_fetch_chunk(pred).data
+                        fetch_graph.add_node(fetch_chunks[pred])
+                    pred = fetch_chunks[pred]
+                fetch_graph.add_edge(pred, c)
+
+        # add chunks incrementally
+        csr_graph = CSRChunkGraph()
+        nodes = list(fetch_graph.topological_iter())
+        csr_graph.add_chunks(fetch_graph, nodes[:len(nodes) // 2])
+        self.assertEqual(len(csr_graph), len([c for c in nodes[:len(nodes) // 2]
+                                              if c not in fetch_chunks.values()]))
+        csr_graph.add_chunks(fetch_graph, nodes)
+        self.assertEqual(len(csr_graph), len(fetch_graph) - len(fetch_chunks))
+
+        csr_analyzer = GraphAnalyzer(fetch_graph, {}, csr_graph=csr_graph)
+        depths = csr_analyzer.calc_depths()
+        for c in fetch_graph:
+            if c in fetch_chunks.values():
+                self.assertNotIn(c.op.key, depths)
+            elif all(pred in fetch_chunks.values() for pred in fetch_graph.iter_predecessors(c)):
+                self.assertEqual(depths[c.op.key], 0)
+            else:
+                self.assertGreater(depths[c.op.key], 0)
+
+        ext_chunks = csr_analyzer.collect_external_input_chunks(initial=True)
+        self.assertSetEqual(set(k for keys in ext_chunks.values() for k in keys),
+                            set(c.key for c in fetch_chunks))
+
+        # chunks with lost fetch inputs cannot be ready
+        lost_key = next(iter(fetch_chunks)).key
+        op_states = dict((c.op.key, OperandState.READY) for c in csr_graph.chunks)
+        csr_analyzer = GraphAnalyzer(fetch_graph, {}, op_states=op_states, lost_chunks=[lost_key],
+                                     csr_graph=csr_graph)
+        changes = csr_analyzer.analyze_state_changes()
+        self.assertGreater(len(changes), 0)
+        for c in csr_graph.chunks:
+            if any(inp.key == lost_key for inp in c.inputs):
+                self.assertEqual(changes[c.op.key], OperandState.UNSCHEDULED)
@@ -21,7 +21,9 @@ from mars.scheduler import ResourceActor, AssignerActor, ChunkMetaClient, \
     ChunkMetaActor, OperandActor
 from mars.scheduler.utils import SchedulerClusterInfoActor
 from mars.actors import FunctionActor, create_actor_pool
+from mars.config import option_context
 from mars.utils import get_next_port
+from mars.worker import ExecutionActor
 
 
 class MockOperandActor(FunctionActor):
@@ -32,6 +34,34 @@ class MockOperandActor(FunctionActor):
         return getattr(self, '_worker_ep', None)
 
 
+class MockBatchOperandActor(FunctionActor):
+    def __init__(self, cancelled=False):
+        self._cancelled = cancelled
+
+    def prepare_submission(self, worker_ep, data_metas):
+        if self._cancelled:
+            self._submitted = (worker_ep, None)
+            return None
+        return 'graph', dict(chunks=[]), data_metas, 'cpu', None
+
+    def submit_to_worker(self, worker_ep, _data_sizes, submitted=False):
+        self._submitted = (worker_ep, submitted)
+
+    def get_submitted(self):
+        return getattr(self, '_submitted', None)
+
+
+class MockExecutionActor(FunctionActor):
+    def __init__(self):
+        self._batches = []
+
+    def execute_graphs(self, session_id, batch_key, submissions):
+        self._batches.append([s[0] for s in submissions])
+
+    def get_batches(self):
+        return self._batches
+
+
 class Test(unittest.TestCase):
 
     def testAssignerActor(self):
@@ -85,3 +115,102 @@ class Test(unittest.TestCase):
             while not reply_ref.get_worker_ep():
                 gevent.sleep(0.1)
             self.assertEqual(reply_ref.get_worker_ep(), endpoint1)
+
+    def testBatchAssign(self):
+        mock_scheduler_addr = '127.0.0.1:%d' % get_next_port()
+        with create_actor_pool(n_process=1, backend='gevent', address=mock_scheduler_addr) as pool, \
+                option_context({'scheduler.submit_batch_size': 2}):
+            cluster_info_ref = pool.create_actor(SchedulerClusterInfoActor, [pool.cluster_info.address],
+                                                 uid=SchedulerClusterInfoActor.default_uid())
+            resource_ref = pool.create_actor(ResourceActor, uid=ResourceActor.default_uid())
+            pool.create_actor(ChunkMetaActor, uid=ChunkMetaActor.default_uid())
+            execution_ref = pool.create_actor(MockExecutionActor, uid=ExecutionActor.default_uid())
+
+            # the worker only holds two cpu slots
+            res = dict(hardware=dict(cpu=2, memory=4096))
+            g = gevent.spawn(lambda: resource_ref.set_worker_meta(mock_scheduler_addr, res))
+            g.join()
+
+            assigner_ref = pool.create_actor(AssignerActor, uid=AssignerActor.default_uid())
+
+            session_id = str(uuid.uuid4())
+            chunk_meta_client = ChunkMetaClient(pool, cluster_info_ref)
+            applications = []
+            reply_refs = []
+            for idx in range(3):
+                op_key = str(uuid.uuid4())
+                chunk_key = str(uuid.uuid4())
+                chunk_meta_client.set_chunk_meta(session_id, chunk_key, size=512,
+                                                 workers=(mock_scheduler_addr,))
+                applications.append((op_key, {
+                    'op_name': 'test_op',
+                    'io_meta': dict(input_chunks=[chunk_key]),
+                    'retries': 0,
+                    'optimize': {
+                        'depth': 0,
+                        'demand_depths': (),
+                        'successor_size': 1,
+                        'descendant_size': 3 - idx,
+                    }
+                }))
+                reply_refs.append(pool.create_actor(
+                    MockBatchOperandActor, uid=OperandActor.gen_uid(session_id, op_key)))
+            assigner_ref.apply_for_multiple_resources(session_id, applications)
+
+            while not all(ref.get_submitted() for ref in reply_refs):
+                gevent.sleep(0.1)
+
+            # two operands submitted in one batch, the last one in another
+            batches = execution_ref.get_batches()
+            self.assertEqual(sorted(len(b) for b in batches), [1, 2])
+            self.assertTrue(all(ref.get_submitted()[1] for ref in reply_refs))
+
+    def testBatchAssignCancelled(self):
+        mock_scheduler_addr = '127.0.0.1:%d' % get_next_port()
+        with create_actor_pool(n_process=1, backend='gevent', address=mock_scheduler_addr) as pool, \
+                option_context({'scheduler.submit_batch_size': 2}):
+            cluster_info_ref = pool.create_actor(SchedulerClusterInfoActor, [pool.cluster_info.address],
+                                                 uid=SchedulerClusterInfoActor.default_uid())
+            resource_ref = pool.create_actor(ResourceActor, uid=ResourceActor.default_uid())
+            pool.create_actor(ChunkMetaActor, uid=ChunkMetaActor.default_uid())
+            execution_ref = pool.create_actor(MockExecutionActor, uid=ExecutionActor.default_uid())
+
+            res = dict(hardware=dict(cpu=1, memory=4096))
+            g = gevent.spawn(lambda: resource_ref.set_worker_meta(mock_scheduler_addr, res))
+            g.join()
+
+            assigner_ref = pool.create_actor(AssignerActor, uid=AssignerActor.default_uid())
+
+            session_id = str(uuid.uuid4())
+            chunk_meta_client = ChunkMetaClient(pool, cluster_info_ref)
+            applications = []
+            reply_refs = []
+            for idx in range(2):
+                op_key = str(uuid.uuid4())
+                chunk_key = str(uuid.uuid4())
+                chunk_meta_client.set_chunk_meta(session_id, chunk_key, size=512,
+                                                 workers=(mock_scheduler_addr,))
+                applications.append((op_key, {
+                    'op_name': 'test_op',
+                    'io_meta': dict(input_chunks=[chunk_key]),
+                    'retries': 0,
+                    'optimize': {
+                        'depth': 0,
+                        'demand_depths': (),
+                        'successor_size': 1,
+                        'descendant_size': 2 - idx,
+                    }
+                }))
+                reply_refs.append(pool.create_actor(
+                    MockBatchOperandActor, True, uid=OperandActor.gen_uid(session_id, op_key)))
+            assigner_ref.apply_for_multiple_resources(session_id, applications)
+
+            while not all(ref.get_submitted() for ref in reply_refs):
+                gevent.sleep(0.1)
+            gevent.sleep(0.5)
+
+            # all operands in the batch cancelled, nothing submitted
+            # and the cpu slot of the batch released
+            self.assertEqual(execution_ref.get_batches(), [])
+            self.assertTrue(resource_ref.allocate_resource(
+                session_id, str(uuid.uuid4()), mock_scheduler_addr, dict(cpu=1, memory=4096)))
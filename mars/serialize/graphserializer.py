@@ -0,0 +1,263 @@
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compact binary format for chunk and tileable graphs.
+
+Graphs are serialized by the json provider first. Every node is then split
+into a template, which holds all fields except keys, ids and indexes, and a
+small delta holding the rest. Structurally identical nodes share one template
+in the serialized message. Strings are interned, and binary values like
+arrays or dtypes of pandas objects are stored as raw bytes instead of base64.
+The result is dumped with pickle and optionally compressed with zlib.
+"""
+
+import base64
+import functools
+import pickle  # nosec
+import zlib
+
+COMPACT_GRAPH_MAGIC = b'\x00mcg'
+_FORMAT_VERSION = 1
+_FLAG_COMPRESSED = 0x01
+
+# tags of containers in frozen templates, always stored
+# as the first element of a tuple
+_DICT, _LIST, _TUPLE, _HOLE, _KEY_HOLE, _BINARY = range(6)
+
+# fields of nodes stored in deltas
+_DELTA_FIELDS = frozenset(['key', 'id', 'index'])
+# types whose values are base64-encoded by the json provider
+_BINARY_TYPES = frozenset(['bytes', 'arr', 'index', 'series', 'dataframe', 'function',
+                           'tzinfo', 'datetime64', 'timedelta64'])
+
+_PICKLE_PROTOCOL = 4
+_TEMPLATE_CACHE_SIZE = 4096
+
+
+class _NodeFreezer(object):
+    """
+    Convert json objects of graph nodes into hashable templates
+    and lists of delta values.
+    """
+    def __init__(self):
+        self._strings = dict()
+        self.holes = []
+
+    def _intern(self, s):
+        try:
+            return self._strings[s]
+        except KeyError:
+            self._strings[s] = s
+            return s
+
+    def _freeze_hole(self, obj):
+        if isinstance(obj, str):
+            obj = self._intern(obj)
+        self.holes.append(obj)
+        return _HOLE,
+
+    def freeze(self, obj):
+        tp = type(obj)
+        if tp is str:
+            return self._intern(obj)
+        elif tp is dict:
+            obj_type = obj.get('type')
+            if len(obj) == 2 and type(obj_type) is str and 'value' in obj:
+                value = obj['value']
+                if obj_type == 'key':
+                    self.holes.append((self._intern(value[0]), self._intern(value[1])))
+                    return _KEY_HOLE,
+                elif obj_type in _BINARY_TYPES and type(value) is str:
+                    return _BINARY, self._intern(obj_type), base64.b64decode(value)
+            items = [_DICT]
+            for k, v in obj.items():
+                items.append(self._intern(k))
+                items.append(self.freeze(v))
+            return tuple(items)
+        elif tp is list:
+            return (_LIST,) + tuple(self.freeze(v) for v in obj)
+        elif tp is tuple:
+            return (_TUPLE,) + tuple(self.freeze(v) for v in obj)
+        else:
+            return obj
+
+    def freeze_node(self, node):
+        self.holes = []
+        fields = [_DICT]
+        for k, v in node['value'].items():
+            fields.append(self._intern(k))
+            fields.append(self._freeze_hole(v) if k in _DELTA_FIELDS else self.freeze(v))
+        return (_DICT, 'type_id', node['type_id'], 'value', tuple(fields)), self.holes
+
+
+def _thaw_constant(frozen):
+    if type(frozen) is not tuple:
+        return frozen
+    tag = frozen[0]
+    if tag == _DICT:
+        return dict((frozen[i], _thaw_constant(frozen[i + 1]))
+                    for i in range(1, len(frozen), 2))
+    elif tag == _LIST:
+        return [_thaw_constant(v) for v in frozen[1:]]
+    elif tag == _TUPLE:
+        return tuple(_thaw_constant(v) for v in frozen[1:])
+    else:
+        assert tag == _BINARY
+        return {'type': frozen[1], 'value': base64.b64encode(frozen[2]).decode()}
+
+
+def _compile(frozen):
+    """
+    Compile frozen template into a builder accepting an iterator of delta
+    values, returns the builder and whether the template contains holes.
+    Sub-templates without holes are built only once and shared by all nodes,
+    as the json provider never modifies objects it deserializes.
+    """
+    if type(frozen) is not tuple:
+        return None, False
+
+    tag = frozen[0]
+    if tag == _HOLE:
+        return next, True
+    elif tag == _KEY_HOLE:
+        def build_key(it):
+            return {'type': 'key', 'value': next(it)}
+
+        return build_key, True
+    elif tag == _BINARY:
+        return None, False
+
+    if tag == _DICT:
+        keys = frozen[1::2]
+        children = [_compile(v) for v in frozen[2::2]]
+    else:
+        keys = None
+        children = [_compile(v) for v in frozen[1:]]
+    if not any(has_hole for _, has_hole in children):
+        return None, False
+
+    constants = frozen[2::2] if tag == _DICT else frozen[1:]
+    builders = []
+    for (builder, has_hole), const in zip(children, constants):
+        if not has_hole:
+            builder = _build_constant(_thaw_constant(const))
+        builders.append(builder)
+
+    if tag == _DICT:
+        pairs = list(zip(keys, builders))
+
+        def build_dict(it):
+            return {k: b(it) for k, b in pairs}
+
+        return build_dict, True
+    elif tag == _LIST:
+        def build_list(it):
+            return [b(it) for b in builders]
+
+        return build_list, True
+    else:
+        def build_tuple(it):
+            return tuple([b(it) for b in builders])
+
+        return build_tuple, True
+
+
+def _build_constant(const_val):
+    """
+    Create a builder returning the constant without consuming delta values.
+    """
+    def build(_):
+        return const_val
+
+    return build
+
+
+@functools.lru_cache(_TEMPLATE_CACHE_SIZE)
+def _get_template_builder(template):
+    builder, has_hole = _compile(template)
+    if not has_hole:
+        builder = _build_constant(_thaw_constant(template))
+    return builder
+
+
+def dumps(json_graph, compress=False):
+    """
+    Serialize graph in json format into compact bytes.
+
+    :param json_graph: graph serialized by json provider
+    :param compress: if True, compress serialized bytes with zlib
+    :return: serialized bytes
+    """
+    freezer = _NodeFreezer()
+    template_ids = dict()
+    node_template_ids = []
+    node_holes = []
+    for node in json_graph['node']:
+        template, holes = freezer.freeze_node(node)
+        try:
+            template_id = template_ids[template]
+        except KeyError:
+            template_id = template_ids[template] = len(template_ids)
+        node_template_ids.append(template_id)
+        node_holes.append(holes)
+
+    graph_fields = dict((k, v) for k, v in json_graph.items() if k != 'node')
+    payload = pickle.dumps((_FORMAT_VERSION, graph_fields, list(template_ids),
+                            node_template_ids, node_holes), protocol=_PICKLE_PROTOCOL)
+    flags = 0
+    if compress:
+        flags |= _FLAG_COMPRESSED
+        payload = zlib.compress(payload)
+    return COMPACT_GRAPH_MAGIC + bytes([flags]) + payload
+
+
+def loads(data):
+    """
+    Deserialize compact bytes into graph in json format.
+
+    :param data: serialized bytes
+    :return: graph in json format
+    """
+    if not is_compact_graph(data):
+        raise ValueError('Data is not a serialized compact graph')
+    header_size = len(COMPACT_GRAPH_MAGIC)
+    flags = data[header_size]
+    payload = data[header_size + 1:]
+    if flags & _FLAG_COMPRESSED:
+        payload = zlib.decompress(payload)
+
+    version, graph_fields, templates, node_template_ids, node_holes = \
+        pickle.loads(payload)  # nosec
+    if version != _FORMAT_VERSION:  # pragma: no cover
+        raise ValueError('Unsupported version of compact graph: %d' % version)
+
+    builders = [_get_template_builder(t) for t in templates]
+    json_graph = graph_fields
+    json_graph['node'] = [builders[tid](iter(holes))
+                          for tid, holes in zip(node_template_ids, node_holes)]
+    return json_graph
+
+
+def is_compact_graph(data):
+    return isinstance(data, (bytes, bytearray, memoryview)) \
+        and bytes(data[:len(COMPACT_GRAPH_MAGIC)]) == COMPACT_GRAPH_MAGIC
+
+
+def serialize_graph(graph, compress=False):
+    return dumps(graph.to_json(), compress=compress)
+
+
+def deserialize_graph(data, graph_cls):
+    return graph_cls.from_json(loads(data))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: mars/serialize/protos/dataframe.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from mars.serialize.protos import value_pb2 as mars_dot_serialize_dot_protos_dot_value__pb2
+from mars.serialize.protos import indexvalue_pb2 as mars_dot_serialize_dot_protos_dot_indexvalue__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n%mars/serialize/protos/dataframe.proto\x1a!mars/serialize/protos/value.proto\x1a&mars/serialize/protos/indexvalue.proto\"\xdb\x01\n\rIndexChunkDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\x05index\x18\x02 \x03(\rB\x02\x10\x01\x12\r\n\x05shape\x18\x03 \x03(\x03\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x0e\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08\x12\x15\n\x05\x64type\x18\x06 \x01(\x0b\x32\x06.Value\x12 \n\x0bindex_value\x18\x0b \x01(\x0b\x32\x0b.IndexValue\x12\x1c\n\x0c\x65xtra_params\x18\x08 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\t \x01(\t\x12\x14\n\x04name\x18\n \x01(\x0b\x32\x06.Value\"\xec\x01\n\x08IndexDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05shape\x18\x02 \x03(\x03\x12\x15\n\x05\x64type\x18\x03 \x01(\x0b\x32\x06.Value\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x17\n\x07nsplits\x18\x05 \x01(\x0b\x32\x06.Value\x12\x1e\n\x06\x63hunks\x18\x06 \x03(\x0b\x32\x0e.IndexChunkDef\x12\x1c\n\x0c\x65xtra_params\x18\x07 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\x08 \x01(\t\x12 \n\x0bindex_value\x18\t \x01(\x0b\x32\x0b.IndexValue\x12\x14\n\x04name\x18\n \x01(\x0b\x32\x06.Value\"\xdc\x01\n\x0eSeriesChunkDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\x05index\x18\x02 \x03(\rB\x02\x10\x01\x12\r\n\x05shape\x18\x03 \x03(\x03\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x0e\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08\x12\x15\n\x05\x64type\x18\x06 \x01(\x0b\x32\x06.Value\x12 \n\x0bindex_value\x18\x0b \x01(\x0b\x32\x0b.IndexValue\x12\x1c\n\x0c\x65xtra_params\x18\x08 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\t \x01(\t\x12\x14\n\x04name\x18\n \x01(\x0b\x32\x06.Value\"\xee\x01\n\tSeriesDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05shape\x18\x02 \x03(\x03\x12\x15\n\x05\x64type\x18\x03 \x01(\x0b\x32\x06.Value\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x17\n\x07nsplits\x18\x05 \x01(\x0b\x32\x06.Value\x12\x1f\n\x06\x63hunks\x18\x06 \x03(\x0b\x32\x0f.SeriesChunkDef\x12\x1c\n\x0c\x65xtra_params\x18\x07 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\x08 \x01(\t\x12\x14\n\x04name\x18\t \x01(\x0b\x32\x06.Value\x12 \n\x0bindex_value\x18\n \x01(\x0b\x32\x0b.IndexValue\"\xee\x01\n\x11\x44\x61taFrameChunkDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\x05index\x18\x02 \x03(\rB\x02\x10\x01\x12\r\n\x05shape\x18\x03 \x03(\x03\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x0e\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08\x12\x16\n\x06\x64types\x18\n \x01(\x0b\x32\x06.Value\x12 \n\x0bindex_value\x18\x0b \x01(\x0b\x32\x0b.IndexValue\x12\"\n\rcolumns_value\x18\x0c \x01(\x0b\x32\x0b.IndexValue\x12\x1c\n\x0c\x65xtra_params\x18\x08 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\t \x01(\t\"\x83\x02\n\x0c\x44\x61taFrameDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05shape\x18\x02 \x03(\x03\x12\x16\n\x06\x64types\x18\x03 \x01(\x0b\x32\x06.Value\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x17\n\x07nsplits\x18\x05 \x01(\x0b\x32\x06.Value\x12\"\n\x06\x63hunks\x18\x06 \x03(\x0b\x32\x12.DataFrameChunkDef\x12\x1c\n\x0c\x65xtra_params\x18\x07 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\x08 \x01(\t\x12 \n\x0bindex_value\x18\t \x01(\x0b\x32\x0b.IndexValue\x12\"\n\rcolumns_value\x18\n \x01(\x0b\x32\x0b.IndexValue\"\xac\x02\n\x18\x44\x61taFrameGroupByChunkDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\x05index\x18\x02 \x03(\rB\x02\x10\x01\x12\r\n\x05shape\x18\x03 \x03(\x03\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x0e\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08\x12\x16\n\x06\x64types\x18\n \x01(\x0b\x32\x06.Value\x12 \n\x0bindex_value\x18\x0b \x01(\x0b\x32\x0b.IndexValue\x12\"\n\rcolumns_value\x18\x0c \x01(\x0b\x32\x0b.IndexValue\x12\x1c\n\x0c\x65xtra_params\x18\x08 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\t \x01(\t\x12\x1a\n\nkey_dtypes\x18\r \x01(\x0b\x32\x06.Value\x12\x19\n\tselection\x18\x0e \x01(\x0b\x32\x06.Value\"\xc8\x02\n\x13\x44\x61taFrameGroupByDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05shape\x18\x02 \x03(\x03\x12\x16\n\x06\x64types\x18\x03 \x01(\x0b\x32\x06.Value\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x17\n\x07nsplits\x18\x05 \x01(\x0b\x32\x06.Value\x12)\n\x06\x63hunks\x18\x06 \x03(\x0b\x32\x19.DataFrameGroupByChunkDef\x12\x1c\n\x0c\x65xtra_params\x18\x07 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\x08 \x01(\t\x12 \n\x0bindex_value\x18\t \x01(\x0b\x32\x0b.IndexValue\x12\"\n\rcolumns_value\x18\n \x01(\x0b\x32\x0b.IndexValue\x12\x1a\n\nkey_dtypes\x18\x0b \x01(\x0b\x32\x06.Value\x12\x19\n\tselection\x18\x0c \x01(\x0b\x32\x06.Value\"\xff\x01\n\x15SeriesGroupByChunkDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\x05index\x18\x02 \x03(\rB\x02\x10\x01\x12\r\n\x05shape\x18\x03 \x03(\x03\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x0e\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08\x12\x15\n\x05\x64type\x18\x06 \x01(\x0b\x32\x06.Value\x12 \n\x0bindex_value\x18\x0b \x01(\x0b\x32\x0b.IndexValue\x12\x1c\n\x0c\x65xtra_params\x18\x08 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\t \x01(\t\x12\x14\n\x04name\x18\n \x01(\x0b\x32\x06.Value\x12\x1a\n\nkey_dtypes\x18\x0c \x01(\x0b\x32\x06.Value\"\x98\x02\n\x10SeriesGroupByDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05shape\x18\x02 \x03(\x03\x12\x15\n\x05\x64type\x18\x03 \x01(\x0b\x32\x06.Value\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x17\n\x07nsplits\x18\x05 \x01(\x0b\x32\x06.Value\x12&\n\x06\x63hunks\x18\x06 \x03(\x0b\x32\x16.SeriesGroupByChunkDef\x12\x1c\n\x0c\x65xtra_params\x18\x07 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\x08 \x01(\t\x12\x14\n\x04name\x18\t \x01(\x0b\x32\x06.Value\x12 \n\x0bindex_value\x18\n \x01(\x0b\x32\x0b.IndexValue\x12\x1a\n\nkey_dtypes\x18\x0b \x01(\x0b\x32\x06.Value\"\xd0\x01\n\x13\x43\x61tegoricalChunkDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\x05index\x18\x02 \x03(\rB\x02\x10\x01\x12\r\n\x05shape\x18\x03 \x03(\x03\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x0e\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08\x12\x15\n\x05\x64type\x18\x06 \x01(\x0b\x32\x06.Value\x12\x1c\n\x0c\x65xtra_params\x18\x08 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\t \x01(\t\x12%\n\x10\x63\x61tegories_value\x18\x0b \x01(\x0b\x32\x0b.IndexValue\"\xe7\x01\n\x0e\x43\x61tegoricalDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05shape\x18\x02 \x03(\x03\x12\x15\n\x05\x64type\x18\x03 \x01(\x0b\x32\x06.Value\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x17\n\x07nsplits\x18\x05 \x01(\x0b\x32\x06.Value\x12$\n\x06\x63hunks\x18\x06 \x03(\x0b\x32\x14.CategoricalChunkDef\x12\x1c\n\x0c\x65xtra_params\x18\x07 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\x08 \x01(\t\x12%\n\x10\x63\x61tegories_value\x18\n \x01(\x0b\x32\x0b.IndexValueb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mars.serialize.protos.dataframe_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _INDEXCHUNKDEF.fields_by_name['index']._options = None
+  _INDEXCHUNKDEF.fields_by_name['index']._serialized_options = b'\020\001'
+  _SERIESCHUNKDEF.fields_by_name['index']._options = None
+  _SERIESCHUNKDEF.fields_by_name['index']._serialized_options = b'\020\001'
+  _DATAFRAMECHUNKDEF.fields_by_name['index']._options = None
+  _DATAFRAMECHUNKDEF.fields_by_name['index']._serialized_options = b'\020\001'
+  _DATAFRAMEGROUPBYCHUNKDEF.fields_by_name['index']._options = None
+  _DATAFRAMEGROUPBYCHUNKDEF.fields_by_name['index']._serialized_options = b'\020\001'
+  _SERIESGROUPBYCHUNKDEF.fields_by_name['index']._options = None
+  _SERIESGROUPBYCHUNKDEF.fields_by_name['index']._serialized_options = b'\020\001'
+  _CATEGORICALCHUNKDEF.fields_by_name['index']._options = None
+  _CATEGORICALCHUNKDEF.fields_by_name['index']._serialized_options = b'\020\001'
+  _INDEXCHUNKDEF._serialized_start=117
+  _INDEXCHUNKDEF._serialized_end=336
+  _INDEXDEF._serialized_start=339
+  _INDEXDEF._serialized_end=575
+  _SERIESCHUNKDEF._serialized_start=578
+  _SERIESCHUNKDEF._serialized_end=798
+  _SERIESDEF._serialized_start=801
+  _SERIESDEF._serialized_end=1039
+  _DATAFRAMECHUNKDEF._serialized_start=1042
+  _DATAFRAMECHUNKDEF._serialized_end=1280
+  _DATAFRAMEDEF._serialized_start=1283
+  _DATAFRAMEDEF._serialized_end=1542
+  _DATAFRAMEGROUPBYCHUNKDEF._serialized_start=1545
+  _DATAFRAMEGROUPBYCHUNKDEF._serialized_end=1845
+  _DATAFRAMEGROUPBYDEF._serialized_start=1848
+  _DATAFRAMEGROUPBYDEF._serialized_end=2176
+  _SERIESGROUPBYCHUNKDEF._serialized_start=2179
+  _SERIESGROUPBYCHUNKDEF._serialized_end=2434
+  _SERIESGROUPBYDEF._serialized_start=2437
+  _SERIESGROUPBYDEF._serialized_end=2717
+  _CATEGORICALCHUNKDEF._serialized_start=2720
+  _CATEGORICALCHUNKDEF._serialized_end=2928
+  _CATEGORICALDEF._serialized_start=2931
+  _CATEGORICALDEF._serialized_end=3162
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: mars/serialize/protos/fusechunk.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from mars.serialize.protos import anyref_pb2 as mars_dot_serialize_dot_protos_dot_anyref__pb2
+from mars.serialize.protos import value_pb2 as mars_dot_serialize_dot_protos_dot_value__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n%mars/serialize/protos/fusechunk.proto\x1a\"mars/serialize/protos/anyref.proto\x1a!mars/serialize/protos/value.proto\"\xac\x01\n\x0c\x46useChunkDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\x05index\x18\x02 \x03(\rB\x02\x10\x01\x12\r\n\x05shape\x18\x03 \x03(\x03\x12\x12\n\x02op\x18\x04 \x01(\x0b\x32\x06.Value\x12\x0e\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08\x12\x1f\n\x08\x63omposed\x18\x07 \x03(\x0b\x32\r.AnyReference\x12\x1c\n\x0c\x65xtra_params\x18\x08 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\t \x01(\tb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mars.serialize.protos.fusechunk_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _FUSECHUNKDEF.fields_by_name['index']._options = None
+  _FUSECHUNKDEF.fields_by_name['index']._serialized_options = b'\020\001'
+  _FUSECHUNKDEF._serialized_start=113
+  _FUSECHUNKDEF._serialized_end=285
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: mars/serialize/protos/object.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from mars.serialize.protos import value_pb2 as mars_dot_serialize_dot_protos_dot_value__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\"mars/serialize/protos/object.proto\x1a!mars/serialize/protos/value.proto\"~\n\x0eObjectChunkDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\x05index\x18\x02 \x03(\rB\x02\x10\x01\x12\x12\n\x02op\x18\x03 \x01(\x0b\x32\x06.Value\x12\x0e\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08\x12\x1c\n\x0c\x65xtra_params\x18\x05 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\x06 \x01(\t\"\x90\x01\n\tObjectDef\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x12\n\x02op\x18\x03 \x01(\x0b\x32\x06.Value\x12\x17\n\x07nsplits\x18\x05 \x01(\x0b\x32\x06.Value\x12\x1f\n\x06\x63hunks\x18\x06 \x03(\x0b\x32\x0f.ObjectChunkDef\x12\x1c\n\x0c\x65xtra_params\x18\x07 \x01(\x0b\x32\x06.Value\x12\n\n\x02id\x18\x08 \x01(\tb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mars.serialize.protos.object_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _OBJECTCHUNKDEF.fields_by_name['index']._options = None
+  _OBJECTCHUNKDEF.fields_by_name['index']._serialized_options = b'\020\001'
+  _OBJECTCHUNKDEF._serialized_start=73
+  _OBJECTCHUNKDEF._serialized_end=199
+  _OBJECTDEF._serialized_start=202
+  _OBJECTDEF._serialized_end=346
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: mars/serialize/protos/operand.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from mars.serialize.protos import value_pb2 as mars_dot_serialize_dot_protos_dot_value__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#mars/serialize/protos/operand.proto\x1a!mars/serialize/protos/value.proto\"\xfc\x33\n\nOperandDef\x12\x0c\n\x04type\x18\x01 \x01(\t\x12#\n\x04\x61ttr\x18\x02 \x03(\x0b\x32\x15.OperandDef.AttrEntry\x12\x1d\n\x08operands\x18\x03 \x03(\x0b\x32\x0b.OperandDef\x12\n\n\x02id\x18\x04 \x01(\t\x1a\x33\n\tAttrEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x15\n\x05value\x18\x02 \x01(\x0b\x32\x06.Value:\x02\x38\x01\"\xda\x32\n\x0bOperandType\x12\x08\n\x04NULL\x10\x00\x12\n\n\x06SCALAR\x10\x01\x12\x16\n\x12TENSOR_DATA_SOURCE\x10\x02\x12\x0f\n\x0bTENSOR_ONES\x10\x03\x12\x14\n\x10TENSOR_ONES_LIKE\x10\x04\x12\x10\n\x0cTENSOR_ZEROS\x10\x05\x12\x15\n\x11TENSOR_ZEROS_LIKE\x10\x06\x12\x10\n\x0cTENSOR_EMPTY\x10\x07\x12\x15\n\x11TENSOR_EMPTY_LIKE\x10\x08\x12\x0f\n\x0bTENSOR_FULL\x10\t\x12\x14\n\x10TENSOR_FULL_LIKE\x10\x19\x12\x11\n\rTENSOR_ARANGE\x10\n\x12\x12\n\x0eTENSOR_INDICES\x10\x0b\x12\x0f\n\x0bTENSOR_DIAG\x10\x0c\x12\x0e\n\nTENSOR_EYE\x10\r\x12\x13\n\x0fTENSOR_LINSPACE\x10\x0e\x12\x0f\n\x0bTENSOR_TRIU\x10\x0f\x12\x0f\n\x0bTENSOR_TRIL\x10\x10\x12\x16\n\x12TENSOR_FROM_TILEDB\x10\x12\x12\x17\n\x13TENSOR_STORE_TILEDB\x10\x13\x12#\n\x1fTENSOR_STORE_TILEDB_CONSOLIDATE\x10\x14\x12\x19\n\x15TENSOR_FROM_DATAFRAME\x10\x16\x12\x14\n\x10TENSOR_FROM_HDF5\x10\x1b\x12\x15\n\x11TENSOR_STORE_HDF5\x10\x1c\x12\x14\n\x10TENSOR_FROM_ZARR\x10\x1d\x12\x15\n\x11TENSOR_STORE_ZARR\x10 \x12\x19\n\x15\x44\x41TAFRAME_DATA_SOURCE\x10\x11\x12\x19\n\x15\x44\x41TAFRAME_FROM_TENSOR\x10\x15\x12\x16\n\x12SERIES_FROM_TENSOR\x10\x1a\x12\x1a\n\x16\x44\x41TAFRAME_FROM_RECORDS\x10\x18\x12\x16\n\x12SERIES_DATA_SOURCE\x10\x17\x12\x15\n\x11INDEX_DATA_SOURCE\x10!\x12\x0e\n\nDATE_RANGE\x10\"\x12\x13\n\x0fTIMEDELTA_RANGE\x10#\x12\n\n\x06TO_GPU\x10\x1e\x12\n\n\x06TO_CPU\x10\x1f\x12\r\n\tRAND_RAND\x10)\x12\x0e\n\nRAND_RANDN\x10*\x12\x10\n\x0cRAND_RANDINT\x10+\x12\x18\n\x14RAND_RANDOM_INTEGERS\x10,\x12\x16\n\x12RAND_RANDOM_SAMPLE\x10-\x12\x0f\n\x0bRAND_RANDOM\x10.\x12\r\n\tRAND_RANF\x10/\x12\x0f\n\x0bRAND_SAMPLE\x10\x30\x12\x0e\n\nRAND_BYTES\x10\x31\x12\r\n\tRAND_BETA\x10\x32\x12\x11\n\rRAND_BINOMIAL\x10\x33\x12\x12\n\x0eRAND_CHISQUARE\x10\x34\x12\x0f\n\x0bRAND_CHOICE\x10\x35\x12\x12\n\x0eRAND_DIRICHLET\x10\x36\x12\x14\n\x10RAND_EXPONENTIAL\x10\x37\x12\n\n\x06RAND_F\x10\x38\x12\x0e\n\nRAND_GAMMA\x10\x39\x12\x12\n\x0eRAND_GEOMETRIC\x10:\x12\x0f\n\x0bRAND_GUMBEL\x10;\x12\x17\n\x13RAND_HYPERGEOMETRIC\x10<\x12\x10\n\x0cRAND_LAPLACE\x10=\x12\x11\n\rRAND_LOGISTIC\x10>\x12\x12\n\x0eRAND_LOGNORMAL\x10?\x12\x12\n\x0eRAND_LOGSERIES\x10@\x12\x14\n\x10RAND_MULTINOMIAL\x10\x41\x12\x1c\n\x18RAND_MULTIVARIATE_NORMAL\x10\x42\x12\x1a\n\x16RAND_NEGATIVE_BINOMIAL\x10\x43\x12\x1c\n\x18RAND_NONCENTRAL_CHISQURE\x10\x44\x12\x15\n\x11RAND_NONCENTRAL_F\x10\x45\x12\x0f\n\x0bRAND_NORMAL\x10\x46\x12\x0f\n\x0bRAND_PARETO\x10G\x12\x14\n\x10RAND_PERMUTATION\x10H\x12\x10\n\x0cRAND_POSSION\x10I\x12\x0e\n\nRAND_POWER\x10J\x12\x11\n\rRAND_RAYLEIGH\x10K\x12\x10\n\x0cRAND_SHUFFLE\x10L\x12\x18\n\x14RAND_STANDARD_CAUCHY\x10M\x12\x1d\n\x19RAND_STANDARD_EXPONENTIAL\x10N\x12\x18\n\x14RAND_STANDARD_GAMMMA\x10O\x12\x18\n\x14RAND_STANDARD_NORMAL\x10P\x12\x13\n\x0fRAND_STANDARD_T\x10Q\x12\x11\n\rRAND_TOMAXINT\x10R\x12\x13\n\x0fRAND_TRIANGULAR\x10S\x12\x10\n\x0cRAND_UNIFORM\x10T\x12\x11\n\rRAND_VONMISES\x10U\x12\r\n\tRAND_WALD\x10V\x12\x10\n\x0cRAND_WEIBULL\x10W\x12\r\n\tRAND_ZIPF\x10X\x12\x0f\n\x0bPERMUTATION\x10Y\x12\n\n\x06UNIQUE\x10Z\x12\x07\n\x03\x41\x44\x44\x10\x65\x12\x07\n\x03SUB\x10\x66\x12\x07\n\x03MUL\x10g\x12\x07\n\x03\x44IV\x10h\x12\x0b\n\x07TRUEDIV\x10i\x12\x0c\n\x08\x46LOORDIV\x10j\x12\x07\n\x03POW\x10k\x12\x07\n\x03MOD\x10l\x12\x08\n\x04\x46MOD\x10m\x12\r\n\tLOGADDEXP\x10n\x12\x0e\n\nLOGADDEXP2\x10o\x12\x0c\n\x08NEGATIVE\x10p\x12\x0c\n\x08POSITIVE\x10q\x12\x0c\n\x08\x41\x42SOLUTE\x10r\x12\x08\n\x04\x46\x41\x42S\x10s\x12\x07\n\x03\x41\x42S\x10t\x12\x08\n\x04RINT\x10u\x12\x08\n\x04SIGN\x10v\x12\x08\n\x04\x43ONJ\x10w\x12\x07\n\x03\x45XP\x10x\x12\x08\n\x04\x45XP2\x10y\x12\x07\n\x03LOG\x10z\x12\x08\n\x04LOG2\x10{\x12\t\n\x05LOG10\x10|\x12\t\n\x05\x45XPM1\x10}\x12\t\n\x05LOG1P\x10~\x12\x08\n\x04SQRT\x10\x7f\x12\x0b\n\x06SQUARE\x10\x80\x01\x12\t\n\x04\x43\x42RT\x10\x81\x01\x12\x0f\n\nRECIPROCAL\x10\x82\x01\x12\x07\n\x02\x45Q\x10\x83\x01\x12\x07\n\x02NE\x10\x84\x01\x12\x07\n\x02LT\x10\x85\x01\x12\x07\n\x02LE\x10\x86\x01\x12\x07\n\x02GT\x10\x87\x01\x12\x07\n\x02GE\x10\x88\x01\x12\x08\n\x03SIN\x10\x89\x01\x12\x08\n\x03\x43OS\x10\x8a\x01\x12\x08\n\x03TAN\x10\x8b\x01\x12\x0b\n\x06\x41RCSIN\x10\x8c\x01\x12\x0b\n\x06\x41RCCOS\x10\x8d\x01\x12\x0b\n\x06\x41RCTAN\x10\x8e\x01\x12\x0c\n\x07\x41RCTAN2\x10\x8f\x01\x12\n\n\x05HYPOT\x10\x90\x01\x12\t\n\x04SINH\x10\x91\x01\x12\t\n\x04\x43OSH\x10\x92\x01\x12\t\n\x04TANH\x10\x93\x01\x12\x0c\n\x07\x41RCSINH\x10\x94\x01\x12\x0c\n\x07\x41RCCOSH\x10\x95\x01\x12\x0c\n\x07\x41RCTANH\x10\x96\x01\x12\x0c\n\x07\x44\x45G2RAD\x10\x97\x01\x12\x0c\n\x07RAD2DEG\x10\x98\x01\x12\x0b\n\x06\x42ITAND\x10\x99\x01\x12\n\n\x05\x42ITOR\x10\x9a\x01\x12\x0b\n\x06\x42ITXOR\x10\x9b\x01\x12\x0b\n\x06INVERT\x10\x9c\x01\x12\x0b\n\x06LSHIFT\x10\x9d\x01\x12\x0b\n\x06RSHIFT\x10\x9e\x01\x12\x08\n\x03\x41ND\x10\x9f\x01\x12\x07\n\x02OR\x10\xa0\x01\x12\x08\n\x03XOR\x10\xa1\x01\x12\x08\n\x03NOT\x10\xa2\x01\x12\x0c\n\x07MAXIMUM\x10\xa3\x01\x12\x0c\n\x07MINIMUM\x10\xa4\x01\x12\x0b\n\x06\x41ROUND\x10\xa5\x01\x12\x10\n\x0b\x46LOAT_POWER\x10\xa6\x01\x12\t\n\x04\x46MAX\x10\xa7\x01\x12\t\n\x04\x46MIN\x10\xa8\x01\x12\r\n\x08ISFINITE\x10\xa9\x01\x12\n\n\x05ISINF\x10\xaa\x01\x12\n\n\x05ISNAN\x10\xab\x01\x12\x0c\n\x07SIGNBIT\x10\xac\x01\x12\r\n\x08\x43OPYSIGN\x10\xad\x01\x12\x0e\n\tNEXTAFTER\x10\xae\x01\x12\x0c\n\x07SPACING\x10\xaf\x01\x12\n\n\x05LDEXP\x10\xb0\x01\x12\n\n\x05\x46REXP\x10\xb1\x01\x12\t\n\x04MODF\x10\xb2\x01\x12\n\n\x05\x46LOOR\x10\xb3\x01\x12\t\n\x04\x43\x45IL\x10\xb4\x01\x12\n\n\x05TRUNC\x10\xb5\x01\x12\x0c\n\x07\x44\x45GREES\x10\xb6\x01\x12\x0c\n\x07RADIANS\x10\xb7\x01\x12\t\n\x04\x43LIP\x10\xb8\x01\x12\x0b\n\x06ISREAL\x10\xb9\x01\x12\x0e\n\tISCOMPLEX\x10\xba\x01\x12\t\n\x04REAL\x10\xbb\x01\x12\t\n\x04IMAG\x10\xbc\x01\x12\x08\n\x03\x46IX\x10\xbd\x01\x12\x07\n\x02I0\x10\xbe\x01\x12\t\n\x04SINC\x10\xbf\x01\x12\x0f\n\nNAN_TO_NUM\x10\xc0\x01\x12\x0c\n\x07ISCLOSE\x10\xc1\x01\x12\x0b\n\x06\x44IVMOD\x10\xc2\x01\x12\n\n\x05\x41NGLE\x10\xc3\x01\x12\r\n\x08SET_REAL\x10\xc4\x01\x12\r\n\x08SET_IMAG\x10\xc5\x01\x12\x0c\n\x07GAMMALN\x10\xc8\x01\x12\x08\n\x03\x45RF\x10\xc9\x01\x12\n\n\x05PDIST\x10\xe7\x01\x12\n\n\x05\x43\x44IST\x10\xe8\x01\x12\x0f\n\nSQUAREFORM\x10\xe9\x01\x12\r\n\x08TREE_ADD\x10\xfb\x01\x12\x12\n\rTREE_MULTIPLY\x10\xfc\x01\x12\x0b\n\x06\x43UMSUM\x10\xad\x02\x12\x0c\n\x07\x43UMPROD\x10\xae\x02\x12\t\n\x04PROD\x10\xaf\x02\x12\x08\n\x03SUM\x10\xb0\x02\x12\x08\n\x03MAX\x10\xb1\x02\x12\x08\n\x03MIN\x10\xb2\x02\x12\x08\n\x03\x41LL\x10\xb3\x02\x12\x08\n\x03\x41NY\x10\xb4\x02\x12\t\n\x04MEAN\x10\xb5\x02\x12\x0b\n\x06\x41RGMAX\x10\xb6\x02\x12\x0b\n\x06\x41RGMIN\x10\xb7\x02\x12\x0b\n\x06NANSUM\x10\xb8\x02\x12\x0b\n\x06NANMAX\x10\xb9\x02\x12\x0b\n\x06NANMIN\x10\xba\x02\x12\x0c\n\x07NANPROD\x10\xbb\x02\x12\x0c\n\x07NANMEAN\x10\xbc\x02\x12\x0e\n\tNANARGMAX\x10\xbd\x02\x12\x0e\n\tNANARGMIN\x10\xbe\x02\x12\x12\n\rCOUNT_NONZERO\x10\xbf\x02\x12\x0b\n\x06MOMENT\x10\xc0\x02\x12\x0e\n\tNANMOMENT\x10\xc1\x02\x12\x08\n\x03VAR\x10\xc2\x02\x12\x08\n\x03STD\x10\xc3\x02\x12\x0b\n\x06NANVAR\x10\xc4\x02\x12\x0b\n\x06NANSTD\x10\xc5\x02\x12\x0e\n\tNANCUMSUM\x10\xc6\x02\x12\x0f\n\nNANCUMPROD\x10\xc7\x02\x12\n\n\x05\x43OUNT\x10\xd7\x02\x12\x0b\n\x06\x43UMMAX\x10\xd8\x02\x12\x0b\n\x06\x43UMMIN\x10\xd9\x02\x12\r\n\x08\x43UMCOUNT\x10\xda\x02\x12\x0c\n\x07RESHAPE\x10\x91\x03\x12\n\n\x05SLICE\x10\x92\x03\x12\n\n\x05INDEX\x10\x93\x03\x12\x12\n\rINDEXSETVALUE\x10\x94\x03\x12\x10\n\x0b\x43ONCATENATE\x10\x95\x03\x12\x0c\n\x07RECHUNK\x10\x96\x03\x12\x0b\n\x06\x41STYPE\x10\x97\x03\x12\x0e\n\tTRANSPOSE\x10\x98\x03\x12\r\n\x08SWAPAXES\x10\x99\x03\x12\x11\n\x0c\x42ROADCAST_TO\x10\x9a\x03\x12\n\n\x05STACK\x10\x9b\x03\x12\n\n\x05WHERE\x10\x9c\x03\x12\x0b\n\x06\x43HOOSE\x10\x9d\x03\x12\x0c\n\x07NONZERO\x10\x9e\x03\x12\r\n\x08\x41RGWHERE\x10\x9f\x03\x12\x12\n\rUNRAVEL_INDEX\x10\xa0\x03\x12\x16\n\x11RAVEL_MULTI_INDEX\x10\xa1\x03\x12\x10\n\x0b\x41RRAY_SPLIT\x10\xa2\x03\x12\x0c\n\x07SQUEEZE\x10\xa3\x03\x12\r\n\x08\x44IGITIZE\x10\xa4\x03\x12\x0b\n\x06REPEAT\x10\xa5\x03\x12\x0b\n\x06\x43OPYTO\x10\xa6\x03\x12\t\n\x04ISIN\x10\xa7\x03\x12\x11\n\x0cSEARCHSORTED\x10\xac\x03\x12\t\n\x04SORT\x10\xad\x03\x12\x0e\n\tHISTOGRAM\x10\xae\x03\x12\x18\n\x13HISTOGRAM_BIN_EDGES\x10\xaf\x03\x12\x0e\n\tPARTITION\x10\xb0\x03\x12\r\n\x08QUANTILE\x10\xb8\x03\x12\x12\n\rFILL_DIAGONAL\x10\xb9\x03\x12\x0e\n\tNORMALIZE\x10\xba\x03\x12\t\n\x04TOPK\x10\xbb\x03\x12\x1b\n\x16\x46\x41NCY_INDEX_DISTRIBUTE\x10\xa8\x03\x12\x17\n\x12\x46\x41NCY_INDEX_CONCAT\x10\xa9\x03\x12\x0e\n\tTENSORDOT\x10\xf5\x03\x12\x08\n\x03\x44OT\x10\xf6\x03\x12\x0b\n\x06MATMUL\x10\xf7\x03\x12\r\n\x08\x43HOLESKY\x10\xfe\x03\x12\x07\n\x02QR\x10\xff\x03\x12\x08\n\x03SVD\x10\x80\x04\x12\x07\n\x02LU\x10\x81\x04\x12\x15\n\x10SOLVE_TRIANGULAR\x10\x88\x04\x12\x08\n\x03INV\x10\x89\x04\x12\t\n\x04NORM\x10\x92\x04\x12\x08\n\x03\x46\x46T\x10\xd9\x04\x12\t\n\x04IFFT\x10\xda\x04\x12\t\n\x04\x46\x46T2\x10\xdb\x04\x12\n\n\x05IFFT2\x10\xdc\x04\x12\t\n\x04\x46\x46TN\x10\xdd\x04\x12\n\n\x05IFFTN\x10\xde\x04\x12\t\n\x04RFFT\x10\xdf\x04\x12\n\n\x05IRFFT\x10\xe0\x04\x12\n\n\x05RFFT2\x10\xe1\x04\x12\x0b\n\x06IRFFT2\x10\xe2\x04\x12\n\n\x05RFFTN\x10\xe3\x04\x12\x0b\n\x06IRFFTN\x10\xe4\x04\x12\t\n\x04HFFT\x10\xe5\x04\x12\n\n\x05IHFFT\x10\xe6\x04\x12\x0c\n\x07\x46\x46TFREQ\x10\xe7\x04\x12\x12\n\rFFTFREQ_CHUNK\x10\xe8\x04\x12\r\n\x08RFFTFREQ\x10\xe9\x04\x12\r\n\x08\x46\x46TSHIFT\x10\xea\x04\x12\x0e\n\tIFFTSHIFT\x10\xeb\x04\x12\x0b\n\x06\x45INSUM\x10\xf6\x04\x12\x1e\n\x19SPARSE_MATRIX_DATA_SOURCE\x10\xbd\x05\x12\x14\n\x0f\x44\x45NSE_TO_SPARSE\x10\xbe\x05\x12\x14\n\x0fSPARSE_TO_DENSE\x10\xbf\x05\x12\x08\n\x03MAP\x10\xc6\x05\x12\r\n\x08\x44\x45SCRIBE\x10\xc8\x05\x12\x0c\n\x07\x46ILL_NA\x10\xc9\x05\x12\x0e\n\tAGGREGATE\x10\xca\x05\x12\x12\n\rSTRING_METHOD\x10\xcb\x05\x12\x14\n\x0f\x44\x41TETIME_METHOD\x10\xcc\x05\x12\n\n\x05\x41PPLY\x10\xcd\x05\x12\x0e\n\tTRANSFORM\x10\xce\x05\x12\r\n\x08\x43HECK_NA\x10\xcf\x05\x12\x0c\n\x07\x44ROP_NA\x10\xd0\x05\x12\x0c\n\x07NUNIQUE\x10\xd1\x05\x12\x08\n\x03\x43UT\x10\xd2\x05\x12\n\n\x05SHIFT\x10\xd3\x05\x12\t\n\x04\x46USE\x10\xa1\x06\x12\n\n\x05\x45NTER\x10\x85\x07\x12\n\n\x05LEAVE\x10\x86\x07\x12\x0f\n\nFIX_LATEST\x10\x87\x07\x12\x0c\n\x07IF_ELSE\x10\x88\x07\x12\x0e\n\tNEXT_ITER\x10\x89\x07\x12\x0e\n\tTABLE_COO\x10\xeb\x07\x12\x0e\n\tSTORE_COO\x10\xec\x07\x12\x12\n\rSHUFFLE_PROXY\x10\xd1\x0f\x12\x1a\n\x15\x44\x41TAFRAME_INDEX_ALIGN\x10\xd4\x0f\x12\x1a\n\x15UNIQUE_INVERSE_REDUCE\x10\xdd\x0f\x12\x18\n\x13\x44\x41TAFRAME_SET_INDEX\x10\xe4\x0f\x12\x1b\n\x16\x44\x41TAFRAME_ILOC_GETITEM\x10\xe5\x0f\x12\x1b\n\x16\x44\x41TAFRAME_ILOC_SETITEM\x10\xe6\x0f\x12\x1a\n\x15\x44\x41TAFRAME_LOC_GETITEM\x10\xe7\x0f\x12\x1a\n\x15\x44\x41TAFRAME_LOC_SETITEM\x10\xe8\x0f\x12\x1c\n\x17\x44\x41TAFRAME_SHUFFLE_MERGE\x10\xda\x0f\x12\"\n\x1d\x44\x41TAFRAME_SHUFFLE_MERGE_ALIGN\x10\xdb\x0f\x12\x0b\n\x06\x41PPEND\x10\xdf\x0f\x12\x10\n\x0bRESET_INDEX\x10\xec\x0f\x12\x0c\n\x07GROUPBY\x10\xee\x0f\x12\x10\n\x0bGROUPBY_AGG\x10\xf1\x0f\x12\x13\n\x0eGROUPBY_CONCAT\x10\xf2\x0f\x12\x10\n\x0bROLLING_AGG\x10\x8c\x10\x12\x1d\n\x18PSRS_SORT_REGULAR_SMAPLE\x10\xf8\x0f\x12\x16\n\x11PSRS_CONCAT_PIVOT\x10\xf9\x0f\x12\x11\n\x0cPSRS_SHUFFLE\x10\xfa\x0f\x12\x0f\n\nPSRS_ALIGN\x10\xfb\x0f\x12\x19\n\x14\x43\x41LC_PARTITIONS_INFO\x10\xfe\x0f\x12\x15\n\x10PARTITION_MERGED\x10\xff\x0f\x12\x10\n\x0bSORT_VALUES\x10\x82\x10\x12\x0f\n\nSORT_INDEX\x10\x83\x10\x12\r\n\x08NLARGEST\x10\x84\x10\x12\r\n\x08READ_CSV\x10\xb4\x10\x12\x0b\n\x06TO_CSV\x10\xb5\x10\x12\x11\n\x0cREAD_PARQUET\x10\xb7\x10\x12\x0f\n\nTO_PARQUET\x10\xb8\x10\x12\x13\n\x0eREAD_SQL_TABLE\x10\xb9\x10\x12\x13\n\x0eREAD_SQL_QUERY\x10\xba\x10\x12\x0b\n\x06TO_SQL\x10\xbc\x10\x12\x10\n\x0bTO_CSV_STAT\x10\xb6\x10\x12\x1c\n\x17STANDARDIZE_RANGE_INDEX\x10\xbb\x10\x12\x19\n\x14SUCCESSORS_EXCLUSIVE\x10\xd2\x0f\x12\x0b\n\x06IMREAD\x10\xbe\x10\x12!\n\x1cPAIRWISE_EUCLIDEAN_DISTANCES\x10\x98\x11\x12!\n\x1cPAIRWISE_MANHATTAN_DISTANCES\x10\x99\x11\x12\x1e\n\x19PAIRWISE_COSINE_DISTANCES\x10\x9a\x11\x12!\n\x1cPAIRWISE_HAVERSINE_DISTANCES\x10\x9b\x11\x12\x12\n\rKD_TREE_TRAIN\x10\xb6\x11\x12\x12\n\rKD_TREE_QUERY\x10\xb7\x11\x12\x14\n\x0f\x42\x41LL_TREE_TRAIN\x10\xb8\x11\x12\x14\n\x0f\x42\x41LL_TREE_QUERY\x10\xb9\x11\x12\x16\n\x11\x46\x41ISS_BUILD_INDEX\x10\xba\x11\x12\x1e\n\x19\x46\x41ISS_TRAIN_SAMPLED_INDEX\x10\xbb\x11\x12\x10\n\x0b\x46\x41ISS_QUERY\x10\xbc\x11\x12\x15\n\x10KNEIGHBORS_GRAPH\x10\xbd\x11\x12\x12\n\rXGBOOST_TRAIN\x10\xb9\x17\x12\x14\n\x0fXGBOOST_PREDICT\x10\xba\x17\x12\x0f\n\nTO_DMATRIX\x10\xbb\x17\x12\x12\n\rSTART_TRACKER\x10\xbc\x17\x12\x13\n\x0eRUN_TENSORFLOW\x10\xc2\x17\x12\x10\n\x0bRUN_PYTORCH\x10\xc3\x17\x12\x17\n\x12\x43HECK_NON_NEGATIVE\x10\xe4\x19\x12\x12\n\rCHECK_TARGETS\x10\xe5\x19\x12\x16\n\x11\x41SSERT_ALL_FINITE\x10\xe6\x19\x12\x12\n\rIS_MULTILABEL\x10\xe7\x19\x12\x13\n\x0eTYPE_OF_TARGET\x10\xe8\x19\x12\x13\n\x0e\x41\x43\x43URACY_SCORE\x10\xe9\x19\x12\x1f\n\x1aTENSOR_FROM_VINEYARD_CHUNK\x10\xa1\x1f\x12\x19\n\x14TENSOR_FROM_VINEYARD\x10\xa2\x1f\x12 \n\x1bTENSOR_STORE_VINEYARD_CHUNK\x10\xa3\x1f\x12$\n\x1fTENSOR_STORE_VINEYARD_CHUNK_MAP\x10\xa4\x1f\x12&\n!TENSOR_STORE_VINEYARD_GLOBAL_META\x10\xa5\x1f\x12\"\n\x1d\x44\x41TAFRAME_FROM_VINEYARD_CHUNK\x10\xa6\x1f\x12\x1c\n\x17\x44\x41TAFRAME_FROM_VINEYARD\x10\xa7\x1f\x12#\n\x1e\x44\x41TAFRAME_STORE_VINEYARD_CHUNK\x10\xa8\x1f\x12\'\n\"DATAFRAME_STORE_VINEYARD_CHUNK_MAP\x10\xa9\x1f\x12)\n$DATAFRAME_STORE_VINEYARD_GLOBAL_META\x10\xaa\x1f\x12\x13\n\rCHOLESKY_FUSE\x10\xb4\x84=\x12\x13\n\rFETCH_SHUFFLE\x10\xbe\x84=\x12\x0b\n\x05\x46\x45TCH\x10\xbf\x84=b\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mars.serialize.protos.operand_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _OPERANDDEF_ATTRENTRY._options = None
+  _OPERANDDEF_ATTRENTRY._serialized_options = b'8\001'
+  _OPERANDDEF._serialized_start=75
+  _OPERANDDEF._serialized_end=6727
+  _OPERANDDEF_ATTRENTRY._serialized_start=183
+  _OPERANDDEF_ATTRENTRY._serialized_end=234
+  _OPERANDDEF_OPERANDTYPE._serialized_start=237
+  _OPERANDDEF_OPERANDTYPE._serialized_end=6727
+# @@protoc_insertion_point(module_scope)
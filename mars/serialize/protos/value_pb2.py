@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: mars/serialize/protos/value.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n!mars/serialize/protos/value.proto\"\xf4\x07\n\x05Value\x12\x11\n\x07is_null\x18\x01 \x01(\x08H\x00\x12\x0b\n\x01\x62\x18\x02 \x01(\x08H\x00\x12\x0b\n\x01i\x18\x03 \x01(\x03H\x00\x12\x0b\n\x01\x66\x18\x04 \x01(\x01H\x00\x12\x1b\n\x01\x63\x18\x13 \x01(\x0b\x32\x0e.Value.ComplexH\x00\x12\x0b\n\x01s\x18\x05 \x01(\x0cH\x00\x12\x0b\n\x01u\x18\x06 \x01(\tH\x00\x12\x1b\n\x04list\x18\x07 \x01(\x0b\x32\x0b.Value.ListH\x00\x12\x1b\n\x04\x64ict\x18\x08 \x01(\x0b\x32\x0b.Value.DictH\x00\x12\x1d\n\x05slice\x18\t \x01(\x0b\x32\x0c.Value.SliceH\x00\x12\r\n\x03\x61rr\x18\n \x01(\x0cH\x00\x12\x0f\n\x05\x64type\x18\x0b \x01(\x0cH\x00\x12\x19\n\x03key\x18\x0c \x01(\x0b\x32\n.Value.KeyH\x00\x12\x14\n\ndatetime64\x18\r \x01(\x0cH\x00\x12\x15\n\x0btimedelta64\x18\x0e \x01(\x0cH\x00\x12\x0f\n\x05index\x18\x0f \x01(\x0cH\x00\x12\x10\n\x06series\x18\x10 \x01(\x0cH\x00\x12\x13\n\tdataframe\x18\x11 \x01(\x0cH\x00\x12\"\n\x05typed\x18\x12 \x01(\x0b\x32\x11.Value.TypedValueH\x00\x12\x12\n\x08\x66unction\x18\x14 \x01(\x0cH\x00\x12\x10\n\x06tzinfo\x18\x15 \x01(\x0cH\x00\x12,\n\x0cinterval_arr\x18\x16 \x01(\x0b\x32\x14.Value.IntervalArrayH\x00\x1a/\n\x04List\x12\x10\n\x08is_tuple\x18\x01 \x01(\x08\x12\x15\n\x05value\x18\x02 \x03(\x0b\x32\x06.Value\x1a\xc4\x01\n\x05Slice\x12\x0f\n\x07is_null\x18\x04 \x01(\x08\x12\x13\n\tstart_val\x18\x01 \x01(\x03H\x00\x12\x15\n\x0bstart_label\x18\x05 \x01(\tH\x00\x12\x13\n\tstart_obj\x18\x06 \x01(\x0cH\x00\x12\x12\n\x08stop_val\x18\x02 \x01(\x03H\x01\x12\x14\n\nstop_label\x18\x07 \x01(\tH\x01\x12\x12\n\x08stop_obj\x18\x08 \x01(\x0cH\x01\x12\x12\n\x08step_val\x18\x03 \x01(\x03H\x02\x42\x07\n\x05startB\x06\n\x04stopB\x06\n\x04step\x1a>\n\x04\x44ict\x12\x19\n\x04keys\x18\x01 \x01(\x0b\x32\x0b.Value.List\x12\x1b\n\x06values\x18\x02 \x01(\x0b\x32\x0b.Value.List\x1a%\n\x07\x43omplex\x12\x0c\n\x04real\x18\x01 \x01(\x01\x12\x0c\n\x04imag\x18\x02 \x01(\x01\x1a\x1e\n\x03Key\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x1a\x34\n\nTypedValue\x12\x0f\n\x07type_id\x18\x01 \x01(\r\x12\x15\n\x05value\x18\x02 \x01(\x0b\x32\x06.Value\x1aK\n\rIntervalArray\x12\x0c\n\x04left\x18\x01 \x01(\x0c\x12\r\n\x05right\x18\x02 \x01(\x0c\x12\x0e\n\x06\x63losed\x18\x03 \x01(\t\x12\r\n\x05\x64type\x18\x04 \x01(\x0c\x42\x07\n\x05valueb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mars.serialize.protos.value_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _VALUE._serialized_start=38
+  _VALUE._serialized_end=1050
+  _VALUE_LIST._serialized_start=529
+  _VALUE_LIST._serialized_end=576
+  _VALUE_SLICE._serialized_start=579
+  _VALUE_SLICE._serialized_end=775
+  _VALUE_DICT._serialized_start=777
+  _VALUE_DICT._serialized_end=839
+  _VALUE_COMPLEX._serialized_start=841
+  _VALUE_COMPLEX._serialized_end=878
+  _VALUE_KEY._serialized_start=880
+  _VALUE_KEY._serialized_end=910
+  _VALUE_TYPEDVALUE._serialized_start=912
+  _VALUE_TYPEDVALUE._serialized_end=964
+  _VALUE_INTERVALARRAY._serialized_start=966
+  _VALUE_INTERVALARRAY._serialized_end=1041
+# @@protoc_insertion_point(module_scope)
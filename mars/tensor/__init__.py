@@ -86,7 +86,7 @@ from numpy import dtype, object, number, inexact, floating, complexfloating, \
 from numpy import finfo
 
 # register fuse op and fetch op
-from .fuse import TensorFuseChunk, TensorCpFuseChunk, TensorNeFuseChunk
+from .fuse import TensorFuseChunk, TensorCpFuseChunk, TensorNeFuseChunk, TensorNumbaFuseChunk
 from .fetch import TensorFetch, TensorFetchShuffle
 from . import ufunc
-del TensorFuseChunk, TensorCpFuseChunk, TensorNeFuseChunk, TensorFetch, TensorFetchShuffle, ufunc
+del TensorFuseChunk, TensorCpFuseChunk, TensorNeFuseChunk, TensorNumbaFuseChunk, TensorFetch, TensorFetchShuffle, ufunc
@@ -218,12 +218,12 @@ class TensorPartition(TensorOperand, ParallelPartitionMixin):
                                                   axis_offsets, out_idx)
 
             # stage 2: gather and merge samples, choose and broadcast p-1 pivots
-            concat_pivot_chunk = cls.concat_and_pivot(
+            concat_pivot_chunks = cls.concat_and_pivot(
                 op, axis_chunk_shape, out_idx, sorted_chunks, sampled_chunks)
 
             # stage 3: Local data is partitioned
             partition_chunks = cls.partition_local_data(
-                op, axis_chunk_shape, sorted_chunks, indices_chunks, concat_pivot_chunk)
+                op, axis_chunk_shape, sorted_chunks, indices_chunks, concat_pivot_chunks)
 
             proxy_chunk = TensorShuffleProxy(dtype=partition_chunks[0].dtype).new_chunk(
                 partition_chunks, shape=())
@@ -18,6 +18,7 @@ from functools import partial
 import numpy as np
 
 from ... import opcodes as OperandDef
+from ...config import options
 from ...tiles import TilesError
 from ...serialize import ValueType, Int32Field, Int64Field, \
     ListField, StringField, BoolField
@@ -65,20 +66,57 @@ class PSRSOperandMixin:
         return in_data, axis_chunk_shape, out_idxes, need_align
 
     @classmethod
-    def local_sort_and_regular_sample(cls, op, in_data, axis_chunk_shape, axis_offsets, out_idx):
+    def _estimate_nbytes(cls, in_data):
+        return in_data.nbytes
+
+    @classmethod
+    def calc_n_partition(cls, op, in_data, axis_chunk_shape, need_align):
+        """
+        Decide count of partitions by size of data, thus each partition
+        can be held by a reducer even if the count of chunks is small.
+        Partitions are aligned back to chunks later when `need_align`,
+        thus the count of chunks is kept.
+        """
+        if need_align:
+            return axis_chunk_shape
+        nbytes = cls._estimate_nbytes(in_data)
+        if np.isnan(nbytes):
+            return axis_chunk_shape
+        n_partition = int(np.ceil(nbytes / options.chunk_store_limit))
+        return int(min(max(axis_chunk_shape, n_partition), in_data.shape[op.axis]))
+
+    @classmethod
+    def calc_n_sample(cls, op, in_data, n_partition):
+        """
+        Decide count of regular samples taken from every chunk. Samples
+        are oversampled for every partition, thus splitters chosen from
+        them are closer to real quantiles when keys are skewed.
+        """
+        axis_shape = in_data.shape[op.axis]
+        oversampling = options.sort.oversampling
+        if oversampling is None:
+            oversampling = max(int(np.ceil(np.log2(max(axis_shape, 2)))), 1)
+        n_sample = oversampling * n_partition
+        return int(max(min(n_sample, min(in_data.nsplits[op.axis])), 1))
+
+    @classmethod
+    def local_sort_and_regular_sample(cls, op, in_data, axis_chunk_shape, axis_offsets, out_idx,
+                                      n_partition=None):
         raise NotImplementedError
 
     @classmethod
-    def concat_and_pivot(cls, op, axis_chunk_shape, out_idx, sorted_chunks, sampled_chunks):
+    def concat_and_pivot(cls, op, axis_chunk_shape, out_idx, sorted_chunks, sampled_chunks,
+                         n_partition=None):
         raise NotImplementedError
 
     @classmethod
     def partition_local_data(cls, op, axis_chunk_shape, sorted_chunks,
-                             indices_chunks, concat_pivot_chunk):
+                             indices_chunks, concat_pivot_chunks, n_partition=None):
         raise NotImplementedError
 
     @classmethod
-    def partition_merge_data(cls, op, need_align, return_value, partition_chunks, proxy_chunk):
+    def partition_merge_data(cls, op, need_align, return_value, partition_chunks, proxy_chunk,
+                             n_partition=None):
         raise NotImplementedError
 
     @classmethod
@@ -89,8 +127,11 @@ class PSRSOperandMixin:
 
 class TensorPSRSOperandMixin(TensorOperandMixin, PSRSOperandMixin):
     @classmethod
-    def local_sort_and_regular_sample(cls, op, in_data, axis_chunk_shape, axis_offsets, out_idx):
+    def local_sort_and_regular_sample(cls, op, in_data, axis_chunk_shape, axis_offsets, out_idx,
+                                      n_partition=None):
         # stage 1: local sort and regular samples collected
+        n_partition = n_partition or axis_chunk_shape
+        n_sample = cls.calc_n_sample(op, in_data, n_partition)
         sorted_chunks, indices_chunks, sampled_chunks = [], [], []
         sampled_dtype = np.dtype([(o, in_data.dtype[o]) for o in op.order]) \
             if op.order is not None else in_data.dtype
@@ -101,7 +142,7 @@ class TensorPSRSOperandMixin(TensorOperandMixin, PSRSOperandMixin):
             kind = None if op.psrs_kinds is None else op.psrs_kinds[0]
             chunk_op = PSRSSortRegularSample(axis=op.axis, order=op.order, kind=kind,
                                              return_indices=op.return_indices,
-                                             n_partition=axis_chunk_shape,
+                                             n_sample=n_sample,
                                              axis_offset=axis_offsets[i],
                                              gpu=op.gpu)
             kws = []
@@ -117,7 +158,7 @@ class TensorPSRSOperandMixin(TensorOperandMixin, PSRSOperandMixin):
                             'dtype': np.dtype(np.int64),
                             'index': in_chunk.index,
                             'type': 'argsort'})
-            sampled_shape = (axis_chunk_shape,)
+            sampled_shape = in_chunk.shape[:op.axis] + (n_sample,) + in_chunk.shape[op.axis + 1:]
             kws.append({'shape': sampled_shape,
                         'order': in_chunk.order,
                         'dtype': sampled_dtype,
@@ -137,26 +178,38 @@ class TensorPSRSOperandMixin(TensorOperandMixin, PSRSOperandMixin):
         return sorted_chunks, indices_chunks, sampled_chunks
 
     @classmethod
-    def concat_and_pivot(cls, op, axis_chunk_shape, out_idx, sorted_chunks, sampled_chunks):
+    def concat_and_pivot(cls, op, axis_chunk_shape, out_idx, sorted_chunks, sampled_chunks,
+                         n_partition=None):
         # stage 2: gather and merge samples, choose and broadcast p-1 pivots
+        # as well as ranks of pivots used to spread duplicate keys
+        n_partition = n_partition or axis_chunk_shape
         concat_pivot_op = PSRSConcatPivot(axis=op.axis,
                                           order=op.order,
                                           kind=None if op.psrs_kinds is None else op.psrs_kinds[1],
+                                          n_partition=n_partition,
+                                          axis_offsets=[c.op.axis_offset for c in sorted_chunks],
+                                          axis_sizes=[c.shape[op.axis] for c in sorted_chunks],
                                           dtype=sampled_chunks[0].dtype,
                                           gpu=op.gpu)
         concat_pivot_shape = \
-            sorted_chunks[0].shape[:op.axis] + (axis_chunk_shape - 1,) + \
+            sorted_chunks[0].shape[:op.axis] + (n_partition - 1,) + \
             sorted_chunks[0].shape[op.axis + 1:]
         concat_pivot_index = out_idx[:op.axis] + (0,) + out_idx[op.axis:]
-        concat_pivot_chunk = concat_pivot_op.new_chunk(sampled_chunks,
-                                                       shape=concat_pivot_shape,
-                                                       index=concat_pivot_index)
-        return concat_pivot_chunk
+        kws = [{'shape': concat_pivot_shape,
+                'index': concat_pivot_index,
+                'dtype': sampled_chunks[0].dtype,
+                'type': 'pivot'},
+               {'shape': concat_pivot_shape,
+                'index': concat_pivot_index,
+                'dtype': np.dtype(np.int64),
+                'type': 'pivot_rank'}]
+        return concat_pivot_op.new_chunks(sampled_chunks, kws=kws)
 
     @classmethod
     def partition_local_data(cls, op, axis_chunk_shape, sorted_chunks,
-                             indices_chunks, concat_pivot_chunk):
+                             indices_chunks, concat_pivot_chunks, n_partition=None):
         # stage 3: Local data is partitioned
+        n_partition = n_partition or axis_chunk_shape
         return_value = op.return_value
         return_indices = op.return_indices
         if return_indices:
@@ -173,11 +226,12 @@ class TensorPSRSOperandMixin(TensorOperandMixin, PSRSOperandMixin):
                 chunk_inputs.append(sorted_chunks[i])
             if indices_chunks:
                 chunk_inputs.append(indices_chunks[i])
-            chunk_inputs.append(concat_pivot_chunk)
+            chunk_inputs.extend(concat_pivot_chunks)
             partition_shuffle_map = PSRSShuffle(return_value=map_return_value,
                                                 return_indices=return_indices,
                                                 stage=OperandStage.map, axis=op.axis,
-                                                n_partition=axis_chunk_shape,
+                                                n_partition=n_partition,
+                                                axis_offset=sorted_chunks[i].op.axis_offset,
                                                 input_sorted=op.psrs_kinds[0] is not None,
                                                 order=op.order, dtype=chunk_inputs[0].dtype,
                                                 gpu=chunk_inputs[0].op.gpu)
@@ -189,12 +243,15 @@ class TensorPSRSOperandMixin(TensorOperandMixin, PSRSOperandMixin):
         return partition_chunks
 
     @classmethod
-    def partition_merge_data(cls, op, need_align, return_value, partition_chunks, proxy_chunk):
+    def partition_merge_data(cls, op, need_align, return_value, partition_chunks, proxy_chunk,
+                             n_partition=None):
         # stage 4: all *ith* classes are gathered and merged
         return_value = return_value if return_value is not None else op.return_value
         return_indices = op.return_indices
+        n_partition = n_partition or len(partition_chunks)
+        partition_chunk = partition_chunks[0]
         partition_sort_chunks, partition_indices_chunks, sort_info_chunks = [], [], []
-        for i, partition_chunk in enumerate(partition_chunks):
+        for i in range(n_partition):
             kind = None if op.psrs_kinds is None else op.psrs_kinds[2]
             partition_shuffle_reduce = PSRSShuffle(return_value=return_value,
                                                    return_indices=return_indices,
@@ -208,11 +265,14 @@ class TensorPSRSOperandMixin(TensorOperandMixin, PSRSOperandMixin):
             kws = []
             chunk_shape = list(partition_chunk.shape)
             chunk_shape[op.axis] = np.nan
+            chunk_index = list(partition_chunk.index)
+            chunk_index[op.axis] = i
+            chunk_index = tuple(chunk_index)
             if return_value:
                 kws.append({
                     'shape': tuple(chunk_shape),
                     'order': partition_chunk.order,
-                    'index': partition_chunk.index,
+                    'index': chunk_index,
                     'dtype': partition_chunk.dtype,
                     'type': 'sorted',
                 })
@@ -220,7 +280,7 @@ class TensorPSRSOperandMixin(TensorOperandMixin, PSRSOperandMixin):
                 kws.append({
                     'shape': tuple(chunk_shape),
                     'order': TensorOrder.C_ORDER,
-                    'index': partition_chunk.index,
+                    'index': chunk_index,
                     'dtype': np.dtype(np.int64),
                     'type': 'argsort'
                 })
@@ -230,7 +290,7 @@ class TensorPSRSOperandMixin(TensorOperandMixin, PSRSOperandMixin):
                 kws.append({
                     'shape': tuple(s),
                     'order': TensorOrder.C_ORDER,
-                    'index': partition_chunk.index,
+                    'index': chunk_index,
                     'dtype': np.dtype(np.int32),
                     'type': 'sort_info',
                 })
@@ -335,6 +395,16 @@ def _argsort(a, op, xp, axis=None, kind=None, order=None):
         return cp.argsort(a, axis=axis)
 
 
+def _duplicated_pivots(pivots, xp):
+    # pivots identical with neighbours indicate keys which are heavier than a partition
+    dup = xp.zeros(pivots.shape, dtype=bool)
+    if len(pivots) > 1:
+        eq = pivots[1:] == pivots[:-1]
+        dup[1:] |= eq
+        dup[:-1] |= eq
+    return dup
+
+
 class PSRSSortRegularSample(TensorOperand, TensorOperandMixin):
     _op_type_ = OperandDef.PSRS_SORT_REGULAR_SMAPLE
 
@@ -342,13 +412,13 @@ class PSRSSortRegularSample(TensorOperand, TensorOperandMixin):
     _order = ListField('order', ValueType.string)
     _kind = StringField('kind')
     _return_indices = BoolField('return_indices')
-    _n_partition = Int32Field('n_partition')
+    _n_sample = Int32Field('n_sample')
     _axis_offset = Int64Field('axis_offset')
 
     def __init__(self, axis=None, order=None, kind=None, return_indices=None,
-                 n_partition=None, axis_offset=None, dtype=None, gpu=None, **kw):
+                 n_sample=None, axis_offset=None, dtype=None, gpu=None, **kw):
         super().__init__(_axis=axis, _order=order, _kind=kind, _return_indices=return_indices,
-                         _n_partition=n_partition, _axis_offset=axis_offset,
+                         _n_sample=n_sample, _axis_offset=axis_offset,
                          _dtype=dtype, _gpu=gpu, **kw)
 
     @property
@@ -368,8 +438,8 @@ class PSRSSortRegularSample(TensorOperand, TensorOperandMixin):
         return self._return_indices
 
     @property
-    def n_partition(self):
-        return self._n_partition
+    def n_sample(self):
+        return self._n_sample
 
     @property
     def axis_offset(self):
@@ -386,33 +456,32 @@ class PSRSSortRegularSample(TensorOperand, TensorOperandMixin):
             [ctx[c.key] for c in op.inputs], device=op.device, ret_extra=True)
 
         with device(device_id):
-            n = op.n_partition
-            w = int(a.shape[op.axis] // n)
+            # regular samples are spread evenly over the chunk
+            n = op.n_sample
+            positions = np.arange(n) * a.shape[op.axis] // n
             if not op.return_indices:
                 if op.kind is not None:
                     # sort
                     res = ctx[op.outputs[0].key] = _sort(a, op, xp)
                 else:
                     # do not sort, prepare for sample by `xp.partition`
-                    kth = np.arange(0, n * w, w)
                     ctx[op.outputs[0].key] = res = xp.partition(
-                        a, kth, axis=op.axis, order=op.order)
+                        a, positions, axis=op.axis, order=op.order)
             else:
                 if op.kind is not None:
                     # argsort
                     indices = _argsort(a, op, xp)
                 else:
                     # do not sort, use `xp.argpartition`
-                    kth = np.arange(0, n * w, w)
                     indices = xp.argpartition(
-                        a, kth, axis=op.axis, order=op.order)
+                        a, positions, axis=op.axis, order=op.order)
                 ctx[op.outputs[0].key] = res = xp.take_along_axis(a, indices, op.axis)
                 ctx[op.outputs[1].key] = op.axis_offset + indices
 
             # do regular sample
             if op.order is not None:
                 res = res[op.order]
-            slc = (slice(None),) * op.axis + (slice(0, n * w, w),)
+            slc = (slice(None),) * op.axis + (positions,)
             ctx[op.outputs[-1].key] = res[slc]
 
 
@@ -422,9 +491,15 @@ class PSRSConcatPivot(TensorOperand, TensorOperandMixin):
     _axis = Int32Field('axis')
     _order = ListField('order', ValueType.string)
     _kind = StringField('kind')
+    _n_partition = Int32Field('n_partition')
+    _axis_offsets = ListField('axis_offsets', ValueType.int64)
+    _axis_sizes = ListField('axis_sizes', ValueType.int64)
 
-    def __init__(self, axis=None, order=None, kind=None, dtype=None, gpu=None, **kw):
-        super().__init__(_axis=axis, _order=order, _kind=kind, _dtype=dtype, _gpu=gpu, **kw)
+    def __init__(self, axis=None, order=None, kind=None, n_partition=None,
+                 axis_offsets=None, axis_sizes=None, dtype=None, gpu=None, **kw):
+        super().__init__(_axis=axis, _order=order, _kind=kind, _n_partition=n_partition,
+                         _axis_offsets=axis_offsets, _axis_sizes=axis_sizes,
+                         _dtype=dtype, _gpu=gpu, **kw)
 
     @property
     def axis(self):
@@ -438,6 +513,23 @@ class PSRSConcatPivot(TensorOperand, TensorOperandMixin):
     def kind(self):
         return self._kind
 
+    @property
+    def n_partition(self):
+        return self._n_partition
+
+    @property
+    def axis_offsets(self):
+        return self._axis_offsets
+
+    @property
+    def axis_sizes(self):
+        return self._axis_sizes
+
+    @property
+    def output_limit(self):
+        # return pivots and ranks of pivots
+        return 2
+
     @classmethod
     def execute(cls, ctx, op):
         inputs, device_id, xp = as_same_device(
@@ -445,21 +537,26 @@ class PSRSConcatPivot(TensorOperand, TensorOperandMixin):
 
         with device(device_id):
             a = xp.concatenate(inputs, axis=op.axis)
-            p = len(inputs)
-            assert a.shape[op.axis] == p ** 2
-
-            if op.kind is not None:
-                # sort
-                _sort(a, op, xp, inplace=True)
-            else:
-                # prepare for sampling via `partition`
-                kth = xp.arange(p - 1, (p - 1) ** 2 + 1, p - 1)
-                a.partition(kth, axis=op.axis)
-
-            select = slice(p, p ** 2 + 1, p)
+            # rank of a sample is its position in sorted input tensor
+            n_sample = inputs[0].shape[op.axis]
+            ranks = xp.concatenate([
+                offset + xp.arange(n_sample, dtype=np.int64) * size // n_sample
+                for offset, size in zip(op.axis_offsets, op.axis_sizes)])
+            assert a.shape[op.axis] == len(ranks)
+
+            # samples are sorted stably whatever the kind is,
+            # thus samples with identical keys are ordered by ranks
+            indices = _argsort(a, op, xp, kind='mergesort')
+            a = xp.take_along_axis(a, indices, op.axis)
+            ranks = ranks[indices]
+
+            # choose p-1 pivots evenly from samples
+            n = a.shape[op.axis]
+            select = np.arange(1, op.n_partition) * n // op.n_partition
             slc = (slice(None),) * op.axis + (select,)
             ctx[op.outputs[0].key] = result = a[slc]
-            assert result.shape[op.axis] == p - 1
+            ctx[op.outputs[1].key] = ranks[slc]
+            assert result.shape[op.axis] == op.n_partition - 1
 
 
 class PSRSShuffle(TensorMapReduceOperand, TensorOperandMixin):
@@ -473,6 +570,7 @@ class PSRSShuffle(TensorMapReduceOperand, TensorOperandMixin):
     _axis = Int32Field('axis')
     _order = ListField('order', ValueType.string)
     _n_partition = Int32Field('n_partition')
+    _axis_offset = Int64Field('axis_offset')
     _input_sorted = BoolField('input_sorted')
 
     # for shuffle reduce
@@ -480,13 +578,14 @@ class PSRSShuffle(TensorMapReduceOperand, TensorOperandMixin):
     _need_align = BoolField('need_align')
 
     def __init__(self, return_value=None, return_indices=None,
-                 axis=None, order=None, n_partition=None, input_sorted=None,
-                 kind=None, need_align=None, stage=None, shuffle_key=None,
-                 dtype=None, gpu=None, **kw):
+                 axis=None, order=None, n_partition=None, axis_offset=None,
+                 input_sorted=None, kind=None, need_align=None, stage=None,
+                 shuffle_key=None, dtype=None, gpu=None, **kw):
         super().__init__(_return_value=return_value, _return_indices=return_indices,
                          _axis=axis, _order=order, _n_partition=n_partition,
-                         _input_sorted=input_sorted, _kind=kind, _need_align=need_align,
-                         _stage=stage, _shuffle_key=shuffle_key, _dtype=dtype, _gpu=gpu, **kw)
+                         _axis_offset=axis_offset, _input_sorted=input_sorted,
+                         _kind=kind, _need_align=need_align, _stage=stage,
+                         _shuffle_key=shuffle_key, _dtype=dtype, _gpu=gpu, **kw)
 
     @property
     def return_value(self):
@@ -508,6 +607,10 @@ class PSRSShuffle(TensorMapReduceOperand, TensorOperandMixin):
     def n_partition(self):
         return self._n_partition
 
+    @property
+    def axis_offset(self):
+        return self._axis_offset
+
     @property
     def input_sorted(self):
         return self._input_sorted
@@ -540,10 +643,10 @@ class PSRSShuffle(TensorMapReduceOperand, TensorOperandMixin):
                                                device=op.device, ret_extra=True)
         out = op.outputs[0]
         a = inputs[0]
-        pivots = inputs[-1]
+        pivots, pivot_ranks = inputs[-2:]
         a_indices = None
         if return_indices:
-            a_indices = inputs[-2]
+            a_indices = inputs[-3]
 
         with device(device_id):
             shape = tuple(s for i, s in enumerate(a.shape) if i != op.axis)
@@ -552,7 +655,7 @@ class PSRSShuffle(TensorMapReduceOperand, TensorOperandMixin):
                 slc = list(idx)
                 slc.insert(op.axis, slice(None))
                 slc = tuple(slc)
-                a_1d, pivots_1d = a[slc], pivots[slc]
+                a_1d, pivots_1d, pivot_ranks_1d = a[slc], pivots[slc], pivot_ranks[slc]
                 a_indices_1d = a_indices[slc] if a_indices is not None else None
                 raw_a_1d = a_1d
                 if op.order is not None:
@@ -560,6 +663,14 @@ class PSRSShuffle(TensorMapReduceOperand, TensorOperandMixin):
                 if op.input_sorted:
                     # a is sorted already
                     poses = xp.searchsorted(a_1d, pivots_1d, side='right')
+                    dup = _duplicated_pivots(pivots_1d, xp)
+                    if dup.any():
+                        # elements equal to duplicated pivots are spread
+                        # across partitions by their ranks in sorted tensor
+                        left_poses = xp.searchsorted(a_1d, pivots_1d, side='left')
+                        rank_poses = xp.clip(pivot_ranks_1d - op.axis_offset + 1,
+                                             left_poses, poses)
+                        poses = xp.where(dup, rank_poses, poses)
                     poses = (None,) + tuple(poses) + (None,)
                     for i in range(op.n_partition):
                         reduce_out = []
@@ -111,28 +111,32 @@ class TensorSort(TensorOperand, TensorPSRSOperandMixin):
         out_tensor = op.outputs[0]
         in_tensor, axis_chunk_shape, out_idxes, need_align = cls.preprocess(op)
         axis_offsets = [0] + np.cumsum(in_tensor.nsplits[op.axis]).tolist()[:-1]
+        n_partition = cls.calc_n_partition(op, in_tensor, axis_chunk_shape, need_align)
         return_value, return_indices = op.return_value, op.return_indices
 
         out_value_chunks, out_indices_chunks = [], []
         for out_idx in out_idxes:
             # stage 1: local sort and regular samples collected
             sorted_chunks, indices_chunks, sampled_chunks = cls.local_sort_and_regular_sample(
-                op, in_tensor, axis_chunk_shape, axis_offsets, out_idx)
+                op, in_tensor, axis_chunk_shape, axis_offsets, out_idx, n_partition=n_partition)
 
             # stage 2: gather and merge samples, choose and broadcast p-1 pivots
-            concat_pivot_chunk = cls.concat_and_pivot(
-                op, axis_chunk_shape, out_idx, sorted_chunks, sampled_chunks)
+            concat_pivot_chunks = cls.concat_and_pivot(
+                op, axis_chunk_shape, out_idx, sorted_chunks, sampled_chunks,
+                n_partition=n_partition)
 
             # stage 3: Local data is partitioned
             partition_chunks = cls.partition_local_data(
-                op, axis_chunk_shape, sorted_chunks, indices_chunks, concat_pivot_chunk)
+                op, axis_chunk_shape, sorted_chunks, indices_chunks, concat_pivot_chunks,
+                n_partition=n_partition)
 
             proxy_chunk = TensorShuffleProxy(dtype=partition_chunks[0].dtype).new_chunk(
                 partition_chunks, shape=())
 
             # stage 4: all *ith* classes are gathered and merged
             partition_sort_chunks, partition_indices_chunks, sort_info_chunks = \
-                cls.partition_merge_data(op, need_align, None, partition_chunks, proxy_chunk)
+                cls.partition_merge_data(op, need_align, None, partition_chunks, proxy_chunk,
+                                         n_partition=n_partition)
 
             if not need_align:
                 if return_value:
@@ -152,7 +156,7 @@ class TensorSort(TensorOperand, TensorPSRSOperandMixin):
         new_op = op.copy()
         nsplits = list(in_tensor.nsplits)
         if not need_align:
-            nsplits[op.axis] = (np.nan,) * axis_chunk_shape
+            nsplits[op.axis] = (np.nan,) * n_partition
         kws = []
         if return_value:
             kws.append({
@@ -21,6 +21,7 @@ import scipy.sparse as sps
 import pandas as pd
 
 from mars import tensor as mt
+from mars.config import option_context
 from mars.tiles import get_tiled
 from mars.tensor.datasource import tensor, ones, zeros, arange
 from mars.tensor.base import copyto, transpose, moveaxis, broadcast_to, broadcast_arrays, where, \
@@ -48,6 +49,25 @@ class Test(unittest.TestCase):
         self.assertTrue(np.array_equal(res[4], raw[8:, :4]))
         self.assertTrue(np.array_equal(res[5], raw[8:, 4:]))
 
+        # rechunk with shuffle
+        with option_context({'rechunk.shuffle_threshold': 1}):
+            arr = tensor(raw, chunk_size=(1, 8))
+            arr2 = arr.rechunk((5, 3))
+            res = self.executor.execute_tensor(arr2, concat=True)[0]
+            np.testing.assert_array_equal(res, raw)
+
+            raw2 = np.asfortranarray(np.random.random((6, 4, 5)))
+            arr = tensor(raw2, chunk_size=(1, 3, 5))
+            arr2 = arr.rechunk((6, 2, 2))
+            res = self.executor.execute_tensor(arr2, concat=True)[0]
+            np.testing.assert_array_equal(res, raw2)
+            self.assertTrue(res.flags['F_CONTIGUOUS'])
+
+            # no uninitialized data is returned if pieces are missing
+            reduce_op = get_tiled(arr2).chunks[0].op
+            with self.assertRaises(ValueError):
+                type(reduce_op).execute(dict(), reduce_op)
+
     def testCopytoExecution(self):
         a = ones((2, 3), chunk_size=1)
         b = tensor([3, -1, 3], chunk_size=2)
@@ -1044,6 +1064,23 @@ class Test(unittest.TestCase):
         res = self.executor.execute_tensor(sx, concat=True)[0]
         np.testing.assert_array_equal(res, np.sort(raw))
 
+        # test duplicate keys spread across partitions
+        raw = np.random.RandomState(0).randint(10, size=400)
+        raw[raw < 7] = 5
+        x = tensor(raw, chunk_size=20)
+
+        sx = sort(x)
+
+        res = self.executor.execute_tensor(sx)
+        self.assertLess(max(len(r) for r in res), len(raw) // 4)
+        np.testing.assert_array_equal(np.concatenate(res), np.sort(raw))
+
+        with option_context({'sort.oversampling': 1}):
+            sx = sort(x, psrs_kinds=['quicksort', None, 'mergesort'])
+
+            res = self.executor.execute_tensor(sx, concat=True)[0]
+            np.testing.assert_array_equal(res, np.sort(raw))
+
         # structured dtype
         raw = np.empty(100, dtype=[('id', np.int32), ('size', np.int64)])
         raw['id'] = np.random.randint(1000, size=100, dtype=np.int32)
@@ -229,8 +229,9 @@ def array(x, dtype=None, copy=True, order='K', ndmin=None, chunk_size=None):
         Specifies the minimum number of dimensions that the resulting
         array should have.  Ones will be pre-pended to the shape as
         needed to meet this requirement.
-    chunk_size: int, tuple, optional
-        Specifies chunk size for each dimension.
+    chunk_size: int, tuple or 'auto', optional
+        Specifies chunk size for each dimension, if 'auto', chunk sizes are
+        decided by operands consuming the tensor and resources of the cluster.
 
     Returns
     -------
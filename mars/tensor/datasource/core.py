@@ -14,12 +14,16 @@
 
 
 import itertools
+import threading
+from collections import OrderedDict
 
 import numpy as np
 
 from ...config import options
+from ...filesystem import get_fs
 from ...serialize import ValueType, StringField, TupleField
-from ..utils import normalize_shape, decide_chunk_sizes
+from ...utils import tokenize
+from ..utils import normalize_shape, decide_tensor_chunk_sizes, align_nsplits
 from ..core import TensorOrder
 from ..operands import TensorOperand, TensorOperandMixin
 
@@ -38,12 +42,15 @@ class TensorDataSource(TensorOperand, TensorOperandMixin):
         chunk_op.extra_params = {'size': chunk_shape}  # to make op key different
         return chunk_op
 
+    @classmethod
+    def _get_nsplits(cls, op):
+        return decide_tensor_chunk_sizes(op.outputs[0])
+
     @classmethod
     def tile(cls, op):
         tensor = op.outputs[0]
 
-        chunk_size = tensor.extra_params.raw_chunk_size or options.chunk_size
-        chunk_size = decide_chunk_sizes(tensor.shape, chunk_size, tensor.dtype.itemsize)
+        chunk_size = cls._get_nsplits(op)
         chunk_size_idxes = (range(len(size)) for size in chunk_size)
 
         out_chunks = []
@@ -135,16 +142,70 @@ class TensorLike(TensorHasInput):
             raise NotImplementedError('Sparse tensor on GPU only supports float32 and float64')
 
 
+def need_align_storage_chunks(op):
+    """
+    Check if chunks of a tensor read from storage should be snapped to
+    storage chunks, explicit chunk sizes other than 'auto' are kept.
+    """
+    if not op.storage_chunks or not options.datasource.align_storage_chunks:
+        return False
+    chunk_size = op.outputs[0].extra_params.raw_chunk_size
+    return chunk_size is None or (isinstance(chunk_size, str) and chunk_size == 'auto')
+
+
+class StorageBlockCache(object):
+    """
+    LRU cache of decompressed storage chunks in a worker process,
+    thus storage chunks overlapped by multiple chunks are read once
+    if they are not evicted.
+    """
+    def __init__(self):
+        self._blocks = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                self._blocks.move_to_end(key)
+            except KeyError:
+                return None
+            return self._blocks[key]
+
+    def put(self, key, block):
+        limit = options.datasource.block_cache_size
+        if block.nbytes > limit:
+            return
+        with self._lock:
+            if key in self._blocks:
+                return
+            self._blocks[key] = block
+            self._size += block.nbytes
+            while self._size > limit:
+                _, evicted = self._blocks.popitem(last=False)
+                self._size -= evicted.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._blocks.clear()
+            self._size = 0
+
+
+_block_cache = StorageBlockCache()
+
+
 class TensorFromHDF5Like(TensorNoInput):
     _filename = StringField('filename')
     _group = StringField('group')
     _dataset = StringField('dataset')
     _axis_offsets = TupleField('axis_offsets', ValueType.int64)
+    _storage_chunks = TupleField('storage_chunks', ValueType.int64)
 
     def __init__(self, filename=None, group=None, dataset=None,
-                 dtype=None, **kw):
+                 dtype=None, storage_chunks=None, **kw):
         super().__init__(_filename=filename, _group=group,
-                         _dataset=dataset, _dtype=dtype, **kw)
+                         _dataset=dataset, _dtype=dtype,
+                         _storage_chunks=storage_chunks, **kw)
 
     @property
     def filename(self):
@@ -162,10 +223,73 @@ class TensorFromHDF5Like(TensorNoInput):
     def axis_offsets(self):
         return self._axis_offsets
 
+    @property
+    def storage_chunks(self):
+        return self._storage_chunks
+
     @property
     def path(self):
         return self.get_path(self.group, self.dataset)
 
+    @classmethod
+    def _get_nsplits(cls, op):
+        nsplits = super()._get_nsplits(op)
+        if need_align_storage_chunks(op):
+            nsplits = align_nsplits(nsplits, op.storage_chunks)
+        return nsplits
+
+    @classmethod
+    def _get_stat_path(cls, op):
+        return op.filename
+
+    @classmethod
+    def _get_cache_token(cls, op):
+        # cached blocks are identified by the status of the file in storage,
+        # thus blocks are not read from the cache once the file is modified
+        path = cls._get_stat_path(op)
+        try:
+            stat = get_fs(path, None).stat(path)
+        except (OSError, NotImplementedError):  # pragma: no cover
+            return None
+        return tokenize(op.filename, op.path, sorted(stat.items()))
+
+    @classmethod
+    def _read(cls, op, arr):
+        """
+        Read data of a chunk from an array in storage. Chunks aligned to
+        storage chunks are read with a single selection, otherwise storage
+        chunks are read one by one through the block cache.
+        """
+        chunk = op.outputs[0]
+        slices = tuple(slice(offset, offset + size)
+                       for offset, size in zip(op.axis_offsets, chunk.shape))
+        storage_chunks = op.storage_chunks
+        if not storage_chunks or 0 in chunk.shape or \
+                all(s.start % c == 0 and (s.stop % c == 0 or s.stop == size)
+                    for s, c, size in zip(slices, storage_chunks, arr.shape)):
+            return arr[slices]
+
+        cache_token = cls._get_cache_token(op)
+        if cache_token is None:  # pragma: no cover
+            return arr[slices]
+
+        data = np.empty(chunk.shape, dtype=arr.dtype, order=chunk.order.value)
+        block_ranges = [range(s.start // c, (s.stop - 1) // c + 1)
+                        for s, c in zip(slices, storage_chunks)]
+        for block_index in itertools.product(*block_ranges):
+            block_slices = tuple(slice(i * c, min((i + 1) * c, size))
+                                 for i, c, size in zip(block_index, storage_chunks, arr.shape))
+            key = (cache_token, block_index)
+            block = _block_cache.get(key)
+            if block is None:
+                block = arr[block_slices]
+                _block_cache.put(key, block)
+            data[tuple(slice(max(s.start, b.start) - s.start, min(s.stop, b.stop) - s.start)
+                       for s, b in zip(slices, block_slices))] = \
+                block[tuple(slice(max(s.start, b.start) - b.start, min(s.stop, b.stop) - b.start)
+                            for s, b in zip(slices, block_slices))]
+        return data
+
     def to_chunk_op(self, *args):
         _, chunk_index, nsplits = args
         chunk_op = super().to_chunk_op(*args)
@@ -24,14 +24,8 @@ class TensorHDF5DataSource(TensorFromHDF5Like):
     def execute(cls, ctx, op):
         import h5py
 
-        axis_offsets = op.axis_offsets
-        shape = op.outputs[0].shape
-
         with h5py.File(open_file(op.filename), mode='r') as f:
-            ds = f[op.path]
-            data = ds[tuple(slice(offset, offset + size)
-                            for offset, size in zip(axis_offsets, shape))]
-            ctx[op.outputs[0].key] = data
+            ctx[op.outputs[0].key] = cls._read(op, f[op.path])
 
 
 def fromhdf5(hdf5_file, group=None, dataset=None, chunk_size=None):
@@ -41,7 +35,7 @@ def fromhdf5(hdf5_file, group=None, dataset=None, chunk_size=None):
         filename = hdf5_file.file.filename
         group = hdf5_file.parent.name
         dataset = hdf5_file.name.rsplit('/', 1)[1]
-        chunk_size = chunk_size if chunk_size is not None else hdf5_file.chunks
+        storage_chunks = hdf5_file.chunks
         shape = hdf5_file.shape
         dtype = hdf5_file.dtype
     elif isinstance(hdf5_file, h5py.File):
@@ -52,7 +46,7 @@ def fromhdf5(hdf5_file, group=None, dataset=None, chunk_size=None):
             h5_dataset = hdf5_file[TensorHDF5DataSource.get_path(group, dataset)]
         except KeyError:
             raise ValueError('dataset({}) does not exist'.format(dataset))
-        chunk_size = chunk_size if chunk_size is not None else h5_dataset.chunks
+        storage_chunks = h5_dataset.chunks
         shape = h5_dataset.shape
         dtype = h5_dataset.dtype
     elif isinstance(hdf5_file, str):
@@ -63,7 +57,7 @@ def fromhdf5(hdf5_file, group=None, dataset=None, chunk_size=None):
                     raise ValueError('`dataset` should be provided')
                 h5_dataset = f[TensorHDF5DataSource.get_path(group, dataset)]
 
-                chunk_size = chunk_size if chunk_size is not None else h5_dataset.chunks
+                storage_chunks = h5_dataset.chunks
                 shape = h5_dataset.shape
                 dtype = h5_dataset.dtype
         except KeyError:
@@ -73,6 +67,7 @@ def fromhdf5(hdf5_file, group=None, dataset=None, chunk_size=None):
                         'expect str, h5py.File or h5py.Dataset, '
                         'got {}'.format(type(hdf5_file)))
 
-    op = TensorHDF5DataSource(filename=filename, group=group,
-                              dataset=dataset, dtype=dtype)
+    chunk_size = chunk_size if chunk_size is not None else storage_chunks
+    op = TensorHDF5DataSource(filename=filename, group=group, dataset=dataset,
+                              dtype=dtype, storage_chunks=storage_chunks)
     return op(shape, chunk_size=chunk_size, order=TensorOrder.C_ORDER)
@@ -17,7 +17,8 @@ from ...serialize import ValueType, DictField, TupleField, StringField, Int64Fie
 from ...lib.sparse.core import sps
 from ...lib.sparse import SparseNDArray
 from ..core import TensorOrder
-from .core import TensorNoInput
+from ..utils import align_nsplits
+from .core import TensorNoInput, need_align_storage_chunks
 
 
 class TensorTileDBDataSource(TensorNoInput):
@@ -33,15 +34,18 @@ class TensorTileDBDataSource(TensorNoInput):
     # open array at a given timestamp if provided
     _tiledb_timestamp = Int64Field('tiledb_timestamp')
     _axis_offsets = TupleField('axis_offsets', ValueType.int64)
+    # tile extents of dimensions
+    _storage_chunks = TupleField('storage_chunks', ValueType.int64)
 
     def __init__(self, tiledb_config=None, tiledb_uri=None, tiledb_dim_starts=None,
                  tiledb_key=None, tiledb_timstamp=None, dtype=None,
-                 gpu=None, sparse=None, **kw):
+                 gpu=None, sparse=None, storage_chunks=None, **kw):
         super().__init__(
             _tiledb_config=tiledb_config, _tiledb_uri=tiledb_uri,
             _tiledb_dim_starts=tiledb_dim_starts,
             _tiledb_key=tiledb_key, _tiledb_timestamp=tiledb_timstamp,
-            _dtype=dtype, _gpu=gpu, _sparse=sparse, **kw)
+            _dtype=dtype, _gpu=gpu, _sparse=sparse,
+            _storage_chunks=storage_chunks, **kw)
 
     @property
     def tiledb_config(self):
@@ -67,6 +71,18 @@ class TensorTileDBDataSource(TensorNoInput):
     def axis_offsets(self):
         return self._axis_offsets
 
+    @property
+    def storage_chunks(self):
+        return self._storage_chunks
+
+    @classmethod
+    def _get_nsplits(cls, op):
+        nsplits = super()._get_nsplits(op)
+        if need_align_storage_chunks(op):
+            # tiles are read and decompressed as a whole by TileDB
+            nsplits = align_nsplits(nsplits, op.storage_chunks)
+        return nsplits
+
     def to_chunk_op(self, *args):
         _, chunk_idx, nsplits = args
         chunk_op = super().to_chunk_op(*args)
@@ -127,7 +143,7 @@ class TensorTileDBDataSource(TensorNoInput):
                     ctx[chunk.key] = SparseNDArray(spmatrix, shape=chunk.shape)
 
 
-def fromtiledb(uri, ctx=None, key=None, timestamp=None, gpu=False):
+def fromtiledb(uri, ctx=None, key=None, timestamp=None, gpu=False, chunk_size=None):
     import tiledb
 
     raw_ctx = ctx
@@ -156,10 +172,12 @@ def fromtiledb(uri, ctx=None, key=None, timestamp=None, gpu=False):
     tiledb_config = None if raw_ctx is None else ctx.config().dict()
     tensor_order = TensorOrder.C_ORDER \
         if tiledb_arr.schema.cell_order == 'row-major' else TensorOrder.F_ORDER
+    storage_chunks = tuple(int(tiledb_arr.domain.dim(i).tile)
+                           for i in range(tiledb_arr.domain.ndim))
     op = TensorTileDBDataSource(tiledb_config=tiledb_config, tiledb_uri=uri,
                                 tiledb_key=key, tiledb_timstamp=timestamp,
                                 tiledb_dim_starts=tiledb_dim_starts,
-                                gpu=gpu, sparse=sparse, dtype=dtype)
-    chunk_size = tuple(int(tiledb_arr.domain.dim(i).tile)
-                       for i in range(tiledb_arr.domain.ndim))
+                                gpu=gpu, sparse=sparse, dtype=dtype,
+                                storage_chunks=storage_chunks)
+    chunk_size = chunk_size if chunk_size is not None else storage_chunks
     return op(tiledb_arr.shape, chunk_size=chunk_size, order=tensor_order)
@@ -21,13 +21,15 @@ from .core import TensorFromHDF5Like
 class TensorFromZarr(TensorFromHDF5Like):
     _op_type_ = OperandDef.TENSOR_FROM_ZARR
 
+    @classmethod
+    def _get_stat_path(cls, op):
+        # chunks of the array are rewritten along with its metadata
+        return '/'.join([op.filename, op.path, '.zarray'])
+
     @classmethod
     def execute(cls, ctx, op):
         import zarr
 
-        axis_offsets = op.axis_offsets
-        shape = op.outputs[0].shape
-
         fs = get_fs(op.filename, None)
         fs_map = FSMap(op.filename, fs)
 
@@ -35,9 +37,7 @@ class TensorFromZarr(TensorFromHDF5Like):
         path = cls.get_path(op.group, op.dataset)
         arr = root[path]
 
-        data = arr[tuple(slice(offset, offset + size)
-                         for offset, size in zip(axis_offsets, shape))]
-        ctx[op.outputs[0].key] = data
+        ctx[op.outputs[0].key] = cls._read(op, arr)
 
 
 def fromzarr(path, group=None, dataset=None, chunk_size=None):
@@ -75,5 +75,5 @@ def fromzarr(path, group=None, dataset=None, chunk_size=None):
 
     chunk_size = chunk_size if chunk_size is not None else arr.chunks
     op = TensorFromZarr(filename=path, group=group, dataset=dataset,
-                        dtype=arr.dtype)
+                        dtype=arr.dtype, storage_chunks=arr.chunks)
     return op(shape, chunk_size=chunk_size, order=TensorOrder(arr.order))
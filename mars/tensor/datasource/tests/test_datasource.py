@@ -15,6 +15,7 @@
 import unittest
 import shutil
 import tempfile
+from unittest import mock
 from weakref import ReferenceType
 from copy import copy
 
@@ -26,7 +27,9 @@ except (ImportError, OSError):  # pragma: no cover
     tiledb = None
 
 import mars.dataframe as md
-from mars.tensor import ones, zeros, tensor, full, arange, diag, linspace, triu, tril, ones_like, dot
+from mars.config import option_context
+from mars.tensor import ones, zeros, tensor, full, arange, diag, linspace, triu, tril, ones_like, \
+    dot, sort
 from mars.tensor.datasource import array, fromtiledb, TensorTileDBDataSource, fromdense
 from mars.tensor.datasource.tri import TensorTriu, TensorTril
 from mars.tensor.datasource.zeros import TensorZeros
@@ -38,6 +41,7 @@ from mars.tensor.core import Tensor, SparseTensor, TensorChunk
 from mars.tensor.datasource.from_dataframe import from_dataframe
 from mars.graph import DAG
 from mars.core import build_mode
+from mars.tiles import get_tiled
 from mars import opcodes
 from mars.tests.core import TestBase
 
@@ -772,3 +776,43 @@ class Test(TestBase):
         tensor = from_dataframe(mdf)
         self.assertEqual(tensor.shape, (3, 3))
         self.assertEqual(np.float64, tensor.dtype)
+
+    @mock.patch('mars.tensor.utils._get_auto_chunk_resources', new=lambda: (4, None))
+    def testAutoChunkSize(self):
+        # no consumers known
+        t = ones((10, 10), chunk_size='auto').tiles()
+        self.assertEqual(t.nsplits, ((10,), (10,)))
+        self.assertIn('no consumer', t.extra_params.auto_chunk_reason)
+
+        with option_context({'auto_chunk.min_chunk_bytes': 0}):
+            # elementwise operands get contiguous slabs
+            a = ones((1000, 100), chunk_size='auto')
+            (a + 1).build_graph(tiled=True)
+            tiled = get_tiled(a)
+            self.assertEqual(tiled.nsplits, ((250,) * 4, (100,)))
+            self.assertIn('elementwise', tiled.extra_params.auto_chunk_reason)
+
+            a = ones((1000, 100), chunk_size='auto', order='F')
+            (a + 1).build_graph(tiled=True)
+            self.assertEqual(get_tiled(a).nsplits, ((1000,), (25,) * 4))
+
+            # contractions get square blocks
+            a = ones((1000, 1000), chunk_size='auto')
+            b = tensor(np.random.rand(1000, 1000), chunk_size=500)
+            dot(a, b).build_graph(tiled=True)
+            tiled = get_tiled(a)
+            self.assertEqual(tiled.nsplits, ((500, 500), (500, 500)))
+            self.assertIn('contraction', tiled.extra_params.auto_chunk_reason)
+
+            # sorts get chunks along the sorted axis as many as cores
+            a = tensor(np.random.rand(1000, 10), chunk_size='auto')
+            sort(a, axis=0).build_graph(tiled=True)
+            tiled = get_tiled(a)
+            self.assertEqual(tiled.nsplits, ((250,) * 4, (10,)))
+            self.assertIn('sort', tiled.extra_params.auto_chunk_reason)
+
+            # chunks are limited by the store limit
+            with option_context({'chunk_store_limit': 8000}):
+                a = ones((1000, 100), chunk_size='auto')
+                (a + 1).build_graph(tiled=True)
+                self.assertEqual(get_tiled(a).nsplits, ((10,) * 100, (100,)))
@@ -19,6 +19,7 @@ import shutil
 import unittest
 import os
 import time
+from unittest import mock
 
 import numpy as np
 import scipy.sparse as sps
@@ -35,12 +36,14 @@ try:
 except ImportError:  # pragma: no cover
     zarr = None
 
+from mars.config import option_context
 from mars.tests.core import TestBase, ExecutorForTest
 from mars.tiles import get_tiled
 from mars.lib.sparse import SparseNDArray
 from mars.tensor.datasource import tensor, ones_like, zeros, zeros_like, full, full_like, \
     arange, empty, empty_like, diag, diagflat, eye, linspace, meshgrid, indices, \
     triu, tril, from_dataframe, fromtiledb, fromhdf5, fromzarr
+from mars.tensor.datasource.core import StorageBlockCache
 from mars.tensor.lib import nd_grid
 import mars.tensor as mt
 import mars.dataframe as md
@@ -1012,6 +1015,28 @@ class Test(TestBase):
                 result = self.executor.execute_tensor(r, concat=True)[0]
                 np.testing.assert_array_equal(result, test_array)
 
+            # chunks decided automatically are snapped to multiples of storage chunks
+            with option_context({'chunk_store_limit': 9 * 8 * test_array.itemsize}):
+                r = fromhdf5(filename, group=group_name, dataset=dataset_name,
+                             chunk_size='auto')
+
+                result = self.executor.execute_tensor(r, concat=True)[0]
+                np.testing.assert_array_equal(result, test_array)
+                for ns, storage_chunk in zip(get_tiled(r).nsplits, (7, 8)):
+                    self.assertTrue(all(s % storage_chunk == 0 for s in np.cumsum(ns)[:-1]))
+
+            # storage chunks overlapped by chunks are read through the block cache,
+            # explicit chunk sizes are not snapped
+            with mock.patch.object(StorageBlockCache, 'put', autospec=True,
+                                   side_effect=StorageBlockCache.put) as put:
+                r = fromhdf5(filename, group=group_name, dataset=dataset_name, chunk_size=9)
+
+                result = self.executor.execute_tensor(r, n_parallel=1, concat=True)[0]
+                np.testing.assert_array_equal(result, test_array)
+                self.assertEqual(get_tiled(r).nsplits, ((9, 9, 2), (9, 1)))
+                # every storage chunk is read only once
+                self.assertEqual(put.call_count, 3 * 3)
+
     @unittest.skipIf(zarr is None, 'zarr not installed')
     def testReadZarrExecution(self):
         test_array = np.random.RandomState(0).rand(20, 10)
@@ -1051,3 +1076,10 @@ class Test(TestBase):
             result = self.executor.execute_tensor(r, concat=True)[0]
             np.testing.assert_array_equal(result, test_array)
             self.assertGreater(len(get_tiled(r).chunks), 1)
+
+            # chunks are snapped to multiples of storage chunks
+            r = fromzarr(path, group=group_name, dataset=dataset_name, chunk_size=9)
+
+            result = self.executor.execute_tensor(r, concat=True)[0]
+            np.testing.assert_array_equal(result, test_array)
+            self.assertEqual(get_tiled(r).nsplits, ((7, 7, 6), (8, 2)))
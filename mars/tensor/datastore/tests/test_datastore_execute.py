@@ -184,6 +184,47 @@ class Test(TestBase):
                     result = np.asarray(f['{}/{}'.format(group_name, dataset_name)])
                     np.testing.assert_array_equal(result, raw)
 
+                # test parallel writes into files stitched by a virtual dataset,
+                # storage chunks are larger than some parts
+                r = tohdf5(filename, t2, group=group_name, dataset=dataset_name,
+                           parallel=True, chunks=(5, 5))
+
+                executor.execute_tensor(r)
+
+                rt = get_tiled(r)
+                self.assertEqual(len(rt.chunks), 1)
+                self.assertEqual(len(rt.chunks[0].inputs), len(get_tiled(t2).chunks))
+                self.assertTrue(all(type(c.op).__name__ != 'SuccessorsExclusive'
+                                    for c in rt.chunks[0].inputs))
+
+                with h5py.File(filename, 'r') as f:
+                    ds = f['{}/{}'.format(group_name, dataset_name)]
+                    self.assertTrue(ds.is_virtual)
+                    np.testing.assert_array_equal(np.asarray(ds), raw)
+                    # parts lie beside the file and are referred relatively
+                    sources = ds.virtual_sources()
+                    self.assertEqual(len(sources), len(get_tiled(t2).chunks))
+                    for source in sources:
+                        self.assertEqual(os.path.basename(source.file_name), source.file_name)
+                        self.assertTrue(os.path.exists(os.path.join(d, source.file_name)))
+                        self.assertEqual(source.dset_name.strip('/'),
+                                         '{}/{}'.format(group_name, dataset_name))
+                        self.assertEqual(source.vspace.shape, raw.shape)
+
+                # files can be moved together
+                moved_dir = os.path.join(d, 'moved')
+                os.mkdir(moved_dir)
+                for fn in os.listdir(d):
+                    if fn.startswith(os.path.basename(filename)):
+                        os.rename(os.path.join(d, fn), os.path.join(moved_dir, fn))
+                with h5py.File(os.path.join(moved_dir, os.path.basename(filename)), 'r') as f:
+                    ds = f['{}/{}'.format(group_name, dataset_name)]
+                    np.testing.assert_array_equal(np.asarray(ds), raw)
+
+                with self.assertRaises(ValueError):
+                    tohdf5('hdfs://localhost:8020/test.hdf5', t2, group=group_name,
+                           dataset=dataset_name, parallel=True)
+
     @unittest.skipIf(zarr is None, 'zarr not installed')
     def testStoreZarrExecution(self):
         raw = np.random.RandomState(0).rand(10, 20)
@@ -222,6 +263,14 @@ class Test(TestBase):
             result = zarr.open_array(path)
             np.testing.assert_array_equal(result, raw + 1)
 
+            # chunks are aligned to zarr chunks
+            r = tozarr(path, t, chunks=4)
+            self.executor.execute_tensor(r)
+            self.assertEqual(get_tiled(r).nsplits, ((0, 0), (0, 0, 0)))
+            result = zarr.open_array(path)
+            self.assertEqual(result.chunks, (4, 4))
+            np.testing.assert_array_equal(result, raw)
+
     @unittest.skipIf(vineyard is None, 'vineyard not installed')
     @mock.patch('webbrowser.open_new_tab', new=lambda *_, **__: True)
     def testToVineyard(self):
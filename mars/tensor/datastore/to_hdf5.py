@@ -12,15 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+import os
+from urllib.parse import urlparse
+
 import numpy as np
 
 from ... import opcodes as OperandDef
-from ...serialize import ValueType, KeyField, StringField, DictField, TupleField
+from ...serialize import ValueType, KeyField, StringField, DictField, TupleField, BoolField
 from ...context import RunningMode
 from ...filesystem import open_file
 from ...tiles import TilesError
 from ...utils import check_chunks_unknown_shape
-from ...operands import SuccessorsExclusive
+from ...operands import SuccessorsExclusive, OperandStage
 from ..datasource import tensor as astensor
 from .core import TensorDataStore
 
@@ -36,11 +40,14 @@ class TensorHDF5DataStore(TensorDataStore):
     _dataset_kwds = DictField('dataset_kwds', key_type=ValueType.string)
     _axis_offsets = TupleField('axis_offsets', ValueType.int32)
     _out_shape = TupleField('out_shape', ValueType.int32)
+    _parallel = BoolField('parallel')
+    _nsplits = TupleField('nsplits', ValueType.tuple(ValueType.uint64))
 
     def __init__(self, lock=None, filename=None, group=None, dataset=None,
-                 dataset_kwds=None, **kw):
+                 dataset_kwds=None, parallel=None, nsplits=None, **kw):
         super().__init__(_lock=lock, _filename=filename, _group=group, _dataset=dataset,
-                         _dataset_kwds=dataset_kwds, **kw)
+                         _dataset_kwds=dataset_kwds, _parallel=parallel,
+                         _nsplits=nsplits, **kw)
 
     @property
     def input(self):
@@ -70,6 +77,14 @@ class TensorHDF5DataStore(TensorDataStore):
     def out_shape(self):
         return self._out_shape
 
+    @property
+    def parallel(self):
+        return self._parallel
+
+    @property
+    def nsplits(self):
+        return self._nsplits
+
     @property
     def path(self):
         paths = []
@@ -105,6 +120,9 @@ class TensorHDF5DataStore(TensorDataStore):
             return new_op.new_tensors(op.inputs, shape=(0,) * in_tensor.ndim,
                                       nsplits=nsplits, chunks=[out_chunk])
 
+        if op.parallel:
+            return cls._tile_parallel(op)
+
         # hdf5 cannot write concurrently,
         # thus create a SuccessorsExclusive to control the concurrency
         exclusive_chunk = SuccessorsExclusive(on=in_tensor.key).new_chunk(in_tensor.chunks)
@@ -125,10 +143,79 @@ class TensorHDF5DataStore(TensorDataStore):
                                   nsplits=nsplits,
                                   chunks=out_chunks)
 
+    @classmethod
+    def _tile_parallel(cls, op):
+        in_tensor = op.input
+
+        # every chunk is written into a file of its own without locks,
+        # then a virtual dataset stitching these files is created
+        map_chunks = []
+        acc = [[0] + np.cumsum(ns).tolist() for ns in in_tensor.nsplits]
+        for chunk in in_tensor.chunks:
+            chunk_op = op.copy().reset_key()
+            chunk_op._stage = OperandStage.map
+            chunk_op._out_shape = in_tensor.shape
+            chunk_op._axis_offsets = tuple(acc[ax][i] for ax, i in enumerate(chunk.index))
+            map_chunks.append(chunk_op.new_chunk([chunk], shape=(0,) * chunk.ndim,
+                                                 index=chunk.index))
+
+        chunk_op = op.copy().reset_key()
+        chunk_op._stage = OperandStage.agg
+        chunk_op._dtype = in_tensor.dtype
+        chunk_op._out_shape = in_tensor.shape
+        chunk_op._nsplits = in_tensor.nsplits
+        out_chunk = chunk_op.new_chunk(map_chunks, shape=(0,) * in_tensor.ndim,
+                                       index=(0,) * in_tensor.ndim)
+
+        new_op = op.copy()
+        return new_op.new_tensors(op.inputs, shape=(0,) * in_tensor.ndim,
+                                  nsplits=((0,),) * in_tensor.ndim, chunks=[out_chunk])
+
+    @classmethod
+    def _execute_map(cls, ctx, op):
+        import h5py
+
+        to_store = ctx[op.inputs[0].key]
+        part_filename = get_part_filename(op.filename, op.path, op.outputs[0].index)
+        dataset_kwds = op.dataset_kwds.copy()
+        if isinstance(dataset_kwds.get('chunks'), (tuple, list)):
+            # storage chunks cannot be larger than the part
+            dataset_kwds['chunks'] = tuple(max(min(c, s), 1) for c, s
+                                           in zip(dataset_kwds['chunks'], to_store.shape))
+        with h5py.File(open_file(part_filename, mode='wb'), mode='w') as f:
+            f.create_dataset(op.path, data=to_store, **dataset_kwds)
+        ctx[op.outputs[0].key] = np.empty((0,) * to_store.ndim, dtype=to_store.dtype)
+
+    @classmethod
+    def _execute_agg(cls, ctx, op):
+        import h5py
+
+        layout = h5py.VirtualLayout(shape=op.out_shape, dtype=op.dtype)
+        acc = [[0] + np.cumsum(ns).tolist() for ns in op.nsplits]
+        for index in itertools.product(*(range(len(ns)) for ns in op.nsplits)):
+            part_filename = get_part_filename(op.filename, op.path, index)
+            shape = tuple(ns[i] for ns, i in zip(op.nsplits, index))
+            # refer to parts relatively, thus files can be moved together
+            source = h5py.VirtualSource(os.path.basename(part_filename), op.path,
+                                        shape=shape, dtype=op.dtype)
+            layout[tuple(slice(acc[ax][i], acc[ax][i] + size)
+                         for ax, (i, size) in enumerate(zip(index, shape)))] = source
+
+        with h5py.File(open_file(op.filename, mode='r+b'), mode='r+') as f:
+            if op.path in f:
+                del f[op.path]
+            f.create_virtual_dataset(op.path, layout)
+        ctx[op.outputs[0].key] = np.empty((0,) * len(op.out_shape), dtype=op.dtype)
+
     @classmethod
     def execute(cls, ctx, op):
         import h5py
 
+        if op.stage == OperandStage.map:
+            return cls._execute_map(ctx, op)
+        elif op.stage == OperandStage.agg:
+            return cls._execute_agg(ctx, op)
+
         to_store = ctx[op.inputs[0].key]
         lock = None
         axis_offsets = op.axis_offsets
@@ -158,7 +245,22 @@ class TensorHDF5DataStore(TensorDataStore):
                 lock.release()
 
 
-def tohdf5(hdf5_file, x, group=None, dataset=None, **kwds):
+def get_part_filename(filename, path, index):
+    """
+    Get name of the file which a chunk is written into in parallel mode,
+    files of chunks lie beside the file of the virtual dataset.
+    """
+    return '{0}.{1}.{2}.h5'.format(filename, path.strip('/').replace('/', '.'),
+                                   '_'.join(str(i) for i in index))
+
+
+def _is_local_path(path):
+    scheme = urlparse(path).scheme
+    # len == 1 for windows drives
+    return scheme in ('', 'file') or len(scheme) == 1
+
+
+def tohdf5(hdf5_file, x, group=None, dataset=None, parallel=False, **kwds):
     import h5py
 
     x = astensor(x)
@@ -179,6 +281,12 @@ def tohdf5(hdf5_file, x, group=None, dataset=None, **kwds):
                         'expect str, h5py.File or h5py.Dataset, '
                         'got {}'.format(type(hdf5_file)))
 
+    if parallel and not _is_local_path(filename):
+        # parts are referred by relative paths in the virtual dataset,
+        # which can only be resolved by HDF5 on local file systems
+        raise ValueError('`parallel` is only supported for local files, '
+                         'got {}'.format(filename))
+
     op = TensorHDF5DataStore(filename=filename, group=group, dataset=dataset,
-                             dataset_kwds=kwds)
+                             dataset_kwds=kwds, parallel=parallel)
     return op(x)
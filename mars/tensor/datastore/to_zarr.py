@@ -22,6 +22,7 @@ from ...serialize import ValueType, KeyField, StringField, BytesField, TupleFiel
 from ...filesystem import get_fs, FSMap
 from ...tiles import TilesError
 from ...utils import check_chunks_unknown_shape
+from ..utils import align_nsplits, recursive_tile
 from .core import TensorDataStore
 
 
@@ -94,6 +95,14 @@ class TensorToZarrDataStore(TensorDataStore):
         check_chunks_unknown_shape(op.inputs, TilesError)
         in_tensor = op.input
 
+        zarr_options = op.zarr_options.todict().copy()
+        chunks = _normalize_zarr_chunks(in_tensor, zarr_options.pop('chunks', None))
+        # align chunks to the grid of zarr chunks, thus every zarr chunk
+        # is written by exactly one chunk and writes need no coordination
+        nsplits = align_nsplits(in_tensor.nsplits, chunks)
+        if nsplits != in_tensor.nsplits:
+            in_tensor = recursive_tile(in_tensor.rechunk(nsplits))
+
         # create dataset
         fs = get_fs(op.path, None)
         path = op.path
@@ -102,8 +111,7 @@ class TensorToZarrDataStore(TensorDataStore):
         fs_map = FSMap(path, fs)
         zarr.open(fs_map, 'w', path=op.dataset,
                   dtype=in_tensor.dtype, shape=in_tensor.shape,
-                  chunks=tuple(max(ns) for ns in in_tensor.nsplits),
-                  **op.zarr_options.todict())
+                  chunks=chunks, **zarr_options)
 
         cum_nsplits = [[0] + np.cumsum(ns).tolist() for ns in in_tensor.nsplits]
         out_chunks = []
@@ -142,6 +150,16 @@ class TensorToZarrDataStore(TensorDataStore):
                                           dtype=to_store.dtype)
 
 
+def _normalize_zarr_chunks(tensor, chunks):
+    if chunks is None:
+        return tuple(max(ns) for ns in tensor.nsplits)
+    if isinstance(chunks, int):
+        chunks = (chunks,) * tensor.ndim
+    # None or -1 means a zarr chunk spans the whole dimension
+    return tuple(max(s, 1) if c is None or c == -1 else int(c)
+                 for s, c in zip(tensor.shape, chunks))
+
+
 def tozarr(path, x, group=None, dataset=None, **zarr_options):
     import zarr
 
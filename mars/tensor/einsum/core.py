@@ -25,7 +25,7 @@ from ..array_utils import as_same_device, device
 from ..arithmetic.utils import tree_add
 from ..core import TensorOrder
 from ..operands import TensorOperand, TensorOperandMixin
-from ..utils import decide_unify_split
+from ..utils import decide_unify_split, recursive_tile
 from .einsumfunc import parse_einsum_input, einsum_path
 
 
@@ -70,8 +70,48 @@ class TensorEinsum(TensorOperand, TensorOperandMixin):
                 order = TensorOrder.F_ORDER
         return self.new_tensor(input_tensors, shape=shape, dtype=self.dtype, order=order)
 
+    @classmethod
+    def _tile_pairwise(cls, op, contraction_list):
+        """
+        Split einsum of more than two operands into pairwise contractions
+        along the contraction path. Contractions without broadcasting are
+        evaluated by tensordot followed by transpose.
+        """
+        from ..linalg.tensordot import tensordot
+
+        out_tensor = op.outputs[0]
+        operands = list(op.inputs)
+        for contract_inds, idx_removed, einsum_str, _, blas in contraction_list:
+            tmp_operands = [operands.pop(x) for x in contract_inds]
+            if blas:
+                input_str, results_index = einsum_str.split('->')
+                input_left, input_right = input_str.split(',')
+                tensor_result = ''.join(s for s in input_left + input_right if s not in idx_removed)
+                left_pos = tuple(input_left.find(s) for s in sorted(idx_removed))
+                right_pos = tuple(input_right.find(s) for s in sorted(idx_removed))
+                result = tensordot(*tmp_operands, axes=(left_pos, right_pos))
+                if tensor_result != results_index:
+                    result = result.transpose([tensor_result.index(s) for s in results_index])
+            else:
+                result = einsum(einsum_str, *tmp_operands,
+                                dtype=np.result_type(*[t.dtype for t in tmp_operands]))
+            operands.append(result)
+
+        result = operands[0]
+        if result.dtype != out_tensor.dtype or result.order != out_tensor.order:
+            result = result.astype(out_tensor.dtype, order=out_tensor.order.value, copy=False)
+        return [recursive_tile(result)]
+
     @classmethod
     def tile(cls, op):
+        if len(op.inputs) > 2 and (op.optimize is None or op.optimize):
+            optimize = op.optimize if op.optimize is not None else 'greedy'
+            _, contraction_list = einsum_path(op.subscripts, *op.inputs,
+                                              optimize=optimize, einsum_call=True)
+            # operands cannot be contracted pairwise if all indices are kept
+            if len(contraction_list) > 1:
+                return cls._tile_pairwise(op, contraction_list)
+
         out_tensor = op.outputs[0]
         input_scripts, output_scripts = op.subscripts.split('->')
         tensor_axes = list(zip(op.inputs, input_scripts.split(',')))
@@ -145,14 +185,14 @@ class TensorEinsum(TensorOperand, TensorOperandMixin):
 
         with device(device_id):
             if xp is np:
-                ctx[op.outputs[0].key] = xp.einsum(op.subscripts, *inputs, optimize=op.optimize, dtype=op.dtype,
+                ctx[op.outputs[0].key] = xp.einsum(op.subscripts, *inputs, optimize=op.optimize or False, dtype=op.dtype,
                                                    order=op.order, casting=op.casting)
             else:
                 # Cupy doesn't support `optimize`, `order` and `casting`.
                 ctx[op.outputs[0].key] = xp.einsum(op.subscripts, *inputs, dtype=op.dtype)
 
 
-def einsum(subscripts, *operands, dtype=None, order='K', casting='safe', optimize=False):
+def einsum(subscripts, *operands, dtype=None, order='K', casting='safe', optimize=None):
     """
     Evaluates the Einstein summation convention on the operands.
 
@@ -178,6 +218,8 @@ def einsum(subscripts, *operands, dtype=None, order='K', casting='safe', optimiz
     :param casting: Controls what kind of data casting may occur. Setting this to ‘unsafe’ is not recommended,
      as it can adversely affect accumulations.
     :param optimize: Controls if intermediate optimization should occur.
+    Default is None, which means more than two operands are contracted pairwise
+    along a greedy path when tiling, while chunks are computed without optimization.
     :return: The calculation based on the Einstein summation convention.
 
     The Einstein summation convention can be used to compute
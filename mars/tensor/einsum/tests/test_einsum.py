@@ -19,6 +19,8 @@ import numpy as np
 from mars.tests.core import TestBase
 from mars.tensor.datasource import tensor
 from mars.tensor import einsum
+from mars.tensor.einsum.core import TensorEinsum
+from mars.tensor.linalg.tensordot import TensorTensorDot
 
 
 class Test(TestBase):
@@ -66,3 +68,33 @@ class Test(TestBase):
 
         t = t.tiles()
         self.assertEqual(len(t.chunks), 3)
+
+    def testEinsumPairwise(self):
+        t1 = tensor(np.random.rand(10, 20), chunk_size=5)
+        t2 = tensor(np.random.rand(20, 30), chunk_size=10)
+        t3 = tensor(np.random.rand(30, 4), chunk_size=4)
+
+        # chain of matrix products is contracted by tensordot
+        t = einsum('ij,jk,kl->li', t1, t2, t3, optimize='optimal')
+        self.assertEqual(t.shape, (4, 10))
+        graph = t.build_graph(tiled=True)
+        self.assertTrue(any(isinstance(c.op, TensorTensorDot) for c in graph))
+        self.assertFalse(any(isinstance(c.op, TensorEinsum) for c in graph))
+
+        t = einsum('ij,jk,kl->li', t1, t2, t3)
+        graph = t.build_graph(tiled=True)
+        self.assertTrue(any(isinstance(c.op, TensorTensorDot) for c in graph))
+
+        # operands are not contracted pairwise if optimization is disabled
+        t = einsum('ij,jk,kl->li', t1, t2, t3, optimize=False)
+        graph = t.build_graph(tiled=True)
+        self.assertFalse(any(isinstance(c.op, TensorTensorDot) for c in graph))
+        self.assertTrue(all(len(c.inputs) == 3 for c in graph
+                            if isinstance(c.op, TensorEinsum)))
+
+        # elementwise products cannot be split
+        t4 = tensor(np.random.rand(10, 20), chunk_size=5)
+        t = einsum('ij,ij,ij->ij', t1, t4, t4)
+        t = t.tiles()
+        self.assertIsInstance(t.chunks[0].op, TensorEinsum)
+        self.assertEqual(len(t.chunks[0].inputs), 3)
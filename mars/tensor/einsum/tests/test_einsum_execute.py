@@ -86,3 +86,24 @@ class Test(TestBase):
         res = self.executor.execute_tensor(t, concat=True)[0]
         expected = np.einsum('ajk,kl,jl,a->a', data1, data2, data3, data4, optimize='greedy')
         np.testing.assert_almost_equal(res, expected)
+
+        # contracted pairwise along the path
+        data1 = np.random.rand(10, 20)
+        data2 = np.random.rand(20, 30)
+        data3 = np.random.rand(30, 4)
+        t1 = tensor(data1, chunk_size=5)
+        t2 = tensor(data2, chunk_size=10)
+        t3 = tensor(data3, chunk_size=4)
+        for subscripts in ['ij,jk,kl->li', 'ij,jk,kl', 'ij,jk,ki->j']:
+            operands = [data1, data2, data3] if subscripts != 'ij,jk,ki->j' \
+                else [data1, data2, data2.T[:, :10]]
+            tensors = [tensor(d, chunk_size=5) for d in operands]
+            t = einsum(subscripts, *tensors, optimize='greedy')
+            res = self.executor.execute_tensor(t, concat=True)[0]
+            expected = np.einsum(subscripts, *operands)
+            np.testing.assert_almost_equal(res, expected)
+
+        t = einsum('ij,jk,kl->il', t1, t2, t3, order='F')
+        res = self.executor.execute_tensor(t, concat=True)[0]
+        np.testing.assert_almost_equal(res, data1.dot(data2).dot(data3))
+        self.assertTrue(res.flags['F_CONTIGUOUS'])
@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import importlib.util
+import os
+import sys
+import tempfile
+import threading
+
+import numpy as np
+
+from ...serialize import DataTypeField
+from ...utils import lazy_import
+from ..operands import TensorFuse
+from .. import arithmetic
+from ..base import TensorWhere, TensorAstype
+from .core import TensorFuseChunkMixin, estimate_fuse_size
+
+numba = lazy_import('numba', globals=globals())
+NUMBA_INSTALLED = numba is not None
+
+
+class TensorNumbaFuseChunk(TensorFuse, TensorFuseChunkMixin):
+    _op_type_ = None  # no opcode, cannot be serialized
+    _dtype = DataTypeField('dtype')
+
+    # use for numba-fused operand
+    def __init__(self, dtype=None, **kw):
+        super().__init__(_dtype=dtype, **kw)
+
+    @property
+    def dtype(self):
+        return getattr(self, '_dtype', None)
+
+    @classmethod
+    def execute(cls, ctx, op):
+        chunk = op.outputs[0]
+        input_keys, source = _evaluate(chunk)
+        kernel = get_kernel(source)
+
+        inputs = dict((c.key, ctx[c.key]) for c in op.inputs)
+        order = chunk.order.value
+        out = np.empty(chunk.shape, dtype=chunk.dtype, order=order)
+        args = [np.ravel(np.broadcast_to(inputs[k], chunk.shape), order=order)
+                for k in input_keys]
+        kernel(np.ravel(out, order=order), *args)
+        ctx[chunk.key] = out
+
+    @classmethod
+    def estimate_size(cls, ctx, op):
+        estimate_fuse_size(ctx, op)
+
+
+# ufuncs implemented by numba for scalars
+NB_UFUNC_OP = {
+    arithmetic.TensorAdd,
+    arithmetic.TensorSubtract,
+    arithmetic.TensorMultiply,
+    arithmetic.TensorDivide,
+    arithmetic.TensorTrueDiv,
+    arithmetic.TensorFloorDiv,
+    arithmetic.TensorMod,
+    arithmetic.TensorFMod,
+    arithmetic.TensorPower,
+    arithmetic.TensorLogAddExp,
+    arithmetic.TensorLogAddExp2,
+    arithmetic.TensorNegative,
+    arithmetic.TensorAbs,
+    arithmetic.TensorAbsolute,
+    arithmetic.TensorFabs,
+    arithmetic.TensorRint,
+    arithmetic.TensorSign,
+    arithmetic.TensorExp,
+    arithmetic.TensorExp2,
+    arithmetic.TensorLog,
+    arithmetic.TensorLog2,
+    arithmetic.TensorLog10,
+    arithmetic.TensorExpm1,
+    arithmetic.TensorLog1p,
+    arithmetic.TensorSqrt,
+    arithmetic.TensorSquare,
+    arithmetic.TensorReciprocal,
+
+    arithmetic.TensorEqual,
+    arithmetic.TensorNotEqual,
+    arithmetic.TensorLessThan,
+    arithmetic.TensorLessEqual,
+    arithmetic.TensorGreaterThan,
+    arithmetic.TensorGreaterEqual,
+
+    arithmetic.TensorSin,
+    arithmetic.TensorCos,
+    arithmetic.TensorTan,
+    arithmetic.TensorArcsin,
+    arithmetic.TensorArccos,
+    arithmetic.TensorArctan,
+    arithmetic.TensorArctan2,
+    arithmetic.TensorHypot,
+    arithmetic.TensorSinh,
+    arithmetic.TensorCosh,
+    arithmetic.TensorTanh,
+    arithmetic.TensorArcsinh,
+    arithmetic.TensorArccosh,
+    arithmetic.TensorArctanh,
+    arithmetic.TensorDeg2rad,
+    arithmetic.TensorRad2deg,
+    arithmetic.TensorDegrees,
+    arithmetic.TensorRadians,
+
+    arithmetic.TensorBitand,
+    arithmetic.TensorBitor,
+    arithmetic.TensorBitxor,
+    arithmetic.TensorInvert,
+    arithmetic.TensorLshift,
+    arithmetic.TensorRshift,
+    arithmetic.TensorAnd,
+    arithmetic.TensorOr,
+    arithmetic.TensorXor,
+    arithmetic.TensorNot,
+
+    arithmetic.TensorMaximum,
+    arithmetic.TensorMinimum,
+    arithmetic.TensorFMax,
+    arithmetic.TensorFMin,
+    arithmetic.TensorFloor,
+    arithmetic.TensorCeil,
+    arithmetic.TensorTrunc,
+    arithmetic.TensorIsFinite,
+    arithmetic.TensorIsInf,
+    arithmetic.TensorIsNan,
+    arithmetic.TensorSignbit,
+    arithmetic.TensorCopysign,
+}
+
+NB_TREE_OP_TO_STRING = {
+    arithmetic.TensorTreeAdd: '+',
+    arithmetic.TensorTreeMultiply: '*',
+}
+
+SUPPORT_OP = NB_UFUNC_OP | set(NB_TREE_OP_TO_STRING) | \
+    {arithmetic.TensorClip, TensorWhere, TensorAstype}
+
+
+def support(node):
+    if not NUMBA_INSTALLED:
+        return False
+    op = node.op
+    if type(op) not in SUPPORT_OP or op.gpu or op.sparse:
+        return False
+    if len(op.outputs) != 1 or node.dtype is None or node.dtype.kind not in 'biuf':
+        return False
+    if getattr(op, 'out', None) is not None or getattr(op, 'where', None) is not None:
+        return False
+    # inputs should be numerical, scalars are inlined into kernels
+    return all(inp.dtype is not None and inp.dtype.kind in 'biuf' for inp in op.inputs)
+
+
+_VAR_FLAG = 'a'
+
+_kernel_cache = dict()
+_kernel_lock = threading.Lock()
+
+_KERNEL_TEMPLATE = '''import numba
+import numpy as np
+
+
+@numba.njit(nogil=True, parallel=True, cache=True, error_model='numpy')
+def kernel(out, {args}):
+    for i in numba.prange(out.shape[0]):
+        out[i] = {expr}
+'''
+
+
+def _scalar_repr(x):
+    x = np.asarray(x).item()
+    if isinstance(x, float) and not np.isfinite(x):
+        return '-np.inf' if x < 0 else ('np.inf' if x > 0 else 'np.nan')
+    return repr(x)
+
+
+def _cast(dtype, expr):
+    return 'np.{0}({1})'.format(np.dtype(dtype).type.__name__, expr)
+
+
+def _evaluate(chunk):
+    """
+    Generate source of a kernel evaluating a fused chunk elementwise.
+    Inputs are named by their positions, thus chunks with the same fused
+    operands share one kernel.
+
+    :return: keys of inputs passed to the kernel, source of the kernel
+    """
+    input_keys = []
+    body = dict()
+    for inp in chunk.op.inputs:
+        if inp.key not in body:
+            body[inp.key] = '{0}{1}[i]'.format(_VAR_FLAG, len(input_keys))
+            input_keys.append(inp.key)
+
+    def _get(x):
+        if hasattr(x, 'key') and x.key in body:
+            return body[x.key]
+        return _scalar_repr(x)
+
+    for node in chunk.composed:
+        op = node.op
+        op_type = type(op)
+        if op_type in NB_UFUNC_OP:
+            if hasattr(op, 'lhs'):
+                args = [_get(op.lhs), _get(op.rhs)]
+            else:
+                args = [_get(op.inputs[0])]
+            expr = 'np.{0}({1})'.format(op._func_name, ', '.join(args))
+        elif op_type in NB_TREE_OP_TO_STRING:
+            expr = NB_TREE_OP_TO_STRING[op_type].join(_get(c) for c in op.inputs)
+        elif op_type is arithmetic.TensorClip:
+            expr = _get(op.a)
+            if op.a_min is not None:
+                expr = 'np.maximum({0}, {1})'.format(expr, _get(op.a_min))
+            if op.a_max is not None:
+                expr = 'np.minimum({0}, {1})'.format(expr, _get(op.a_max))
+        elif op_type is TensorWhere:
+            expr = '({1} if {0} else {2})'.format(
+                _get(op.condition), _get(op.x), _get(op.y))
+        elif op_type is TensorAstype:
+            expr = _get(op.inputs[0])
+        else:  # pragma: no cover
+            raise TypeError('unsupported operator in numba: {}'.format(op_type.__name__))
+        # keep dtype of every intermediate result identical with numpy
+        body[node.key] = _cast(node.dtype, expr)
+
+    args = ', '.join('{0}{1}'.format(_VAR_FLAG, i) for i in range(len(input_keys)))
+    source = _KERNEL_TEMPLATE.format(args=args, expr=body[chunk.composed[-1].key])
+    return input_keys, source
+
+
+def _get_kernel_dir():
+    cache_dir = numba.config.CACHE_DIR or tempfile.gettempdir()
+    kernel_dir = os.path.join(cache_dir, 'mars_numba_kernels')
+    os.makedirs(kernel_dir, exist_ok=True)
+    return kernel_dir
+
+
+def _load_kernel(source):
+    """
+    Write the source into a file named by its hash under the numba cache
+    directory and import the kernel from it. As numba caches compiled
+    kernels beside their source files, workers sharing the directory
+    compile every kernel only once.
+    """
+    module_name = 'mars_nb_kernel_' + hashlib.sha1(source.encode()).hexdigest()
+    path = os.path.join(_get_kernel_dir(), module_name + '.py')
+    if not os.path.exists(path):
+        # write into a temp file first as other processes may read the file
+        fd, tmp_path = tempfile.mkstemp(suffix='.py', dir=os.path.dirname(path))
+        with os.fdopen(fd, 'w') as f:
+            f.write(source)
+        os.replace(tmp_path, path)
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    # numba resolves globals of cached kernels by module name
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module.kernel
+
+
+def get_kernel(source):
+    """
+    Get compiled kernel of the source. Kernels are cached in the process
+    as well as on disk, thus chunks sharing the same source are compiled
+    once across processes.
+    """
+    try:
+        return _kernel_cache[source]
+    except KeyError:
+        pass
+
+    with _kernel_lock:
+        if source in _kernel_cache:
+            return _kernel_cache[source]
+        kernel = _kernel_cache[source] = _load_kernel(source)
+        return kernel
@@ -14,17 +14,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import sys
 import threading
 
 try:
     import numexpr as ne
+    from numexpr.necompiler import getType as _get_ne_type
     NUMEXPR_INSTALLED = True
 except ImportError:
     ne = None
+    _get_ne_type = None
     NUMEXPR_INSTALLED = False
 import numpy as np
 
+from ...operands import OperandStage
 from ...serialize import DataTypeField
 from ..operands import TensorFuse
 from .. import arithmetic, reduction
@@ -52,19 +56,30 @@ class TensorNeFuseChunk(TensorFuse, TensorFuseChunkMixin):
         return getattr(self, '_dtype', None)
 
     @classmethod
-    def execute(cls, ctx, op):
-        chunk = op.outputs[0]
-        inputs = as_same_device([ctx[c.key] for c in op.inputs], device=op.device)
-        for c, i in zip(op.inputs, inputs):
-            exec('V_' + c.key + ' = i')
-        expr = _evaluate(chunk)
+    def _evaluate(cls, expr, input_chunks, inputs):
         if cls._lock is not None:
             cls._lock.acquire()
         try:
-            res = ne.evaluate(expr)
+            return evaluate_template(expr, [c.key for c in input_chunks], inputs)
         finally:
             if cls._lock is not None:
                 cls._lock.release()
+
+    @classmethod
+    def execute(cls, ctx, op):
+        chunk = op.outputs[0]
+        inputs = as_same_device([ctx[c.key] for c in op.inputs], device=op.device)
+        out_chunk = chunk.composed[-1]
+        if type(out_chunk.op) in REDUCTION_OP and not is_ne_reduction(out_chunk):
+            # evaluate elementwise operands by numexpr, then reduce the result
+            # by the reduction operand itself, which handles all stages
+            res = cls._evaluate(_compose_expr(chunk.composed[:-1]), op.inputs, inputs)
+            reduction_ctx = {out_chunk.inputs[0].key: res}
+            type(out_chunk.op).execute(reduction_ctx, out_chunk.op)
+            ctx[chunk.key] = reduction_ctx[out_chunk.key]
+            return
+
+        res = cls._evaluate(_evaluate(chunk), op.inputs, inputs)
         res = _maybe_keepdims(chunk, res)
         if chunk.ndim == 0 and res.ndim == 1 and res.size == 0:
             res = res.dtype.type(0)
@@ -134,6 +149,47 @@ NE_REDUCTION_TO_STRING = {
     reduction.TensorMin: 'min'
 }
 
+# reductions which can be fused after elementwise operands,
+# those not supported by numexpr are applied on results of numexpr
+REDUCTION_OP = set(NE_REDUCTION_TO_STRING) | {reduction.TensorMean}
+
+
+def is_ne_reduction(chunk):
+    """
+    Check if a reduction can be encoded in numexpr, which only reduces
+    outputs along one axis or all axes.
+    """
+    op = chunk.op
+    if type(op) not in NE_REDUCTION_TO_STRING or op.stage not in (None, OperandStage.agg):
+        return False
+    return len(op.axis) == 1 or len(op.axis) == chunk.inputs[0].ndim
+
+
+@functools.lru_cache(512)
+def _compile(expr, signature):
+    return ne.NumExpr(expr, signature)
+
+
+def evaluate_template(expr, input_keys, inputs):
+    """
+    Evaluate an expression whose variables are named by keys of inputs.
+
+    Variables are renamed by positions of inputs, thus expressions of
+    chunks with the same fused operands share one template, which is
+    compiled only once.
+    """
+    names = dict()
+    args = []
+    for key, inp in zip(input_keys, inputs):
+        if key not in names:
+            names[key] = 'V%d' % len(names)
+            args.append(np.asarray(inp))
+    # replace longer keys first in case that a key is a prefix of another
+    for key in sorted(names, key=len, reverse=True):
+        expr = expr.replace(_VAR_FLAG + key, names[key])
+    signature = tuple((names[key], _get_ne_type(arg)) for key, arg in zip(names, args))
+    return _compile(expr, signature)(*args)
+
 
 def _handle_unary(chunk):
     if len(chunk.inputs) != 1:
@@ -144,14 +200,18 @@ def _handle_unary(chunk):
     return _expr
 
 
-def _decompose(chunk):
-    expr = _VAR_FLAG + chunk.key
-    for node, op in zip(reversed(chunk.composed), reversed(chunk.op.operands)):
+def _compose_expr(composed):
+    expr = _VAR_FLAG + composed[-1].key
+    for node in reversed(composed):
         _expr = _evaluate(node)
         expr = expr.replace(_VAR_FLAG + node.key, '({})'.format(_expr))
     return expr
 
 
+def _decompose(chunk):
+    return _compose_expr(chunk.composed)
+
+
 def _handle_bin(chunk):
     lhs = str(chunk.op.lhs) if np.isscalar(chunk.op.lhs) else _VAR_FLAG + chunk.op.lhs.key
     rhs = str(chunk.op.rhs) if np.isscalar(chunk.op.rhs) else _VAR_FLAG + chunk.op.rhs.key
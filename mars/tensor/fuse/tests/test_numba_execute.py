@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 1999-2020 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import numpy as np
+
+import mars.tensor as mt
+from mars.executor import Executor
+from mars.tensor.datasource import tensor
+from mars.tensor.fuse.nb import NUMBA_INSTALLED, TensorNumbaFuseChunk, _evaluate, \
+    _kernel_cache, _get_kernel_dir, _load_kernel, _KERNEL_TEMPLATE
+from mars.tiles import get_tiled
+from mars.optimizes.runtime.optimizers.core import Optimizer
+
+
+@unittest.skipIf(not NUMBA_INSTALLED, 'numba not installed')
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.executor = Executor('numba')
+        self.executor_numpy = Executor('numpy')
+
+    def testCompose(self):
+        t1 = tensor(np.random.rand(10, 10), chunk_size=5)
+        t2 = tensor(np.random.rand(10), chunk_size=5)
+        t = mt.where(mt.isnan(t1), 0, mt.clip(t1 // t2, 0, 3)).astype(np.float32)
+
+        g = t.build_graph(tiled=True)
+        result_keys = [c.key for c in get_tiled(t).chunks]
+        Optimizer(g, 'numba').optimize(result_keys)
+        fused = [n for n in g if isinstance(n.op, TensorNumbaFuseChunk)]
+        self.assertTrue(all(isinstance(n.op, TensorNumbaFuseChunk)
+                            for n in g if n.key in result_keys))
+
+        # chunks with the same fused operands share one kernel
+        sources = dict()
+        for n in fused:
+            sources.setdefault(tuple(type(c.op) for c in n.composed), set()).add(_evaluate(n)[1])
+        self.assertTrue(all(len(s) == 1 for s in sources.values()))
+
+    def testElementwiseExecution(self):
+        raw1 = np.random.rand(10, 10)
+        raw1[raw1 < 0.1] = np.nan
+        raw2 = np.random.randint(1, 10, size=(10,))
+        t1 = tensor(raw1, chunk_size=4)
+        t2 = tensor(raw2, chunk_size=4)
+
+        t = mt.where(mt.isnan(t1), 0, mt.clip(t1 * 10 // t2, 0, 3)).astype(np.float32)
+        res = self.executor.execute_tensor(t, concat=True)[0]
+        expected = np.where(np.isnan(raw1), 0, np.clip(raw1 * 10 // raw2, 0, 3)).astype(np.float32)
+        np.testing.assert_array_equal(res, expected)
+        self.assertEqual(res.dtype, expected.dtype)
+        # kernels are cached in memory and written into the cache directory
+        self.assertGreater(len(_kernel_cache), 0)
+        source = next(iter(_kernel_cache))
+        paths = [os.path.join(_get_kernel_dir(), fn) for fn in os.listdir(_get_kernel_dir())
+                 if fn.endswith('.py')]
+        self.assertIn(source, [open(p).read() for p in paths])
+        # kernels loaded again from the cache directory work as well
+        source = _KERNEL_TEMPLATE.format(args='a0, a1', expr='np.float64(a0[i] * 2 + a1[i])')
+        for _ in range(2):
+            out = np.empty(3)
+            _load_kernel(source)(out, np.array([1., 2., 3.]), np.array([1, 2, 1]))
+            np.testing.assert_array_equal(out, np.array([3., 6., 7.]))
+
+        raw3 = np.asfortranarray(np.random.randint(10, size=(4, 5, 6)))
+        t3 = tensor(raw3, chunk_size=2)
+        t = (t3 % 3 + (t3 > 5)) * 2
+        res = self.executor.execute_tensor(t, concat=True)[0]
+        np.testing.assert_array_equal(res, (raw3 % 3 + (raw3 > 5)) * 2)
+        self.assertEqual(res.flags['F_CONTIGUOUS'], True)
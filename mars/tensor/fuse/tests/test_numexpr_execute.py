@@ -154,6 +154,34 @@ class Test(unittest.TestCase):
         self.assertTrue(np.array_equal(raw3.max(axis=(0, 1)), res3[0]))
         self.assertTrue(np.array_equal(raw3.min(axis=(0, 1)), res4[0]))
 
+    def testFusedReductionExecution(self):
+        from mars.tensor.fuse.ne import _compile
+
+        raw1 = np.random.rand(8, 8, 8)
+        raw2 = np.random.rand(8, 8, 8)
+        arr1 = tensor(raw1, chunk_size=3)
+        arr2 = tensor(raw2, chunk_size=3)
+
+        # reductions over multiple axes cannot be encoded in numexpr
+        res1 = self.executor.execute_tensor((arr1 * 2 + arr2).sum(axis=(0, 2)), concat=True)
+        res2 = self.executor.execute_tensor((arr1 * 2 + arr2).max(axis=(1, 2), keepdims=True),
+                                            concat=True)
+        np.testing.assert_allclose(res1[0], (raw1 * 2 + raw2).sum(axis=(0, 2)))
+        np.testing.assert_allclose(res2[0], (raw1 * 2 + raw2).max(axis=(1, 2), keepdims=True))
+
+        _compile.cache_clear()
+        res = self.executor.execute_tensor((arr1 - arr2).mean(axis=(0, 1)), concat=True)
+        np.testing.assert_allclose(res[0], (raw1 - raw2).mean(axis=(0, 1)))
+        res = self.executor.execute_tensor((arr1 - 1).mean())
+        np.testing.assert_allclose(res[0], (raw1 - 1).mean())
+        # templates of fused chunks are compiled only once
+        self.assertGreater(_compile.cache_info().hits, 0)
+
+        raw = np.random.rand(10)
+        arr = tensor(raw, chunk_size=10)
+        res = self.executor.execute_tensor(abs(arr - 0.5).mean())
+        np.testing.assert_allclose(res[0], abs(raw - 0.5).mean())
+
     def testBoolReductionExecution(self):
         raw = np.random.randint(5, size=(8, 8, 8))
         arr = tensor(raw, chunk_size=2)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import itertools
+import weakref
 from abc import ABC, abstractmethod
 from collections import OrderedDict, namedtuple
 from enum import Enum
@@ -22,15 +23,20 @@ from numbers import Integral
 
 import numpy as np
 
+from ...config import options
+from ...context import get_context
 from ...core import TileableEntity
 from ...operands import OperandStage
-from ...tiles import TilesError
+from ...tiles import TilesError, is_iterative_tiling
 from ...utils import check_chunks_unknown_shape, calc_nsplits, merge_chunks
 from ..core import TENSOR_TYPE, Chunk, TensorOrder
 from ..operands import TensorShuffleProxy
 from ..utils import slice_split, calc_sliced_size, broadcast_shape, unify_chunks, \
     split_indexes_into_chunks, filter_inputs, calc_pos, recursive_tile
 
+# chunks calculating bounds of fancy indexes, executed before tiling again
+_op_to_fancy_index_bounds_chunks = weakref.WeakKeyDictionary()
+
 
 class IndexType(Enum):
     new_axis = 0
@@ -75,6 +81,10 @@ class FancyIndexInfo(IndexInfo):
         #   - chunk_index_to_raw_positions
         #   - is_fancy_index_asc_sorted
         self.split_info = None
+        # gather info
+        #   - chunk_index_to_input_chunk_range
+        #   - input_chunk_index_to_output_position
+        self.gather_info = None
 
 
 ChunkIndexAxisInfo = namedtuple(
@@ -660,6 +670,13 @@ class TensorFancyIndexHandler(_FancyIndexHandler):
             list(info.raw_index for info in fancy_index_infos)
         check_chunks_unknown_shape(to_check, TilesError)
 
+        if len(fancy_index_infos) == 1 and index_info.raw_index.ndim == 1:
+            gather_info = self._plan_gather(index_info, context)
+            if gather_info is not None:
+                index_info.shape_unified_index = index_info.raw_index
+                index_info.gather_info = gather_info
+                return
+
         # unify shapes of all fancy indexes
         shape = broadcast_shape(
             *(info.raw_index.shape for info in fancy_index_infos))
@@ -683,6 +700,88 @@ class TensorFancyIndexHandler(_FancyIndexHandler):
         self._shuffle_fancy_indexes(concat_fancy_index, context,
                                     index_info, fancy_index_axes)
 
+    @classmethod
+    def _get_index_chunk_bounds(cls,
+                                index: TileableEntity,
+                                context: IndexHandlerContext):
+        from ..datasource.array import ArrayDataSource
+        from ..reduction import TensorMax, TensorMin
+
+        chunks = [c for c in index.chunks if c.size > 0]
+        if all(isinstance(c.op, ArrayDataSource) for c in chunks):
+            # values of index are known when tiling
+            return {c.index: (int(c.op.data.min()), int(c.op.data.max()))
+                    for c in chunks}
+
+        ctx = get_context()
+        if not options.fancy_index.calc_gather_bounds or ctx is None or \
+                not is_iterative_tiling(context.op.outputs[0]):
+            return
+
+        op = context.op
+        bounds_chunks = _op_to_fancy_index_bounds_chunks.pop(op, None)
+        if bounds_chunks is None:
+            bounds_chunks = []
+            for c in chunks:
+                for op_type in (TensorMin, TensorMax):
+                    bounds_op = op_type(axis=(0,), dtype=c.dtype, keepdims=True)
+                    bounds_chunks.append(bounds_op.new_chunk(
+                        [c], shape=(1,), index=c.index, order=TensorOrder.C_ORDER).data)
+            _op_to_fancy_index_bounds_chunks[op] = bounds_chunks
+            err = TilesError('bounds of fancy index need to be calculated first')
+            err.partial_tiled_chunks = list(bounds_chunks)
+            raise err
+
+        keys = [c.key for c in bounds_chunks]
+        if any(meta is None for meta in ctx.get_chunk_metas(keys)):
+            # bounds lost, fall back to shuffle
+            return
+        results = ctx.get_chunk_results(keys)
+        if len(results) != 2 * len(chunks):
+            return
+        bounds = iter(int(r[0]) for r in results)
+        return {c.index: (next(bounds), next(bounds)) for c in chunks}
+
+    @classmethod
+    def _plan_gather(cls,
+                     index_info: IndexInfo,
+                     context: IndexHandlerContext):
+        """
+        Plan to gather input chunks directly for each chunk of the fancy index,
+        feasible when values in every chunk of the fancy index fall in few input
+        chunks, e.g. monotonic or clustered indexes. Return None if the fancy
+        index should be shuffled.
+        """
+        limit = options.fancy_index.gather_chunk_limit
+        if limit <= 0:
+            return
+
+        index = index_info.raw_index
+        bounds = cls._get_index_chunk_bounds(index, context)
+        if bounds is None:
+            return
+
+        cum_size = np.cumsum((0,) + context.tileable.nsplits[index_info.input_axis])
+        chunk_index_to_range = OrderedDict()
+        for c in index.chunks:
+            if c.index not in bounds:
+                # empty chunk of index, gather from first input chunk
+                chunk_index_to_range[c.index] = (0, 1)
+                continue
+            low, high = bounds[c.index]
+            if low < 0 or high >= cum_size[-1]:
+                # leave negative and out-of-bound indexes to shuffle
+                return
+            start = int(np.searchsorted(cum_size, low, side='right')) - 1
+            stop = int(np.searchsorted(cum_size, high, side='right'))
+            if stop - start > limit:
+                return
+            chunk_index_to_range[c.index] = (start, stop)
+
+        effected = sorted(set(itertools.chain(
+            *(range(start, stop) for start, stop in chunk_index_to_range.values()))))
+        return chunk_index_to_range, {i: pos for pos, i in enumerate(effected)}
+
     @classmethod
     def _shuffle_fancy_indexes(cls,
                                concat_fancy_index: TileableEntity,
@@ -735,6 +834,9 @@ class TensorFancyIndexHandler(_FancyIndexHandler):
                 index_info: IndexInfo,
                 context: IndexHandlerContext) -> None:
         fancy_index_infos = context.get_indexes(index_info.index_type)
+        if fancy_index_infos[0].gather_info is not None:
+            return self._process_gather(index_info, context)
+
         fancy_index_axes = [info.input_axis for info in fancy_index_infos]
         split_info = fancy_index_infos[0].split_info
         chunk_index_to_fancy_index_chunks = split_info[0]
@@ -760,6 +862,78 @@ class TensorFancyIndexHandler(_FancyIndexHandler):
                                                     processed_index=fancy_index_chunk,
                                                     output_shape=output_axis_shape))
 
+    @classmethod
+    def _process_gather(cls,
+                        index_info: IndexInfo,
+                        context: IndexHandlerContext) -> None:
+        tileable = context.tileable
+        input_axis = index_info.input_axis
+
+        # keep input chunks covered by the fancy index intact on the axis,
+        # they are concatenated and taken from when postprocessing
+        input_chunk_index_to_pos = index_info.gather_info[1]
+
+        index_to_info = context.chunk_index_to_info.copy()
+        for chunk_index, chunk_index_info in index_to_info.items():
+            i = chunk_index[input_axis]
+            if i not in input_chunk_index_to_pos:
+                del context.chunk_index_to_info[chunk_index]
+                continue
+            cls.set_chunk_index_info(context, index_info, chunk_index, chunk_index_info,
+                                     input_chunk_index_to_pos[i], slice(None),
+                                     tileable.nsplits[input_axis][i])
+
+    @classmethod
+    def _postprocess_gather(cls,
+                            index_info: IndexInfo,
+                            context: IndexHandlerContext) -> None:
+        from ..arithmetic import TensorSubtract
+
+        chunks, nsplits = context.out_chunks, context.out_nsplits
+        index_to_chunks = {c.index: c for c in chunks}
+        cum_size = np.cumsum((0,) + context.tileable.nsplits[index_info.input_axis])
+        index = index_info.raw_index
+        axis = index_info.output_axis
+        chunk_index_to_range, input_chunk_index_to_pos = index_info.gather_info
+
+        # indexes on concatenated chunks are relative to the first one
+        index_chunks = []
+        for c in index.chunks:
+            offset = int(cum_size[chunk_index_to_range[c.index][0]])
+            if offset == 0:
+                index_chunks.append(c)
+            else:
+                sub_op = TensorSubtract(lhs=c, rhs=offset, dtype=c.dtype)
+                index_chunks.append(sub_op.new_chunk(
+                    [c], shape=c.shape, index=c.index, order=c.order))
+
+        out_chunks = []
+        for out_index in itertools.product(
+                *(range(len(ns)) if ax != axis else range(len(index_chunks))
+                  for ax, ns in enumerate(nsplits))):
+            index_chunk = index_chunks[out_index[axis]]
+            start, stop = chunk_index_to_range[index_chunk.index]
+            to_concat_chunks = []
+            for i in range(start, stop):
+                to_concat_index = out_index[:axis] + \
+                    (input_chunk_index_to_pos[i],) + out_index[axis + 1:]
+                to_concat_chunks.append(index_to_chunks[to_concat_index])
+            if len(to_concat_chunks) == 1:
+                concat_chunk = to_concat_chunks[0]
+            else:
+                concat_chunk = context.concat_chunks(to_concat_chunks, axis)
+
+            take_op = context.op.copy().reset_key()
+            take_op._indexes = indexes = (slice(None),) * axis + (index_chunk,)
+            out_shape = concat_chunk.shape[:axis] + index_chunk.shape + \
+                concat_chunk.shape[axis + 1:]
+            out_chunks.append(take_op.new_chunk(
+                filter_inputs([concat_chunk] + list(indexes)), shape=out_shape,
+                index=out_index, order=context.op.outputs[0].order))
+
+        context.out_chunks = out_chunks
+        context.out_nsplits = nsplits[:axis] + index.nsplits + nsplits[axis + 1:]
+
     def postprocess(self,
                     index_info: IndexInfo,
                     context: IndexHandlerContext) -> None:
@@ -772,6 +946,9 @@ class TensorFancyIndexHandler(_FancyIndexHandler):
             # only need to postprocess fancy indexes once
             return
 
+        if index_info.gather_info is not None:
+            return self._postprocess_gather(index_info, context)
+
         # current chunks and nsplits
         chunks, nsplits = context.out_chunks, context.out_nsplits
         chunk_shape = tuple(len(ns) for ns in nsplits)
@@ -18,11 +18,14 @@ import unittest
 
 import numpy as np
 
+from mars.tensor.arithmetic import TensorSubtract
 from mars.tensor.base.broadcast_to import TensorBroadcastTo
 from mars.tensor.datasource import ones, tensor, array, empty
 from mars.tensor.datasource.ones import TensorOnes
 from mars.tensor.indexing import choose, unravel_index, nonzero, \
     compress, fill_diagonal
+from mars.tensor.indexing.getitem import TensorIndex, FancyIndexingDistribute, \
+    FancyIndexingConcat
 from mars.tensor.indexing.setitem import TensorIndexSetValue
 from mars.tensor.merge.concatenate import TensorConcatenate
 from mars.config import option_context
@@ -151,6 +154,30 @@ class Test(unittest.TestCase):
         self.assertEqual(t13.chunks[0].ndim, 3)
         self.assertEqual(t13.nsplits, ((2,), (2,), (10, 5)))
 
+    def testFancyIndexingGather(self):
+        t = ones((30, 40), chunk_size=10)
+
+        # values of each index chunk fall in few chunks, gather directly
+        index = tensor([3, 1, 15, 12, 25, 11], chunk_size=2)
+        t2 = t[2:25, index].tiles()
+        self.assertEqual(t2.shape, (23, 6))
+        self.assertEqual(t2.nsplits, ((8, 10, 5), (2, 2, 2)))
+        graph = t2.build_graph(tiled=True)
+        self.assertFalse(any(isinstance(c.op, (FancyIndexingDistribute, FancyIndexingConcat))
+                             for c in graph))
+        self.assertIsInstance(t2.cix[0, 0].inputs[0].op, TensorIndex)
+        self.assertIsInstance(t2.cix[0, 2].inputs[0].op, TensorConcatenate)
+        self.assertIsInstance(t2.cix[0, 2].inputs[1].op, TensorSubtract)
+
+        # values spread over too many chunks, shuffle
+        t3 = ones((30, 100), chunk_size=10)[:, tensor([3, 99, 15, 12], chunk_size=2)].tiles()
+        self.assertEqual(t3.nsplits, ((10, 10, 10), (2, 2)))
+        self.assertIsInstance(t3.chunks[0].op, FancyIndexingConcat)
+
+        with option_context({'fancy_index.gather_chunk_limit': 0}):
+            t4 = t[2:25, index].tiles()
+            self.assertIsInstance(t4.chunks[0].op, FancyIndexingConcat)
+
     def testMixedIndexing(self):
         t = ones((100, 200, 300, 400))
 
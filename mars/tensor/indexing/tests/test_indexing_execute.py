@@ -22,7 +22,7 @@ from mars.tensor.datasource import tensor, arange, zeros
 from mars.tensor.indexing import take, compress, extract, choose, \
     unravel_index, nonzero, flatnonzero, fill_diagonal
 from mars.tensor import mod, stack, hstack
-from mars.config import options
+from mars.config import options, option_context
 from mars.tests.core import ExecutorForTest, TestBase
 
 
@@ -223,6 +223,45 @@ class Test(TestBase):
         self.assertEqual(res.flags['C_CONTIGUOUS'], expected.flags['C_CONTIGUOUS'])
         self.assertEqual(res.flags['F_CONTIGUOUS'], expected.flags['F_CONTIGUOUS'])
 
+    def testFancyIndexingGatherExecution(self):
+        from mars.tensor.indexing.getitem import TensorIndex
+
+        raw = np.random.random((30, 40))
+        arr = tensor(raw, chunk_size=(7, 10))
+
+        raw_index = [3, 1, 15, 12, 25, 11, 39, 30]
+        index = tensor(raw_index, chunk_size=2)
+        for idx, raw_idx in [((slice(None), index), (slice(None), raw_index)),
+                             ((slice(2, 25), index), (slice(2, 25), raw_index)),
+                             ((5, index), (5, raw_index)),
+                             ((index[:4], slice(3, None)), (raw_index[:4], slice(3, None)))]:
+            res = self.executor.execute_tensor(arr[idx], concat=True)[0]
+            np.testing.assert_array_equal(res, raw[raw_idx])
+
+        ctx, executor = self._create_test_context(self.executor)
+        with ctx:
+            # bounds of index are unknown, shuffle by default
+            arr2 = arr[:, index + 0]
+            res = executor.execute_tensors([arr2])[0]
+            np.testing.assert_array_equal(res, raw[:, raw_index])
+            self.assertFalse(all(isinstance(c.op, TensorIndex)
+                                 for c in get_tiled(arr2).chunks))
+
+        ctx, executor = self._create_test_context(self.executor)
+        with ctx, option_context({'fancy_index.calc_gather_bounds': True}):
+            # bounds of index are calculated first
+            arr2 = arr[:, index + 0]
+            res = executor.execute_tensors([arr2])[0]
+            np.testing.assert_array_equal(res, raw[:, raw_index])
+            self.assertTrue(all(isinstance(c.op, TensorIndex)
+                                for c in get_tiled(arr2).chunks))
+
+            # fall back to shuffle
+            raw_index2 = [39, 0, 20, 5]
+            arr3 = arr[tensor(raw_index2, chunk_size=2) - 10]
+            res = executor.execute_tensors([arr3])[0]
+            np.testing.assert_array_equal(res, raw[np.array(raw_index2) - 10])
+
     def testSliceExecution(self):
         raw = np.random.random((11, 8, 12, 14))
         arr = tensor(raw, chunk_size=3)
@@ -20,6 +20,8 @@ from collections.abc import Iterable
 import numpy as np
 
 from ... import opcodes as OperandDef
+from ...config import options
+from ...context import get_context, RunningMode
 from ...serialize import ValueType, KeyField, TupleField
 from ...utils import check_chunks_unknown_shape
 from ...tiles import TilesError
@@ -84,6 +86,51 @@ class TensorTensorDot(TensorOperand, TensorOperandMixin):
 
         ctx[chunk.key] = (chunk.nbytes, calc_usage)
 
+    @staticmethod
+    def _get_workers_and_parallelism():
+        ctx = get_context()
+        if ctx is None:
+            return None, 1
+        ncores = ctx.get_ncores() or 1
+        if ctx.running_mode != RunningMode.distributed:
+            return None, ncores
+        workers = ctx.get_worker_addresses() or []
+        return workers, max(len(workers), 1) * ncores
+
+    @staticmethod
+    def _group_contractions(pairs, n_groups, size_limit):
+        """
+        Split pairs of contraction blocks into consecutive groups whose
+        products are accumulated by single chunks. Every group holds at
+        most ``size_limit`` bytes of inputs, and pairs are split into at
+        least ``n_groups`` groups if possible to keep workers busy.
+        """
+        max_count = int(np.ceil(len(pairs) / n_groups))
+        groups, group, group_size = [], [], 0
+        for pair in pairs:
+            size = sum(c.nbytes for c in pair)
+            if group and (len(group) >= max_count or group_size + size > size_limit):
+                groups.append(group)
+                group, group_size = [], 0
+            group.append(pair)
+            group_size += size
+        if group:
+            groups.append(group)
+        return groups
+
+    @staticmethod
+    def _pick_worker(workers, a_index, b_index, group_index):
+        """
+        Workers are arranged into a grid, chunks of the same row of ``a``
+        are assigned to a row of workers and chunks of the same column of
+        ``b`` to a column, thus every panel is sent to only a few workers.
+        Groups of contraction blocks are assigned to different layers.
+        """
+        n_rows = max(int(np.sqrt(len(workers))), 1)
+        n_cols = max(len(workers) // n_rows, 1)
+        idx = (a_index % n_rows) * n_cols + b_index % n_cols + group_index * n_rows * n_cols
+        return workers[idx % len(workers)]
+
     @classmethod
     def tile(cls, op):
         a, b, a_axes, b_axes = op.a, op.b, op.a_axes, op.b_axes
@@ -100,6 +147,22 @@ class TensorTensorDot(TensorOperand, TensorOperandMixin):
         output_axes = [(0, i) for i in range(a.ndim) if i not in a_axes] + \
                       [(1, i) for i in range(b.ndim) if i not in b_axes]
 
+        # sparse products are summed by tree add
+        accumulate = options.tensordot.accumulate and not op.sparse
+        if accumulate:
+            workers, parallelism = cls._get_workers_and_parallelism()
+            if not options.tensordot.pin_workers:
+                workers = None
+            n_outputs = int(np.prod([len(r) for r in itertools.chain(a_output_indexes, b_output_indexes)]))
+            n_contractions = int(np.prod([len(a.nsplits[ax]) for ax in a_axes]))
+            # split contractions when output chunks are not enough for all workers
+            n_groups = min(max(int(np.ceil(parallelism / n_outputs)), 1), n_contractions)
+            panel_size_limit = options.tensordot.panel_size_limit or options.chunk_store_limit
+        else:
+            workers, n_groups, panel_size_limit = None, None, None
+
+        a_output_shape = tuple(len(r) for r in a_output_indexes)
+        b_output_shape = tuple(len(r) for r in b_output_indexes)
         out_chunks = []
         for out_idx in itertools.product(*itertools.chain(a_output_indexes, b_output_indexes)):
             a_indexes = [None] * a.ndim
@@ -112,18 +175,32 @@ class TensorTensorDot(TensorOperand, TensorOperandMixin):
                 tensor_shape.append(t.nsplits[axis][idx])
             tensor_shape = tuple(tensor_shape)
 
-            tensordot_chunks = []
+            pairs = []
             for contract_indexes in itertools.product(*[range(len(a.nsplits[ax])) for ax in a_axes]):
                 a_indices, b_indices = list(a_indexes), list(b_indexes)
                 for a_axis, contract_index in zip(a_axes, contract_indexes):
                     a_indices[a_axis] = contract_index
                 for b_axis, contract_index in zip(b_axes, contract_indexes):
                     b_indices[b_axis] = contract_index
+                pairs.append((a.cix[tuple(a_indices)], b.cix[tuple(b_indices)]))
+
+            if accumulate:
+                groups = cls._group_contractions(pairs, n_groups, panel_size_limit)
+            else:
+                groups = [[pair] for pair in pairs]
 
+            tensordot_chunks = []
+            for group_index, group in enumerate(groups):
                 tensordot_chunk_op = op.copy().reset_key()
+                if workers:
+                    a_index = int(np.ravel_multi_index(out_idx[:len(a_output_shape)], a_output_shape)) \
+                        if a_output_shape else 0
+                    b_index = int(np.ravel_multi_index(out_idx[len(a_output_shape):], b_output_shape)) \
+                        if b_output_shape else 0
+                    tensordot_chunk_op._expect_worker = \
+                        cls._pick_worker(workers, a_index, b_index, group_index)
                 tensordot_chunk = tensordot_chunk_op.new_chunk(
-                    [a.cix[tuple(a_indices)], b.cix[tuple(b_indices)]],
-                    shape=tensor_shape, order=out.order)
+                    list(itertools.chain.from_iterable(group)), shape=tensor_shape, order=out.order)
                 tensordot_chunks.append(tensordot_chunk)
 
             if len(tensordot_chunks) == 1:
@@ -134,24 +211,30 @@ class TensorTensorDot(TensorOperand, TensorOperandMixin):
                 chunk = tree_add(op.dtype, tensordot_chunks, out_idx, tensor_shape, sparse=op.sparse)
             out_chunks.append(chunk)
 
-        get_nsplits = lambda t_idx, i: (a, b)[t_idx].nsplits[i]
-        nsplits = [get_nsplits(*it) for it in output_axes]
+        nsplits = [(a, b)[t_idx].nsplits[i] for t_idx, i in output_axes]
         new_op = op.copy()
         return new_op.new_tensors([a, b], out.shape,
                                   chunks=out_chunks, nsplits=nsplits)
 
     @classmethod
     def execute(cls, ctx, op):
-        (a, b), device_id, xp = as_same_device(
+        inputs, device_id, xp = as_same_device(
             [ctx[c.key] for c in op.inputs], device=op.device, ret_extra=True)
 
         axes = op.a_axes, op.b_axes
         with device(device_id):
-            if not op.sparse and is_sparse_module(xp):
-                # tell sparse to do calculation on numpy or cupy dot
-                ctx[op.outputs[0].key] = xp.tensordot(a, b, axes, sparse=False)
+            to_dense = not op.sparse and is_sparse_module(xp)
+            # tell sparse to do calculation on numpy or cupy dot
+            kw = {'sparse': False} if to_dense else {}
+
+            ret = xp.tensordot(inputs[0], inputs[1], axes, **kw)
+            # accumulate products of contraction blocks in place
+            for a, b in zip(inputs[2::2], inputs[3::2]):
+                ret += xp.tensordot(a, b, axes, **kw)
+
+            if to_dense:
+                ctx[op.outputs[0].key] = ret
             else:
-                ret = xp.tensordot(a, b, axes)
                 out = op.outputs[0]
                 ctx[out.key] = ret.astype(ret.dtype, order=out.order.value, copy=False)
 
@@ -21,7 +21,10 @@ import numpy as np
 import scipy.sparse as sps
 
 import mars.tensor as mt
+from mars.config import option_context
 from mars.tensor import ones, tensor, dot, empty
+from mars.tensor.arithmetic import TensorTreeAdd
+from mars.tensor.linalg.tensordot import TensorTensorDot
 from mars.graph import DirectedGraph
 from mars.tensor.core import SparseTensor, Tensor
 from mars.tensor.linalg import matmul
@@ -428,6 +431,47 @@ class Test(unittest.TestCase):
         c = c.tiles()
         self.assertEqual(c.shape, tuple(sum(s) for s in c.nsplits))
 
+    def testTensordotAccumulate(self):
+        a = ones((10, 40), chunk_size=5)
+        b = ones((40, 10), chunk_size=5)
+
+        # products of contraction blocks are accumulated by single chunks
+        with option_context({'tensordot.accumulate': True}):
+            c = dot(a, b).tiles()
+        self.assertEqual(len(c.chunks), 4)
+        for chunk in c.chunks:
+            self.assertIsInstance(chunk.op, TensorTensorDot)
+            self.assertEqual(len(chunk.inputs), 16)
+
+        # panels are split by size limit
+        with option_context({'tensordot.accumulate': True,
+                             'tensordot.panel_size_limit': 3 * 5 * 5 * 8 * 2}):
+            c = dot(a, b).tiles()
+        for chunk in c.chunks:
+            self.assertIsInstance(chunk.op, TensorTreeAdd)
+            self.assertEqual([len(inp.inputs) for inp in chunk.inputs], [6, 6, 4])
+
+        # panels are bounded by chunk_store_limit by default
+        with option_context({'tensordot.accumulate': True,
+                             'chunk_store_limit': 3 * 5 * 5 * 8 * 2}):
+            c = dot(a, b).tiles()
+        for chunk in c.chunks:
+            self.assertIsInstance(chunk.op, TensorTreeAdd)
+            self.assertEqual([len(inp.inputs) for inp in chunk.inputs], [6, 6, 4])
+
+        # products are summed by tree add by default
+        c = dot(a, b).tiles()
+        for chunk in c.chunks:
+            self.assertIsInstance(chunk.op, TensorTreeAdd)
+            self.assertTrue(all(len(inp.inputs) == 2 for inp in chunk.inputs[0].inputs))
+
+        workers = ['worker{}'.format(i) for i in range(4)]
+        picked = [TensorTensorDot._pick_worker(workers, i, j, 0) for i in range(4) for j in range(4)]
+        # chunks in the same row of a are assigned to a row of workers
+        self.assertEqual(set(picked[:4]), {'worker0', 'worker1'})
+        self.assertEqual(set(picked[4:8]), {'worker2', 'worker3'})
+        self.assertEqual(TensorTensorDot._pick_worker(workers, 0, 0, 1), 'worker0')
+
     def testDot(self):
         t1 = tensor([[0, 1, 0], [1, 0, 0]], chunk_size=2).tosparse()
         t2 = t1.T
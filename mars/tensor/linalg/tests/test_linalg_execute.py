@@ -19,6 +19,7 @@ import unittest
 import numpy as np
 import scipy.sparse as sps
 
+from mars.config import option_context
 from mars.tensor.datasource import tensor, diag, ones, arange
 from mars.tensor.linalg import qr, svd, cholesky, norm, lu, \
     solve_triangular, solve, inv, tensordot, dot, inner, vdot, matmul, randomized_svd
@@ -840,6 +841,10 @@ class Test(unittest.TestCase):
         self.assertTrue(np.array_equal(res[0], expected[:500, :]))
         self.assertTrue(np.array_equal(res[1], expected[500:, :]))
 
+        with option_context({'tensordot.accumulate': True}):
+            res = self.executor.execute_tensor(dot(a, b), concat=True)[0]
+        np.testing.assert_array_equal(res, expected)
+
         a = ones((10, 8), chunk_size=2)
         b = ones((8, 10), chunk_size=2)
         c = a.dot(b)
@@ -140,11 +140,14 @@ class TensorConcatenate(TensorOperand, TensorOperandMixin):
                 axes = axis or list(range(chunk.ndim))
                 chunks = [(_get_index(input), data) for input, data in zip(chunk.inputs, inputs)]
                 with device(device_id):
-                    for i in range(len(axes) - 1):
+                    for ax in reversed(axes[1:]):
+                        # concatenate chunks which only differ in index on the axis
                         new_chunks = []
-                        for idx, cs in itertools.groupby(chunks, key=lambda t: t[0][:-1]):
+                        for idx, cs in itertools.groupby(
+                                chunks, key=lambda t: t[0][:ax] + t[0][ax + 1:]):
                             cs = list(map(operator.itemgetter(1), cs))
-                            new_chunks.append((idx, xp.concatenate(cs, axis=len(axes) - i - 1)))
+                            new_chunks.append((idx[:ax] + (0,) + idx[ax:],
+                                               xp.concatenate(cs, axis=ax)))
                         chunks = new_chunks
                     try:
                         res = xp.concatenate(list(map(operator.itemgetter(1), chunks)), axis=axes[0])
@@ -19,11 +19,10 @@ from contextlib import contextmanager
 
 import numpy as np
 
-from ...config import options
 from ...serialize import ValueType, TupleField, Int32Field
 from ...utils import tokenize
 from ..core import TENSOR_TYPE, CHUNK_TYPE
-from ..utils import decide_chunk_sizes, gen_random_seeds, broadcast_shape
+from ..utils import decide_tensor_chunk_sizes, gen_random_seeds, broadcast_shape
 from ..array_utils import array_module, device
 from ..operands import TensorOperand, TensorMapReduceOperand, TensorOperandMixin
 from ..datasource import tensor as astensor
@@ -94,8 +93,7 @@ class TensorRandomOperandMixin(TensorOperandMixin):
     @classmethod
     def tile(cls, op):
         tensor = op.outputs[0]
-        chunk_size = tensor.extra_params.raw_chunk_size or options.chunk_size
-        nsplits = decide_chunk_sizes(tensor.shape, chunk_size, tensor.dtype.itemsize)
+        nsplits = decide_tensor_chunk_sizes(tensor)
         fields = getattr(op, '_input_fields_', [])
         to_one_chunk_fields = set(getattr(op, '_into_one_chunk_fields_', list()))
 
@@ -51,6 +51,19 @@ def _estimate_graph_size(old_chunk_size, new_chunk_size):
                   (len(oc) + len(nc) for oc, nc in zip(old_chunk_size, new_chunk_size)))
 
 
+def estimate_rechunk_fanout(old_chunk_size, new_chunk_size):
+    """
+    Estimate the number of pieces each chunk is sliced into or assembled
+    from when rechunking directly, that is the number of overlaps between
+    old and new chunks divided by the larger number of chunks.
+    """
+    overlaps = 1
+    for oc, nc in zip(old_chunk_size, new_chunk_size):
+        bounds = set(np.cumsum(oc).tolist()) | set(np.cumsum(nc).tolist())
+        overlaps *= max(len(bounds), 1)
+    return overlaps / max(_chunk_number(old_chunk_size), _chunk_number(new_chunk_size))
+
+
 def plan_rechunks(tileable, new_chunk_size, itemsize, threshold=None, chunk_size_limit=None):
     threshold = threshold or options.rechunk.threshold
     chunk_size_limit = chunk_size_limit or options.rechunk.chunk_size_limit
@@ -14,16 +14,21 @@
 
 import itertools
 
+import numpy as np
+
 from ... import opcodes as OperandDef
-from ...serialize import KeyField, AnyField, Int32Field, Int64Field
-from ...utils import check_chunks_unknown_shape
+from ...config import options
+from ...operands import OperandStage
+from ...serialize import KeyField, AnyField, Int32Field, Int64Field, TupleField, ValueType
+from ...utils import check_chunks_unknown_shape, get_shuffle_input_keys_idxes
 from ...tiles import TilesError
+from ..array_utils import get_array_module
 from ..utils import calc_sliced_size
-from ..operands import TensorHasInput, TensorOperandMixin
-from .core import plan_rechunks, get_nsplits, compute_rechunk_slices
+from ..operands import TensorMapReduceOperand, TensorOperandMixin, TensorShuffleProxy
+from .core import plan_rechunks, get_nsplits, compute_rechunk_slices, estimate_rechunk_fanout
 
 
-class TensorRechunk(TensorHasInput, TensorOperandMixin):
+class TensorRechunk(TensorMapReduceOperand, TensorOperandMixin):
     _op_type_ = OperandDef.RECHUNK
 
     _input = KeyField('input')
@@ -31,10 +36,18 @@ class TensorRechunk(TensorHasInput, TensorOperandMixin):
     _threshold = Int32Field('threshold')
     _chunk_size_limit = Int64Field('chunk_size_limit')
 
-    def __init__(self, chunk_size=None, threshold=None, chunk_size_limit=None, dtype=None, sparse=False, **kw):
+    _axis_offsets = TupleField('axis_offsets', ValueType.uint64)
+
+    def __init__(self, chunk_size=None, threshold=None, chunk_size_limit=None, axis_offsets=None,
+                 stage=None, shuffle_key=None, dtype=None, sparse=False, **kw):
         super().__init__(_chunk_size=chunk_size, _threshold=threshold, _chunk_size_limit=chunk_size_limit,
+                         _axis_offsets=axis_offsets, _stage=stage, _shuffle_key=shuffle_key,
                          _dtype=dtype, _sparse=sparse, **kw)
 
+    @property
+    def input(self):
+        return self._input
+
     @property
     def chunk_size(self):
         return self._chunk_size
@@ -47,6 +60,10 @@ class TensorRechunk(TensorHasInput, TensorOperandMixin):
     def chunk_size_limit(self):
         return self._chunk_size_limit
 
+    @property
+    def axis_offsets(self):
+        return self._axis_offsets
+
     def _set_inputs(self, inputs):
         super()._set_inputs(inputs)
         self._input = self._inputs[0]
@@ -57,7 +74,13 @@ class TensorRechunk(TensorHasInput, TensorOperandMixin):
     @classmethod
     def tile(cls, op):
         check_chunks_unknown_shape(op.inputs, TilesError)
+        in_tensor = op.inputs[0]
         new_chunk_size = op.chunk_size
+        if not in_tensor.issparse() and estimate_rechunk_fanout(
+                in_tensor.nsplits, new_chunk_size) > options.rechunk.shuffle_threshold:
+            # slicing every overlap creates too many chunks, exchange with shuffle instead
+            return [compute_rechunk_shuffle(in_tensor, new_chunk_size)]
+
         steps = plan_rechunks(op.inputs[0], new_chunk_size, op.inputs[0].dtype.itemsize,
                               threshold=op.threshold,
                               chunk_size_limit=op.chunk_size_limit)
@@ -67,6 +90,82 @@ class TensorRechunk(TensorHasInput, TensorOperandMixin):
 
         return [tensor]
 
+    @classmethod
+    def estimate_size(cls, ctx, op):
+        chunk = op.outputs[0]
+        if op.stage == OperandStage.map:
+            inp_size, inp_calc = ctx[chunk.inputs[0].key]
+            ctx[chunk.key] = (inp_size, inp_calc)
+        elif op.stage == OperandStage.reduce:
+            sum_size = 0
+            for shuffle_input in chunk.inputs[0].inputs or ():
+                key = (shuffle_input.key, op.shuffle_key)
+                if ctx.get(key) is not None:
+                    sum_size += ctx[key][0]
+                else:
+                    ctx[key] = None
+            ctx[chunk.key] = (chunk.nbytes, max(sum_size, chunk.nbytes))
+        else:
+            super().estimate_size(ctx, op)
+
+    @classmethod
+    def _execute_map(cls, ctx, op):
+        chunk = op.outputs[0]
+        data = ctx[op.inputs[0].key]
+
+        dim_pieces = []
+        for offset, size, splits in zip(op.axis_offsets, data.shape, op.chunk_size):
+            offset = int(offset)
+            bounds = np.cumsum((0,) + tuple(splits))
+            start_idx = int(np.searchsorted(bounds, offset, side='right')) - 1
+            end_idx = int(np.searchsorted(bounds, offset + size, side='left'))
+            pieces = []
+            for idx in range(start_idx, end_idx):
+                start = max(int(bounds[idx]), offset)
+                end = min(int(bounds[idx + 1]), offset + size)
+                # index of target chunk, slice on the input, offset in the target
+                pieces.append((idx, slice(start - offset, end - offset), start - int(bounds[idx])))
+            dim_pieces.append(pieces)
+
+        for piece in itertools.product(*dim_pieces):
+            target_idx, slc, target_offsets = zip(*piece)
+            group_key = ','.join(str(i) for i in target_idx)
+            ctx[(chunk.key, group_key)] = (target_offsets, data[slc])
+
+    @classmethod
+    def _execute_reduce(cls, ctx, op):
+        chunk = op.outputs[0]
+        input_keys, _ = get_shuffle_input_keys_idxes(chunk.inputs[0])
+
+        result = None
+        n_covered = 0
+        for input_key in input_keys:
+            key = (input_key, op.shuffle_key)
+            if ctx.get(key) is None:
+                ctx[key] = None
+                continue
+            offsets, data = ctx[key]
+            if result is None:
+                xp = get_array_module(data)
+                result = xp.empty(chunk.shape, dtype=chunk.dtype, order=chunk.order.value)
+            result[tuple(slice(o, o + s) for o, s in zip(offsets, data.shape))] = data
+            n_covered += int(np.prod(data.shape))
+        # pieces never overlap, thus every element is written once sizes add up
+        if n_covered != int(np.prod(chunk.shape)):
+            raise ValueError('pieces received cover {} of {} elements of chunk {}'.format(
+                n_covered, int(np.prod(chunk.shape)), chunk.index))
+        if result is None:
+            # chunk without elements
+            result = np.empty(chunk.shape, dtype=chunk.dtype, order=chunk.order.value)
+        ctx[chunk.key] = result
+
+    @classmethod
+    def execute(cls, ctx, op):
+        if op.stage == OperandStage.map:
+            cls._execute_map(ctx, op)
+        else:
+            cls._execute_reduce(ctx, op)
+
 
 def rechunk(tensor, chunk_size, threshold=None, chunk_size_limit=None):
     chunk_size = get_nsplits(tensor, chunk_size, tensor.dtype.itemsize)
@@ -112,3 +211,35 @@ def compute_rechunk(tensor, chunk_size):
     op = TensorRechunk(chunk_size, sparse=tensor.issparse())
     return op.new_tensor([tensor], tensor.shape, dtype=tensor.dtype, order=tensor.order,
                          nsplits=chunk_size, chunks=result_chunks)
+
+
+def compute_rechunk_shuffle(tensor, chunk_size):
+    """
+    Rechunk with a map stage slicing every input chunk into pieces keyed
+    by target chunks and a reduce stage assembling pieces for every output
+    chunk, thus the size of the graph is linear in the number of chunks.
+    """
+    axis_offsets = [[0] + np.cumsum(ns)[:-1].tolist() for ns in tensor.nsplits]
+
+    map_chunks = []
+    for inp in tensor.chunks:
+        offsets = tuple(axis_offsets[axis][idx] for axis, idx in enumerate(inp.index))
+        map_op = TensorRechunk(chunk_size, axis_offsets=offsets, stage=OperandStage.map,
+                               dtype=inp.dtype)
+        map_chunks.append(map_op.new_chunk([inp], shape=(np.nan,), index=inp.index))
+
+    proxy_chunk = TensorShuffleProxy(dtype=tensor.dtype, _tensor_keys=[tensor.op.key]) \
+        .new_chunk(map_chunks, shape=())
+
+    result_chunks = []
+    idxes = itertools.product(*[range(len(c)) for c in chunk_size])
+    chunk_shapes = itertools.product(*chunk_size)
+    for idx, chunk_shape in zip(idxes, chunk_shapes):
+        reduce_op = TensorRechunk(stage=OperandStage.reduce, dtype=tensor.dtype,
+                                  shuffle_key=','.join(str(i) for i in idx))
+        result_chunks.append(reduce_op.new_chunk([proxy_chunk], shape=chunk_shape,
+                                                 index=idx, order=tensor.order))
+
+    op = TensorRechunk(chunk_size, sparse=tensor.issparse())
+    return op.new_tensor([tensor], tensor.shape, dtype=tensor.dtype, order=tensor.order,
+                         nsplits=chunk_size, chunks=result_chunks)
@@ -16,10 +16,14 @@
 
 import unittest
 
+from mars.config import option_context
+from mars.operands import OperandStage
 from mars.tiles import get_tiled
 from mars.tensor.datasource import ones
 from mars.tensor.indexing.slice import TensorSlice
-from mars.tensor.rechunk.rechunk import compute_rechunk
+from mars.tensor.operands import TensorShuffleProxy
+from mars.tensor.rechunk.core import estimate_rechunk_fanout
+from mars.tensor.rechunk.rechunk import compute_rechunk, TensorRechunk
 
 
 class Test(unittest.TestCase):
@@ -62,6 +66,33 @@ class Test(unittest.TestCase):
         self.assertEqual(new_tensor.chunks[-1].inputs[1].op.slices,
                          (slice(1, None, None), slice(None, None, None)))
 
+    def testShuffleRechunk(self):
+        # rechunk row blocks into column blocks
+        self.assertEqual(estimate_rechunk_fanout(((1,) * 10, (10,)), ((10,), (1,) * 10)), 10)
+        self.assertEqual(estimate_rechunk_fanout(((10,), (10,)), ((1,) * 10, (10,))), 1)
+
+        tensor = ones((10, 10), chunk_size=(1, 10))
+        with option_context({'rechunk.shuffle_threshold': 4}):
+            new_tensor = tensor.rechunk((10, 1)).tiles()
+
+        self.assertEqual(new_tensor.nsplits, ((10,), (1,) * 10))
+        self.assertEqual(len(new_tensor.chunks), 10)
+        proxy = new_tensor.chunks[0].inputs[0]
+        self.assertIsInstance(proxy.op, TensorShuffleProxy)
+        self.assertEqual(len(proxy.inputs), 10)
+        for c in new_tensor.chunks:
+            self.assertIsInstance(c.op, TensorRechunk)
+            self.assertEqual(c.op.stage, OperandStage.reduce)
+            self.assertIs(c.inputs[0], proxy)
+        map_chunk = proxy.inputs[3]
+        self.assertEqual(map_chunk.op.stage, OperandStage.map)
+        self.assertEqual(map_chunk.op.axis_offsets, (3, 0))
+
+        # small fan-out still slices and concatenates
+        with option_context({'rechunk.shuffle_threshold': 4}):
+            new_tensor = ones((12, 9), chunk_size=4).rechunk(3).tiles()
+        self.assertIsInstance(new_tensor.chunks[1].inputs[0].op, TensorSlice)
+
     def testSparse(self):
         tensor = ones((7, 12), chunk_size=4).tosparse()
         new_tensor = tensor.rechunk(5)
@@ -19,6 +19,7 @@ import copy
 import inspect
 import itertools
 import operator
+from collections import OrderedDict
 from collections.abc import Iterable
 from functools import reduce
 from math import ceil, log
@@ -26,8 +27,10 @@ from math import ceil, log
 import numpy as np
 
 from ...config import options
+from ...context import get_context, RunningMode
 from ...operands import OperandStage
 from ...serialize import KeyField, AnyField, DataTypeField, BoolField, Int32Field
+from ...tiles import TilesError
 from ..core import Tensor, TensorOrder
 from ..array_utils import get_array_module, as_same_device, device, cp
 from ..utils import check_out_param, validate_axis
@@ -174,6 +177,99 @@ class TensorReductionMixin(TensorOperandMixin):
 
         return cls._partial_reduction(tensor, axis, op.dtype, keepdims, combine_size, OperandStage.agg, kw)
 
+    @classmethod
+    def _get_chunk_workers(cls, chunks):
+        """
+        Get workers holding chunks when reducing with locality in distributed
+        mode, chunks need to be executed before tiling.
+        """
+        ctx = get_context()
+        if not options.reduction.locality_aware or ctx is None or \
+                ctx.running_mode != RunningMode.distributed:
+            return None
+        metas = ctx.get_chunk_metas([c.key for c in chunks], filter_fields=['workers'])
+        if builtins.any(not meta or not meta[0] for meta in metas):
+            raise TilesError('Workers of input chunks are unknown')
+        return [sorted(meta[0])[0] for meta in metas]
+
+    @classmethod
+    def _locality_combine(cls, op, chunks, axis, order, stage, keepdims=True, index=None, kw=None):
+        from ..merge.concatenate import TensorConcatenate
+
+        if len(chunks) > 1:
+            # chunks are reduced along axes, thus can be concatenated along any of them
+            concat_shape = list(chunks[0].shape)
+            concat_shape[axis[0]] = builtins.sum(c.shape[axis[0]] for c in chunks)
+            concat_op = TensorConcatenate(axis=axis[0], dtype=chunks[0].dtype)
+            chk = concat_op.new_chunk(chunks, shape=tuple(concat_shape), order=order)
+        else:
+            chk = chunks[0]
+        shape = tuple(1 if i in axis else s for i, s in enumerate(chk.shape)
+                      if keepdims or i not in axis)
+        agg_op = type(op)(stage=stage, axis=axis, dtype=op.dtype, keepdims=keepdims, **(kw or {}))
+        return agg_op.new_chunk([chk], shape=shape, index=index, order=order)
+
+    @classmethod
+    def _locality_tree_reduction(cls, tensor, axis, workers):
+        """
+        Combine chunks on the same worker before combining across workers,
+        thus data is transferred only when combining results of workers,
+        and the number of levels across workers depends on the number of
+        workers instead of the number of chunks.
+        """
+        op = tensor.op
+        kw = op._get_op_kw() or {}
+        keepdims = op.keepdims
+        combine_size = op.combine_size or options.combine_size
+        if isinstance(combine_size, dict):
+            combine_size = reduce(operator.mul, (v or 1 for v in combine_size.values()), 1)
+        combine_size = builtins.max(combine_size, 2)
+
+        # group chunks reduced into the same output chunk by workers
+        out_groups = OrderedDict()
+        for chunk, worker in zip(tensor.chunks, workers):
+            out_idx = tuple(idx for i, idx in enumerate(chunk.index) if i not in axis)
+            out_groups.setdefault(out_idx, OrderedDict()).setdefault(worker, []).append(chunk)
+
+        def _combine_level(chunks):
+            combined = []
+            for i in range(0, len(chunks), combine_size):
+                chks = chunks[i: i + combine_size]
+                if len(chks) == 1:
+                    combined.append(chks[0])
+                else:
+                    combined.append(cls._locality_combine(
+                        op, chks, axis, tensor.order, OperandStage.combine,
+                        index=chks[0].index, kw=kw))
+            return combined
+
+        out_chunks = []
+        for worker_chunks in out_groups.values():
+            to_combine = []
+            for worker in sorted(worker_chunks):
+                chunks = worker_chunks[worker]
+                # combine locally till one chunk left on every worker
+                while len(chunks) > combine_size or (len(chunks) > 1 and len(worker_chunks) > 1):
+                    chunks = _combine_level(chunks)
+                to_combine.extend(chunks)
+            while len(to_combine) > combine_size:
+                to_combine = _combine_level(to_combine)
+
+            first = worker_chunks[next(iter(worker_chunks))][0]
+            index = tuple(0 if i in axis else idx for i, idx in enumerate(first.index)
+                          if keepdims or i not in axis)
+            out_chunks.append(cls._locality_combine(
+                op, to_combine, axis, tensor.order, OperandStage.agg,
+                keepdims=keepdims, index=index, kw=kw))
+
+        nsplits = tuple((1,) if i in axis else ns for i, ns in enumerate(tensor.nsplits)
+                        if keepdims or i not in axis)
+        shape = tuple(builtins.sum(ns) for ns in nsplits)
+        agg_op = type(op)(stage=OperandStage.agg, axis=axis, dtype=op.dtype, keepdims=keepdims,
+                          combine_size=op.combine_size, **kw)
+        return agg_op.new_tensors([tensor], shape, order=tensor.order,
+                                  chunks=out_chunks, nsplits=nsplits)
+
     @classmethod
     def _partial_reduction(cls, tensor, axis, dtype, keepdims, combine_size, stage, kw=None):
         from ..merge.concatenate import TensorConcatenate
@@ -253,6 +349,10 @@ class TensorReductionMixin(TensorOperandMixin):
         tensor = new_op.new_tensor(op.inputs, cls._reduced_shape(in_tensor.shape, axis),
                                    order=out_tensor.order,
                                    nsplits=cls._reduced_nsplits(in_tensor.nsplits, axis), chunks=chunks)
+
+        workers = cls._get_chunk_workers(in_tensor.chunks)
+        if workers is not None and len(set(workers)) > 1:
+            return cls._locality_tree_reduction(tensor, axis, workers)
         return cls._tree_reduction(tensor, axis)
 
     @classmethod
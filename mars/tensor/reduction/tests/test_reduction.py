@@ -15,16 +15,59 @@
 # limitations under the License.
 
 import unittest
+from unittest import mock
 
 import numpy as np
 
 from mars.operands import OperandStage
 from mars.tensor.datasource import ones, tensor
 from mars.tensor.merge import TensorConcatenate
-from mars.tensor.reduction import all, TensorMean, TensorArgmax, TensorArgmin
+from mars.tensor.reduction import all, TensorMean, TensorArgmax, TensorArgmin, TensorSum
 
 
 class Test(unittest.TestCase):
+    def testLocalityTreeReduction(self):
+        # chunks are interleaved on 2 workers
+        workers = ['worker{}'.format(i % 2) for i in range(20)]
+        with mock.patch.object(TensorSum, '_get_chunk_workers', return_value=workers):
+            res = ones((10, 8), chunk_size=2).sum().tiles()
+
+        self.assertEqual(len(res.chunks), 1)
+        agg_chunk = res.chunks[0]
+        self.assertEqual(agg_chunk.op.stage, OperandStage.agg)
+        self.assertIsInstance(agg_chunk.inputs[0].op, TensorConcatenate)
+        # one reduced chunk from each worker
+        worker_chunks = agg_chunk.inputs[0].inputs
+        self.assertEqual(len(worker_chunks), 2)
+        for c in worker_chunks:
+            self.assertIsInstance(c.op, TensorSum)
+            source_chunks = []
+            stack = [c]
+            while stack:
+                chunk = stack.pop()
+                if not chunk.inputs:
+                    source_chunks.append(chunk)
+                else:
+                    stack.extend(chunk.inputs)
+            # every worker only reduces the chunks it holds
+            self.assertEqual(len(source_chunks), 10)
+            self.assertEqual(len(set(sc.index[1] % 2 for sc in source_chunks)), 1)
+
+        # reductions supporting combine keep the combine stage on workers
+        with mock.patch.object(TensorMean, '_get_chunk_workers', return_value=workers):
+            res = ones((10, 8), chunk_size=2).mean().tiles()
+        worker_chunks = res.chunks[0].inputs[0].inputs
+        self.assertEqual(len(worker_chunks), 2)
+        for c in worker_chunks:
+            self.assertEqual(c.op.stage, OperandStage.combine)
+
+        workers = ['worker{}'.format(i % 3) for i in range(20)]
+        with mock.patch.object(TensorSum, '_get_chunk_workers', return_value=workers):
+            res = ones((10, 8), chunk_size=2).sum(axis=0, keepdims=True).tiles()
+        self.assertEqual(res.shape, (1, 8))
+        self.assertEqual(res.nsplits, ((1,), (2,) * 4))
+        self.assertEqual([c.index for c in res.chunks], [(0, i) for i in range(4)])
+
     def testBaseReduction(self):
         sum = lambda x, *args, **kwargs: x.sum(*args, **kwargs).tiles()
         prod = lambda x, *args, **kwargs: x.prod(*args, **kwargs).tiles()
@@ -15,12 +15,13 @@
 # limitations under the License.
 
 import unittest
+from unittest import mock
 
 import numpy as np
 import scipy.sparse as sps
 
 from mars.tensor.datasource import ones, tensor
-from mars.tensor.reduction import mean, nansum, nanmax, nanmin, nanmean, nanprod, nanargmax, \
+from mars.tensor.reduction import TensorSum, TensorVar, mean, nansum, nanmax, nanmin, nanmean, nanprod, nanargmax, \
     nanargmin, nanvar, nanstd, count_nonzero, allclose, array_equal, var, std, nancumsum, nancumprod
 from mars.utils import ignore_warning
 from mars.tests.core import ExecutorForTest
@@ -30,6 +31,21 @@ class Test(unittest.TestCase):
     def setUp(self):
         self.executor = ExecutorForTest('numpy')
 
+    def testLocalityReductionExecution(self):
+        raw = np.random.rand(10, 8)
+        workers = ['worker{}'.format(i % 3) for i in range(20)]
+        with mock.patch.object(TensorSum, '_get_chunk_workers', return_value=workers), \
+                mock.patch.object(TensorVar, '_get_chunk_workers', return_value=workers):
+            arr = tensor(raw, chunk_size=(1, 4))
+            res = self.executor.execute_tensor(arr.sum(), concat=True)[0]
+            self.assertAlmostEqual(res, raw.sum())
+
+            res = self.executor.execute_tensor(arr.sum(axis=0), concat=True)[0]
+            np.testing.assert_almost_equal(res, raw.sum(axis=0))
+
+            res = self.executor.execute_tensor(arr.var(axis=0, keepdims=True), concat=True)[0]
+            np.testing.assert_almost_equal(res, raw.var(axis=0, keepdims=True))
+
     def testSumProdExecution(self):
         arr = ones((10, 8), chunk_size=3)
         self.assertEqual([80], self.executor.execute_tensor(arr.sum()))
@@ -41,6 +57,13 @@ class Test(unittest.TestCase):
         self.assertEqual((8,) * 3,
                          tuple(np.concatenate(self.executor.execute_tensor((arr * 2).prod(axis=0)))))
 
+        # chunks are concatenated over axes which are not trailing
+        raw = np.random.rand(8, 7, 9)
+        arr = tensor(raw, chunk_size=3)
+        for axis in [(0, 2), (1, 2)]:
+            res = self.executor.execute_tensor(arr.sum(axis=axis), concat=True)[0]
+            np.testing.assert_allclose(res, raw.sum(axis=axis))
+
         raw = sps.random(10, 20, density=.1)
         arr = tensor(raw, chunk_size=3)
         res = self.executor.execute_tensor(arr.sum())[0]
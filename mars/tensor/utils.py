@@ -540,7 +540,7 @@ def dictify_chunk_size(shape, chunk_size):
     return chunk_size
 
 
-def decide_chunk_sizes(shape, chunk_size, itemsize):
+def decide_chunk_sizes(shape, chunk_size, itemsize, chunk_store_limit=None):
     """
     Decide how a given tensor can be split into chunk.
 
@@ -548,12 +548,16 @@ def decide_chunk_sizes(shape, chunk_size, itemsize):
     :param chunk_size: if dict provided, it's dimension id to chunk size;
                        if provided, it's the chunk size for each dimension.
     :param itemsize: element size
+    :param chunk_store_limit: max bytes of a chunk, options.chunk_store_limit by default
     :return: the calculated chunk size for each dimension
     :rtype: tuple
     """
 
     from ..config import options
 
+    if isinstance(chunk_size, str) and chunk_size == 'auto':
+        # operands unaware of consumers split by the store limit
+        chunk_size = None
     chunk_size = dictify_chunk_size(shape, chunk_size)
     nleft = len(shape) - len(chunk_size)
     if nleft < 0:
@@ -561,7 +565,7 @@ def decide_chunk_sizes(shape, chunk_size, itemsize):
     if nleft == 0:
         return normalize_chunk_sizes(shape, tuple(chunk_size[j] for j in range(len(shape))))
 
-    max_chunk_size = options.chunk_store_limit
+    max_chunk_size = chunk_store_limit or options.chunk_store_limit
 
     # normalize the dimension which specified first
     dim_to_normalized = {i: normalize_chunk_sizes((shape[i],), (c,))[0]
@@ -586,6 +590,175 @@ def decide_chunk_sizes(shape, chunk_size, itemsize):
     return tuple(dim_to_normalized[i] for i in range(len(dim_to_normalized)))
 
 
+def _get_auto_chunk_resources():
+    """
+    Get number of cores in the cluster and memory of a core,
+    memory is None if unknown.
+    """
+    from .. import resource
+    from ..context import get_context, RunningMode
+
+    ctx = get_context()
+    n_cores = mem_per_core = None
+    if ctx is not None and ctx.running_mode == RunningMode.distributed:
+        hardwares = [meta.get('hardware') or dict()
+                     for meta in (ctx.get_worker_metas() or dict()).values()]
+        cores = [int(hw.get('cpu_total') or 0) for hw in hardwares]
+        mems = [hw.get('mem_quota_total') or hw.get('memory_total') for hw in hardwares]
+        if hardwares and all(cores) and all(mems):
+            n_cores = sum(cores)
+            mem_per_core = min(m / c for m, c in zip(mems, cores))
+        else:
+            n_cores = len(ctx.get_worker_addresses() or ()) * (ctx.get_ncores() or 1)
+        return n_cores or 1, mem_per_core
+
+    if ctx is not None:
+        n_cores = ctx.get_ncores()
+    n_cores = n_cores or resource.cpu_count()
+    mem_per_core = resource.virtual_memory().total / resource.cpu_count()
+    return n_cores, mem_per_core
+
+
+def _get_auto_chunk_consumer(consumers):
+    """
+    Get kind of the consumer which decides chunk sizes, contractions
+    are preferred to sorts, then other operands, then elementwise ones.
+    """
+    from .arithmetic.core import TensorElementWise
+    from .base.partition import TensorPartition
+    from .base.sort import TensorSort
+    from .einsum.core import TensorEinsum
+    from .linalg.dot import TensorDot
+    from .linalg.matmul import TensorMatmul
+    from .linalg.tensordot import TensorTensorDot
+    from .reduction.core import TensorReductionMixin
+
+    kind_to_op = dict()
+    for consumer in consumers:
+        op = consumer.op
+        if isinstance(op, (TensorTensorDot, TensorDot, TensorMatmul, TensorEinsum)):
+            kind = 'contraction'
+        elif isinstance(op, (TensorSort, TensorPartition)) and op.axis is not None:
+            kind = 'sort'
+        elif isinstance(op, (TensorElementWise, TensorReductionMixin)):
+            kind = 'elementwise'
+        else:
+            kind = 'other'
+        kind_to_op.setdefault(kind, op)
+    for kind in ('contraction', 'sort', 'other', 'elementwise'):
+        if kind in kind_to_op:
+            return kind, kind_to_op[kind]
+    return None, None
+
+
+def decide_auto_chunk_sizes(shape, itemsize, consumers=None, order=None):
+    """
+    Decide how a tensor is split into chunks for `chunk_size='auto'`
+    by operands consuming it and resources of the cluster.
+
+    Every chunk is kept under the store limit and a fraction of memory
+    of a core, and the tensor is split into as many chunks as cores if
+    chunks are not too small. Then contractions get square blocks, sorts
+    get chunks along the sorted axis, and elementwise operands get slabs
+    contiguous in memory.
+
+    :param shape: tensor's shape
+    :param itemsize: element size
+    :param consumers: tileables consuming the tensor
+    :param order: tensor's order
+    :return: the calculated chunk size for each dimension, and why they are chosen
+    :rtype: tuple
+    """
+    from ..config import options
+    from .core import TensorOrder
+
+    n_cores, mem_per_core = _get_auto_chunk_resources()
+    limit = options.chunk_store_limit
+    reasons = ['{0} cores'.format(n_cores)]
+    if mem_per_core:
+        limit = min(limit, int(mem_per_core * options.auto_chunk.memory_fraction))
+        reasons.append('{0} bytes memory per core'.format(int(mem_per_core)))
+    nbytes = int(np.prod(shape)) * itemsize
+    limit = min(limit, max(ceil(nbytes / n_cores), options.auto_chunk.min_chunk_bytes))
+    limit = max(int(limit), itemsize)
+    reasons.append('chunk limit {0} bytes'.format(limit))
+
+    kind, op = _get_auto_chunk_consumer(consumers or ())
+    ndim = len(shape)
+    if kind is None:
+        reasons.insert(0, 'no consumer known, split evenly')
+    else:
+        reasons.insert(0, '{0} consumer {1}'.format(kind, type(op).__name__))
+    if ndim == 0 or nbytes == 0:
+        return decide_chunk_sizes(shape, None, itemsize, limit), ', '.join(reasons)
+
+    chunk_size = None
+    if kind == 'contraction':
+        reasons.append('square blocks')
+    elif kind == 'sort':
+        axis = op.axis % ndim
+        n_parts = int(ceil(nbytes / limit))
+        chunk_size = {axis: int(ceil(shape[axis] / n_parts))}
+        reasons.append('{0} chunks along sorted axis {1}'.format(n_parts, axis))
+    elif kind == 'elementwise':
+        axis = ndim - 1 if order == TensorOrder.F_ORDER else 0
+        slab_nbytes = nbytes // shape[axis]
+        if slab_nbytes <= limit:
+            n_parts = int(ceil(shape[axis] / (limit // slab_nbytes)))
+            chunk_size = {i: shape[i] for i in range(ndim)}
+            chunk_size[axis] = int(ceil(shape[axis] / n_parts))
+            reasons.append('contiguous slabs along axis {0}'.format(axis))
+    nsplits = decide_chunk_sizes(shape, chunk_size, itemsize, limit)
+    return nsplits, ', '.join(reasons)
+
+
+def decide_tensor_chunk_sizes(tensor):
+    """
+    Decide how a tensor created by a data source is split into chunks.
+    If `chunk_size='auto'` is specified, chunk sizes are decided by
+    consumers of the tensor, and why they are chosen is recorded as
+    `auto_chunk_reason` in extra params of the tensor.
+
+    :param tensor: tensor created by a data source
+    :return: the calculated chunk size for each dimension
+    :rtype: tuple
+    """
+    from ..config import options
+    from ..tiles import get_tiling_consumers
+
+    chunk_size = tensor.extra_params.raw_chunk_size or options.chunk_size
+    if isinstance(chunk_size, str) and chunk_size == 'auto':
+        nsplits, reason = decide_auto_chunk_sizes(
+            tensor.shape, tensor.dtype.itemsize, consumers=get_tiling_consumers(tensor),
+            order=tensor.order)
+        tensor.extra_params['auto_chunk_reason'] = reason
+        return nsplits
+    return decide_chunk_sizes(tensor.shape, chunk_size, tensor.dtype.itemsize)
+
+
+def align_nsplits(nsplits, storage_chunks):
+    """
+    Snap chunk boundaries to multiples of chunks in storage, thus
+    every storage chunk is covered by exactly one chunk. Chunk sizes
+    of an axis already aligned are kept as they are.
+
+    :param nsplits: chunk sizes of each dimension
+    :param storage_chunks: storage chunk size of each dimension
+    :return: aligned chunk sizes
+    :rtype: tuple
+    """
+    aligned = []
+    for ns, c in zip(nsplits, storage_chunks):
+        if not c or all(s % c == 0 for s in ns[:-1]):
+            aligned.append(tuple(ns))
+            continue
+        size = max(int(round(max(ns) / c)), 1) * c
+        dim_size = sum(ns)
+        aligned.append((size,) * (dim_size // size) +
+                       ((dim_size % size,) if dim_size % size else ()))
+    return tuple(aligned)
+
+
 def check_random_state(seed):
     """
     Turn seed into a mt.random.RandomState instance
@@ -16,7 +16,7 @@
 
 import unittest
 
-from mars.graph import DAG, GraphContainsCycleError
+from mars.graph import DAG, GraphContainsCycleError, GraphFrozenError
 
 
 class Test(unittest.TestCase):
@@ -87,6 +87,68 @@ class Test(unittest.TestCase):
             self.assertTrue(all(dag_copy.has_successor(pred, n)
                                 for pred in dag_copy.predecessors(n)))
 
+    def testFrozenDAG(self):
+        dag = DAG()
+        [dag.add_node(i) for i in range(1, 7)]
+        dag.add_edge(1, 4)
+        dag.add_edge(2, 6)
+        dag.add_edge(2, 5)
+        dag.add_edge(5, 6)
+        dag.add_edge(3, 5)
+
+        traversals = [
+            lambda: dag.traverse(),
+            lambda: dag.dfs(),
+            lambda: dag.dfs(start=5),
+            lambda: dag.bfs(),
+            lambda: dag.bfs(start=[5, 1]),
+            lambda: dag.bfs(reverse=True),
+        ]
+        expected_orders = [list(f()) for f in traversals]
+
+        dag.freeze()
+        self.assertTrue(dag.frozen)
+        self.assertEqual(list(dag.topological_iter()), [3, 2, 5, 6, 1, 4])
+        self.assertEqual(list(dag.dfs()), [3, 2, 5, 6, 1, 4])
+        self.assertEqual(list(dag.bfs()), [1, 2, 3, 4, 5, 6])
+        self.assertEqual([list(f()) for f in traversals], expected_orders)
+        self.assertEqual(list(dag.iter_indep()), [1, 2, 3])
+        self.assertEqual(list(dag.iter_indep(reverse=True)), [4, 6])
+        self.assertEqual(dag.count_indep(), 3)
+        self.assertEqual(set(dag.bfs(start=5, visit_predicate='all')), {5, 6})
+        self.assertEqual(dag.count_successors(2), 2)
+        self.assertEqual(dag.count_predecessors(6), 2)
+
+        with self.assertRaises(GraphFrozenError):
+            dag.add_node(7)
+        with self.assertRaises(GraphFrozenError):
+            dag.add_edge(4, 6)
+        with self.assertRaises(GraphFrozenError):
+            dag.remove_edge(1, 4)
+        with self.assertRaises(GraphFrozenError):
+            dag.remove_node(1)
+
+        dag.unfreeze()
+        self.assertFalse(dag.frozen)
+        dag.add_edge(6, 1)
+        dag.add_edge(1, 2)
+        dag.freeze()
+        self.assertRaises(GraphContainsCycleError, lambda: list(dag.topological_iter()))
+
+    def testNoEdgeAttrs(self):
+        dag = DAG(edge_attrs=False)
+        self.assertFalse(dag.edge_attrs)
+        [dag.add_node(i) for i in range(1, 4)]
+        dag.add_edge(1, 2)
+        dag.add_edge(2, 3)
+        with self.assertRaises(ValueError):
+            dag.add_edge(1, 3, weight=1)
+
+        self.assertEqual(list(dag.topological_iter()), [1, 2, 3])
+        self.assertFalse(dag.copy().edge_attrs)
+        self.assertFalse(dag.build_reversed().edge_attrs)
+        self.assertEqual(list(dag.build_reversed().topological_iter()), [3, 2, 1])
+
     def testToDot(self):
         import mars.tensor as mt
 
@@ -201,6 +201,49 @@ class Test(unittest.TestCase):
         self.assertTrue(any(isinstance(n.op, TensorFetch) for n in graph))
         self.assertEqual(len(graph), 1)
 
+    def testSerializeGraph(self):
+        from mars.graph import DAG
+        from mars.serialize.graphserializer import is_compact_graph
+
+        a = mt.random.rand(10, 10, chunk_size=3)
+        b = mt.ones((10, 10), chunk_size=3, dtype='f4')
+        c = (a + b).sum(axis=0)
+        graph = c.build_graph(tiled=True, compose=False)
+
+        pb_ser = utils.serialize_graph(graph)
+        for compress in (False, True):
+            ser = utils.serialize_graph(graph, compress=compress, compact=True)
+            self.assertTrue(is_compact_graph(ser))
+            self.assertLess(len(ser), len(pb_ser))
+
+            graph2 = utils.deserialize_graph(ser, graph_cls=DAG)
+            self.assertIsInstance(graph2, DAG)
+            self.assertEqual(len(graph2), len(graph))
+            nodes = dict(((n.key, n.id), n) for n in graph)
+            for n2 in graph2:
+                n = nodes[n2.key, n2.id]
+                self.assertIs(type(n2.op), type(n.op))
+                self.assertEqual(n2.index, n.index)
+                self.assertEqual(n2.shape, n.shape)
+                self.assertEqual(n2.dtype, n.dtype)
+                self.assertEqual(n2.op.key, n.op.key)
+                self.assertEqual([(i.key, i.id) for i in n2.inputs or ()],
+                                 [(i.key, i.id) for i in n.inputs or ()])
+                self.assertEqual(graph2.count_predecessors(n2), graph.count_predecessors(n))
+
+        # graphs serialized by protobuf and json are still accepted
+        pb_graph = utils.deserialize_graph(pb_ser)
+        self.assertEqual(len(pb_graph), len(graph))
+        self.assertTrue(pb_graph.edge_attrs)
+        self.assertFalse(is_compact_graph(pb_ser))
+
+        # composed graphs give the same nodes as a protobuf round trip
+        graph = c.build_graph(tiled=True)
+        pb_graph = utils.deserialize_graph(utils.serialize_graph(graph))
+        graph2 = utils.deserialize_graph(utils.serialize_graph(graph, compact=True))
+        self.assertEqual(sorted((n.key, n.id) for n in graph2),
+                         sorted((n.key, n.id) for n in pb_graph))
+
     def testKernelMode(self):
         from mars.config import option_context, options
 
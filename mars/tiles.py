@@ -15,7 +15,10 @@
 # limitations under the License.
 
 import sys
+import threading
 import weakref
+from collections import defaultdict
+from contextlib import contextmanager
 
 from .graph import DAG
 from .graph_builder import GraphBuilder, TileableGraphBuilder
@@ -72,6 +75,63 @@ class Tileable(object):
 
         return Source(dot)
 
+    @classmethod
+    def _explain_node(cls, node):
+        items = ['key={}'.format(node.key[:8])]
+        if getattr(node, 'shape', None) is not None:
+            items.append('shape={}'.format(node.shape))
+        if getattr(node, 'ndim', None) == 2 and getattr(node, 'dtypes', None) is not None:
+            items.append('columns={}'.format(list(node.dtypes.index)))
+        if hasattr(node.op, 'get_filters') and node.op.get_filters():
+            items.append('filters={}'.format(list(node.op.get_filters())))
+        return '{}({})'.format(type(node.op).__name__, ', '.join(items))
+
+    def explain(self, optimize=None):
+        """
+        Get the plan of the tileable graph as a readable string,
+        each line is a node with its inputs indented below, thus
+        it's easy to see what the graph optimizer does, e.g. which
+        columns are read and which filters are pushed into data sources.
+
+        Parameters
+        ----------
+        optimize : bool, optional
+            Whether to optimize the graph, use `options.optimize_tileable_graph`
+            if not specified.
+
+        Returns
+        -------
+        str
+            The plan of the tileable graph.
+        """
+        from .optimizes.tileable_graph import OptimizeIntegratedTileableGraphBuilder, \
+            tileable_optimized
+
+        if optimize is None:
+            optimize = options.optimize_tileable_graph
+        data = getattr(self, 'data', self)
+        if optimize:
+            OptimizeIntegratedTileableGraphBuilder().build([data])
+            # look up by identity, hashing and comparing a DataFrame with
+            # unknown shape triggers elementwise `==` and `len()`
+            root = next((v for k, v in tileable_optimized.items() if k is data), data)
+        else:
+            root = data
+
+        lines = []
+        visited = set()
+        nodes = [(root, 0)]
+        while len(nodes) > 0:
+            node, depth = nodes.pop()
+            line = '  ' * depth + self._explain_node(node)
+            if node in visited:
+                lines.append(line + ' ...')
+                continue
+            visited.add(node)
+            lines.append(line)
+            nodes.extend((inp, depth + 1) for inp in reversed(node.inputs or []))
+        return '\n'.join(lines)
+
 
 class TilesError(Exception):
     pass
@@ -141,6 +201,58 @@ _tileable_data_to_tiled = weakref.WeakKeyDictionary()
 _op_to_copied = weakref.WeakKeyDictionary()
 
 
+_tiling_local = threading.local()
+
+
+@contextmanager
+def _enter_tileable_graph(tileable_graph, iterative=False):
+    prev = getattr(_tiling_local, 'tileable_graph', None), \
+        getattr(_tiling_local, 'key_to_nodes', None), \
+        getattr(_tiling_local, 'iterative', False)
+    _tiling_local.tileable_graph, _tiling_local.key_to_nodes, _tiling_local.iterative = \
+        tileable_graph, None, iterative
+    try:
+        yield
+    finally:
+        _tiling_local.tileable_graph, _tiling_local.key_to_nodes, _tiling_local.iterative = prev
+
+
+def get_tiling_consumers(tileable):
+    """
+    Get tileables consuming the given tileable in the tileable graph
+    being tiled, None if the tileable is not tiled by a graph builder.
+    """
+    tileable_graph = getattr(_tiling_local, 'tileable_graph', None)
+    if tileable_graph is None:
+        return None
+    consumers = []
+    for n in _get_tiling_nodes(tileable):
+        consumers.extend(tileable_graph.iter_successors(n))
+    return consumers
+
+
+def _get_tiling_nodes(tileable):
+    key_to_nodes = _tiling_local.key_to_nodes
+    if key_to_nodes is None:
+        # tileables are copied when tiling, thus look up them by keys
+        key_to_nodes = _tiling_local.key_to_nodes = defaultdict(list)
+        for n in _tiling_local.tileable_graph:
+            key_to_nodes[n.key].append(n)
+    return key_to_nodes.get(tileable.key, ())
+
+
+def is_iterative_tiling(tileable):
+    """
+    Check if the tileable is tiled by an iterative graph builder as a node
+    of the tileable graph, thus its tiling could raise TilesError with chunks
+    to execute first, and be tiled again after they are executed.
+    """
+    if not getattr(_tiling_local, 'iterative', False):
+        return False
+    # tileables created when tiling others are not tiled again
+    return len(_get_tiling_nodes(tileable)) > 0
+
+
 @enter_build_mode
 def get_tiled(tileable, mapping=None, raise_err_if_not_tiled=True):
     tileable_data = tileable.data if hasattr(tileable, 'data') else tileable
@@ -153,6 +265,8 @@ def get_tiled(tileable, mapping=None, raise_err_if_not_tiled=True):
 
 
 class ChunkGraphBuilder(GraphBuilder):
+    _iterative = False
+
     def __init__(self, graph=None, graph_cls=DAG, node_processor=None,
                  inputs_selector=None, compose=True,
                  on_tile=None, on_tile_success=None, on_tile_failure=None):
@@ -189,9 +303,11 @@ class ChunkGraphBuilder(GraphBuilder):
                 t._chunks = o.chunks
                 t._nsplits = o.nsplits
         elif on_tile is None:
-            tds[0]._inplace_tile()
+            with _enter_tileable_graph(tileable_graph, self._iterative):
+                tds[0]._inplace_tile()
         else:
-            tds = on_tile(tileable_data.op.outputs, tds)
+            with _enter_tileable_graph(tileable_graph, self._iterative):
+                tds = on_tile(tileable_data.op.outputs, tds)
             if not isinstance(tds, (list, tuple)):
                 tds = [tds]
             assert len(tileable_data.op.outputs) == len(tds)
@@ -264,6 +380,8 @@ class ChunkGraphBuilder(GraphBuilder):
 
 
 class IterativeChunkGraphBuilder(ChunkGraphBuilder):
+    _iterative = True
+
     def __init__(self, graph=None, graph_cls=DAG, node_processor=None, inputs_selector=None,
                  compose=True, on_tile=None, on_tile_success=None, on_tile_failure=None):
         self._interrupted_ops = set()
@@ -251,7 +251,10 @@ def lazy_import(name, package=None, globals=None, locals=None, rename=None):
         return None
 
 
-def serialize_graph(graph, compress=False):
+def serialize_graph(graph, compress=False, compact=False):
+    if compact:
+        from .serialize.graphserializer import serialize_graph as serialize_compact_graph
+        return serialize_compact_graph(graph, compress=compress)
     ser_graph = graph.to_pb().SerializeToString()
     if compress:
         ser_graph = zlib.compress(ser_graph)
@@ -260,10 +263,15 @@ def serialize_graph(graph, compress=False):
 
 def deserialize_graph(ser_graph, graph_cls=None):
     from google.protobuf.message import DecodeError
+    from .serialize.graphserializer import is_compact_graph, \
+        deserialize_graph as deserialize_compact_graph
     from .serialize.protos.graph_pb2 import GraphDef
     from .graph import DirectedGraph
     graph_cls = graph_cls or DirectedGraph
     ser_graph_bin = to_binary(ser_graph)
+    if is_compact_graph(ser_graph_bin):
+        return deserialize_compact_graph(ser_graph_bin, graph_cls)
+
     g = GraphDef()
     try:
         ser_graph = ser_graph
@@ -573,17 +581,19 @@ def build_fetch(entity):
         raise TypeError('Type %s not supported' % type(entity).__name__)
 
 
-def build_fuse_chunk(fused_chunks, **kwargs):
+def build_fuse_chunk(fused_chunks, inputs=None, **kwargs):
     head_chunk = fused_chunks[0]
     tail_chunk = fused_chunks[-1]
     chunk_op = tail_chunk.op
     params = tail_chunk.params.copy()
+    if inputs is None:
+        inputs = head_chunk.inputs
 
     fuse_op = chunk_op.get_fuse_op_cls(tail_chunk)(
         sparse=chunk_op.sparse, _key=chunk_op.key, _gpu=tail_chunk.op.gpu,
         _operands=[c.op for c in fused_chunks])
     return fuse_op.new_chunk(
-        head_chunk.inputs, kws=[params], _key=tail_chunk.key, _composed=fused_chunks, **kwargs)
+        inputs, kws=[params], _key=tail_chunk.key, _composed=fused_chunks, **kwargs)
 
 
 def get_chunk_shuffle_key(chunk):
@@ -15,17 +15,19 @@
 import functools
 import logging
 import random
+import sys
 import time
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 from .. import promise
 from ..config import options
 from ..errors import PinDataKeyFailed, WorkerProcessStopped, WorkerDead, \
     ExecutionInterrupted, DependencyMissing
 from ..executor import Executor
+from ..graph import DAG
 from ..operands import Fetch, FetchShuffle
-from ..utils import BlacklistSet, deserialize_graph, log_unhandled, build_exc_info, \
-    calc_data_size, get_chunk_shuffle_key
+from ..utils import BlacklistSet, serialize_graph, deserialize_graph, log_unhandled, \
+    build_exc_info, calc_data_size, get_chunk_shuffle_key
 from .storage import DataStorageDevice
 from .transfer import ReceiverManagerActor
 from .utils import WorkerActor, ExpiringCache, ExecutionState, concat_operand_keys, \
@@ -109,6 +111,18 @@ class GraphResultRecord(object):
             return self.exc, dict(_accept=False)
 
 
+class BatchExecutionRecord(object):
+    """
+    Execution records of graphs submitted in a batch
+    """
+    __slots__ = ('graph_callbacks', 'graph_targets', 'stop_requested_keys')
+
+    def __init__(self):
+        self.graph_callbacks = OrderedDict()
+        self.graph_targets = dict()
+        self.stop_requested_keys = set()
+
+
 class ExecutionActor(WorkerActor):
     """
     Actor for execution control
@@ -128,6 +142,9 @@ class ExecutionActor(WorkerActor):
         self._graph_records = dict()  # type: dict[tuple, GraphExecutionRecord]
         self._result_cache = ExpiringCache()  # type: dict[tuple, GraphResultRecord]
 
+        self._batch_records = dict()  # type: dict[tuple, BatchExecutionRecord]
+        self._graph_to_batch = dict()  # type: dict[tuple, str]
+
         self._peer_blacklist = BlacklistSet(options.worker.peer_blacklist_time)
 
     def post_create(self):
@@ -439,6 +456,16 @@ class ExecutionActor(WorkerActor):
         callback = callback or []
         if not isinstance(callback, list):
             callback = [callback]
+
+        try:
+            # graph already submitted in a batch
+            graph_batch_key = self._graph_to_batch[session_graph_key]
+            self._batch_records[(session_id, graph_batch_key)] \
+                .graph_callbacks[graph_key].extend(callback)
+            return
+        except KeyError:
+            pass
+
         try:
             all_callbacks = self._graph_records[session_graph_key].finish_callbacks or []
             self._graph_records[session_graph_key].finish_callbacks.extend(callback)
@@ -545,6 +572,98 @@ class ExecutionActor(WorkerActor):
                 .then(lambda saved_keys: self._store_results(session_id, graph_key, saved_keys)) \
                 .then(_handle_success, _handle_rejection)
 
+    @log_unhandled
+    def execute_graphs(self, session_id, batch_key, submissions):
+        """
+        Merge graphs submitted in a batch and execute them as a single graph.
+        Results are reported to finish callbacks of every graph separately.
+        :param session_id: session id
+        :param batch_key: key of the batch
+        :param submissions: list of (graph_key, graph_ser, io_meta, data_metas,
+                            calc_device, send_addresses)
+        """
+        query_key = (session_id, batch_key)
+        batch_record = self._batch_records[query_key] = BatchExecutionRecord()
+        logger.debug('Executing %d graphs in batch %s', len(submissions), batch_key)
+
+        for submission in submissions:
+            graph_key = submission[0]
+            self._graph_to_batch[(session_id, graph_key)] = batch_key
+            batch_record.graph_callbacks[graph_key] = []
+            try:
+                del self._result_cache[(session_id, graph_key)]
+            except KeyError:
+                pass
+
+        try:
+            graph = DAG()
+            chunks = dict()
+            io_meta = dict(chunks=[], data_targets=[], shared_input_chunks=set(),
+                           input_data_metas=dict(), no_prepare_chunk_keys=set())
+            data_metas = dict()
+            send_addresses = dict()
+            calc_device = None
+            for graph_key, sub_graph_ser, sub_io_meta, sub_data_metas, sub_calc_device, \
+                    sub_send_addresses in submissions:
+                sub_graph = deserialize_graph(sub_graph_ser, graph_cls=DAG)
+                # input chunks shared between graphs are merged
+                for c in sub_graph:
+                    if (c.key, c.id) not in chunks:
+                        chunks[(c.key, c.id)] = c
+                        graph.add_node(c)
+                for c in sub_graph:
+                    for succ in sub_graph.iter_successors(c):
+                        graph.add_edge(chunks[(c.key, c.id)], chunks[(succ.key, succ.id)])
+
+                data_targets = list(sub_io_meta.get('data_targets') or sub_io_meta['chunks'])
+                batch_record.graph_targets[graph_key] = data_targets
+                io_meta['chunks'].extend(sub_io_meta['chunks'])
+                io_meta['data_targets'].extend(data_targets)
+                io_meta['shared_input_chunks'].update(sub_io_meta.get('shared_input_chunks') or ())
+                io_meta['input_data_metas'].update(sub_io_meta.get('input_data_metas') or dict())
+                io_meta['no_prepare_chunk_keys'].update(sub_io_meta.get('no_prepare_chunk_keys') or ())
+                data_metas.update(sub_data_metas or dict())
+                send_addresses.update(sub_send_addresses or dict())
+                calc_device = calc_device or sub_calc_device
+            io_meta['shared_input_chunks'] = list(io_meta['shared_input_chunks'])
+
+            graph_ser = serialize_graph(
+                graph, compact=options.scheduler.compact_graph_serialization)
+            self.execute_graph(session_id, batch_key, graph_ser,
+                               io_meta, data_metas, calc_device=calc_device,
+                               send_addresses=send_addresses or None)
+        except:  # noqa: E722
+            logger.exception('Failed to execute batch %s', batch_key)
+            self._result_cache[query_key] = GraphResultRecord(*sys.exc_info(), succeeded=False)
+            self._invoke_batch_callbacks(session_id, batch_key)
+            if self._resource_ref is not None:
+                self._resource_ref.deallocate_resource(
+                    session_id, batch_key, self.address, _tell=True, _wait=False)
+
+    def _invoke_batch_callbacks(self, session_id, batch_key):
+        """
+        Split result of a batch and call finish callbacks of every graph in it
+        :param session_id: session id
+        :param batch_key: key of the batch
+        """
+        batch_record = self._batch_records.pop((session_id, batch_key))
+        result = self._result_cache[(session_id, batch_key)]
+        for graph_key, callbacks in batch_record.graph_callbacks.items():
+            self._graph_to_batch.pop((session_id, graph_key), None)
+            if result.succeeded:
+                data_sizes = result.data_sizes
+                sub_result = GraphResultRecord(dict(
+                    (k, data_sizes[k]) for k in batch_record.graph_targets.get(graph_key, ())
+                    if k in data_sizes))
+            else:
+                sub_result = result
+            self._result_cache[(session_id, graph_key)] = sub_result
+
+            args, kwargs = sub_result.build_args()
+            kwargs['_wait'] = False
+            for cb in callbacks:
+                self.tell_promise(cb, *args, **kwargs)
+
     @log_unhandled
     def _prepare_graph_inputs(self, session_id, graph_key):
         """
@@ -844,8 +963,16 @@ class ExecutionActor(WorkerActor):
             graph_record = self._graph_records[(session_id, graph_key)]
             if not graph_record.resource_released:
                 graph_record.resource_released = True
-                self._resource_ref.deallocate_resource(
-                    session_id, graph_key, self.address, _delay=delay, _tell=True, _wait=False)
+                try:
+                    # resources are allocated for every graph in the batch
+                    op_keys = list(self._batch_records[(session_id, graph_key)].graph_callbacks)
+                    # the cpu slot is allocated for the batch itself
+                    op_keys.append(graph_key)
+                except KeyError:
+                    op_keys = [graph_key]
+                for op_key in op_keys:
+                    self._resource_ref.deallocate_resource(
+                        session_id, op_key, self.address, _delay=delay, _tell=True, _wait=False)
         except:  # noqa: E722
             pass
 
@@ -892,7 +1019,13 @@ class ExecutionActor(WorkerActor):
             args, kwargs = self._result_cache[(session_id, graph_key)].build_args()
             self.tell_promise(callback, *args, **kwargs)
         except KeyError:
-            self._graph_records[(session_id, graph_key)].finish_callbacks.append(callback)
+            try:
+                batch_key = self._graph_to_batch[(session_id, graph_key)]
+            except KeyError:
+                self._graph_records[(session_id, graph_key)].finish_callbacks.append(callback)
+            else:
+                self._batch_records[(session_id, batch_key)] \
+                    .graph_callbacks[graph_key].append(callback)
 
     @promise.reject_on_exception
     @log_unhandled
@@ -916,6 +1049,14 @@ class ExecutionActor(WorkerActor):
         :param graph_key: graph key
         """
         logger.debug('Receive stop for graph %s', graph_key)
+        try:
+            batch_key = self._graph_to_batch[(session_id, graph_key)]
+        except KeyError:
+            pass
+        else:
+            self._stop_batch_graph(session_id, batch_key, graph_key)
+            return
+
         try:
             graph_record = self._graph_records[(session_id, graph_key)]
         except KeyError:
@@ -930,6 +1071,17 @@ class ExecutionActor(WorkerActor):
             if self._daemon_ref is not None and graph_record.calc_actor_uid is not None:
                 self._daemon_ref.kill_actor_process(self.ctx.actor_ref(graph_record.calc_actor_uid), _tell=True)
 
+    def _stop_batch_graph(self, session_id, batch_key, graph_key):
+        """
+        Stop graph submitted in a batch. As graphs in the batch are
+        executed together, the batch is stopped only when all graphs
+        in it are requested to stop.
+        """
+        batch_record = self._batch_records[(session_id, batch_key)]
+        batch_record.stop_requested_keys.add(graph_key)
+        if len(batch_record.stop_requested_keys) == len(batch_record.graph_callbacks):
+            self.stop_execution(session_id, batch_key)
+
     @log_unhandled
     def delete_data_by_keys(self, session_id, keys):
         self.storage_client.delete(session_id, keys, _tell=True)
@@ -970,6 +1122,9 @@ class ExecutionActor(WorkerActor):
             self.tell_promise(cb, *args, **kwargs)
         self._cleanup_graph(session_id, graph_key)
 
+        if query_key in self._batch_records:
+            self._invoke_batch_callbacks(session_id, graph_key)
+
     def _dump_execution_states(self):
         if logger.getEffectiveLevel() <= logging.DEBUG:
             cur_time = time.time()
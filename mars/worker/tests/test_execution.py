@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 import tempfile
 import threading
@@ -569,6 +570,54 @@ class Test(WorkerCase):
 
             self.get_result()
 
+    def testBatchExecution(self):
+        pool_address = '127.0.0.1:%d' % get_next_port()
+        session_id = str(uuid.uuid4())
+        with create_actor_pool(n_process=1, backend='gevent',
+                               address=pool_address, distributor=MarsDistributor(2, 'w:0:')) as pool:
+            self.create_standard_actors(pool, pool_address, with_daemon=False, with_status=False)
+            pool.create_actor(CpuCalcActor, uid='w:1:cpu-calc')
+            pool.create_actor(InProcHolderActor, uid='w:1:inproc-holder')
+
+            import mars.tensor as mt
+            graph_sers, result_keys, expects = [], [], []
+            for i in range(3):
+                mock_data = np.arange(4) + i
+                result_tensor = mt.ones((4,), chunk_size=4) + mt.array(mock_data)
+                graph_sers.append(serialize_graph(result_tensor.build_graph(compose=False, tiled=True)))
+                result_keys.append(get_tiled(result_tensor).chunks[0].key)
+                expects.append(mock_data + 1)
+
+            results = dict()
+
+            def _validate(*_):
+                for idx, data_sizes in results.items():
+                    # every graph only reports its own results
+                    self.assertEqual(list(data_sizes), [result_keys[idx]])
+                    data = test_actor.shared_store.get(session_id, result_keys[idx])
+                    assert_array_equal(data, expects[idx])
+
+            # graphs in the batch are submitted in a single call
+            with self.run_actor_test(pool) as test_actor:
+                batch_key = str(uuid.uuid4())
+                graph_keys = [str(uuid.uuid4()) for _ in range(3)]
+                execution_ref = test_actor.promise_ref(ExecutionActor.default_uid())
+                execution_ref.execute_graphs(session_id, batch_key, [
+                    (graph_keys[idx], graph_sers[idx], dict(chunks=[result_keys[idx]]), None, None, None)
+                    for idx in range(3)], _tell=True)
+                promises = [execution_ref.add_finish_callback(session_id, graph_keys[idx], _promise=True)
+                            .then(functools.partial(results.__setitem__, idx)) for idx in range(3)]
+                promise.all_(promises) \
+                    .then(_validate) \
+                    .then(lambda *_: execution_ref.add_finish_callback(
+                        session_id, graph_keys[1], _promise=True)) \
+                    .then(lambda data_sizes: self.assertEqual(list(data_sizes), [result_keys[1]])) \
+                    .then(lambda *_: test_actor.set_result(None)) \
+                    .catch(lambda *exc: test_actor.set_result(exc, False))
+
+            self.get_result()
+            self.assertEqual(len(results), 3)
+
     def testReExecuteExisting(self):
         pool_address = '127.0.0.1:%d' % get_next_port()
         session_id = str(uuid.uuid4())